@@ -1,6 +1,10 @@
+import os
 import sys
 import re
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools-additional'))
+import rime_dict
+
 def find_number_in_string(s):
 	# Search for a number in the string
 	match = re.search(r'\d+', s)
@@ -12,17 +16,13 @@ def find_number_in_string(s):
 		return None
 
 def load_data(file_path):
-	data = []
-	with open(file_path, 'r', encoding='utf-8') as file:
-		for line in file:
-			parts = line.strip()
-			data.append(parts)
-	return data
+	# Rows are split once here instead of on every query
+	with rime_dict.open_dict(file_path) as file:
+		return [row for row in rime_dict.reader(file) if row]
 
 def find_match(data, inputs):
 	results = []
-	for line in data:
-		parts = line.split('\t')
+	for parts in data:
 		chinese_chars = parts[0]  # Not used in the current implementation but could be useful
 		targets = parts[1:]  # List of pinyin strings
 
@@ -106,7 +106,7 @@ def find_match(data, inputs):
 				break
 
 		if is_match:
-			results.append(line)
+			results.append('\t'.join(parts))
 
 	return results
 
@@ -5,165 +5,26 @@ set -x
 
 # BUILD_TYPE="$1"
 
-rm -rf molong-chs
-rm -rf molong-cht
+# 複製 rime-moran 並生成詞庫（見 tools-additional/schemes.py）；build.py 為每個方案各自生成詞庫，再以 --no-dicts 執行
+if [ "$1" != "--no-dicts" ]; then
+    cd ./tools-additional
+    python3 make_dicts.py molong
+    cd ..
+fi
 
 # 生成繁體
-cp -a ./rime-moran-cht/. ./molong-cht
-
-rm -rf ./molong-cht/.git
-rm -rf ./molong-cht/.gitignore
-rm -rf ./molong-cht/README.md
-rm -rf ./molong-cht/README-en.md
-rm -rf ./molong-cht/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./molong-cht/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./molong-cht/moran.yaml
 # mv ./molong-cht/punctuation.yaml ./schema
 
-
-# cp ./rime-moran/tools/data/zrmdb.txt ./tools-additional
-sed -i 's/ /\t/g' ./tools-additional/zrmdb_zrlong.txt
-
 # 生成簡體
-cp -a ./rime-moran-chs/. ./molong-chs
-
-rm -rf ./molong-chs/.git
-rm -rf ./molong-chs/.gitignore
-rm -rf ./molong-chs/README.md
-rm -rf ./molong-chs/README-en.md
-rm -rf ./molong-chs/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./molong-chs/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./molong-chs/moran.yaml
 # mv ./molong-chs/punctuation.yaml ./schema
 
-# 轉換詞庫
-cd ./tools-additional
-# 轉換繁体詞庫
-echo 轉換繁体詞庫...
-sed '/\.\.\./q' ../molong-cht/moran.chars.dict.yaml > ../molong-cht/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p zrlong -x zrmdb_zrlong -i ../data/zdicdbtonesorted.yaml -o ../molong-cht/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../molong-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../molong-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../molong-cht/temp.txt
-echo "" >> ../molong-cht/moran.chars.dict.yaml.bak
-cat ../molong-cht/temp.txt >> ../molong-cht/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../molong-cht/moran.base.dict.yaml > ../molong-cht/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../molong-cht/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../molong-cht/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p zrlong -x zrmdb_zrlong -t -i ../molong-cht/snow_pinyin.base.dict.yaml -o ../molong-cht/temp.txt
-# echo "" >> ../molong-cht/moran.base.dict.yaml.bak
-cat ../molong-cht/temp.txt >> ../molong-cht/moran.base.dict.yaml.bak
-rm ../molong-cht/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molong-cht/moran.tencent.dict.yaml > ../../molong-cht/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molong-cht/moran.moe.dict.yaml > ../../molong-cht/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molong-cht/moran.computer.dict.yaml > ../../molong-cht/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molong-cht/moran.hanyu.dict.yaml > ../../molong-cht/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molong-cht/moran.words.dict.yaml > ../../molong-cht/moran.words.dict.yaml.bak
-# python3 ../../tools-additional/convert_sp.py -i ../../molong-cht/zrlf.dict.yaml -o ../../molong-cht/zrlf.dict.yaml.bak
-
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+\n//g" ../molong-cht/moran_fixed.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../molong-cht/moran_fixed.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../molong-cht/moran_fixed.dict.yaml
-sed '/\.\.\./q' ../molong-cht/moran_fixed.dict.yaml > ../molong-cht/moran_fixed.dict.yaml.bak
-cp ../rime-zrlong/zrlong.dict.yaml ../molong-cht/zrlong.dict.yaml
-sed -i '0,/\.\.\./d' ../molong-cht/zrlong.dict.yaml
-opencc -i ../molong-cht/zrlong.dict.yaml -o ../molong-cht/temp.txt -c s2t
-echo "" >> ../molong-cht/moran_fixed.dict.yaml.bak
-cat ../molong-cht/temp.txt >> ../molong-cht/moran_fixed.dict.yaml.bak
-# sed '0,/#----------词库----------#/d' ../molong-cht/moran_fixed.dict.yaml >> ../molong-cht/moran_fixed.dict.yaml.bak
-rm ../molong-cht/zrlong.dict.yaml
-
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+\n//g" ../molong-cht/moran_fixed_simp.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../molong-cht/moran_fixed_simp.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../molong-cht/moran_fixed_simp.dict.yaml
-sed '/\.\.\./q' ../molong-cht/moran_fixed_simp.dict.yaml > ../molong-cht/moran_fixed_simp.dict.yaml.bak
-cp ../rime-zrlong/zrlong.dict.yaml ../molong-cht/zrlong.dict.yaml
-sed -i '0,/\.\.\./d' ../molong-cht/zrlong.dict.yaml
-cp ../molong-cht/zrlong.dict.yaml ../molong-cht/temp.txt
-echo "" >> ../molong-cht/moran_fixed_simp.dict.yaml.bak
-cat ../molong-cht/temp.txt >> ../molong-cht/moran_fixed_simp.dict.yaml.bak
-# sed '0,/#----------词库----------#/d' ../molong-cht/moran_fixed_simp.dict.yaml >> ../molong-cht/moran_fixed_simp.dict.yaml.bak
-rm ../molong-cht/zrlong.dict.yaml
-
-mv ../molong-cht/moran.chars.dict.yaml{.bak,}
-mv ../molong-cht/moran.base.dict.yaml{.bak,}
-# mv ../molong-cht/moran.tencent.dict.yaml{.bak,}
-# mv ../molong-cht/moran.moe.dict.yaml{.bak,}
-# mv ../molong-cht/moran.computer.dict.yaml{.bak,}
-# mv ../molong-cht/moran.hanyu.dict.yaml{.bak,}
-# mv ../molong-cht/moran.words.dict.yaml{.bak,}
-mv ../molong-cht/moran_fixed.dict.yaml{.bak,}
-mv ../molong-cht/moran_fixed_simp.dict.yaml{.bak,}
-# mv ../molong-cht/zrlf.dict.yaml{.bak,}
-
-# 轉換简体詞庫
-echo 轉換简体詞庫...
-sed '/\.\.\./q' ../molong-chs/moran.chars.dict.yaml > ../molong-chs/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p zrlong -x zrmdb_zrlong -i ../data/zdicdbtonesorted.yaml -o ../molong-chs/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../molong-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../molong-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../molong-chs/temp.txt
-echo "" >> ../molong-chs/moran.chars.dict.yaml.bak
-cat ../molong-chs/temp.txt >> ../molong-chs/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../molong-chs/moran.base.dict.yaml > ../molong-chs/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../molong-chs/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../molong-chs/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p zrlong -x zrmdb_zrlong -s -i ../molong-chs/snow_pinyin.base.dict.yaml -o ../molong-chs/temp.txt
-# echo "" >> ../molong-chs/moran.base.dict.yaml.bak
-cat ../molong-chs/temp.txt >> ../molong-chs/moran.base.dict.yaml.bak
-rm ../molong-chs/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molong-chs/moran.tencent.dict.yaml > ../../molong-chs/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molong-chs/moran.moe.dict.yaml > ../../molong-chs/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molong-chs/moran.computer.dict.yaml > ../../molong-chs/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molong-chs/moran.hanyu.dict.yaml > ../../molong-chs/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molong-chs/moran.words.dict.yaml > ../../molong-chs/moran.words.dict.yaml.bak
-# python3 ../../tools-additional/convert_sp.py -i ../../molong-chs/zrlf.dict.yaml -o ../../molong-chs/zrlf.dict.yaml.bak
-
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+\n//g" ../molong-chs/moran_fixed.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../molong-chs/moran_fixed.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../molong-chs/moran_fixed.dict.yaml
-sed '/\.\.\./q' ../molong-chs/moran_fixed.dict.yaml > ../molong-chs/moran_fixed.dict.yaml.bak
-cp ../rime-zrlong/zrlong.dict.yaml ../molong-chs/zrlong.dict.yaml
-sed -i '0,/\.\.\./d' ../molong-chs/zrlong.dict.yaml
-opencc -i ../molong-chs/zrlong.dict.yaml -o ../molong-chs/temp.txt -c s2t
-echo "" >> ../molong-chs/moran_fixed.dict.yaml.bak
-cat ../molong-chs/temp.txt >> ../molong-chs/moran_fixed.dict.yaml.bak
-# sed '0,/#----------词库----------#/d' ../molong-chs/moran_fixed.dict.yaml >> ../molong-chs/moran_fixed.dict.yaml.bak
-rm ../molong-chs/zrlong.dict.yaml
-
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+\n//g" ../molong-chs/moran_fixed_simp.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../molong-chs/moran_fixed_simp.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../molong-chs/moran_fixed_simp.dict.yaml
-sed '/\.\.\./q' ../molong-chs/moran_fixed_simp.dict.yaml > ../molong-chs/moran_fixed_simp.dict.yaml.bak
-cp ../rime-zrlong/zrlong.dict.yaml ../molong-chs/zrlong.dict.yaml
-sed -i '0,/\.\.\./d' ../molong-chs/zrlong.dict.yaml
-cp ../molong-chs/zrlong.dict.yaml ../molong-chs/temp.txt
-echo "" >> ../molong-chs/moran_fixed_simp.dict.yaml.bak
-cat ../molong-chs/temp.txt >> ../molong-chs/moran_fixed_simp.dict.yaml.bak
-# sed '0,/#----------词库----------#/d' ../molong-chs/moran_fixed_simp.dict.yaml >> ../molong-chs/moran_fixed_simp.dict.yaml.bak
-rm ../molong-chs/zrlong.dict.yaml
-
-mv ../molong-chs/moran.chars.dict.yaml{.bak,}
-mv ../molong-chs/moran.base.dict.yaml{.bak,}
-# mv ../molong-chs/moran.tencent.dict.yaml{.bak,}
-# mv ../molong-chs/moran.moe.dict.yaml{.bak,}
-# mv ../molong-chs/moran.computer.dict.yaml{.bak,}
-# mv ../molong-chs/moran.hanyu.dict.yaml{.bak,}
-# mv ../molong-chs/moran.words.dict.yaml{.bak,}
-mv ../molong-chs/moran_fixed.dict.yaml{.bak,}
-mv ../molong-chs/moran_fixed_simp.dict.yaml{.bak,}
-# mv ../molong-chs/zrlf.dict.yaml{.bak,}
-cd ..
-
 # 整理文件結構
 rm -rf ./molong-cht/tools
 rm -rf ./molong-cht/make_simp_dist.sh
-mkdir -p ./molong-cht/snow-dicts/
-mkdir -p ./molong-chs/snow-dicts/
 # cp -a ./molong-cht/moran_fixed.dict.yaml ./schema/molong_fixed.dict.yaml
 # cp -a ./molong-cht/moran_fixed_simp.dict.yaml ./schema/molong_fixed_simp.dict.yaml
 cp -a ./schema/default.custom.molong.yaml ./molong-cht/default.custom.yaml
@@ -184,37 +45,14 @@ cp -a ./schema/default.custom.molong.yaml ./molong-chs/default.custom.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\n//g" ./schema/moran_fixed_simp.dict.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\t.*\n//g" ./schema/moran_fixed_simp.dict.yaml
 
-cd ./tools-additional
-# 生成繁體霧凇
-python3 gen_dict_with_shape.py -p zrlong -x zrmdb_zrlong -t -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../molong-cht/snow-dicts/zrlong_zrmdb_zrlong_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x zrmdb_zrlong -t -o ../molong-cht/snow-dicts/flypy_zrmdb_zrlong_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x zrmdb_zrlong -t -o ../molong-cht/snow-dicts/flypy_zrmdb_zrlong_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x zrmdb_zrlong -t -o ../molong-cht/snow-dicts/flypy_zrmdb_zrlong_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x zrmdb_zrlong -t -o ../molong-cht/snow-dicts/flypy_zrmdb_zrlong_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x zrmdb_zrlong -t -o ../molong-cht/snow-dicts/flypy_zrmdb_zrlong_others.dict.yaml
-python3 gen_dict_with_shape.py -p zrlong -x zrmdb_zrlong -t -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../molong-cht/snow-dicts/zrlong_zrmdb_zrlong_tencent.dict.yaml
-# 生成簡體霧凇
-python3 gen_dict_with_shape.py -p zrlong -x zrmdb_zrlong -s -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../molong-chs/snow-dicts/zrlong_zrmdb_zrlong_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x zrmdb_zrlong -o ../molong-chs/snow-dicts/flypy_zrmdb_zrlong_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x zrmdb_zrlong -o ../molong-chs/snow-dicts/flypy_zrmdb_zrlong_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x zrmdb_zrlong -o ../molong-chs/snow-dicts/flypy_zrmdb_zrlong_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x zrmdb_zrlong -o ../molong-chs/snow-dicts/flypy_zrmdb_zrlong_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x zrmdb_zrlong -o ../molong-chs/snow-dicts/flypy_zrmdb_zrlong_others.dict.yaml
-python3 gen_dict_with_shape.py -p zrlong -x zrmdb_zrlong -s -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../molong-chs/snow-dicts/zrlong_zrmdb_zrlong_tencent.dict.yaml
-cd ..
-
 # 生成ocz
 cp ./rime-radical-pinyin/radical.schema.yaml ./molong-chs
 cp ./rime-radical-pinyin/radical.schema.yaml ./molong-cht
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./molong-cht
-sed '/\.\.\./q' ./molong-cht/radical_flypy.dict.yaml > ./molong-cht/radical_flypy.dict.yaml.bak
-python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o temp.txt -c ./molong-cht/moran.chars.dict.yaml
-echo "" >> ./molong-cht/radical_flypy.dict.yaml.bak
-cat temp.txt >> ./molong-cht/radical_flypy.dict.yaml.bak
-mv ./molong-cht/radical_flypy.dict.yaml{.bak,}
+python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o ./molong-cht/temp.txt -c ./molong-cht/moran.chars.dict.yaml
+python3 ./tools-additional/assemble_dict.py -o ./molong-cht/radical_flypy.dict.yaml --head ./molong-cht/radical_flypy.dict.yaml "..." --text "" --file ./molong-cht/temp.txt
 cp ./molong-cht/radical_flypy.dict.yaml ./molong-chs
 
-rm -f temp.txt
 rm -f ./molong-cht/temp.txt
 rm -f ./molong-chs/temp.txt
 
@@ -230,7 +68,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/zrlong_zrmdb_zrlong_tencent
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml molong.schema.yaml
@@ -287,8 +124,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/zrlong_zrmdb_zrlong_tencent
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml molong.schema.yaml
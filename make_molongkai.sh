@@ -5,173 +5,26 @@ set -x
 
 # BUILD_TYPE="$1"
 
-rm -rf molongkai-chs
-rm -rf molongkai-cht
+# 複製 rime-moran 並生成詞庫（見 tools-additional/schemes.py）；build.py 為每個方案各自生成詞庫，再以 --no-dicts 執行
+if [ "$1" != "--no-dicts" ]; then
+    cd ./tools-additional
+    python3 make_dicts.py molongkai
+    cd ..
+fi
 
 # 生成繁體
-cp -a ./rime-moran-cht/. ./molongkai-cht
-
-rm -rf ./molongkai-cht/.git
-rm -rf ./molongkai-cht/.gitignore
-rm -rf ./molongkai-cht/README.md
-rm -rf ./molongkai-cht/README-en.md
-rm -rf ./molongkai-cht/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./molongkai-cht/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./molongkai-cht/moran.yaml
 # mv ./molongkai-cht/punctuation.yaml ./schema
 
-
-cp ./rime-moran/tools/data/zrmdb.txt ./tools-additional
-sed -i 's/ /\t/g' ./tools-additional/zrmdb.txt
-
 # 生成簡體
-cp -a ./rime-moran-chs/. ./molongkai-chs
-
-rm -rf ./molongkai-chs/.git
-rm -rf ./molongkai-chs/.gitignore
-rm -rf ./molongkai-chs/README.md
-rm -rf ./molongkai-chs/README-en.md
-rm -rf ./molongkai-chs/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./molongkai-chs/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./molongkai-chs/moran.yaml
 # mv ./molongkai-chs/punctuation.yaml ./schema
 
-# 轉換詞庫
-cd ./tools-additional
-# 轉換繁体詞庫
-echo 轉換繁体詞庫...
-sed '/\.\.\./q' ../molongkai-cht/moran.chars.dict.yaml > ../molongkai-cht/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p molongkai -x zrmdb -m -i ../data/zdicdbtonesorted.yaml -o ../molongkai-cht/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../molongkai-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../molongkai-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../molongkai-cht/temp.txt
-echo "" >> ../molongkai-cht/moran.chars.dict.yaml.bak
-cat ../molongkai-cht/temp.txt >> ../molongkai-cht/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../molongkai-cht/moran.base.dict.yaml > ../molongkai-cht/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../molongkai-cht/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../molongkai-cht/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p molongkai -x zrmdb -t -i ../molongkai-cht/snow_pinyin.base.dict.yaml -o ../molongkai-cht/temp.txt
-# echo "" >> ../molongkai-cht/moran.base.dict.yaml.bak
-cat ../molongkai-cht/temp.txt >> ../molongkai-cht/moran.base.dict.yaml.bak
-rm ../molongkai-cht/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongkai-cht/moran.tencent.dict.yaml > ../../molongkai-cht/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongkai-cht/moran.moe.dict.yaml > ../../molongkai-cht/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongkai-cht/moran.computer.dict.yaml > ../../molongkai-cht/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongkai-cht/moran.hanyu.dict.yaml > ../../molongkai-cht/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongkai-cht/moran.words.dict.yaml > ../../molongkai-cht/moran.words.dict.yaml.bak
-# python3 convert_sp.py -i ../molongkai-cht/zrlf.dict.yaml -o ../molongkai-cht/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../molongkai-cht/moran_fixed.dict.yaml > ../molongkai-cht/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/molongkai.simpchars.txt ../molongkai-cht/molongkai.simpchars.txt && opencc -i ../molongkai-cht/molongkai.simpchars.txt -o ../molongkai-cht/temp.txt -c s2t
-echo "" >> ../molongkai-cht/moran_fixed.dict.yaml.bak
-cat ../molongkai-cht/temp.txt >> ../molongkai-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/molong.simpwords.txt -o ../molongkai-cht/temp.txt -c s2t
-echo "" >> ../molongkai-cht/moran_fixed.dict.yaml.bak && cat ../molongkai-cht/temp.txt >> ../molongkai-cht/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../molongkai-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../molongkai-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../molongkai-cht/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../molongkai-cht/moran_fixed.dict.yaml >> ../molongkai-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../molongkai-cht/temp.txt -c s2t
-echo "" >> ../molongkai-cht/moran_fixed.dict.yaml.bak && cat ../molongkai-cht/temp.txt >> ../molongkai-cht/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../molongkai-cht/moran_fixed.dict.yaml.bak
-rm ../molongkai-cht/molongkai.simpchars.txt
-
-sed '/#----------词库----------#/q' ../molongkai-cht/moran_fixed_simp.dict.yaml > ../molongkai-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/molongkai.simpchars.txt ../molongkai-cht/molongkai.simpchars.txt && cp ../molongkai-cht/molongkai.simpchars.txt ../molongkai-cht/temp.txt
-echo "" >> ../molongkai-cht/moran_fixed_simp.dict.yaml.bak
-cat ../molongkai-cht/temp.txt >> ../molongkai-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/molong.simpwords.txt ../molongkai-cht/temp.txt
-echo "" >> ../molongkai-cht/moran_fixed_simp.dict.yaml.bak && cat ../molongkai-cht/temp.txt >> ../molongkai-cht/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../molongkai-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../molongkai-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../molongkai-cht/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../molongkai-cht/moran_fixed_simp.dict.yaml >> ../molongkai-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../molongkai-cht/temp.txt
-echo "" >> ../molongkai-cht/moran_fixed_simp.dict.yaml.bak && cat ../molongkai-cht/temp.txt >> ../molongkai-cht/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../molongkai-cht/moran_fixed_simp.dict.yaml.bak
-rm ../molongkai-cht/molongkai.simpchars.txt
-
-mv ../molongkai-cht/moran.chars.dict.yaml{.bak,}
-mv ../molongkai-cht/moran.base.dict.yaml{.bak,}
-# mv ../molongkai-cht/moran.tencent.dict.yaml{.bak,}
-# mv ../molongkai-cht/moran.moe.dict.yaml{.bak,}
-# mv ../molongkai-cht/moran.computer.dict.yaml{.bak,}
-# mv ../molongkai-cht/moran.hanyu.dict.yaml{.bak,}
-# mv ../molongkai-cht/moran.words.dict.yaml{.bak,}
-mv ../molongkai-cht/moran_fixed.dict.yaml{.bak,}
-mv ../molongkai-cht/moran_fixed_simp.dict.yaml{.bak,}
-# mv ../molongkai-cht/zrlf.dict.yaml{.bak,}
-
-# 轉換简体詞庫
-echo 轉換简体詞庫...
-sed '/\.\.\./q' ../molongkai-chs/moran.chars.dict.yaml > ../molongkai-chs/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p molongkai -x zrmdb -m -i ../data/zdicdbtonesorted.yaml -o ../molongkai-chs/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../molongkai-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../molongkai-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../molongkai-chs/temp.txt
-echo "" >> ../molongkai-chs/moran.chars.dict.yaml.bak
-cat ../molongkai-chs/temp.txt >> ../molongkai-chs/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../molongkai-chs/moran.base.dict.yaml > ../molongkai-chs/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../molongkai-chs/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../molongkai-chs/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p molongkai -x zrmdb -s -i ../molongkai-chs/snow_pinyin.base.dict.yaml -o ../molongkai-chs/temp.txt
-# echo "" >> ../molongkai-chs/moran.base.dict.yaml.bak
-cat ../molongkai-chs/temp.txt >> ../molongkai-chs/moran.base.dict.yaml.bak
-rm ../molongkai-chs/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongkai-chs/moran.tencent.dict.yaml > ../../molongkai-chs/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongkai-chs/moran.moe.dict.yaml > ../../molongkai-chs/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongkai-chs/moran.computer.dict.yaml > ../../molongkai-chs/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongkai-chs/moran.hanyu.dict.yaml > ../../molongkai-chs/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongkai-chs/moran.words.dict.yaml > ../../molongkai-chs/moran.words.dict.yaml.bak
-# python3 convert_sp.py -i ../molongkai-chs/zrlf.dict.yaml -o ../molongkai-chs/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../molongkai-chs/moran_fixed.dict.yaml > ../molongkai-chs/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/molongkai.simpchars.txt ../molongkai-chs/molongkai.simpchars.txt && opencc -i ../molongkai-chs/molongkai.simpchars.txt -o ../molongkai-chs/temp.txt -c s2t
-echo "" >> ../molongkai-chs/moran_fixed.dict.yaml.bak
-cat ../molongkai-chs/temp.txt >> ../molongkai-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/molong.simpwords.txt -o ../molongkai-chs/temp.txt -c s2t
-echo "" >> ../molongkai-chs/moran_fixed.dict.yaml.bak && cat ../molongkai-chs/temp.txt >> ../molongkai-chs/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../molongkai-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../molongkai-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../molongkai-chs/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../molongkai-chs/moran_fixed.dict.yaml >> ../molongkai-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../molongkai-chs/temp.txt -c s2t
-echo "" >> ../molongkai-chs/moran_fixed.dict.yaml.bak && cat ../molongkai-chs/temp.txt >> ../molongkai-chs/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../molongkai-chs/moran_fixed.dict.yaml.bak
-rm ../molongkai-chs/molongkai.simpchars.txt
-
-sed '/#----------词库----------#/q' ../molongkai-chs/moran_fixed_simp.dict.yaml > ../molongkai-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/molongkai.simpchars.txt ../molongkai-chs/molongkai.simpchars.txt && cp ../molongkai-chs/molongkai.simpchars.txt ../molongkai-chs/temp.txt
-echo "" >> ../molongkai-chs/moran_fixed_simp.dict.yaml.bak
-cat ../molongkai-chs/temp.txt >> ../molongkai-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/molong.simpwords.txt ../molongkai-chs/temp.txt
-echo "" >> ../molongkai-chs/moran_fixed_simp.dict.yaml.bak && cat ../molongkai-chs/temp.txt >> ../molongkai-chs/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../molongkai-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../molongkai-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../molongkai-chs/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../molongkai-chs/moran_fixed_simp.dict.yaml >> ../molongkai-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../molongkai-chs/temp.txt
-echo "" >> ../molongkai-chs/moran_fixed_simp.dict.yaml.bak && cat ../molongkai-chs/temp.txt >> ../molongkai-chs/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../molongkai-chs/moran_fixed_simp.dict.yaml.bak
-rm ../molongkai-chs/molongkai.simpchars.txt
-
-mv ../molongkai-chs/moran.chars.dict.yaml{.bak,}
-mv ../molongkai-chs/moran.base.dict.yaml{.bak,}
-# mv ../molongkai-chs/moran.tencent.dict.yaml{.bak,}
-# mv ../molongkai-chs/moran.moe.dict.yaml{.bak,}
-# mv ../molongkai-chs/moran.computer.dict.yaml{.bak,}
-# mv ../molongkai-chs/moran.hanyu.dict.yaml{.bak,}
-# mv ../molongkai-chs/moran.words.dict.yaml{.bak,}
-mv ../molongkai-chs/moran_fixed.dict.yaml{.bak,}
-mv ../molongkai-chs/moran_fixed_simp.dict.yaml{.bak,}
-# mv ../molongkai-chs/zrlf.dict.yaml{.bak,}
-cd ..
-
 # 整理文件結構
 rm -rf ./molongkai-cht/tools
 rm -rf ./molongkai-cht/make_simp_dist.sh
-mkdir -p ./molongkai-cht/snow-dicts/
-mkdir -p ./molongkai-chs/snow-dicts/
 # cp -a ./molongkai-cht/moran_fixed.dict.yaml ./schema/molongkai_fixed.dict.yaml
 # cp -a ./molongkai-cht/moran_fixed_simp.dict.yaml ./schema/molongkai_fixed_simp.dict.yaml
 cp -a ./schema/default.custom.molongkai.yaml ./molongkai-cht/default.custom.yaml
@@ -192,37 +45,14 @@ cp -a ./schema/default.custom.molongkai.yaml ./molongkai-chs/default.custom.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\n//g" ./schema/moran_fixed_simp.dict.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\t.*\n//g" ./schema/moran_fixed_simp.dict.yaml
 
-cd ./tools-additional
-# 生成繁體霧凇
-python3 gen_dict_with_shape.py -p molongkai -x zrmdb -t -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../molongkai-cht/snow-dicts/molongkai_zrmdb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x zrmdb -t -o ../molongkai-cht/snow-dicts/flypy_zrmdb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x zrmdb -t -o ../molongkai-cht/snow-dicts/flypy_zrmdb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x zrmdb -t -o ../molongkai-cht/snow-dicts/flypy_zrmdb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x zrmdb -t -o ../molongkai-cht/snow-dicts/flypy_zrmdb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x zrmdb -t -o ../molongkai-cht/snow-dicts/flypy_zrmdb_others.dict.yaml
-python3 gen_dict_with_shape.py -p molongkai -x zrmdb -t -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../molongkai-cht/snow-dicts/molongkai_zrmdb_tencent.dict.yaml
-# 生成簡體霧凇
-python3 gen_dict_with_shape.py -p molongkai -x zrmdb -s -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../molongkai-chs/snow-dicts/molongkai_zrmdb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x zrmdb -o ../molongkai-chs/snow-dicts/flypy_zrmdb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x zrmdb -o ../molongkai-chs/snow-dicts/flypy_zrmdb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x zrmdb -o ../molongkai-chs/snow-dicts/flypy_zrmdb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x zrmdb -o ../molongkai-chs/snow-dicts/flypy_zrmdb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x zrmdb -o ../molongkai-chs/snow-dicts/flypy_zrmdb_others.dict.yaml
-python3 gen_dict_with_shape.py -p molongkai -x zrmdb -s -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../molongkai-chs/snow-dicts/molongkai_zrmdb_tencent.dict.yaml
-cd ..
-
 # 生成ocz
 cp ./rime-radical-pinyin/radical.schema.yaml ./molongkai-chs
 cp ./rime-radical-pinyin/radical.schema.yaml ./molongkai-cht
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./molongkai-cht
-sed '/\.\.\./q' ./molongkai-cht/radical_flypy.dict.yaml > ./molongkai-cht/radical_flypy.dict.yaml.bak
-python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o temp.txt -c ./molongkai-cht/moran.chars.dict.yaml
-echo "" >> ./molongkai-cht/radical_flypy.dict.yaml.bak
-cat temp.txt >> ./molongkai-cht/radical_flypy.dict.yaml.bak
-mv ./molongkai-cht/radical_flypy.dict.yaml{.bak,}
+python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o ./molongkai-cht/temp.txt -c ./molongkai-cht/moran.chars.dict.yaml
+python3 ./tools-additional/assemble_dict.py -o ./molongkai-cht/radical_flypy.dict.yaml --head ./molongkai-cht/radical_flypy.dict.yaml "..." --text "" --file ./molongkai-cht/temp.txt
 cp ./molongkai-cht/radical_flypy.dict.yaml ./molongkai-chs
 
-rm -f temp.txt
 rm -f ./molongkai-cht/temp.txt
 rm -f ./molongkai-chs/temp.txt
 
@@ -238,7 +68,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/molongkai_zrmdb_tencent      #
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml molongkai.schema.yaml
@@ -295,7 +124,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/molongkai_zrmdb_tencent      #
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml molongkai.schema.yaml
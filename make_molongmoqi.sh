@@ -5,177 +5,30 @@ set -x
 
 # BUILD_TYPE="$1"
 
-rm -rf molongmoqi-chs
-rm -rf molongmoqi-cht
+# 複製 rime-moran 並生成詞庫（見 tools-additional/schemes.py）；build.py 為每個方案各自生成詞庫，再以 --no-dicts 執行
+if [ "$1" != "--no-dicts" ]; then
+    cd ./tools-additional
+    python3 make_dicts.py molongmoqi
+    cd ..
+fi
 
 # 生成繁體
-cp -a ./rime-moran-cht/. ./molongmoqi-cht
-
-rm -rf ./molongmoqi-cht/.git
-rm -rf ./molongmoqi-cht/.gitignore
-rm -rf ./molongmoqi-cht/README.md
-rm -rf ./molongmoqi-cht/README-en.md
-rm -rf ./molongmoqi-cht/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./molongmoqi-cht/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./molongmoqi-cht/moran.yaml
 # mv ./molongmoqi-cht/punctuation.yaml ./schema
 cp ./rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt ./molongmoqi-cht/opencc/moran_chaifen.txt
 sed -i -E 's/^(\S+)\t(\S+)\t(.+)$/\1\t〔\3\2〕/' ./molongmoqi-cht/opencc/moran_chaifen.txt
-cp ./rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt ./tools-additional/moqidb.txt # && sed -i '0,/\.\.\./d' ./tools-additional/moqidb.txt
-perl -CSAD -i -pe 's/(.*\t[a-z]{2})\t.*/$1/' ./tools-additional/moqidb.txt
 
 # 生成簡體
-cp -a ./rime-moran-chs/. ./molongmoqi-chs
-
-rm -rf ./molongmoqi-chs/.git
-rm -rf ./molongmoqi-chs/.gitignore
-rm -rf ./molongmoqi-chs/README.md
-rm -rf ./molongmoqi-chs/README-en.md
-rm -rf ./molongmoqi-chs/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./molongmoqi-chs/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./molongmoqi-chs/moran.yaml
 # mv ./molongmoqi-chs/punctuation.yaml ./schema
 cp ./rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt ./molongmoqi-chs/opencc/moran_chaifen.txt
 sed -i -E 's/^(\S+)\t(\S+)\t(.+)$/\1\t〔\3\2〕/' ./molongmoqi-chs/opencc/moran_chaifen.txt
-cp ./rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt ./tools-additional/moqidb.txt # && sed -i '0,/\.\.\./d' ./tools-additional/moqidb.txt
-perl -CSAD -i -pe 's/(.*\t[a-z]{2})\t.*/$1/' ./tools-additional/moqidb.txt
-
-# 轉換詞庫
-cd ./tools-additional
-# 轉換繁体詞庫
-echo 轉換繁体詞庫...
-sed '/\.\.\./q' ../molongmoqi-cht/moran.chars.dict.yaml > ../molongmoqi-cht/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p molongmoqi -x moqidb -i ../data/zdicdbtonesorted.yaml -o ../molongmoqi-cht/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../molongmoqi-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../molongmoqi-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../molongmoqi-cht/temp.txt
-echo "" >> ../molongmoqi-cht/moran.chars.dict.yaml.bak
-cat ../molongmoqi-cht/temp.txt >> ../molongmoqi-cht/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../molongmoqi-cht/moran.base.dict.yaml > ../molongmoqi-cht/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../molongmoqi-cht/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../molongmoqi-cht/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p molongmoqi -x moqidb -t -i ../molongmoqi-cht/snow_pinyin.base.dict.yaml -o ../molongmoqi-cht/temp.txt
-# echo "" >> ../molongmoqi-cht/moran.base.dict.yaml.bak
-cat ../molongmoqi-cht/temp.txt >> ../molongmoqi-cht/moran.base.dict.yaml.bak
-rm ../molongmoqi-cht/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongmoqi-cht/moran.tencent.dict.yaml > ../../molongmoqi-cht/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongmoqi-cht/moran.moe.dict.yaml > ../../molongmoqi-cht/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongmoqi-cht/moran.computer.dict.yaml > ../../molongmoqi-cht/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongmoqi-cht/moran.hanyu.dict.yaml > ../../molongmoqi-cht/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongmoqi-cht/moran.words.dict.yaml > ../../molongmoqi-cht/moran.words.dict.yaml.bak
-# python3 convert_sp.py -i ../molongmoqi-cht/zrlf.dict.yaml -o ../molongmoqi-cht/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../molongmoqi-cht/moran_fixed.dict.yaml > ../molongmoqi-cht/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/molongmoqi.simpchars.txt ../molongmoqi-cht/molongmoqi.simpchars.txt && opencc -i ../molongmoqi-cht/molongmoqi.simpchars.txt -o ../molongmoqi-cht/temp.txt -c s2t
-echo "" >> ../molongmoqi-cht/moran_fixed.dict.yaml.bak
-cat ../molongmoqi-cht/temp.txt >> ../molongmoqi-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/molong.simpwords.txt -o ../molongmoqi-cht/temp.txt -c s2t
-echo "" >> ../molongmoqi-cht/moran_fixed.dict.yaml.bak && cat ../molongmoqi-cht/temp.txt >> ../molongmoqi-cht/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../molongmoqi-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../molongmoqi-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../molongmoqi-cht/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../molongmoqi-cht/moran_fixed.dict.yaml >> ../molongmoqi-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../molongmoqi-cht/temp.txt -c s2t
-echo "" >> ../molongmoqi-cht/moran_fixed.dict.yaml.bak && cat ../molongmoqi-cht/temp.txt >> ../molongmoqi-cht/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../molongmoqi-cht/moran_fixed.dict.yaml.bak
-rm ../molongmoqi-cht/molongmoqi.simpchars.txt
-
-sed '/#----------词库----------#/q' ../molongmoqi-cht/moran_fixed_simp.dict.yaml > ../molongmoqi-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/molongmoqi.simpchars.txt ../molongmoqi-cht/molongmoqi.simpchars.txt && cp ../molongmoqi-cht/molongmoqi.simpchars.txt ../molongmoqi-cht/temp.txt
-echo "" >> ../molongmoqi-cht/moran_fixed_simp.dict.yaml.bak
-cat ../molongmoqi-cht/temp.txt >> ../molongmoqi-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/molong.simpwords.txt ../molongmoqi-cht/temp.txt
-echo "" >> ../molongmoqi-cht/moran_fixed_simp.dict.yaml.bak && cat ../molongmoqi-cht/temp.txt >> ../molongmoqi-cht/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../molongmoqi-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../molongmoqi-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../molongmoqi-cht/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../molongmoqi-cht/moran_fixed_simp.dict.yaml >> ../molongmoqi-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../molongmoqi-cht/temp.txt
-echo "" >> ../molongmoqi-cht/moran_fixed_simp.dict.yaml.bak && cat ../molongmoqi-cht/temp.txt >> ../molongmoqi-cht/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../molongmoqi-cht/moran_fixed_simp.dict.yaml.bak
-rm ../molongmoqi-cht/molongmoqi.simpchars.txt
-
-mv ../molongmoqi-cht/moran.chars.dict.yaml{.bak,}
-mv ../molongmoqi-cht/moran.base.dict.yaml{.bak,}
-# mv ../molongmoqi-cht/moran.tencent.dict.yaml{.bak,}
-# mv ../molongmoqi-cht/moran.moe.dict.yaml{.bak,}
-# mv ../molongmoqi-cht/moran.computer.dict.yaml{.bak,}
-# mv ../molongmoqi-cht/moran.hanyu.dict.yaml{.bak,}
-# mv ../molongmoqi-cht/moran.words.dict.yaml{.bak,}
-mv ../molongmoqi-cht/moran_fixed.dict.yaml{.bak,}
-mv ../molongmoqi-cht/moran_fixed_simp.dict.yaml{.bak,}
-# mv ../molongmoqi-cht/zrlf.dict.yaml{.bak,}
-
-# 轉換简体詞庫
-echo 轉換简体詞庫...
-sed '/\.\.\./q' ../molongmoqi-chs/moran.chars.dict.yaml > ../molongmoqi-chs/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p molongmoqi -x moqidb -i ../data/zdicdbtonesorted.yaml -o ../molongmoqi-chs/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../molongmoqi-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../molongmoqi-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../molongmoqi-chs/temp.txt
-echo "" >> ../molongmoqi-chs/moran.chars.dict.yaml.bak
-cat ../molongmoqi-chs/temp.txt >> ../molongmoqi-chs/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../molongmoqi-chs/moran.base.dict.yaml > ../molongmoqi-chs/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../molongmoqi-chs/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../molongmoqi-chs/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p molongmoqi -x moqidb -s -i ../molongmoqi-chs/snow_pinyin.base.dict.yaml -o ../molongmoqi-chs/temp.txt
-# echo "" >> ../molongmoqi-chs/moran.base.dict.yaml.bak
-cat ../molongmoqi-chs/temp.txt >> ../molongmoqi-chs/moran.base.dict.yaml.bak
-rm ../molongmoqi-chs/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongmoqi-chs/moran.tencent.dict.yaml > ../../molongmoqi-chs/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongmoqi-chs/moran.moe.dict.yaml > ../../molongmoqi-chs/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongmoqi-chs/moran.computer.dict.yaml > ../../molongmoqi-chs/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongmoqi-chs/moran.hanyu.dict.yaml > ../../molongmoqi-chs/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../molongmoqi-chs/moran.words.dict.yaml > ../../molongmoqi-chs/moran.words.dict.yaml.bak
-# python3 convert_sp.py -i ../molongmoqi-chs/zrlf.dict.yaml -o ../molongmoqi-chs/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../molongmoqi-chs/moran_fixed.dict.yaml > ../molongmoqi-chs/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/molongmoqi.simpchars.txt ../molongmoqi-chs/molongmoqi.simpchars.txt && opencc -i ../molongmoqi-chs/molongmoqi.simpchars.txt -o ../molongmoqi-chs/temp.txt -c s2t
-echo "" >> ../molongmoqi-chs/moran_fixed.dict.yaml.bak
-cat ../molongmoqi-chs/temp.txt >> ../molongmoqi-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/molong.simpwords.txt -o ../molongmoqi-chs/temp.txt -c s2t
-echo "" >> ../molongmoqi-chs/moran_fixed.dict.yaml.bak && cat ../molongmoqi-chs/temp.txt >> ../molongmoqi-chs/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../molongmoqi-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../molongmoqi-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../molongmoqi-chs/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../molongmoqi-chs/moran_fixed.dict.yaml >> ../molongmoqi-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../molongmoqi-chs/temp.txt -c s2t
-echo "" >> ../molongmoqi-chs/moran_fixed.dict.yaml.bak && cat ../molongmoqi-chs/temp.txt >> ../molongmoqi-chs/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../molongmoqi-chs/moran_fixed.dict.yaml.bak
-rm ../molongmoqi-chs/molongmoqi.simpchars.txt
-
-sed '/#----------词库----------#/q' ../molongmoqi-chs/moran_fixed_simp.dict.yaml > ../molongmoqi-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/molongmoqi.simpchars.txt ../molongmoqi-chs/molongmoqi.simpchars.txt && cp ../molongmoqi-chs/molongmoqi.simpchars.txt ../molongmoqi-chs/temp.txt
-echo "" >> ../molongmoqi-chs/moran_fixed_simp.dict.yaml.bak
-cat ../molongmoqi-chs/temp.txt >> ../molongmoqi-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/molong.simpwords.txt ../molongmoqi-chs/temp.txt
-echo "" >> ../molongmoqi-chs/moran_fixed_simp.dict.yaml.bak && cat ../molongmoqi-chs/temp.txt >> ../molongmoqi-chs/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../molongmoqi-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../molongmoqi-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../molongmoqi-chs/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../molongmoqi-chs/moran_fixed_simp.dict.yaml >> ../molongmoqi-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../molongmoqi-chs/temp.txt
-echo "" >> ../molongmoqi-chs/moran_fixed_simp.dict.yaml.bak && cat ../molongmoqi-chs/temp.txt >> ../molongmoqi-chs/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../molongmoqi-chs/moran_fixed_simp.dict.yaml.bak
-rm ../molongmoqi-chs/molongmoqi.simpchars.txt
-
-mv ../molongmoqi-chs/moran.chars.dict.yaml{.bak,}
-mv ../molongmoqi-chs/moran.base.dict.yaml{.bak,}
-# mv ../molongmoqi-chs/moran.tencent.dict.yaml{.bak,}
-# mv ../molongmoqi-chs/moran.moe.dict.yaml{.bak,}
-# mv ../molongmoqi-chs/moran.computer.dict.yaml{.bak,}
-# mv ../molongmoqi-chs/moran.hanyu.dict.yaml{.bak,}
-# mv ../molongmoqi-chs/moran.words.dict.yaml{.bak,}
-mv ../molongmoqi-chs/moran_fixed.dict.yaml{.bak,}
-mv ../molongmoqi-chs/moran_fixed_simp.dict.yaml{.bak,}
-# mv ../molongmoqi-chs/zrlf.dict.yaml{.bak,}
-cd ..
 
 # 整理文件結構
 rm -rf ./molongmoqi-cht/tools
 rm -rf ./molongmoqi-cht/make_simp_dist.sh
-mkdir -p ./molongmoqi-cht/snow-dicts/
-mkdir -p ./molongmoqi-chs/snow-dicts/
 # cp -a ./molongmoqi-cht/moran_fixed.dict.yaml ./schema/molongmoqi_fixed.dict.yaml
 # cp -a ./molongmoqi-cht/moran_fixed_simp.dict.yaml ./schema/molongmoqi_fixed_simp.dict.yaml
 cp -a ./schema/default.custom.molongmoqi.yaml ./molongmoqi-cht/default.custom.yaml
@@ -196,37 +49,14 @@ cp -a ./schema/default.custom.molongmoqi.yaml ./molongmoqi-chs/default.custom.ya
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\n//g" ./schema/moran_fixed_simp.dict.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\t.*\n//g" ./schema/moran_fixed_simp.dict.yaml
 
-cd ./tools-additional
-# 生成繁體霧凇
-python3 gen_dict_with_shape.py -p molongmoqi -x moqidb -t -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../molongmoqi-cht/snow-dicts/molongmoqi_moqidb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x moqidb -t -o ../molongmoqi-cht/snow-dicts/flypy_moqidb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x moqidb -t -o ../molongmoqi-cht/snow-dicts/flypy_moqidb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x moqidb -t -o ../molongmoqi-cht/snow-dicts/flypy_moqidb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x moqidb -t -o ../molongmoqi-cht/snow-dicts/flypy_moqidb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x moqidb -t -o ../molongmoqi-cht/snow-dicts/flypy_moqidb_others.dict.yaml
-python3 gen_dict_with_shape.py -p molongmoqi -x moqidb -t -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../molongmoqi-cht/snow-dicts/molongmoqi_moqidb_tencent.dict.yaml
-# 生成簡體霧凇
-python3 gen_dict_with_shape.py -p molongmoqi -x moqidb -s -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../molongmoqi-chs/snow-dicts/molongmoqi_moqidb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x moqidb -o ../molongmoqi-chs/snow-dicts/flypy_moqidb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x moqidb -o ../molongmoqi-chs/snow-dicts/flypy_moqidb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x moqidb -o ../molongmoqi-chs/snow-dicts/flypy_moqidb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x moqidb -o ../molongmoqi-chs/snow-dicts/flypy_moqidb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x moqidb -o ../molongmoqi-chs/snow-dicts/flypy_moqidb_others.dict.yaml
-python3 gen_dict_with_shape.py -p molongmoqi -x moqidb -s -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../molongmoqi-chs/snow-dicts/molongmoqi_moqidb_tencent.dict.yaml
-cd ..
-
 # 生成ocz
 cp ./rime-radical-pinyin/radical.schema.yaml ./molongmoqi-chs
 cp ./rime-radical-pinyin/radical.schema.yaml ./molongmoqi-cht
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./molongmoqi-cht
-sed '/\.\.\./q' ./molongmoqi-cht/radical_flypy.dict.yaml > ./molongmoqi-cht/radical_flypy.dict.yaml.bak
-python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o temp.txt -c ./molongmoqi-cht/moran.chars.dict.yaml
-echo "" >> ./molongmoqi-cht/radical_flypy.dict.yaml.bak
-cat temp.txt >> ./molongmoqi-cht/radical_flypy.dict.yaml.bak
-mv ./molongmoqi-cht/radical_flypy.dict.yaml{.bak,}
+python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o ./molongmoqi-cht/temp.txt -c ./molongmoqi-cht/moran.chars.dict.yaml
+python3 ./tools-additional/assemble_dict.py -o ./molongmoqi-cht/radical_flypy.dict.yaml --head ./molongmoqi-cht/radical_flypy.dict.yaml "..." --text "" --file ./molongmoqi-cht/temp.txt
 cp ./molongmoqi-cht/radical_flypy.dict.yaml ./molongmoqi-chs
 
-rm -f temp.txt
 rm -f ./molongmoqi-cht/temp.txt
 rm -f ./molongmoqi-chs/temp.txt
 
@@ -242,7 +72,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/molongmoqi_moqidb_tencent
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml molongmoqi.schema.yaml
@@ -299,7 +128,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/molongmoqi_moqidb_tencent
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml molongmoqi.schema.yaml
@@ -5,173 +5,26 @@ set -x
 
 # BUILD_TYPE="$1"
 
-rm -rf morankai-chs
-rm -rf morankai-cht
+# 複製 rime-moran 並生成詞庫（見 tools-additional/schemes.py）；build.py 為每個方案各自生成詞庫，再以 --no-dicts 執行
+if [ "$1" != "--no-dicts" ]; then
+    cd ./tools-additional
+    python3 make_dicts.py morankai
+    cd ..
+fi
 
 # 生成繁體
-cp -a ./rime-moran-cht/. ./morankai-cht
-
-rm -rf ./morankai-cht/.git
-rm -rf ./morankai-cht/.gitignore
-rm -rf ./morankai-cht/README.md
-rm -rf ./morankai-cht/README-en.md
-rm -rf ./morankai-cht/.github/
 # perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./morankai-cht/moran.yaml
 # mv ./morankai-cht/key_bindings.yaml ./schema
 # mv ./morankai-cht/punctuation.yaml ./schema
 
-
-cp ./rime-moran/tools/data/zrmdb.txt ./tools-additional
-sed -i 's/ /\t/g' ./tools-additional/zrmdb.txt
-
 # 生成簡體
-cp -a ./rime-moran-chs/. ./morankai-chs
-
-rm -rf ./morankai-chs/.git
-rm -rf ./morankai-chs/.gitignore
-rm -rf ./morankai-chs/README.md
-rm -rf ./morankai-chs/README-en.md
-rm -rf ./morankai-chs/.github/
 # perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./morankai-chs/moran.yaml
 # mv ./morankai-chs/key_bindings.yaml ./schema
 # mv ./morankai-chs/punctuation.yaml ./schema
 
-# 轉換詞庫
-cd ./tools-additional
-# 轉換繁体詞庫
-# echo 轉換繁体詞庫...
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-cht/moran.chars.dict.yaml > ../morankai-cht/moran.chars.dict.yaml.bak
-# python3 gen_dict_with_shape.py -p morankai -x zrmdb -i ../rime-ice/cn_dicts/8105.dict.yaml -o ../morankai-cht/temp.txt
-# perl -CSAD -i -pe "s/.\t[a-z]{2};;(\t[0-9]+)?\n//g" ../morankai-cht/temp.txt && sed -i '0,/\.\.\./d' ../morankai-cht/temp.txt
-# echo "" >> ../morankai-cht/moran.chars.dict.yaml.bak && cat ../morankai-cht/temp.txt >> ../morankai-cht/moran.chars.dict.yaml.bak
-# python3 gen_dict_with_shape.py -p morankai -x zrmdb -i ../rime-ice/cn_dicts/41448.dict.yaml -o ../morankai-cht/temp.txt
-# perl -CSAD -i -pe "s/.\t[a-z]{2};;(\t[0-9]+)?\n//g" ../morankai-cht/temp.txt && sed -i '0,/\.\.\./d' ../morankai-cht/temp.txt
-# echo "" >> ../morankai-cht/moran.chars.dict.yaml.bak && cat ../morankai-cht/temp.txt >> ../morankai-cht/moran.chars.dict.yaml.bak
-
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-cht/moran.base.dict.yaml > ../morankai-cht/moran.base.dict.yaml.bak
-# cp ../rime-ice/cn_dicts/base.dict.yaml ../morankai-cht/ice.base.dict.yaml
-# sed -i '0,/\.\.\./d' ../morankai-cht/ice.base.dict.yaml
-# python3 gen_dict_with_shape.py -p morankai -x zrmdb -t -i ../morankai-cht/ice.base.dict.yaml -o ../morankai-cht/temp.txt
-# echo "" >> ../morankai-cht/moran.base.dict.yaml.bak
-# cat ../morankai-cht/temp.txt >> ../morankai-cht/moran.base.dict.yaml.bak
-# rm ../morankai-cht/ice.base.dict.yaml
-
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-cht/moran.tencent.dict.yaml > ../morankai-cht/moran.tencent.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-cht/moran.moe.dict.yaml > ../morankai-cht/moran.moe.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-cht/moran.computer.dict.yaml > ../morankai-cht/moran.computer.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-cht/moran.hanyu.dict.yaml > ../morankai-cht/moran.hanyu.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-cht/moran.words.dict.yaml > ../morankai-cht/moran.words.dict.yaml.bak
-# python3 convert_sp.py -i ../morankai-cht/zrlf.dict.yaml -o ../morankai-cht/zrlf.dict.yaml.bak
-
-# sed '/#----------詞庫----------#/q' ../morankai-cht/moran_fixed.dict.yaml > ../morankai-cht/moran_fixed.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-fixed-sp --to=flypy --rime-dict=../morankai-cht/moran_fixed.dict.yaml > ../morankai-cht/temp.txt
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2,100}\t[A-Za-z]+.*\n//g" ../morankai-cht/temp.txt
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]{4}.*\n//g" ../morankai-cht/temp.txt
-# sed -i '0,/#----------詞庫----------#/d' ../morankai-cht/temp.txt  &&  echo "" >> ../morankai-cht/moran_fixed.dict.yaml.bak && cat ../morankai-cht/temp.txt >> ../morankai-cht/moran_fixed.dict.yaml.bak
-# opencc -i ../data/assess.tiger-code.com/moran.simpwords.txt -o ../morankai-cht/temp.txt -c s2t
-# echo "" >> ../morankai-cht/moran_fixed.dict.yaml.bak && cat ../morankai-cht/temp.txt >> ../morankai-cht/moran_fixed.dict.yaml.bak
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../morankai-cht/moran_fixed.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../morankai-cht/moran_fixed.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../morankai-cht/moran_fixed.dict.yaml
-# sed '0,/#----------詞庫----------#/d' ../morankai-cht/moran_fixed.dict.yaml >> ../morankai-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../morankai-cht/temp.txt -c s2t
-echo "" >> ../morankai-cht/moran_fixed.dict.yaml && cat ../morankai-cht/temp.txt >> ../morankai-cht/moran_fixed.dict.yaml && perl -i -ne 'print if !$seen{$_}++' ../morankai-cht/moran_fixed.dict.yaml
-
-# sed '/#----------词库----------#/q' ../morankai-cht/moran_fixed_simp.dict.yaml > ../morankai-cht/moran_fixed_simp.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-fixed-sp --to=flypy --rime-dict=../morankai-cht/moran_fixed_simp.dict.yaml > ../morankai-cht/temp.txt
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2,100}\t[A-Za-z]+.*\n//g" ../morankai-cht/temp.txt
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]{4}.*\n//g" ../morankai-cht/temp.txt
-# sed -i '0,/#----------词库----------#/d' ../morankai-cht/temp.txt  &&  echo "" >> ../morankai-cht/moran_fixed_simp.dict.yaml.bak && cat ../morankai-cht/temp.txt >> ../morankai-cht/moran_fixed_simp.dict.yaml.bak
-# cp ../data/assess.tiger-code.com/moran.simpwords.txt ../morankai-cht/temp.txt
-# echo "" >> ../morankai-cht/moran_fixed_simp.dict.yaml.bak && cat ../morankai-cht/temp.txt >> ../morankai-cht/moran_fixed_simp.dict.yaml.bak
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../morankai-cht/moran_fixed_simp.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../morankai-cht/moran_fixed_simp.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../morankai-cht/moran_fixed_simp.dict.yaml
-# sed '0,/#----------词库----------#/d' ../morankai-cht/moran_fixed_simp.dict.yaml >> ../morankai-cht/moran_fixed_simp.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../morankai-cht/temp.txt -c s2t
-echo "" >> ../morankai-cht/moran_fixed_simp.dict.yaml && cat ../morankai-cht/temp.txt >> ../morankai-cht/moran_fixed_simp.dict.yaml && perl -i -ne 'print if !$seen{$_}++' ../morankai-cht/moran_fixed_simp.dict.yaml
-
-# mv ../morankai-cht/moran.chars.dict.yaml{.bak,}
-# mv ../morankai-cht/moran.base.dict.yaml{.bak,}
-# mv ../morankai-cht/moran.tencent.dict.yaml{.bak,}
-# mv ../morankai-cht/moran.moe.dict.yaml{.bak,}
-# mv ../morankai-cht/moran.computer.dict.yaml{.bak,}
-# mv ../morankai-cht/moran.hanyu.dict.yaml{.bak,}
-# mv ../morankai-cht/moran.words.dict.yaml{.bak,}
-# mv ../morankai-cht/moran_fixed.dict.yaml{.bak,}
-# mv ../morankai-cht/moran_fixed_simp.dict.yaml{.bak,}
-# mv ../morankai-cht/zrlf.dict.yaml{.bak,}
-
-# 轉換简体詞庫
-# echo 轉換简体詞庫...
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-chs/moran.chars.dict.yaml > ../morankai-chs/moran.chars.dict.yaml.bak
-# python3 gen_dict_with_shape.py -p morankai -x zrmdb -i ../rime-ice/cn_dicts/8105.dict.yaml -o ../morankai-chs/temp.txt
-# perl -CSAD -i -pe "s/.\t[a-z]{2};;(\t[0-9]+)?\n//g" ../morankai-chs/temp.txt && sed -i '0,/\.\.\./d' ../morankai-chs/temp.txt
-# echo "" >> ../morankai-chs/moran.chars.dict.yaml.bak && cat ../morankai-chs/temp.txt >> ../morankai-chs/moran.chars.dict.yaml.bak
-# python3 gen_dict_with_shape.py -p morankai -x zrmdb -i ../rime-ice/cn_dicts/41448.dict.yaml -o ../morankai-chs/temp.txt
-# perl -CSAD -i -pe "s/.\t[a-z]{2};;(\t[0-9]+)?\n//g" ../morankai-chs/temp.txt && sed -i '0,/\.\.\./d' ../morankai-chs/temp.txt
-# echo "" >> ../morankai-chs/moran.chars.dict.yaml.bak && cat ../morankai-chs/temp.txt >> ../morankai-chs/moran.chars.dict.yaml.bak
-
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-chs/moran.base.dict.yaml > ../morankai-chs/moran.base.dict.yaml.bak
-# cp ../rime-ice/cn_dicts/base.dict.yaml ../morankai-chs/ice.base.dict.yaml
-# sed -i '0,/\.\.\./d' ../morankai-chs/ice.base.dict.yaml
-# python3 gen_dict_with_shape.py -p morankai -x zrmdb -s -i ../morankai-chs/ice.base.dict.yaml -o ../morankai-chs/temp.txt
-# echo "" >> ../morankai-chs/moran.base.dict.yaml.bak
-# cat ../morankai-chs/temp.txt >> ../morankai-chs/moran.base.dict.yaml.bak
-# rm ../morankai-chs/ice.base.dict.yaml
-
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-chs/moran.tencent.dict.yaml > ../morankai-chs/moran.tencent.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-chs/moran.moe.dict.yaml > ../morankai-chs/moran.moe.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-chs/moran.computer.dict.yaml > ../morankai-chs/moran.computer.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-chs/moran.hanyu.dict.yaml > ../morankai-chs/moran.hanyu.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../morankai-chs/moran.words.dict.yaml > ../morankai-chs/moran.words.dict.yaml.bak
-# python3 convert_sp.py -i ../morankai-chs/zrlf.dict.yaml -o ../morankai-chs/zrlf.dict.yaml.bak
-
-# sed '/#----------詞庫----------#/q' ../morankai-chs/moran_fixed.dict.yaml > ../morankai-chs/moran_fixed.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-fixed-sp --to=flypy --rime-dict=../morankai-chs/moran_fixed.dict.yaml > ../morankai-chs/temp.txt
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2,100}\t[A-Za-z]+.*\n//g" ../morankai-chs/temp.txt
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]{4}.*\n//g" ../morankai-chs/temp.txt
-# sed -i '0,/#----------詞庫----------#/d' ../morankai-chs/temp.txt  &&  echo "" >> ../morankai-chs/moran_fixed.dict.yaml.bak && cat ../morankai-chs/temp.txt >> ../morankai-chs/moran_fixed.dict.yaml.bak
-# opencc -i ../data/assess.tiger-code.com/moran.simpwords.txt -o ../morankai-chs/temp.txt -c s2t
-# echo "" >> ../morankai-chs/moran_fixed.dict.yaml.bak && cat ../morankai-chs/temp.txt >> ../morankai-chs/moran_fixed.dict.yaml.bak
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../morankai-chs/moran_fixed.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../morankai-chs/moran_fixed.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../morankai-chs/moran_fixed.dict.yaml
-# sed '0,/#----------詞庫----------#/d' ../morankai-chs/moran_fixed.dict.yaml >> ../morankai-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../morankai-chs/temp.txt -c s2t
-echo "" >> ../morankai-chs/moran_fixed.dict.yaml && cat ../morankai-chs/temp.txt >> ../morankai-chs/moran_fixed.dict.yaml && perl -i -ne 'print if !$seen{$_}++' ../morankai-chs/moran_fixed.dict.yaml
-
-# sed '/#----------词库----------#/q' ../morankai-chs/moran_fixed_simp.dict.yaml > ../morankai-chs/moran_fixed_simp.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-fixed-sp --to=flypy --rime-dict=../morankai-chs/moran_fixed_simp.dict.yaml > ../morankai-chs/temp.txt
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2,100}\t[A-Za-z]+.*\n//g" ../morankai-chs/temp.txt
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]{4}.*\n//g" ../morankai-chs/temp.txt
-# sed -i '0,/#----------词库----------#/d' ../morankai-chs/temp.txt  &&  echo "" >> ../morankai-chs/moran_fixed_simp.dict.yaml.bak && cat ../morankai-chs/temp.txt >> ../morankai-chs/moran_fixed_simp.dict.yaml.bak
-# cp ../data/assess.tiger-code.com/moran.simpwords.txt ../morankai-chs/temp.txt
-# echo "" >> ../morankai-chs/moran_fixed_simp.dict.yaml.bak && cat ../morankai-chs/temp.txt >> ../morankai-chs/moran_fixed_simp.dict.yaml.bak
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../morankai-chs/moran_fixed_simp.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../morankai-chs/moran_fixed_simp.dict.yaml
-# perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../morankai-chs/moran_fixed_simp.dict.yaml
-# sed '0,/#----------词库----------#/d' ../morankai-chs/moran_fixed_simp.dict.yaml >> ../morankai-chs/moran_fixed_simp.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../morankai-chs/temp.txt -c s2t
-echo "" >> ../morankai-chs/moran_fixed_simp.dict.yaml && cat ../morankai-chs/temp.txt >> ../morankai-chs/moran_fixed_simp.dict.yaml && perl -i -ne 'print if !$seen{$_}++' ../morankai-chs/moran_fixed_simp.dict.yaml
-
-# mv ../morankai-chs/moran.chars.dict.yaml{.bak,}
-# mv ../morankai-chs/moran.base.dict.yaml{.bak,}
-# mv ../morankai-chs/moran.tencent.dict.yaml{.bak,}
-# mv ../morankai-chs/moran.moe.dict.yaml{.bak,}
-# mv ../morankai-chs/moran.computer.dict.yaml{.bak,}
-# mv ../morankai-chs/moran.hanyu.dict.yaml{.bak,}
-# mv ../morankai-chs/moran.words.dict.yaml{.bak,}
-# mv ../morankai-chs/moran_fixed.dict.yaml{.bak,}
-# mv ../morankai-chs/moran_fixed_simp.dict.yaml{.bak,}
-# mv ../morankai-chs/zrlf.dict.yaml{.bak,}
-cd ..
-
 # 整理文件結構
 rm -rf ./morankai-cht/tools
 rm -rf ./morankai-cht/make_simp_dist.sh
-mkdir -p ./morankai-cht/ice-dicts/
-mkdir -p ./morankai-chs/ice-dicts/
 # cp -a ./morankai-cht/moran_fixed.dict.yaml ./schema/morankai_fixed.dict.yaml
 # cp -a ./morankai-cht/moran_fixed_simp.dict.yaml ./schema/morankai_fixed_simp.dict.yaml
 cp -a ./schema/default.custom.morankai.yaml ./morankai-cht/default.custom.yaml
@@ -192,37 +45,14 @@ cp -a ./schema/default.custom.morankai.yaml ./morankai-chs/default.custom.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\n//g" ./schema/moran_fixed_simp.dict.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\t.*\n//g" ./schema/moran_fixed_simp.dict.yaml
 
-cd ./tools-additional
-# 生成繁體霧凇
-# python3 gen_dict_with_shape.py -p morankai -x zrmdb -t -i ../rime-ice/cn_dicts/ext.dict.yaml -o ../morankai-cht/ice-dicts/morankai_zrmdb_ext.dict.yaml
-python3 gen_dict_with_shape.py -p morankai -x zrmdb -t -i ../rime-ice/cn_dicts/8105.dict.yaml -o ../morankai-cht/ice-dicts/morankai_zrmdb_8105.dict.yaml
-python3 gen_dict_with_shape.py -p morankai -x zrmdb -t -i ../rime-ice/cn_dicts/41448.dict.yaml -o ../morankai-cht/ice-dicts/morankai_zrmdb_41448.dict.yaml
-python3 gen_dict_with_shape.py -p morankai -x zrmdb -t -i ../rime-ice/cn_dicts/base.dict.yaml -o ../morankai-cht/ice-dicts/morankai_zrmdb_base.dict.yaml
-python3 gen_dict_with_shape.py -p morankai -x zrmdb -t -i ../rime-ice/cn_dicts/ext.dict.yaml -o ../morankai-cht/ice-dicts/morankai_zrmdb_ext.dict.yaml
-python3 gen_dict_with_shape.py -p morankai -x zrmdb -t -i ../rime-ice/cn_dicts/others.dict.yaml  -o ../morankai-cht/ice-dicts/morankai_zrmdb_others.dict.yaml
-python3 gen_dict_with_shape.py -p morankai -x zrmdb -t -i ../rime-ice/cn_dicts/tencent.dict.yaml -o ../morankai-cht/ice-dicts/morankai_zrmdb_tencent.dict.yaml
-# 生成簡體霧凇
-# python3 gen_dict_with_shape.py -p morankai -x zrmdb -s -i ../rime-ice/cn_dicts/ext.dict.yaml -o ../morankai-chs/ice-dicts/morankai_zrmdb_ext.dict.yaml
-python3 gen_dict_with_shape.py -p morankai -x zrmdb -s -i ../rime-ice/cn_dicts/8105.dict.yaml -o ../morankai-chs/ice-dicts/morankai_zrmdb_8105.dict.yaml
-python3 gen_dict_with_shape.py -p morankai -x zrmdb -s -i ../rime-ice/cn_dicts/41448.dict.yaml -o ../morankai-chs/ice-dicts/morankai_zrmdb_41448.dict.yaml
-python3 gen_dict_with_shape.py -p morankai -x zrmdb -s -i ../rime-ice/cn_dicts/base.dict.yaml -o ../morankai-chs/ice-dicts/morankai_zrmdb_base.dict.yaml
-python3 gen_dict_with_shape.py -p morankai -x zrmdb -s -i ../rime-ice/cn_dicts/ext.dict.yaml -o ../morankai-chs/ice-dicts/morankai_zrmdb_ext.dict.yaml
-python3 gen_dict_with_shape.py -p morankai -x zrmdb -s -i ../rime-ice/cn_dicts/others.dict.yaml -o ../morankai-chs/ice-dicts/morankai_zrmdb_others.dict.yaml
-python3 gen_dict_with_shape.py -p morankai -x zrmdb -s -i ../rime-ice/cn_dicts/tencent.dict.yaml -o ../morankai-chs/ice-dicts/morankai_zrmdb_tencent.dict.yaml
-cd ..
-
 # 生成ocz
 cp ./rime-radical-pinyin/radical.schema.yaml ./morankai-chs
 cp ./rime-radical-pinyin/radical.schema.yaml ./morankai-cht
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./morankai-cht
-sed '/\.\.\./q' ./morankai-cht/radical_flypy.dict.yaml > ./morankai-cht/radical_flypy.dict.yaml.bak
-python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o temp.txt -c ./morankai-cht/moran.chars.dict.yaml
-echo "" >> ./morankai-cht/radical_flypy.dict.yaml.bak
-cat temp.txt >> ./morankai-cht/radical_flypy.dict.yaml.bak
-mv ./morankai-cht/radical_flypy.dict.yaml{.bak,}
+python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o ./morankai-cht/temp.txt -c ./morankai-cht/moran.chars.dict.yaml
+python3 ./tools-additional/assemble_dict.py -o ./morankai-cht/radical_flypy.dict.yaml --head ./morankai-cht/radical_flypy.dict.yaml "..." --text "" --file ./morankai-cht/temp.txt
 cp ./morankai-cht/radical_flypy.dict.yaml ./morankai-chs
 
-rm -f temp.txt
 rm -f ./morankai-cht/temp.txt
 rm -f ./morankai-chs/temp.txt
 
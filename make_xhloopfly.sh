@@ -5,173 +5,29 @@ set -x
 
 # BUILD_TYPE="$1"
 
-rm -rf xhloopfly-chs
-rm -rf xhloopfly-cht
+# 複製 rime-moran 並生成詞庫（見 tools-additional/schemes.py）；build.py 為每個方案各自生成詞庫，再以 --no-dicts 執行
+if [ "$1" != "--no-dicts" ]; then
+    cd ./tools-additional
+    python3 make_dicts.py xhloopfly
+    cd ..
+fi
 
 # 生成繁體
-cp -a ./rime-moran-cht/. ./xhloopfly-cht
-
-rm -rf ./xhloopfly-cht/.git
-rm -rf ./xhloopfly-cht/.gitignore
-rm -rf ./xhloopfly-cht/README.md
-rm -rf ./xhloopfly-cht/README-en.md
-rm -rf ./xhloopfly-cht/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./xhloopfly-cht/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./xhloopfly-cht/moran.yaml
 # mv ./xhloopfly-cht/punctuation.yaml ./schema
 
-
 # cp ./rime-moran/tools/data/flypydb.txt ./tools-additional
 # sed -i 's/ /\t/g' ./tools-additional/flypydb.txt
 
 # 生成簡體
-cp -a ./rime-moran-chs/. ./xhloopfly-chs
-
-rm -rf ./xhloopfly-chs/.git
-rm -rf ./xhloopfly-chs/.gitignore
-rm -rf ./xhloopfly-chs/README.md
-rm -rf ./xhloopfly-chs/README-en.md
-rm -rf ./xhloopfly-chs/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./xhloopfly-chs/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./xhloopfly-chs/moran.yaml
 # mv ./xhloopfly-chs/punctuation.yaml ./schema
 
-# 轉換詞庫
-cd ./tools-additional
-# 轉換繁体詞庫
-echo 轉換繁体詞庫...
-sed '/\.\.\./q' ../xhloopfly-cht/moran.chars.dict.yaml > ../xhloopfly-cht/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p xhloopfly -x flypydb -i ../data/zdicdbtonesorted.yaml -o ../xhloopfly-cht/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../xhloopfly-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../xhloopfly-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../xhloopfly-cht/temp.txt
-echo "" >> ../xhloopfly-cht/moran.chars.dict.yaml.bak
-cat ../xhloopfly-cht/temp.txt >> ../xhloopfly-cht/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../xhloopfly-cht/moran.base.dict.yaml > ../xhloopfly-cht/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../xhloopfly-cht/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../xhloopfly-cht/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p xhloopfly -x flypydb -t -i ../xhloopfly-cht/snow_pinyin.base.dict.yaml -o ../xhloopfly-cht/temp.txt
-# echo "" >> ../xhloopfly-cht/moran.base.dict.yaml.bak
-cat ../xhloopfly-cht/temp.txt >> ../xhloopfly-cht/moran.base.dict.yaml.bak
-rm ../xhloopfly-cht/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopfly-cht/moran.tencent.dict.yaml > ../../xhloopfly-cht/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopfly-cht/moran.moe.dict.yaml > ../../xhloopfly-cht/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopfly-cht/moran.computer.dict.yaml > ../../xhloopfly-cht/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopfly-cht/moran.hanyu.dict.yaml > ../../xhloopfly-cht/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopfly-cht/moran.words.dict.yaml > ../../xhloopfly-cht/moran.words.dict.yaml.bak
-python3 convert_sp.py -i ../xhloopfly-cht/zrlf.dict.yaml -o ../xhloopfly-cht/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../xhloopfly-cht/moran_fixed.dict.yaml > ../xhloopfly-cht/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloopfly.simpchars.txt ../xhloopfly-cht/xhloopfly.simpchars.txt && opencc -i ../xhloopfly-cht/xhloopfly.simpchars.txt -o ../xhloopfly-cht/temp.txt -c s2t
-echo "" >> ../xhloopfly-cht/moran_fixed.dict.yaml.bak
-cat ../xhloopfly-cht/temp.txt >> ../xhloopfly-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/xhloop.simpwords.txt -o ../xhloopfly-cht/temp.txt -c s2t
-echo "" >> ../xhloopfly-cht/moran_fixed.dict.yaml.bak && cat ../xhloopfly-cht/temp.txt >> ../xhloopfly-cht/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhloopfly-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhloopfly-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhloopfly-cht/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../xhloopfly-cht/moran_fixed.dict.yaml >> ../xhloopfly-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../xhloopfly-cht/temp.txt -c s2t
-echo "" >> ../xhloopfly-cht/moran_fixed.dict.yaml.bak && cat ../xhloopfly-cht/temp.txt >> ../xhloopfly-cht/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhloopfly-cht/moran_fixed.dict.yaml.bak
-rm ../xhloopfly-cht/xhloopfly.simpchars.txt
-
-sed '/#----------词库----------#/q' ../xhloopfly-cht/moran_fixed_simp.dict.yaml > ../xhloopfly-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloopfly.simpchars.txt ../xhloopfly-cht/xhloopfly.simpchars.txt && cp ../xhloopfly-cht/xhloopfly.simpchars.txt ../xhloopfly-cht/temp.txt
-echo "" >> ../xhloopfly-cht/moran_fixed_simp.dict.yaml.bak
-cat ../xhloopfly-cht/temp.txt >> ../xhloopfly-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloop.simpwords.txt ../xhloopfly-cht/temp.txt
-echo "" >> ../xhloopfly-cht/moran_fixed_simp.dict.yaml.bak && cat ../xhloopfly-cht/temp.txt >> ../xhloopfly-cht/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhloopfly-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhloopfly-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhloopfly-cht/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../xhloopfly-cht/moran_fixed_simp.dict.yaml >> ../xhloopfly-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../xhloopfly-cht/temp.txt
-echo "" >> ../xhloopfly-cht/moran_fixed_simp.dict.yaml.bak && cat ../xhloopfly-cht/temp.txt >> ../xhloopfly-cht/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhloopfly-cht/moran_fixed_simp.dict.yaml.bak
-rm ../xhloopfly-cht/xhloopfly.simpchars.txt
-
-mv ../xhloopfly-cht/moran.chars.dict.yaml{.bak,}
-mv ../xhloopfly-cht/moran.base.dict.yaml{.bak,}
-# mv ../xhloopfly-cht/moran.tencent.dict.yaml{.bak,}
-# mv ../xhloopfly-cht/moran.moe.dict.yaml{.bak,}
-# mv ../xhloopfly-cht/moran.computer.dict.yaml{.bak,}
-# mv ../xhloopfly-cht/moran.hanyu.dict.yaml{.bak,}
-# mv ../xhloopfly-cht/moran.words.dict.yaml{.bak,}
-mv ../xhloopfly-cht/moran_fixed.dict.yaml{.bak,}
-mv ../xhloopfly-cht/moran_fixed_simp.dict.yaml{.bak,}
-mv ../xhloopfly-cht/zrlf.dict.yaml{.bak,}
-
-# 轉換简体詞庫
-echo 轉換简体詞庫...
-sed '/\.\.\./q' ../xhloopfly-chs/moran.chars.dict.yaml > ../xhloopfly-chs/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p xhloopfly -x flypydb -i ../data/zdicdbtonesorted.yaml -o ../xhloopfly-chs/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../xhloopfly-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../xhloopfly-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../xhloopfly-chs/temp.txt
-echo "" >> ../xhloopfly-chs/moran.chars.dict.yaml.bak
-cat ../xhloopfly-chs/temp.txt >> ../xhloopfly-chs/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../xhloopfly-chs/moran.base.dict.yaml > ../xhloopfly-chs/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../xhloopfly-chs/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../xhloopfly-chs/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p xhloopfly -x flypydb -s -i ../xhloopfly-chs/snow_pinyin.base.dict.yaml -o ../xhloopfly-chs/temp.txt
-# echo "" >> ../xhloopfly-chs/moran.base.dict.yaml.bak
-cat ../xhloopfly-chs/temp.txt >> ../xhloopfly-chs/moran.base.dict.yaml.bak
-rm ../xhloopfly-chs/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopfly-chs/moran.tencent.dict.yaml > ../../xhloopfly-chs/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopfly-chs/moran.moe.dict.yaml > ../../xhloopfly-chs/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopfly-chs/moran.computer.dict.yaml > ../../xhloopfly-chs/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopfly-chs/moran.hanyu.dict.yaml > ../../xhloopfly-chs/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopfly-chs/moran.words.dict.yaml > ../../xhloopfly-chs/moran.words.dict.yaml.bak
-python3 convert_sp.py -i ../xhloopfly-chs/zrlf.dict.yaml -o ../xhloopfly-chs/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../xhloopfly-chs/moran_fixed.dict.yaml > ../xhloopfly-chs/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloopfly.simpchars.txt ../xhloopfly-chs/xhloopfly.simpchars.txt && opencc -i ../xhloopfly-chs/xhloopfly.simpchars.txt -o ../xhloopfly-chs/temp.txt -c s2t
-echo "" >> ../xhloopfly-chs/moran_fixed.dict.yaml.bak
-cat ../xhloopfly-chs/temp.txt >> ../xhloopfly-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/xhloop.simpwords.txt -o ../xhloopfly-chs/temp.txt -c s2t
-echo "" >> ../xhloopfly-chs/moran_fixed.dict.yaml.bak && cat ../xhloopfly-chs/temp.txt >> ../xhloopfly-chs/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhloopfly-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhloopfly-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhloopfly-chs/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../xhloopfly-chs/moran_fixed.dict.yaml >> ../xhloopfly-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../xhloopfly-chs/temp.txt -c s2t
-echo "" >> ../xhloopfly-chs/moran_fixed.dict.yaml.bak && cat ../xhloopfly-chs/temp.txt >> ../xhloopfly-chs/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhloopfly-chs/moran_fixed.dict.yaml.bak
-rm ../xhloopfly-chs/xhloopfly.simpchars.txt
-
-sed '/#----------词库----------#/q' ../xhloopfly-chs/moran_fixed_simp.dict.yaml > ../xhloopfly-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloopfly.simpchars.txt ../xhloopfly-chs/xhloopfly.simpchars.txt && cp ../xhloopfly-chs/xhloopfly.simpchars.txt ../xhloopfly-chs/temp.txt
-echo "" >> ../xhloopfly-chs/moran_fixed_simp.dict.yaml.bak
-cat ../xhloopfly-chs/temp.txt >> ../xhloopfly-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloop.simpwords.txt ../xhloopfly-chs/temp.txt
-echo "" >> ../xhloopfly-chs/moran_fixed_simp.dict.yaml.bak && cat ../xhloopfly-chs/temp.txt >> ../xhloopfly-chs/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhloopfly-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhloopfly-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhloopfly-chs/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../xhloopfly-chs/moran_fixed_simp.dict.yaml >> ../xhloopfly-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../xhloopfly-chs/temp.txt
-echo "" >> ../xhloopfly-chs/moran_fixed_simp.dict.yaml.bak && cat ../xhloopfly-chs/temp.txt >> ../xhloopfly-chs/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhloopfly-chs/moran_fixed_simp.dict.yaml.bak
-rm ../xhloopfly-chs/xhloopfly.simpchars.txt
-
-mv ../xhloopfly-chs/moran.chars.dict.yaml{.bak,}
-mv ../xhloopfly-chs/moran.base.dict.yaml{.bak,}
-# mv ../xhloopfly-chs/moran.tencent.dict.yaml{.bak,}
-# mv ../xhloopfly-chs/moran.moe.dict.yaml{.bak,}
-# mv ../xhloopfly-chs/moran.computer.dict.yaml{.bak,}
-# mv ../xhloopfly-chs/moran.hanyu.dict.yaml{.bak,}
-# mv ../xhloopfly-chs/moran.words.dict.yaml{.bak,}
-mv ../xhloopfly-chs/moran_fixed.dict.yaml{.bak,}
-mv ../xhloopfly-chs/moran_fixed_simp.dict.yaml{.bak,}
-mv ../xhloopfly-chs/zrlf.dict.yaml{.bak,}
-cd ..
-
 # 整理文件結構
 rm -rf ./xhloopfly-cht/tools
 rm -rf ./xhloopfly-cht/make_simp_dist.sh
-mkdir -p ./xhloopfly-cht/snow-dicts/
-mkdir -p ./xhloopfly-chs/snow-dicts/
 # cp -a ./xhloopfly-cht/moran_fixed.dict.yaml ./schema/xhloopfly_fixed.dict.yaml
 # cp -a ./xhloopfly-cht/moran_fixed_simp.dict.yaml ./schema/xhloopfly_fixed_simp.dict.yaml
 cp -a ./schema/default.custom.xhloopfly.yaml ./xhloopfly-cht/default.custom.yaml
@@ -192,37 +48,14 @@ cp -a ./schema/default.custom.xhloopfly.yaml ./xhloopfly-chs/default.custom.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\n//g" ./schema/moran_fixed_simp.dict.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\t.*\n//g" ./schema/moran_fixed_simp.dict.yaml
 
-cd ./tools-additional
-# 生成繁體霧凇
-python3 gen_dict_with_shape.py -p xhloopfly -x flypydb -t -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../xhloopfly-cht/snow-dicts/xhloopfly_flypydb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x flypydb -t -o ../xhloopfly-cht/snow-dicts/flypy_flypydb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x flypydb -t -o ../xhloopfly-cht/snow-dicts/flypy_flypydb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x flypydb -t -o ../xhloopfly-cht/snow-dicts/flypy_flypydb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x flypydb -t -o ../xhloopfly-cht/snow-dicts/flypy_flypydb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x flypydb -t -o ../xhloopfly-cht/snow-dicts/flypy_flypydb_others.dict.yaml
-python3 gen_dict_with_shape.py -p xhloopfly -x flypydb -t -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../xhloopfly-cht/snow-dicts/xhloopfly_flypydb_tencent.dict.yaml
-# 生成簡體霧凇
-python3 gen_dict_with_shape.py -p xhloopfly -x flypydb -s -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../xhloopfly-chs/snow-dicts/xhloopfly_flypydb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x flypydb -o ../xhloopfly-chs/snow-dicts/flypy_flypydb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x flypydb -o ../xhloopfly-chs/snow-dicts/flypy_flypydb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x flypydb -o ../xhloopfly-chs/snow-dicts/flypy_flypydb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x flypydb -o ../xhloopfly-chs/snow-dicts/flypy_flypydb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x flypydb -o ../xhloopfly-chs/snow-dicts/flypy_flypydb_others.dict.yaml
-python3 gen_dict_with_shape.py -p xhloopfly -x flypydb -s -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../xhloopfly-chs/snow-dicts/xhloopfly_flypydb_tencent.dict.yaml
-cd ..
-
 # 生成ocz
 cp ./rime-radical-pinyin/radical.schema.yaml ./xhloopfly-chs
 cp ./rime-radical-pinyin/radical.schema.yaml ./xhloopfly-cht
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./xhloopfly-cht
-sed '/\.\.\./q' ./xhloopfly-cht/radical_flypy.dict.yaml > ./xhloopfly-cht/radical_flypy.dict.yaml.bak
-python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o temp.txt -c ./xhloopfly-cht/moran.chars.dict.yaml
-echo "" >> ./xhloopfly-cht/radical_flypy.dict.yaml.bak
-cat temp.txt >> ./xhloopfly-cht/radical_flypy.dict.yaml.bak
-mv ./xhloopfly-cht/radical_flypy.dict.yaml{.bak,}
+python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o ./xhloopfly-cht/temp.txt -c ./xhloopfly-cht/moran.chars.dict.yaml
+python3 ./tools-additional/assemble_dict.py -o ./xhloopfly-cht/radical_flypy.dict.yaml --head ./xhloopfly-cht/radical_flypy.dict.yaml "..." --text "" --file ./xhloopfly-cht/temp.txt
 cp ./xhloopfly-cht/radical_flypy.dict.yaml ./xhloopfly-chs
 
-rm -f temp.txt
 rm -f ./xhloopfly-cht/temp.txt
 rm -f ./xhloopfly-chs/temp.txt
 
@@ -238,7 +71,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/xhloopfly_flypydb_tencent
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml xhloopfly.schema.yaml
@@ -295,7 +127,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/xhloopfly_flypydb_tencent
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml xhloopfly.schema.yaml
@@ -5,173 +5,26 @@ set -x
 
 # BUILD_TYPE="$1"
 
-rm -rf xhloopkai-chs
-rm -rf xhloopkai-cht
+# 複製 rime-moran 並生成詞庫（見 tools-additional/schemes.py）；build.py 為每個方案各自生成詞庫，再以 --no-dicts 執行
+if [ "$1" != "--no-dicts" ]; then
+    cd ./tools-additional
+    python3 make_dicts.py xhloopkai
+    cd ..
+fi
 
 # 生成繁體
-cp -a ./rime-moran-cht/. ./xhloopkai-cht
-
-rm -rf ./xhloopkai-cht/.git
-rm -rf ./xhloopkai-cht/.gitignore
-rm -rf ./xhloopkai-cht/README.md
-rm -rf ./xhloopkai-cht/README-en.md
-rm -rf ./xhloopkai-cht/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./xhloopkai-cht/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./xhloopkai-cht/moran.yaml
 # mv ./xhloopkai-cht/punctuation.yaml ./schema
 
-
-cp ./rime-moran/tools/data/zrmdb.txt ./tools-additional
-sed -i 's/ /\t/g' ./tools-additional/zrmdb.txt
-
 # 生成簡體
-cp -a ./rime-moran-chs/. ./xhloopkai-chs
-
-rm -rf ./xhloopkai-chs/.git
-rm -rf ./xhloopkai-chs/.gitignore
-rm -rf ./xhloopkai-chs/README.md
-rm -rf ./xhloopkai-chs/README-en.md
-rm -rf ./xhloopkai-chs/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./xhloopkai-chs/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./xhloopkai-chs/moran.yaml
 # mv ./xhloopkai-chs/punctuation.yaml ./schema
 
-# 轉換詞庫
-cd ./tools-additional
-# 轉換繁体詞庫
-echo 轉換繁体詞庫...
-sed '/\.\.\./q' ../xhloopkai-cht/moran.chars.dict.yaml > ../xhloopkai-cht/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p xhloopkai -x zrmdb -m -i ../data/zdicdbtonesorted.yaml -o ../xhloopkai-cht/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../xhloopkai-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../xhloopkai-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../xhloopkai-cht/temp.txt
-echo "" >> ../xhloopkai-cht/moran.chars.dict.yaml.bak
-cat ../xhloopkai-cht/temp.txt >> ../xhloopkai-cht/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../xhloopkai-cht/moran.base.dict.yaml > ../xhloopkai-cht/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../xhloopkai-cht/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../xhloopkai-cht/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p xhloopkai -x zrmdb -t -i ../xhloopkai-cht/snow_pinyin.base.dict.yaml -o ../xhloopkai-cht/temp.txt
-# echo "" >> ../xhloopkai-cht/moran.base.dict.yaml.bak
-cat ../xhloopkai-cht/temp.txt >> ../xhloopkai-cht/moran.base.dict.yaml.bak
-rm ../xhloopkai-cht/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopkai-cht/moran.tencent.dict.yaml > ../../xhloopkai-cht/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopkai-cht/moran.moe.dict.yaml > ../../xhloopkai-cht/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopkai-cht/moran.computer.dict.yaml > ../../xhloopkai-cht/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopkai-cht/moran.hanyu.dict.yaml > ../../xhloopkai-cht/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopkai-cht/moran.words.dict.yaml > ../../xhloopkai-cht/moran.words.dict.yaml.bak
-python3 convert_sp.py -i ../xhloopkai-cht/zrlf.dict.yaml -o ../xhloopkai-cht/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../xhloopkai-cht/moran_fixed.dict.yaml > ../xhloopkai-cht/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloopkai.simpchars.txt ../xhloopkai-cht/xhloopkai.simpchars.txt && opencc -i ../xhloopkai-cht/xhloopkai.simpchars.txt -o ../xhloopkai-cht/temp.txt -c s2t
-echo "" >> ../xhloopkai-cht/moran_fixed.dict.yaml.bak
-cat ../xhloopkai-cht/temp.txt >> ../xhloopkai-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/xhloop.simpwords.txt -o ../xhloopkai-cht/temp.txt -c s2t
-echo "" >> ../xhloopkai-cht/moran_fixed.dict.yaml.bak && cat ../xhloopkai-cht/temp.txt >> ../xhloopkai-cht/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhloopkai-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhloopkai-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhloopkai-cht/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../xhloopkai-cht/moran_fixed.dict.yaml >> ../xhloopkai-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../xhloopkai-cht/temp.txt -c s2t
-echo "" >> ../xhloopkai-cht/moran_fixed.dict.yaml.bak && cat ../xhloopkai-cht/temp.txt >> ../xhloopkai-cht/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhloopkai-cht/moran_fixed.dict.yaml.bak
-rm ../xhloopkai-cht/xhloopkai.simpchars.txt
-
-sed '/#----------词库----------#/q' ../xhloopkai-cht/moran_fixed_simp.dict.yaml > ../xhloopkai-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloopkai.simpchars.txt ../xhloopkai-cht/xhloopkai.simpchars.txt && cp ../xhloopkai-cht/xhloopkai.simpchars.txt ../xhloopkai-cht/temp.txt
-echo "" >> ../xhloopkai-cht/moran_fixed_simp.dict.yaml.bak
-cat ../xhloopkai-cht/temp.txt >> ../xhloopkai-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloop.simpwords.txt ../xhloopkai-cht/temp.txt
-echo "" >> ../xhloopkai-cht/moran_fixed_simp.dict.yaml.bak && cat ../xhloopkai-cht/temp.txt >> ../xhloopkai-cht/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhloopkai-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhloopkai-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhloopkai-cht/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../xhloopkai-cht/moran_fixed_simp.dict.yaml >> ../xhloopkai-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../xhloopkai-cht/temp.txt
-echo "" >> ../xhloopkai-cht/moran_fixed_simp.dict.yaml.bak && cat ../xhloopkai-cht/temp.txt >> ../xhloopkai-cht/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhloopkai-cht/moran_fixed_simp.dict.yaml.bak
-rm ../xhloopkai-cht/xhloopkai.simpchars.txt
-
-mv ../xhloopkai-cht/moran.chars.dict.yaml{.bak,}
-mv ../xhloopkai-cht/moran.base.dict.yaml{.bak,}
-# mv ../xhloopkai-cht/moran.tencent.dict.yaml{.bak,}
-# mv ../xhloopkai-cht/moran.moe.dict.yaml{.bak,}
-# mv ../xhloopkai-cht/moran.computer.dict.yaml{.bak,}
-# mv ../xhloopkai-cht/moran.hanyu.dict.yaml{.bak,}
-# mv ../xhloopkai-cht/moran.words.dict.yaml{.bak,}
-mv ../xhloopkai-cht/moran_fixed.dict.yaml{.bak,}
-mv ../xhloopkai-cht/moran_fixed_simp.dict.yaml{.bak,}
-mv ../xhloopkai-cht/zrlf.dict.yaml{.bak,}
-
-# 轉換简体詞庫
-echo 轉換简体詞庫...
-sed '/\.\.\./q' ../xhloopkai-chs/moran.chars.dict.yaml > ../xhloopkai-chs/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p xhloopkai -x zrmdb -m -i ../data/zdicdbtonesorted.yaml -o ../xhloopkai-chs/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../xhloopkai-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../xhloopkai-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../xhloopkai-chs/temp.txt
-echo "" >> ../xhloopkai-chs/moran.chars.dict.yaml.bak
-cat ../xhloopkai-chs/temp.txt >> ../xhloopkai-chs/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../xhloopkai-chs/moran.base.dict.yaml > ../xhloopkai-chs/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../xhloopkai-chs/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../xhloopkai-chs/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p xhloopkai -x zrmdb -s -i ../xhloopkai-chs/snow_pinyin.base.dict.yaml -o ../xhloopkai-chs/temp.txt
-# echo "" >> ../xhloopkai-chs/moran.base.dict.yaml.bak
-cat ../xhloopkai-chs/temp.txt >> ../xhloopkai-chs/moran.base.dict.yaml.bak
-rm ../xhloopkai-chs/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopkai-chs/moran.tencent.dict.yaml > ../../xhloopkai-chs/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopkai-chs/moran.moe.dict.yaml > ../../xhloopkai-chs/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopkai-chs/moran.computer.dict.yaml > ../../xhloopkai-chs/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopkai-chs/moran.hanyu.dict.yaml > ../../xhloopkai-chs/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopkai-chs/moran.words.dict.yaml > ../../xhloopkai-chs/moran.words.dict.yaml.bak
-python3 convert_sp.py -i ../xhloopkai-chs/zrlf.dict.yaml -o ../xhloopkai-chs/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../xhloopkai-chs/moran_fixed.dict.yaml > ../xhloopkai-chs/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloopkai.simpchars.txt ../xhloopkai-chs/xhloopkai.simpchars.txt && opencc -i ../xhloopkai-chs/xhloopkai.simpchars.txt -o ../xhloopkai-chs/temp.txt -c s2t
-echo "" >> ../xhloopkai-chs/moran_fixed.dict.yaml.bak
-cat ../xhloopkai-chs/temp.txt >> ../xhloopkai-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/xhloop.simpwords.txt -o ../xhloopkai-chs/temp.txt -c s2t
-echo "" >> ../xhloopkai-chs/moran_fixed.dict.yaml.bak && cat ../xhloopkai-chs/temp.txt >> ../xhloopkai-chs/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhloopkai-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhloopkai-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhloopkai-chs/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../xhloopkai-chs/moran_fixed.dict.yaml >> ../xhloopkai-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../xhloopkai-chs/temp.txt -c s2t
-echo "" >> ../xhloopkai-chs/moran_fixed.dict.yaml.bak && cat ../xhloopkai-chs/temp.txt >> ../xhloopkai-chs/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhloopkai-chs/moran_fixed.dict.yaml.bak
-rm ../xhloopkai-chs/xhloopkai.simpchars.txt
-
-sed '/#----------词库----------#/q' ../xhloopkai-chs/moran_fixed_simp.dict.yaml > ../xhloopkai-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloopkai.simpchars.txt ../xhloopkai-chs/xhloopkai.simpchars.txt && cp ../xhloopkai-chs/xhloopkai.simpchars.txt ../xhloopkai-chs/temp.txt
-echo "" >> ../xhloopkai-chs/moran_fixed_simp.dict.yaml.bak
-cat ../xhloopkai-chs/temp.txt >> ../xhloopkai-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloop.simpwords.txt ../xhloopkai-chs/temp.txt
-echo "" >> ../xhloopkai-chs/moran_fixed_simp.dict.yaml.bak && cat ../xhloopkai-chs/temp.txt >> ../xhloopkai-chs/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhloopkai-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhloopkai-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhloopkai-chs/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../xhloopkai-chs/moran_fixed_simp.dict.yaml >> ../xhloopkai-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../xhloopkai-chs/temp.txt
-echo "" >> ../xhloopkai-chs/moran_fixed_simp.dict.yaml.bak && cat ../xhloopkai-chs/temp.txt >> ../xhloopkai-chs/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhloopkai-chs/moran_fixed_simp.dict.yaml.bak
-rm ../xhloopkai-chs/xhloopkai.simpchars.txt
-
-mv ../xhloopkai-chs/moran.chars.dict.yaml{.bak,}
-mv ../xhloopkai-chs/moran.base.dict.yaml{.bak,}
-# mv ../xhloopkai-chs/moran.tencent.dict.yaml{.bak,}
-# mv ../xhloopkai-chs/moran.moe.dict.yaml{.bak,}
-# mv ../xhloopkai-chs/moran.computer.dict.yaml{.bak,}
-# mv ../xhloopkai-chs/moran.hanyu.dict.yaml{.bak,}
-# mv ../xhloopkai-chs/moran.words.dict.yaml{.bak,}
-mv ../xhloopkai-chs/moran_fixed.dict.yaml{.bak,}
-mv ../xhloopkai-chs/moran_fixed_simp.dict.yaml{.bak,}
-mv ../xhloopkai-chs/zrlf.dict.yaml{.bak,}
-cd ..
-
 # 整理文件結構
 rm -rf ./xhloopkai-cht/tools
 rm -rf ./xhloopkai-cht/make_simp_dist.sh
-mkdir -p ./xhloopkai-cht/snow-dicts/
-mkdir -p ./xhloopkai-chs/snow-dicts/
 # cp -a ./xhloopkai-cht/moran_fixed.dict.yaml ./schema/xhloopkai_fixed.dict.yaml
 # cp -a ./xhloopkai-cht/moran_fixed_simp.dict.yaml ./schema/xhloopkai_fixed_simp.dict.yaml
 cp -a ./schema/default.custom.xhloopkai.yaml ./xhloopkai-cht/default.custom.yaml
@@ -192,37 +45,14 @@ cp -a ./schema/default.custom.xhloopkai.yaml ./xhloopkai-chs/default.custom.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\n//g" ./schema/moran_fixed_simp.dict.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\t.*\n//g" ./schema/moran_fixed_simp.dict.yaml
 
-cd ./tools-additional
-# 生成繁體霧凇
-python3 gen_dict_with_shape.py -p xhloopkai -x zrmdb -t -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../xhloopkai-cht/snow-dicts/xhloopkai_zrmdb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x zrmdb -t -o ../xhloopkai-cht/snow-dicts/flypy_zrmdb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x zrmdb -t -o ../xhloopkai-cht/snow-dicts/flypy_zrmdb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x zrmdb -t -o ../xhloopkai-cht/snow-dicts/flypy_zrmdb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x zrmdb -t -o ../xhloopkai-cht/snow-dicts/flypy_zrmdb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x zrmdb -t -o ../xhloopkai-cht/snow-dicts/flypy_zrmdb_others.dict.yaml
-python3 gen_dict_with_shape.py -p xhloopkai -x zrmdb -t -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../xhloopkai-cht/snow-dicts/xhloopkai_zrmdb_tencent.dict.yaml
-# 生成簡體霧凇
-python3 gen_dict_with_shape.py -p xhloopkai -x zrmdb -s -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../xhloopkai-chs/snow-dicts/xhloopkai_zrmdb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x zrmdb -o ../xhloopkai-chs/snow-dicts/flypy_zrmdb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x zrmdb -o ../xhloopkai-chs/snow-dicts/flypy_zrmdb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x zrmdb -o ../xhloopkai-chs/snow-dicts/flypy_zrmdb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x zrmdb -o ../xhloopkai-chs/snow-dicts/flypy_zrmdb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x zrmdb -o ../xhloopkai-chs/snow-dicts/flypy_zrmdb_others.dict.yaml
-python3 gen_dict_with_shape.py -p xhloopkai -x zrmdb -s -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../xhloopkai-chs/snow-dicts/xhloopkai_zrmdb_tencent.dict.yaml
-cd ..
-
 # 生成ocz
 cp ./rime-radical-pinyin/radical.schema.yaml ./xhloopkai-chs
 cp ./rime-radical-pinyin/radical.schema.yaml ./xhloopkai-cht
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./xhloopkai-cht
-sed '/\.\.\./q' ./xhloopkai-cht/radical_flypy.dict.yaml > ./xhloopkai-cht/radical_flypy.dict.yaml.bak
-python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o temp.txt -c ./xhloopkai-cht/moran.chars.dict.yaml
-echo "" >> ./xhloopkai-cht/radical_flypy.dict.yaml.bak
-cat temp.txt >> ./xhloopkai-cht/radical_flypy.dict.yaml.bak
-mv ./xhloopkai-cht/radical_flypy.dict.yaml{.bak,}
+python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o ./xhloopkai-cht/temp.txt -c ./xhloopkai-cht/moran.chars.dict.yaml
+python3 ./tools-additional/assemble_dict.py -o ./xhloopkai-cht/radical_flypy.dict.yaml --head ./xhloopkai-cht/radical_flypy.dict.yaml "..." --text "" --file ./xhloopkai-cht/temp.txt
 cp ./xhloopkai-cht/radical_flypy.dict.yaml ./xhloopkai-chs
 
-rm -f temp.txt
 rm -f ./xhloopkai-cht/temp.txt
 rm -f ./xhloopkai-chs/temp.txt
 
@@ -238,7 +68,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/xhloopkai_zrmdb_tencent      #
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml xhloopkai.schema.yaml
@@ -295,7 +124,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/xhloopkai_zrmdb_tencent      #
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml xhloopkai.schema.yaml
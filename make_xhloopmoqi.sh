@@ -5,177 +5,30 @@ set -x
 
 # BUILD_TYPE="$1"
 
-rm -rf xhloopmoqi-chs
-rm -rf xhloopmoqi-cht
+# 複製 rime-moran 並生成詞庫（見 tools-additional/schemes.py）；build.py 為每個方案各自生成詞庫，再以 --no-dicts 執行
+if [ "$1" != "--no-dicts" ]; then
+    cd ./tools-additional
+    python3 make_dicts.py xhloopmoqi
+    cd ..
+fi
 
 # 生成繁體
-cp -a ./rime-moran-cht/. ./xhloopmoqi-cht
-
-rm -rf ./xhloopmoqi-cht/.git
-rm -rf ./xhloopmoqi-cht/.gitignore
-rm -rf ./xhloopmoqi-cht/README.md
-rm -rf ./xhloopmoqi-cht/README-en.md
-rm -rf ./xhloopmoqi-cht/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./xhloopmoqi-cht/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./xhloopmoqi-cht/moran.yaml
 # mv ./xhloopmoqi-cht/punctuation.yaml ./schema
 cp ./rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt ./xhloopmoqi-cht/opencc/moran_chaifen.txt
 sed -i -E 's/^(\S+)\t(\S+)\t(.+)$/\1\t〔\3\2〕/' ./xhloopmoqi-cht/opencc/moran_chaifen.txt
-cp ./rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt ./tools-additional/moqidb.txt # && sed -i '0,/\.\.\./d' ./tools-additional/moqidb.txt
-perl -CSAD -i -pe 's/(.*\t[a-z]{2})\t.*/$1/' ./tools-additional/moqidb.txt
 
 # 生成簡體
-cp -a ./rime-moran-chs/. ./xhloopmoqi-chs
-
-rm -rf ./xhloopmoqi-chs/.git
-rm -rf ./xhloopmoqi-chs/.gitignore
-rm -rf ./xhloopmoqi-chs/README.md
-rm -rf ./xhloopmoqi-chs/README-en.md
-rm -rf ./xhloopmoqi-chs/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./xhloopmoqi-chs/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./xhloopmoqi-chs/moran.yaml
 # mv ./xhloopmoqi-chs/punctuation.yaml ./schema
 cp ./rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt ./xhloopmoqi-chs/opencc/moran_chaifen.txt
 sed -i -E 's/^(\S+)\t(\S+)\t(.+)$/\1\t〔\3\2〕/' ./xhloopmoqi-chs/opencc/moran_chaifen.txt
-cp ./rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt ./tools-additional/moqidb.txt # && sed -i '0,/\.\.\./d' ./tools-additional/moqidb.txt
-perl -CSAD -i -pe 's/(.*\t[a-z]{2})\t.*/$1/' ./tools-additional/moqidb.txt
-
-# 轉換詞庫
-cd ./tools-additional
-# 轉換繁体詞庫
-echo 轉換繁体詞庫...
-sed '/\.\.\./q' ../xhloopmoqi-cht/moran.chars.dict.yaml > ../xhloopmoqi-cht/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p xhloopmoqi -x moqidb -i ../data/zdicdbtonesorted.yaml -o ../xhloopmoqi-cht/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../xhloopmoqi-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../xhloopmoqi-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../xhloopmoqi-cht/temp.txt
-echo "" >> ../xhloopmoqi-cht/moran.chars.dict.yaml.bak
-cat ../xhloopmoqi-cht/temp.txt >> ../xhloopmoqi-cht/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../xhloopmoqi-cht/moran.base.dict.yaml > ../xhloopmoqi-cht/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../xhloopmoqi-cht/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../xhloopmoqi-cht/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p xhloopmoqi -x moqidb -t -i ../xhloopmoqi-cht/snow_pinyin.base.dict.yaml -o ../xhloopmoqi-cht/temp.txt
-# echo "" >> ../xhloopmoqi-cht/moran.base.dict.yaml.bak
-cat ../xhloopmoqi-cht/temp.txt >> ../xhloopmoqi-cht/moran.base.dict.yaml.bak
-rm ../xhloopmoqi-cht/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopmoqi-cht/moran.tencent.dict.yaml > ../../xhloopmoqi-cht/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopmoqi-cht/moran.moe.dict.yaml > ../../xhloopmoqi-cht/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopmoqi-cht/moran.computer.dict.yaml > ../../xhloopmoqi-cht/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopmoqi-cht/moran.hanyu.dict.yaml > ../../xhloopmoqi-cht/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopmoqi-cht/moran.words.dict.yaml > ../../xhloopmoqi-cht/moran.words.dict.yaml.bak
-python3 convert_sp.py -i ../xhloopmoqi-cht/zrlf.dict.yaml -o ../xhloopmoqi-cht/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../xhloopmoqi-cht/moran_fixed.dict.yaml > ../xhloopmoqi-cht/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloopmoqi.simpchars.txt ../xhloopmoqi-cht/xhloopmoqi.simpchars.txt && opencc -i ../xhloopmoqi-cht/xhloopmoqi.simpchars.txt -o ../xhloopmoqi-cht/temp.txt -c s2t
-echo "" >> ../xhloopmoqi-cht/moran_fixed.dict.yaml.bak
-cat ../xhloopmoqi-cht/temp.txt >> ../xhloopmoqi-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/xhloop.simpwords.txt -o ../xhloopmoqi-cht/temp.txt -c s2t
-echo "" >> ../xhloopmoqi-cht/moran_fixed.dict.yaml.bak && cat ../xhloopmoqi-cht/temp.txt >> ../xhloopmoqi-cht/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhloopmoqi-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhloopmoqi-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhloopmoqi-cht/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../xhloopmoqi-cht/moran_fixed.dict.yaml >> ../xhloopmoqi-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../xhloopmoqi-cht/temp.txt -c s2t
-echo "" >> ../xhloopmoqi-cht/moran_fixed.dict.yaml.bak && cat ../xhloopmoqi-cht/temp.txt >> ../xhloopmoqi-cht/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhloopmoqi-cht/moran_fixed.dict.yaml.bak
-rm ../xhloopmoqi-cht/xhloopmoqi.simpchars.txt
-
-sed '/#----------词库----------#/q' ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml > ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloopmoqi.simpchars.txt ../xhloopmoqi-cht/xhloopmoqi.simpchars.txt && cp ../xhloopmoqi-cht/xhloopmoqi.simpchars.txt ../xhloopmoqi-cht/temp.txt
-echo "" >> ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml.bak
-cat ../xhloopmoqi-cht/temp.txt >> ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloop.simpwords.txt ../xhloopmoqi-cht/temp.txt
-echo "" >> ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml.bak && cat ../xhloopmoqi-cht/temp.txt >> ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml >> ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../xhloopmoqi-cht/temp.txt
-echo "" >> ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml.bak && cat ../xhloopmoqi-cht/temp.txt >> ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml.bak
-rm ../xhloopmoqi-cht/xhloopmoqi.simpchars.txt
-
-mv ../xhloopmoqi-cht/moran.chars.dict.yaml{.bak,}
-mv ../xhloopmoqi-cht/moran.base.dict.yaml{.bak,}
-# mv ../xhloopmoqi-cht/moran.tencent.dict.yaml{.bak,}
-# mv ../xhloopmoqi-cht/moran.moe.dict.yaml{.bak,}
-# mv ../xhloopmoqi-cht/moran.computer.dict.yaml{.bak,}
-# mv ../xhloopmoqi-cht/moran.hanyu.dict.yaml{.bak,}
-# mv ../xhloopmoqi-cht/moran.words.dict.yaml{.bak,}
-mv ../xhloopmoqi-cht/moran_fixed.dict.yaml{.bak,}
-mv ../xhloopmoqi-cht/moran_fixed_simp.dict.yaml{.bak,}
-mv ../xhloopmoqi-cht/zrlf.dict.yaml{.bak,}
-
-# 轉換简体詞庫
-echo 轉換简体詞庫...
-sed '/\.\.\./q' ../xhloopmoqi-chs/moran.chars.dict.yaml > ../xhloopmoqi-chs/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p xhloopmoqi -x moqidb -i ../data/zdicdbtonesorted.yaml -o ../xhloopmoqi-chs/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../xhloopmoqi-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../xhloopmoqi-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../xhloopmoqi-chs/temp.txt
-echo "" >> ../xhloopmoqi-chs/moran.chars.dict.yaml.bak
-cat ../xhloopmoqi-chs/temp.txt >> ../xhloopmoqi-chs/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../xhloopmoqi-chs/moran.base.dict.yaml > ../xhloopmoqi-chs/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../xhloopmoqi-chs/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../xhloopmoqi-chs/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p xhloopmoqi -x moqidb -s -i ../xhloopmoqi-chs/snow_pinyin.base.dict.yaml -o ../xhloopmoqi-chs/temp.txt
-# echo "" >> ../xhloopmoqi-chs/moran.base.dict.yaml.bak
-cat ../xhloopmoqi-chs/temp.txt >> ../xhloopmoqi-chs/moran.base.dict.yaml.bak
-rm ../xhloopmoqi-chs/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopmoqi-chs/moran.tencent.dict.yaml > ../../xhloopmoqi-chs/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopmoqi-chs/moran.moe.dict.yaml > ../../xhloopmoqi-chs/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopmoqi-chs/moran.computer.dict.yaml > ../../xhloopmoqi-chs/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopmoqi-chs/moran.hanyu.dict.yaml > ../../xhloopmoqi-chs/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhloopmoqi-chs/moran.words.dict.yaml > ../../xhloopmoqi-chs/moran.words.dict.yaml.bak
-python3 convert_sp.py -i ../xhloopmoqi-chs/zrlf.dict.yaml -o ../xhloopmoqi-chs/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../xhloopmoqi-chs/moran_fixed.dict.yaml > ../xhloopmoqi-chs/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloopmoqi.simpchars.txt ../xhloopmoqi-chs/xhloopmoqi.simpchars.txt && opencc -i ../xhloopmoqi-chs/xhloopmoqi.simpchars.txt -o ../xhloopmoqi-chs/temp.txt -c s2t
-echo "" >> ../xhloopmoqi-chs/moran_fixed.dict.yaml.bak
-cat ../xhloopmoqi-chs/temp.txt >> ../xhloopmoqi-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/xhloop.simpwords.txt -o ../xhloopmoqi-chs/temp.txt -c s2t
-echo "" >> ../xhloopmoqi-chs/moran_fixed.dict.yaml.bak && cat ../xhloopmoqi-chs/temp.txt >> ../xhloopmoqi-chs/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhloopmoqi-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhloopmoqi-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhloopmoqi-chs/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../xhloopmoqi-chs/moran_fixed.dict.yaml >> ../xhloopmoqi-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../xhloopmoqi-chs/temp.txt -c s2t
-echo "" >> ../xhloopmoqi-chs/moran_fixed.dict.yaml.bak && cat ../xhloopmoqi-chs/temp.txt >> ../xhloopmoqi-chs/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhloopmoqi-chs/moran_fixed.dict.yaml.bak
-rm ../xhloopmoqi-chs/xhloopmoqi.simpchars.txt
-
-sed '/#----------词库----------#/q' ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml > ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloopmoqi.simpchars.txt ../xhloopmoqi-chs/xhloopmoqi.simpchars.txt && cp ../xhloopmoqi-chs/xhloopmoqi.simpchars.txt ../xhloopmoqi-chs/temp.txt
-echo "" >> ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml.bak
-cat ../xhloopmoqi-chs/temp.txt >> ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhloop.simpwords.txt ../xhloopmoqi-chs/temp.txt
-echo "" >> ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml.bak && cat ../xhloopmoqi-chs/temp.txt >> ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml >> ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../xhloopmoqi-chs/temp.txt
-echo "" >> ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml.bak && cat ../xhloopmoqi-chs/temp.txt >> ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml.bak
-rm ../xhloopmoqi-chs/xhloopmoqi.simpchars.txt
-
-mv ../xhloopmoqi-chs/moran.chars.dict.yaml{.bak,}
-mv ../xhloopmoqi-chs/moran.base.dict.yaml{.bak,}
-# mv ../xhloopmoqi-chs/moran.tencent.dict.yaml{.bak,}
-# mv ../xhloopmoqi-chs/moran.moe.dict.yaml{.bak,}
-# mv ../xhloopmoqi-chs/moran.computer.dict.yaml{.bak,}
-# mv ../xhloopmoqi-chs/moran.hanyu.dict.yaml{.bak,}
-# mv ../xhloopmoqi-chs/moran.words.dict.yaml{.bak,}
-mv ../xhloopmoqi-chs/moran_fixed.dict.yaml{.bak,}
-mv ../xhloopmoqi-chs/moran_fixed_simp.dict.yaml{.bak,}
-mv ../xhloopmoqi-chs/zrlf.dict.yaml{.bak,}
-cd ..
 
 # 整理文件結構
 rm -rf ./xhloopmoqi-cht/tools
 rm -rf ./xhloopmoqi-cht/make_simp_dist.sh
-mkdir -p ./xhloopmoqi-cht/snow-dicts/
-mkdir -p ./xhloopmoqi-chs/snow-dicts/
 # cp -a ./xhloopmoqi-cht/moran_fixed.dict.yaml ./schema/xhloopmoqi_fixed.dict.yaml
 # cp -a ./xhloopmoqi-cht/moran_fixed_simp.dict.yaml ./schema/xhloopmoqi_fixed_simp.dict.yaml
 cp -a ./schema/default.custom.xhloopmoqi.yaml ./xhloopmoqi-cht/default.custom.yaml
@@ -196,37 +49,14 @@ cp -a ./schema/default.custom.xhloopmoqi.yaml ./xhloopmoqi-chs/default.custom.ya
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\n//g" ./schema/moran_fixed_simp.dict.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\t.*\n//g" ./schema/moran_fixed_simp.dict.yaml
 
-cd ./tools-additional
-# 生成繁體霧凇
-python3 gen_dict_with_shape.py -p xhloopmoqi -x moqidb -t -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../xhloopmoqi-cht/snow-dicts/xhloopmoqi_moqidb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x moqidb -t -o ../xhloopmoqi-cht/snow-dicts/flypy_moqidb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x moqidb -t -o ../xhloopmoqi-cht/snow-dicts/flypy_moqidb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x moqidb -t -o ../xhloopmoqi-cht/snow-dicts/flypy_moqidb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x moqidb -t -o ../xhloopmoqi-cht/snow-dicts/flypy_moqidb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x moqidb -t -o ../xhloopmoqi-cht/snow-dicts/flypy_moqidb_others.dict.yaml
-python3 gen_dict_with_shape.py -p xhloopmoqi -x moqidb -t -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../xhloopmoqi-cht/snow-dicts/xhloopmoqi_moqidb_tencent.dict.yaml
-# 生成簡體霧凇
-python3 gen_dict_with_shape.py -p xhloopmoqi -x moqidb -s -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../xhloopmoqi-chs/snow-dicts/xhloopmoqi_moqidb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x moqidb -o ../xhloopmoqi-chs/snow-dicts/flypy_moqidb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x moqidb -o ../xhloopmoqi-chs/snow-dicts/flypy_moqidb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x moqidb -o ../xhloopmoqi-chs/snow-dicts/flypy_moqidb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x moqidb -o ../xhloopmoqi-chs/snow-dicts/flypy_moqidb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x moqidb -o ../xhloopmoqi-chs/snow-dicts/flypy_moqidb_others.dict.yaml
-python3 gen_dict_with_shape.py -p xhloopmoqi -x moqidb -s -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../xhloopmoqi-chs/snow-dicts/xhloopmoqi_moqidb_tencent.dict.yaml
-cd ..
-
 # 生成ocz
 cp ./rime-radical-pinyin/radical.schema.yaml ./xhloopmoqi-chs
 cp ./rime-radical-pinyin/radical.schema.yaml ./xhloopmoqi-cht
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./xhloopmoqi-cht
-sed '/\.\.\./q' ./xhloopmoqi-cht/radical_flypy.dict.yaml > ./xhloopmoqi-cht/radical_flypy.dict.yaml.bak
-python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o temp.txt -c ./xhloopmoqi-cht/moran.chars.dict.yaml
-echo "" >> ./xhloopmoqi-cht/radical_flypy.dict.yaml.bak
-cat temp.txt >> ./xhloopmoqi-cht/radical_flypy.dict.yaml.bak
-mv ./xhloopmoqi-cht/radical_flypy.dict.yaml{.bak,}
+python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o ./xhloopmoqi-cht/temp.txt -c ./xhloopmoqi-cht/moran.chars.dict.yaml
+python3 ./tools-additional/assemble_dict.py -o ./xhloopmoqi-cht/radical_flypy.dict.yaml --head ./xhloopmoqi-cht/radical_flypy.dict.yaml "..." --text "" --file ./xhloopmoqi-cht/temp.txt
 cp ./xhloopmoqi-cht/radical_flypy.dict.yaml ./xhloopmoqi-chs
 
-rm -f temp.txt
 rm -f ./xhloopmoqi-cht/temp.txt
 rm -f ./xhloopmoqi-chs/temp.txt
 
@@ -242,7 +72,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/xhloopmoqi_moqidb_tencent
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml xhloopmoqi.schema.yaml
@@ -299,7 +128,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/xhloopmoqi_moqidb_tencent
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml xhloopmoqi.schema.yaml
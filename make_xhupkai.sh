@@ -5,173 +5,26 @@ set -x
 
 # BUILD_TYPE="$1"
 
-rm -rf xhupkai-chs
-rm -rf xhupkai-cht
+# 複製 rime-moran 並生成詞庫（見 tools-additional/schemes.py）；build.py 為每個方案各自生成詞庫，再以 --no-dicts 執行
+if [ "$1" != "--no-dicts" ]; then
+    cd ./tools-additional
+    python3 make_dicts.py xhupkai
+    cd ..
+fi
 
 # 生成繁體
-cp -a ./rime-moran-cht/. ./xhupkai-cht
-
-rm -rf ./xhupkai-cht/.git
-rm -rf ./xhupkai-cht/.gitignore
-rm -rf ./xhupkai-cht/README.md
-rm -rf ./xhupkai-cht/README-en.md
-rm -rf ./xhupkai-cht/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./xhupkai-cht/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./xhupkai-cht/moran.yaml
 # mv ./xhupkai-cht/punctuation.yaml ./schema
 
-
-cp ./rime-moran/tools/data/zrmdb.txt ./tools-additional
-sed -i 's/ /\t/g' ./tools-additional/zrmdb.txt
-
 # 生成簡體
-cp -a ./rime-moran-chs/. ./xhupkai-chs
-
-rm -rf ./xhupkai-chs/.git
-rm -rf ./xhupkai-chs/.gitignore
-rm -rf ./xhupkai-chs/README.md
-rm -rf ./xhupkai-chs/README-en.md
-rm -rf ./xhupkai-chs/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./xhupkai-chs/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./xhupkai-chs/moran.yaml
 # mv ./xhupkai-chs/punctuation.yaml ./schema
 
-# 轉換詞庫
-cd ./tools-additional
-# 轉換繁体詞庫
-echo 轉換繁体詞庫...
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-cht/moran.chars.dict.yaml > ../xhupkai-cht/moran.chars.dict.yaml.bak
-# python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -i ../rime-ice/cn_dicts/8105.dict.yaml -o ../xhupkai-cht/temp.txt
-# perl -CSAD -i -pe "s/.\t[a-z]{2};;(\t[0-9]+)?\n//g" ../xhupkai-cht/temp.txt && sed -i '0,/\.\.\./d' ../xhupkai-cht/temp.txt
-# echo "" >> ../xhupkai-cht/moran.chars.dict.yaml.bak && cat ../xhupkai-cht/temp.txt >> ../xhupkai-cht/moran.chars.dict.yaml.bak
-# python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -i ../rime-ice/cn_dicts/41448.dict.yaml -o ../xhupkai-cht/temp.txt
-# perl -CSAD -i -pe "s/.\t[a-z]{2};;(\t[0-9]+)?\n//g" ../xhupkai-cht/temp.txt && sed -i '0,/\.\.\./d' ../xhupkai-cht/temp.txt
-# echo "" >> ../xhupkai-cht/moran.chars.dict.yaml.bak && cat ../xhupkai-cht/temp.txt >> ../xhupkai-cht/moran.chars.dict.yaml.bak
-
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-cht/moran.base.dict.yaml > ../xhupkai-cht/moran.base.dict.yaml.bak
-# cp ../rime-ice/cn_dicts/base.dict.yaml ../xhupkai-cht/ice.base.dict.yaml
-# sed -i '0,/\.\.\./d' ../xhupkai-cht/ice.base.dict.yaml
-# python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -t -i ../xhupkai-cht/ice.base.dict.yaml -o ../xhupkai-cht/temp.txt
-# echo "" >> ../xhupkai-cht/moran.base.dict.yaml.bak
-# cat ../xhupkai-cht/temp.txt >> ../xhupkai-cht/moran.base.dict.yaml.bak
-# rm ../xhupkai-cht/ice.base.dict.yaml
-
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-cht/moran.tencent.dict.yaml > ../xhupkai-cht/moran.tencent.dict.yaml.bak
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-cht/moran.moe.dict.yaml > ../xhupkai-cht/moran.moe.dict.yaml.bak
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-cht/moran.computer.dict.yaml > ../xhupkai-cht/moran.computer.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-cht/moran.hanyu.dict.yaml > ../xhupkai-cht/moran.hanyu.dict.yaml.bak
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-cht/moran.words.dict.yaml > ../xhupkai-cht/moran.words.dict.yaml.bak
-python3 convert_sp.py -i ../xhupkai-cht/zrlf.dict.yaml -o ../xhupkai-cht/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../xhupkai-cht/moran_fixed.dict.yaml > ../xhupkai-cht/moran_fixed.dict.yaml.bak
-python3 ../rime-moran/tools/schemagen.py convert-fixed-sp --to=flypy --rime-dict=../xhupkai-cht/moran_fixed.dict.yaml > ../xhupkai-cht/temp.txt && sed -i '/# Some words for testing\.\.\./,$d' ../xhupkai-cht/temp.txt
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2,100}\t[A-Za-z]+.*\n//g" ../xhupkai-cht/temp.txt
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]{4}.*\n//g" ../xhupkai-cht/temp.txt
-sed -i '0,/#----------詞庫----------#/d' ../xhupkai-cht/temp.txt  &&  echo "" >> ../xhupkai-cht/moran_fixed.dict.yaml.bak && cat ../xhupkai-cht/temp.txt >> ../xhupkai-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/xhup.simpwords.txt -o ../xhupkai-cht/temp.txt -c s2t
-echo "" >> ../xhupkai-cht/moran_fixed.dict.yaml.bak && cat ../xhupkai-cht/temp.txt >> ../xhupkai-cht/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhupkai-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhupkai-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhupkai-cht/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../xhupkai-cht/moran_fixed.dict.yaml >> ../xhupkai-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../xhupkai-cht/temp.txt -c s2t
-echo "" >> ../xhupkai-cht/moran_fixed.dict.yaml.bak && cat ../xhupkai-cht/temp.txt >> ../xhupkai-cht/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhupkai-cht/moran_fixed.dict.yaml.bak
-
-sed '/#----------词库----------#/q' ../xhupkai-cht/moran_fixed_simp.dict.yaml > ../xhupkai-cht/moran_fixed_simp.dict.yaml.bak
-python3 ../rime-moran/tools/schemagen.py convert-fixed-sp --to=flypy --rime-dict=../xhupkai-cht/moran_fixed_simp.dict.yaml > ../xhupkai-cht/temp.txt && sed -i '/# 化学元素/,$d' ../xhupkai-cht/temp.txt
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2,100}\t[A-Za-z]+.*\n//g" ../xhupkai-cht/temp.txt
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]{4}.*\n//g" ../xhupkai-cht/temp.txt
-sed -i '0,/#----------词库----------#/d' ../xhupkai-cht/temp.txt  &&  echo "" >> ../xhupkai-cht/moran_fixed_simp.dict.yaml.bak && cat ../xhupkai-cht/temp.txt >> ../xhupkai-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhup.simpwords.txt ../xhupkai-cht/temp.txt
-echo "" >> ../xhupkai-cht/moran_fixed_simp.dict.yaml.bak && cat ../xhupkai-cht/temp.txt >> ../xhupkai-cht/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhupkai-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhupkai-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhupkai-cht/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../xhupkai-cht/moran_fixed_simp.dict.yaml >> ../xhupkai-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../xhupkai-cht/temp.txt
-echo "" >> ../xhupkai-cht/moran_fixed_simp.dict.yaml.bak && cat ../xhupkai-cht/temp.txt >> ../xhupkai-cht/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhupkai-cht/moran_fixed_simp.dict.yaml.bak
-
-mv ../xhupkai-cht/moran.chars.dict.yaml{.bak,}
-mv ../xhupkai-cht/moran.base.dict.yaml{.bak,}
-mv ../xhupkai-cht/moran.tencent.dict.yaml{.bak,}
-mv ../xhupkai-cht/moran.moe.dict.yaml{.bak,}
-mv ../xhupkai-cht/moran.computer.dict.yaml{.bak,}
-# mv ../xhupkai-cht/moran.hanyu.dict.yaml{.bak,}
-mv ../xhupkai-cht/moran.words.dict.yaml{.bak,}
-mv ../xhupkai-cht/moran_fixed.dict.yaml{.bak,}
-mv ../xhupkai-cht/moran_fixed_simp.dict.yaml{.bak,}
-mv ../xhupkai-cht/zrlf.dict.yaml{.bak,}
-
-# 轉換简体詞庫
-echo 轉換简体詞庫...
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-chs/moran.chars.dict.yaml > ../xhupkai-chs/moran.chars.dict.yaml.bak
-# python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -i ../rime-ice/cn_dicts/8105.dict.yaml -o ../xhupkai-chs/temp.txt
-# perl -CSAD -i -pe "s/.\t[a-z]{2};;(\t[0-9]+)?\n//g" ../xhupkai-chs/temp.txt && sed -i '0,/\.\.\./d' ../xhupkai-chs/temp.txt
-# echo "" >> ../xhupkai-chs/moran.chars.dict.yaml.bak && cat ../xhupkai-chs/temp.txt >> ../xhupkai-chs/moran.chars.dict.yaml.bak
-# python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -i ../rime-ice/cn_dicts/41448.dict.yaml -o ../xhupkai-chs/temp.txt
-# perl -CSAD -i -pe "s/.\t[a-z]{2};;(\t[0-9]+)?\n//g" ../xhupkai-chs/temp.txt && sed -i '0,/\.\.\./d' ../xhupkai-chs/temp.txt
-# echo "" >> ../xhupkai-chs/moran.chars.dict.yaml.bak && cat ../xhupkai-chs/temp.txt >> ../xhupkai-chs/moran.chars.dict.yaml.bak
-
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-chs/moran.base.dict.yaml > ../xhupkai-chs/moran.base.dict.yaml.bak
-# cp ../rime-ice/cn_dicts/base.dict.yaml ../xhupkai-chs/ice.base.dict.yaml
-# sed -i '0,/\.\.\./d' ../xhupkai-chs/ice.base.dict.yaml
-# python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -s -i ../xhupkai-chs/ice.base.dict.yaml -o ../xhupkai-chs/temp.txt
-# echo "" >> ../xhupkai-chs/moran.base.dict.yaml.bak
-# cat ../xhupkai-chs/temp.txt >> ../xhupkai-chs/moran.base.dict.yaml.bak
-# rm ../xhupkai-chs/ice.base.dict.yaml
-
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-chs/moran.tencent.dict.yaml > ../xhupkai-chs/moran.tencent.dict.yaml.bak
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-chs/moran.moe.dict.yaml > ../xhupkai-chs/moran.moe.dict.yaml.bak
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-chs/moran.computer.dict.yaml > ../xhupkai-chs/moran.computer.dict.yaml.bak
-# python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-chs/moran.hanyu.dict.yaml > ../xhupkai-chs/moran.hanyu.dict.yaml.bak
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupkai-chs/moran.words.dict.yaml > ../xhupkai-chs/moran.words.dict.yaml.bak
-python3 convert_sp.py -i ../xhupkai-chs/zrlf.dict.yaml -o ../xhupkai-chs/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../xhupkai-chs/moran_fixed.dict.yaml > ../xhupkai-chs/moran_fixed.dict.yaml.bak
-python3 ../rime-moran/tools/schemagen.py convert-fixed-sp --to=flypy --rime-dict=../xhupkai-chs/moran_fixed.dict.yaml > ../xhupkai-chs/temp.txt && sed -i '/# Some words for testing\.\.\./,$d' ../xhupkai-chs/temp.txt
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2,100}\t[A-Za-z]+.*\n//g" ../xhupkai-chs/temp.txt
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]{4}.*\n//g" ../xhupkai-chs/temp.txt
-sed -i '0,/#----------詞庫----------#/d' ../xhupkai-chs/temp.txt  &&  echo "" >> ../xhupkai-chs/moran_fixed.dict.yaml.bak && cat ../xhupkai-chs/temp.txt >> ../xhupkai-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/xhup.simpwords.txt -o ../xhupkai-chs/temp.txt -c s2t
-echo "" >> ../xhupkai-chs/moran_fixed.dict.yaml.bak && cat ../xhupkai-chs/temp.txt >> ../xhupkai-chs/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhupkai-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhupkai-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhupkai-chs/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../xhupkai-chs/moran_fixed.dict.yaml >> ../xhupkai-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../xhupkai-chs/temp.txt -c s2t
-echo "" >> ../xhupkai-chs/moran_fixed.dict.yaml.bak && cat ../xhupkai-chs/temp.txt >> ../xhupkai-chs/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhupkai-chs/moran_fixed.dict.yaml.bak
-
-sed '/#----------词库----------#/q' ../xhupkai-chs/moran_fixed_simp.dict.yaml > ../xhupkai-chs/moran_fixed_simp.dict.yaml.bak
-python3 ../rime-moran/tools/schemagen.py convert-fixed-sp --to=flypy --rime-dict=../xhupkai-chs/moran_fixed_simp.dict.yaml > ../xhupkai-chs/temp.txt && sed -i '/# 化学元素/,$d' ../xhupkai-chs/temp.txt
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2,100}\t[A-Za-z]+.*\n//g" ../xhupkai-chs/temp.txt
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]{4}.*\n//g" ../xhupkai-chs/temp.txt
-sed -i '0,/#----------词库----------#/d' ../xhupkai-chs/temp.txt  &&  echo "" >> ../xhupkai-chs/moran_fixed_simp.dict.yaml.bak && cat ../xhupkai-chs/temp.txt >> ../xhupkai-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhup.simpwords.txt ../xhupkai-chs/temp.txt
-echo "" >> ../xhupkai-chs/moran_fixed_simp.dict.yaml.bak && cat ../xhupkai-chs/temp.txt >> ../xhupkai-chs/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhupkai-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhupkai-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhupkai-chs/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../xhupkai-chs/moran_fixed_simp.dict.yaml >> ../xhupkai-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../xhupkai-chs/temp.txt
-echo "" >> ../xhupkai-chs/moran_fixed_simp.dict.yaml.bak && cat ../xhupkai-chs/temp.txt >> ../xhupkai-chs/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhupkai-chs/moran_fixed_simp.dict.yaml.bak
-
-mv ../xhupkai-chs/moran.chars.dict.yaml{.bak,}
-mv ../xhupkai-chs/moran.base.dict.yaml{.bak,}
-mv ../xhupkai-chs/moran.tencent.dict.yaml{.bak,}
-mv ../xhupkai-chs/moran.moe.dict.yaml{.bak,}
-mv ../xhupkai-chs/moran.computer.dict.yaml{.bak,}
-# mv ../xhupkai-chs/moran.hanyu.dict.yaml{.bak,}
-mv ../xhupkai-chs/moran.words.dict.yaml{.bak,}
-mv ../xhupkai-chs/moran_fixed.dict.yaml{.bak,}
-mv ../xhupkai-chs/moran_fixed_simp.dict.yaml{.bak,}
-mv ../xhupkai-chs/zrlf.dict.yaml{.bak,}
-cd ..
-
 # 整理文件結構
 rm -rf ./xhupkai-cht/tools
 rm -rf ./xhupkai-cht/make_simp_dist.sh
-mkdir -p ./xhupkai-cht/ice-dicts/
-mkdir -p ./xhupkai-chs/ice-dicts/
 # cp -a ./xhupkai-cht/moran_fixed.dict.yaml ./schema/xhupkai_fixed.dict.yaml
 # cp -a ./xhupkai-cht/moran_fixed_simp.dict.yaml ./schema/xhupkai_fixed_simp.dict.yaml
 cp -a ./schema/default.custom.xhupkai.yaml ./xhupkai-cht/default.custom.yaml
@@ -192,25 +45,6 @@ cp -a ./schema/default.custom.xhupkai.yaml ./xhupkai-chs/default.custom.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\n//g" ./schema/moran_fixed_simp.dict.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\t.*\n//g" ./schema/moran_fixed_simp.dict.yaml
 
-cd ./tools-additional
-# 生成繁體霧凇
-# python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -t -i ../rime-ice/cn_dicts/ext.dict.yaml -o ../xhupkai-cht/ice-dicts/xhupkai_zrmdb_ext.dict.yaml
-python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -t -i ../rime-ice/cn_dicts/8105.dict.yaml -o ../xhupkai-cht/ice-dicts/xhupkai_zrmdb_8105.dict.yaml
-python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -t -i ../rime-ice/cn_dicts/41448.dict.yaml -o ../xhupkai-cht/ice-dicts/xhupkai_zrmdb_41448.dict.yaml
-python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -t -i ../rime-ice/cn_dicts/base.dict.yaml -o ../xhupkai-cht/ice-dicts/xhupkai_zrmdb_base.dict.yaml
-python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -t -i ../rime-ice/cn_dicts/ext.dict.yaml -o ../xhupkai-cht/ice-dicts/xhupkai_zrmdb_ext.dict.yaml
-python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -t -i ../rime-ice/cn_dicts/others.dict.yaml  -o ../xhupkai-cht/ice-dicts/xhupkai_zrmdb_others.dict.yaml
-python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -t -i ../rime-ice/cn_dicts/tencent.dict.yaml -o ../xhupkai-cht/ice-dicts/xhupkai_zrmdb_tencent.dict.yaml
-# 生成簡體霧凇
-# python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -s -i ../rime-ice/cn_dicts/ext.dict.yaml -o ../xhupkai-chs/ice-dicts/xhupkai_zrmdb_ext.dict.yaml
-python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -s -i ../rime-ice/cn_dicts/8105.dict.yaml -o ../xhupkai-chs/ice-dicts/xhupkai_zrmdb_8105.dict.yaml
-python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -s -i ../rime-ice/cn_dicts/41448.dict.yaml -o ../xhupkai-chs/ice-dicts/xhupkai_zrmdb_41448.dict.yaml
-python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -s -i ../rime-ice/cn_dicts/base.dict.yaml -o ../xhupkai-chs/ice-dicts/xhupkai_zrmdb_base.dict.yaml
-python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -s -i ../rime-ice/cn_dicts/ext.dict.yaml -o ../xhupkai-chs/ice-dicts/xhupkai_zrmdb_ext.dict.yaml
-python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -s -i ../rime-ice/cn_dicts/others.dict.yaml -o ../xhupkai-chs/ice-dicts/xhupkai_zrmdb_others.dict.yaml
-python3 gen_dict_with_shape.py -p xhupkai -x zrmdb -s -i ../rime-ice/cn_dicts/tencent.dict.yaml -o ../xhupkai-chs/ice-dicts/xhupkai_zrmdb_tencent.dict.yaml
-cd ..
-
 # 生成ocz
 cp ./rime-radical-pinyin/radical.schema.yaml ./xhupkai-cht
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./xhupkai-cht
@@ -222,7 +56,6 @@ cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./xhupkai-cht
 cp ./rime-radical-pinyin/radical.schema.yaml ./xhupkai-chs
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./xhupkai-chs
 
-rm -f temp.txt
 rm -f ./xhupkai-cht/temp.txt
 rm -f ./xhupkai-chs/temp.txt
 
@@ -5,17 +5,14 @@ set -x
 
 # BUILD_TYPE="$1"
 
-rm -rf xhupzrmfast-chs
-rm -rf xhupzrmfast-cht
+# 複製 rime-moran 並生成詞庫（見 tools-additional/schemes.py）；build.py 為每個方案各自生成詞庫，再以 --no-dicts 執行
+if [ "$1" != "--no-dicts" ]; then
+    cd ./tools-additional
+    python3 make_dicts.py xhupzrmfast
+    cd ..
+fi
 
 # 生成繁體
-cp -a ./rime-moran-cht/. ./xhupzrmfast-cht
-
-rm -rf ./xhupzrmfast-cht/.git
-rm -rf ./xhupzrmfast-cht/.gitignore
-rm -rf ./xhupzrmfast-cht/README.md
-rm -rf ./xhupzrmfast-cht/README-en.md
-rm -rf ./xhupzrmfast-cht/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./xhupzrmfast-cht/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./xhupzrmfast-cht/moran.yaml
 # mv ./xhupzrmfast-cht/punctuation.yaml ./schema
@@ -25,13 +22,6 @@ perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$
 # perl -CSAD -i -pe 's/(.\t[a-z]{2})\t.*/$1/' ./tools-additional/zrmfastdb.txt
 
 # 生成簡體
-cp -a ./rime-moran-chs/. ./xhupzrmfast-chs
-
-rm -rf ./xhupzrmfast-chs/.git
-rm -rf ./xhupzrmfast-chs/.gitignore
-rm -rf ./xhupzrmfast-chs/README.md
-rm -rf ./xhupzrmfast-chs/README-en.md
-rm -rf ./xhupzrmfast-chs/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./xhupzrmfast-chs/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./xhupzrmfast-chs/moran.yaml
 # mv ./xhupzrmfast-chs/punctuation.yaml ./schema
@@ -40,142 +30,9 @@ perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$
 # cp ./rime-shuangpin-fuzhuma/moqima8105.txt ./tools-additional/zrmfastdb.txt
 # perl -CSAD -i -pe 's/(.\t[a-z]{2})\t.*/$1/' ./tools-additional/zrmfastdb.txt
 
-# 轉換詞庫
-cd ./tools-additional
-# 轉換繁体詞庫
-echo 轉換繁体詞庫...
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupzrmfast-cht/moran.chars.dict.yaml > ../xhupzrmfast-cht/moran.chars.dict.yaml.bak
-mv ../xhupzrmfast-cht/moran.chars.dict.yaml{.bak,} && perl -CSAD -i -pe "s/([a-z]{2});[a-z]{2}/\1/g" ../xhupzrmfast-cht/moran.chars.dict.yaml
-sed '/\.\.\./q' ../xhupzrmfast-cht/moran.chars.dict.yaml > ../xhupzrmfast-cht/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p static -x zrmfastdb -i ../xhupzrmfast-cht/moran.chars.dict.yaml -o ../xhupzrmfast-cht/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../xhupzrmfast-cht/temp.txt && sed -i '0,/\.\.\./d' ../xhupzrmfast-cht/temp.txt
-awk 'NF >= 2 && /^[^\s]+\t[a-z;]+/ && !seen[$1 FS $2]++ {print $0}' ../xhupzrmfast-cht/temp.txt > temp && mv temp ../xhupzrmfast-cht/temp.txt
-echo "" >> ../xhupzrmfast-cht/moran.chars.dict.yaml.bak && cat ../xhupzrmfast-cht/temp.txt >> ../xhupzrmfast-cht/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../xhupzrmfast-cht/moran.base.dict.yaml > ../xhupzrmfast-cht/moran.base.dict.yaml.bak
-cp ../rime-ice/cn_dicts/base.dict.yaml ../xhupzrmfast-cht/ice.base.dict.yaml
-sed -i '0,/\.\.\./d' ../xhupzrmfast-cht/ice.base.dict.yaml
-python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -t -i ../xhupzrmfast-cht/ice.base.dict.yaml -o ../xhupzrmfast-cht/temp.txt
-# echo "" >> ../xhupzrmfast-cht/moran.base.dict.yaml.bak
-cat ../xhupzrmfast-cht/temp.txt >> ../xhupzrmfast-cht/moran.base.dict.yaml.bak
-rm ../xhupzrmfast-cht/ice.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhupzrmfast-cht/moran.tencent.dict.yaml > ../../xhupzrmfast-cht/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhupzrmfast-cht/moran.moe.dict.yaml > ../../xhupzrmfast-cht/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhupzrmfast-cht/moran.computer.dict.yaml > ../../xhupzrmfast-cht/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhupzrmfast-cht/moran.hanyu.dict.yaml > ../../xhupzrmfast-cht/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhupzrmfast-cht/moran.words.dict.yaml > ../../xhupzrmfast-cht/moran.words.dict.yaml.bak
-python3 convert_sp.py -i ../xhupzrmfast-cht/zrlf.dict.yaml -o ../xhupzrmfast-cht/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../xhupzrmfast-cht/moran_fixed.dict.yaml > ../xhupzrmfast-cht/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhupzrmfast.simpchars.txt ../xhupzrmfast-cht/xhupzrmfast.simpchars.txt && opencc -i ../xhupzrmfast-cht/xhupzrmfast.simpchars.txt -o ../xhupzrmfast-cht/temp.txt -c s2t
-echo "" >> ../xhupzrmfast-cht/moran_fixed.dict.yaml.bak
-cat ../xhupzrmfast-cht/temp.txt >> ../xhupzrmfast-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/xhup.simpwords.txt -o ../xhupzrmfast-cht/temp.txt -c s2t
-echo ""  >> ../xhupzrmfast-cht/moran_fixed.dict.yaml.bak && cat ../xhupzrmfast-cht/temp.txt >> ../xhupzrmfast-cht/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhupzrmfast-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhupzrmfast-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhupzrmfast-cht/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../xhupzrmfast-cht/moran_fixed.dict.yaml >> ../xhupzrmfast-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../xhupzrmfast-cht/temp.txt -c s2t
-echo "" >> ../xhupzrmfast-cht/moran_fixed.dict.yaml.bak && cat ../xhupzrmfast-cht/temp.txt >> ../xhupzrmfast-cht/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhupzrmfast-cht/moran_fixed.dict.yaml.bak
-rm ../xhupzrmfast-cht/xhupzrmfast.simpchars.txt
-
-sed '/#----------词库----------#/q' ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml > ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhupzrmfast.simpchars.txt ../xhupzrmfast-cht/xhupzrmfast.simpchars.txt && cp ../xhupzrmfast-cht/xhupzrmfast.simpchars.txt ../xhupzrmfast-cht/temp.txt
-echo "" >> ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml.bak
-cat ../xhupzrmfast-cht/temp.txt >> ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhup.simpwords.txt ../xhupzrmfast-cht/temp.txt
-echo "" >> ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml.bak && cat ../xhupzrmfast-cht/temp.txt >> ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml >> ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../xhupzrmfast-cht/temp.txt
-echo "" >> ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml.bak && cat ../xhupzrmfast-cht/temp.txt >> ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml.bak
-rm ../xhupzrmfast-cht/xhupzrmfast.simpchars.txt
-
-mv ../xhupzrmfast-cht/moran.chars.dict.yaml{.bak,}
-mv ../xhupzrmfast-cht/moran.base.dict.yaml{.bak,}
-# mv ../xhupzrmfast-cht/moran.tencent.dict.yaml{.bak,}
-# mv ../xhupzrmfast-cht/moran.moe.dict.yaml{.bak,}
-# mv ../xhupzrmfast-cht/moran.computer.dict.yaml{.bak,}
-# mv ../xhupzrmfast-cht/moran.hanyu.dict.yaml{.bak,}
-# mv ../xhupzrmfast-cht/moran.words.dict.yaml{.bak,}
-mv ../xhupzrmfast-cht/moran_fixed.dict.yaml{.bak,}
-mv ../xhupzrmfast-cht/moran_fixed_simp.dict.yaml{.bak,}
-mv ../xhupzrmfast-cht/zrlf.dict.yaml{.bak,}
-
-# 轉換简体詞庫
-echo 轉換简体詞庫...
-python3 ../rime-moran/tools/schemagen.py convert-sp --to=flypy --rime-dict=../xhupzrmfast-chs/moran.chars.dict.yaml > ../xhupzrmfast-chs/moran.chars.dict.yaml.bak
-mv ../xhupzrmfast-chs/moran.chars.dict.yaml{.bak,} && perl -CSAD -i -pe "s/([a-z]{2});[a-z]{2}/\1/g" ../xhupzrmfast-chs/moran.chars.dict.yaml
-sed '/\.\.\./q' ../xhupzrmfast-chs/moran.chars.dict.yaml > ../xhupzrmfast-chs/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p static -x zrmfastdb -i ../xhupzrmfast-chs/moran.chars.dict.yaml -o ../xhupzrmfast-chs/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../xhupzrmfast-chs/temp.txt && sed -i '0,/\.\.\./d' ../xhupzrmfast-chs/temp.txt
-awk 'NF >= 2 && /^[^\s]+\t[a-z;]+/ && !seen[$1 FS $2]++ {print $0}' ../xhupzrmfast-chs/temp.txt > temp && mv temp ../xhupzrmfast-chs/temp.txt
-echo "" >> ../xhupzrmfast-chs/moran.chars.dict.yaml.bak && cat ../xhupzrmfast-chs/temp.txt >> ../xhupzrmfast-chs/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../xhupzrmfast-chs/moran.base.dict.yaml > ../xhupzrmfast-chs/moran.base.dict.yaml.bak
-cp ../rime-ice/cn_dicts/base.dict.yaml ../xhupzrmfast-chs/ice.base.dict.yaml
-sed -i '0,/\.\.\./d' ../xhupzrmfast-chs/ice.base.dict.yaml
-python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -s -i ../xhupzrmfast-chs/ice.base.dict.yaml -o ../xhupzrmfast-chs/temp.txt
-# echo "" >> ../xhupzrmfast-chs/moran.base.dict.yaml.bak
-cat ../xhupzrmfast-chs/temp.txt >> ../xhupzrmfast-chs/moran.base.dict.yaml.bak
-rm ../xhupzrmfast-chs/ice.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhupzrmfast-chs/moran.tencent.dict.yaml > ../../xhupzrmfast-chs/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhupzrmfast-chs/moran.moe.dict.yaml > ../../xhupzrmfast-chs/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhupzrmfast-chs/moran.computer.dict.yaml > ../../xhupzrmfast-chs/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhupzrmfast-chs/moran.hanyu.dict.yaml > ../../xhupzrmfast-chs/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../xhupzrmfast-chs/moran.words.dict.yaml > ../../xhupzrmfast-chs/moran.words.dict.yaml.bak
-python3 convert_sp.py -i ../xhupzrmfast-chs/zrlf.dict.yaml -o ../xhupzrmfast-chs/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../xhupzrmfast-chs/moran_fixed.dict.yaml > ../xhupzrmfast-chs/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhupzrmfast.simpchars.txt ../xhupzrmfast-chs/xhupzrmfast.simpchars.txt && opencc -i ../xhupzrmfast-chs/xhupzrmfast.simpchars.txt -o ../xhupzrmfast-chs/temp.txt -c s2t
-echo "" >> ../xhupzrmfast-chs/moran_fixed.dict.yaml.bak
-cat ../xhupzrmfast-chs/temp.txt >> ../xhupzrmfast-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/xhup.simpwords.txt -o ../xhupzrmfast-chs/temp.txt -c s2t
-echo ""  >> ../xhupzrmfast-chs/moran_fixed.dict.yaml.bak && cat ../xhupzrmfast-chs/temp.txt >> ../xhupzrmfast-chs/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhupzrmfast-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhupzrmfast-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhupzrmfast-chs/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../xhupzrmfast-chs/moran_fixed.dict.yaml >> ../xhupzrmfast-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../xhupzrmfast-chs/temp.txt -c s2t
-echo ""  >> ../xhupzrmfast-chs/moran_fixed.dict.yaml.bak && cat ../xhupzrmfast-chs/temp.txt >> ../xhupzrmfast-chs/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhupzrmfast-chs/moran_fixed.dict.yaml.bak
-rm ../xhupzrmfast-chs/xhupzrmfast.simpchars.txt
-
-sed '/#----------词库----------#/q' ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml > ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhupzrmfast.simpchars.txt ../xhupzrmfast-chs/xhupzrmfast.simpchars.txt && cp ../xhupzrmfast-chs/xhupzrmfast.simpchars.txt ../xhupzrmfast-chs/temp.txt
-echo "" >> ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml.bak
-cat ../xhupzrmfast-chs/temp.txt >> ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/xhup.simpwords.txt ../xhupzrmfast-chs/temp.txt
-echo "" >> ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml.bak && cat ../xhupzrmfast-chs/temp.txt >> ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml >> ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../xhupzrmfast-chs/temp.txt
-echo "" >> ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml.bak && cat ../xhupzrmfast-chs/temp.txt >> ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml.bak
-rm ../xhupzrmfast-chs/xhupzrmfast.simpchars.txt
-
-mv ../xhupzrmfast-chs/moran.chars.dict.yaml{.bak,}
-mv ../xhupzrmfast-chs/moran.base.dict.yaml{.bak,}
-# mv ../xhupzrmfast-chs/moran.tencent.dict.yaml{.bak,}
-# mv ../xhupzrmfast-chs/moran.moe.dict.yaml{.bak,}
-# mv ../xhupzrmfast-chs/moran.computer.dict.yaml{.bak,}
-# mv ../xhupzrmfast-chs/moran.hanyu.dict.yaml{.bak,}
-# mv ../xhupzrmfast-chs/moran.words.dict.yaml{.bak,}
-mv ../xhupzrmfast-chs/moran_fixed.dict.yaml{.bak,}
-mv ../xhupzrmfast-chs/moran_fixed_simp.dict.yaml{.bak,}
-mv ../xhupzrmfast-chs/zrlf.dict.yaml{.bak,}
-cd ..
-
 # 整理文件結構
 rm -rf ./xhupzrmfast-cht/tools
 rm -rf ./xhupzrmfast-cht/make_simp_dist.sh
-mkdir -p ./xhupzrmfast-cht/ice-dicts/
-mkdir -p ./xhupzrmfast-chs/ice-dicts/
 # cp -a ./xhupzrmfast-cht/moran_fixed.dict.yaml ./schema/xhupzrmfast_fixed.dict.yaml
 # cp -a ./xhupzrmfast-cht/moran_fixed_simp.dict.yaml ./schema/xhupzrmfast_fixed_simp.dict.yaml
 cp -a ./schema/default.custom.xhupzrmfast.yaml ./xhupzrmfast-cht/default.custom.yaml
@@ -196,25 +53,6 @@ cp -a ./schema/default.custom.xhupzrmfast.yaml ./xhupzrmfast-chs/default.custom.
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\n//g" ./schema/moran_fixed_simp.dict.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\t.*\n//g" ./schema/moran_fixed_simp.dict.yaml
 
-cd ./tools-additional
-# 生成繁體霧凇
-# python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -t -i ../rime-ice/cn_dicts/ext.dict.yaml -o ../xhupzrmfast-cht/ice-dicts/xhupzrmfast_zrmfastdb_ext.dict.yaml
-python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -t -i ../rime-ice/cn_dicts/8105.dict.yaml -o ../xhupzrmfast-cht/ice-dicts/xhupzrmfast_zrmfastdb_8105.dict.yaml
-python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -t -i ../rime-ice/cn_dicts/41448.dict.yaml -o ../xhupzrmfast-cht/ice-dicts/xhupzrmfast_zrmfastdb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -t -i ../rime-ice/cn_dicts/base.dict.yaml -o ../xhupzrmfast-cht/ice-dicts/xhupzrmfast_zrmfastdb_base.dict.yaml
-python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -t -i ../rime-ice/cn_dicts/ext.dict.yaml -o ../xhupzrmfast-cht/ice-dicts/xhupzrmfast_zrmfastdb_ext.dict.yaml
-python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -t -i ../rime-ice/cn_dicts/others.dict.yaml  -o ../xhupzrmfast-cht/ice-dicts/xhupzrmfast_zrmfastdb_others.dict.yaml
-python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -t -i ../rime-ice/cn_dicts/tencent.dict.yaml -o ../xhupzrmfast-cht/ice-dicts/xhupzrmfast_zrmfastdb_tencent.dict.yaml
-# 生成簡體霧凇
-# python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -s -i ../rime-ice/cn_dicts/ext.dict.yaml -o ../xhupzrmfast-chs/ice-dicts/xhupzrmfast_zrmfastdb_ext.dict.yaml
-python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -s -i ../rime-ice/cn_dicts/8105.dict.yaml -o ../xhupzrmfast-chs/ice-dicts/xhupzrmfast_zrmfastdb_8105.dict.yaml
-python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -s -i ../rime-ice/cn_dicts/41448.dict.yaml -o ../xhupzrmfast-chs/ice-dicts/xhupzrmfast_zrmfastdb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -s -i ../rime-ice/cn_dicts/base.dict.yaml -o ../xhupzrmfast-chs/ice-dicts/xhupzrmfast_zrmfastdb_base.dict.yaml
-python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -s -i ../rime-ice/cn_dicts/ext.dict.yaml -o ../xhupzrmfast-chs/ice-dicts/xhupzrmfast_zrmfastdb_ext.dict.yaml
-python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -s -i ../rime-ice/cn_dicts/others.dict.yaml -o ../xhupzrmfast-chs/ice-dicts/xhupzrmfast_zrmfastdb_others.dict.yaml
-python3 gen_dict_with_shape.py -p xhupzrmfast -x zrmfastdb -s -i ../rime-ice/cn_dicts/tencent.dict.yaml -o ../xhupzrmfast-chs/ice-dicts/xhupzrmfast_zrmfastdb_tencent.dict.yaml
-cd ..
-
 # 生成ocz
 cp ./rime-radical-pinyin/radical.schema.yaml ./xhupzrmfast-cht
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./xhupzrmfast-cht
@@ -226,7 +64,6 @@ cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./xhupzrmfast-cht
 cp ./rime-radical-pinyin/radical.schema.yaml ./xhupzrmfast-chs
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./xhupzrmfast-chs
 
-rm -f temp.txt
 rm -f ./xhupzrmfast-cht/temp.txt
 rm -f ./xhupzrmfast-chs/temp.txt
 
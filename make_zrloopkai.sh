@@ -5,173 +5,26 @@ set -x
 
 # BUILD_TYPE="$1"
 
-rm -rf zrloopkai-chs
-rm -rf zrloopkai-cht
+# 複製 rime-moran 並生成詞庫（見 tools-additional/schemes.py）；build.py 為每個方案各自生成詞庫，再以 --no-dicts 執行
+if [ "$1" != "--no-dicts" ]; then
+    cd ./tools-additional
+    python3 make_dicts.py zrloopkai
+    cd ..
+fi
 
 # 生成繁體
-cp -a ./rime-moran-cht/. ./zrloopkai-cht
-
-rm -rf ./zrloopkai-cht/.git
-rm -rf ./zrloopkai-cht/.gitignore
-rm -rf ./zrloopkai-cht/README.md
-rm -rf ./zrloopkai-cht/README-en.md
-rm -rf ./zrloopkai-cht/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./zrloopkai-cht/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./zrloopkai-cht/moran.yaml
 # mv ./zrloopkai-cht/punctuation.yaml ./schema
 
-
-cp ./rime-moran/tools/data/zrmdb.txt ./tools-additional
-sed -i 's/ /\t/g' ./tools-additional/zrmdb.txt
-
 # 生成簡體
-cp -a ./rime-moran-chs/. ./zrloopkai-chs
-
-rm -rf ./zrloopkai-chs/.git
-rm -rf ./zrloopkai-chs/.gitignore
-rm -rf ./zrloopkai-chs/README.md
-rm -rf ./zrloopkai-chs/README-en.md
-rm -rf ./zrloopkai-chs/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./zrloopkai-chs/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./zrloopkai-chs/moran.yaml
 # mv ./zrloopkai-chs/punctuation.yaml ./schema
 
-# 轉換詞庫
-cd ./tools-additional
-# 轉換繁体詞庫
-echo 轉換繁体詞庫...
-sed '/\.\.\./q' ../zrloopkai-cht/moran.chars.dict.yaml > ../zrloopkai-cht/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p zrloopkai -x zrmdb -m -i ../data/zdicdbtonesorted.yaml -o ../zrloopkai-cht/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../zrloopkai-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../zrloopkai-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../zrloopkai-cht/temp.txt
-echo "" >> ../zrloopkai-cht/moran.chars.dict.yaml.bak
-cat ../zrloopkai-cht/temp.txt >> ../zrloopkai-cht/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../zrloopkai-cht/moran.base.dict.yaml > ../zrloopkai-cht/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../zrloopkai-cht/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../zrloopkai-cht/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p zrloopkai -x zrmdb -t -i ../zrloopkai-cht/snow_pinyin.base.dict.yaml -o ../zrloopkai-cht/temp.txt
-# echo "" >> ../zrloopkai-cht/moran.base.dict.yaml.bak
-cat ../zrloopkai-cht/temp.txt >> ../zrloopkai-cht/moran.base.dict.yaml.bak
-rm ../zrloopkai-cht/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopkai-cht/moran.tencent.dict.yaml > ../../zrloopkai-cht/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopkai-cht/moran.moe.dict.yaml > ../../zrloopkai-cht/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopkai-cht/moran.computer.dict.yaml > ../../zrloopkai-cht/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopkai-cht/moran.hanyu.dict.yaml > ../../zrloopkai-cht/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopkai-cht/moran.words.dict.yaml > ../../zrloopkai-cht/moran.words.dict.yaml.bak
-# python3 convert_sp.py -i ../zrloopkai-cht/zrlf.dict.yaml -o ../zrloopkai-cht/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../zrloopkai-cht/moran_fixed.dict.yaml > ../zrloopkai-cht/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/zrloopkai.simpchars.txt ../zrloopkai-cht/zrloopkai.simpchars.txt && opencc -i ../zrloopkai-cht/zrloopkai.simpchars.txt -o ../zrloopkai-cht/temp.txt -c s2t
-echo "" >> ../zrloopkai-cht/moran_fixed.dict.yaml.bak
-cat ../zrloopkai-cht/temp.txt >> ../zrloopkai-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/zrloop.simpwords.txt -o ../zrloopkai-cht/temp.txt -c s2t
-echo "" >> ../zrloopkai-cht/moran_fixed.dict.yaml.bak && cat ../zrloopkai-cht/temp.txt >> ../zrloopkai-cht/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../zrloopkai-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../zrloopkai-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../zrloopkai-cht/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../zrloopkai-cht/moran_fixed.dict.yaml >> ../zrloopkai-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../zrloopkai-cht/temp.txt -c s2t
-echo "" >> ../zrloopkai-cht/moran_fixed.dict.yaml.bak && cat ../zrloopkai-cht/temp.txt >> ../zrloopkai-cht/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../zrloopkai-cht/moran_fixed.dict.yaml.bak
-rm ../zrloopkai-cht/zrloopkai.simpchars.txt
-
-sed '/#----------词库----------#/q' ../zrloopkai-cht/moran_fixed_simp.dict.yaml > ../zrloopkai-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/zrloopkai.simpchars.txt ../zrloopkai-cht/zrloopkai.simpchars.txt && cp ../zrloopkai-cht/zrloopkai.simpchars.txt ../zrloopkai-cht/temp.txt
-echo "" >> ../zrloopkai-cht/moran_fixed_simp.dict.yaml.bak
-cat ../zrloopkai-cht/temp.txt >> ../zrloopkai-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/zrloop.simpwords.txt ../zrloopkai-cht/temp.txt
-echo "" >> ../zrloopkai-cht/moran_fixed_simp.dict.yaml.bak && cat ../zrloopkai-cht/temp.txt >> ../zrloopkai-cht/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../zrloopkai-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../zrloopkai-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../zrloopkai-cht/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../zrloopkai-cht/moran_fixed_simp.dict.yaml >> ../zrloopkai-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../zrloopkai-cht/temp.txt
-echo "" >> ../zrloopkai-cht/moran_fixed_simp.dict.yaml.bak && cat ../zrloopkai-cht/temp.txt >> ../zrloopkai-cht/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../zrloopkai-cht/moran_fixed_simp.dict.yaml.bak
-rm ../zrloopkai-cht/zrloopkai.simpchars.txt
-
-mv ../zrloopkai-cht/moran.chars.dict.yaml{.bak,}
-mv ../zrloopkai-cht/moran.base.dict.yaml{.bak,}
-# mv ../zrloopkai-cht/moran.tencent.dict.yaml{.bak,}
-# mv ../zrloopkai-cht/moran.moe.dict.yaml{.bak,}
-# mv ../zrloopkai-cht/moran.computer.dict.yaml{.bak,}
-# mv ../zrloopkai-cht/moran.hanyu.dict.yaml{.bak,}
-# mv ../zrloopkai-cht/moran.words.dict.yaml{.bak,}
-mv ../zrloopkai-cht/moran_fixed.dict.yaml{.bak,}
-mv ../zrloopkai-cht/moran_fixed_simp.dict.yaml{.bak,}
-# mv ../zrloopkai-cht/zrlf.dict.yaml{.bak,}
-
-# 轉換简体詞庫
-echo 轉換简体詞庫...
-sed '/\.\.\./q' ../zrloopkai-chs/moran.chars.dict.yaml > ../zrloopkai-chs/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p zrloopkai -x zrmdb -m -i ../data/zdicdbtonesorted.yaml -o ../zrloopkai-chs/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../zrloopkai-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../zrloopkai-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../zrloopkai-chs/temp.txt
-echo "" >> ../zrloopkai-chs/moran.chars.dict.yaml.bak
-cat ../zrloopkai-chs/temp.txt >> ../zrloopkai-chs/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../zrloopkai-chs/moran.base.dict.yaml > ../zrloopkai-chs/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../zrloopkai-chs/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../zrloopkai-chs/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p zrloopkai -x zrmdb -s -i ../zrloopkai-chs/snow_pinyin.base.dict.yaml -o ../zrloopkai-chs/temp.txt
-# echo "" >> ../zrloopkai-chs/moran.base.dict.yaml.bak
-cat ../zrloopkai-chs/temp.txt >> ../zrloopkai-chs/moran.base.dict.yaml.bak
-rm ../zrloopkai-chs/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopkai-chs/moran.tencent.dict.yaml > ../../zrloopkai-chs/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopkai-chs/moran.moe.dict.yaml > ../../zrloopkai-chs/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopkai-chs/moran.computer.dict.yaml > ../../zrloopkai-chs/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopkai-chs/moran.hanyu.dict.yaml > ../../zrloopkai-chs/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopkai-chs/moran.words.dict.yaml > ../../zrloopkai-chs/moran.words.dict.yaml.bak
-# python3 convert_sp.py -i ../zrloopkai-chs/zrlf.dict.yaml -o ../zrloopkai-chs/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../zrloopkai-chs/moran_fixed.dict.yaml > ../zrloopkai-chs/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/zrloopkai.simpchars.txt ../zrloopkai-chs/zrloopkai.simpchars.txt && opencc -i ../zrloopkai-chs/zrloopkai.simpchars.txt -o ../zrloopkai-chs/temp.txt -c s2t
-echo "" >> ../zrloopkai-chs/moran_fixed.dict.yaml.bak
-cat ../zrloopkai-chs/temp.txt >> ../zrloopkai-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/zrloop.simpwords.txt -o ../zrloopkai-chs/temp.txt -c s2t
-echo "" >> ../zrloopkai-chs/moran_fixed.dict.yaml.bak && cat ../zrloopkai-chs/temp.txt >> ../zrloopkai-chs/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../zrloopkai-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../zrloopkai-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../zrloopkai-chs/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../zrloopkai-chs/moran_fixed.dict.yaml >> ../zrloopkai-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../zrloopkai-chs/temp.txt -c s2t
-echo "" >> ../zrloopkai-chs/moran_fixed.dict.yaml.bak && cat ../zrloopkai-chs/temp.txt >> ../zrloopkai-chs/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../zrloopkai-chs/moran_fixed.dict.yaml.bak
-rm ../zrloopkai-chs/zrloopkai.simpchars.txt
-
-sed '/#----------词库----------#/q' ../zrloopkai-chs/moran_fixed_simp.dict.yaml > ../zrloopkai-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/zrloopkai.simpchars.txt ../zrloopkai-chs/zrloopkai.simpchars.txt && cp ../zrloopkai-chs/zrloopkai.simpchars.txt ../zrloopkai-chs/temp.txt
-echo "" >> ../zrloopkai-chs/moran_fixed_simp.dict.yaml.bak
-cat ../zrloopkai-chs/temp.txt >> ../zrloopkai-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/zrloop.simpwords.txt ../zrloopkai-chs/temp.txt
-echo "" >> ../zrloopkai-chs/moran_fixed_simp.dict.yaml.bak && cat ../zrloopkai-chs/temp.txt >> ../zrloopkai-chs/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../zrloopkai-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../zrloopkai-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../zrloopkai-chs/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../zrloopkai-chs/moran_fixed_simp.dict.yaml >> ../zrloopkai-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../zrloopkai-chs/temp.txt
-echo "" >> ../zrloopkai-chs/moran_fixed_simp.dict.yaml.bak && cat ../zrloopkai-chs/temp.txt >> ../zrloopkai-chs/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../zrloopkai-chs/moran_fixed_simp.dict.yaml.bak
-rm ../zrloopkai-chs/zrloopkai.simpchars.txt
-
-mv ../zrloopkai-chs/moran.chars.dict.yaml{.bak,}
-mv ../zrloopkai-chs/moran.base.dict.yaml{.bak,}
-# mv ../zrloopkai-chs/moran.tencent.dict.yaml{.bak,}
-# mv ../zrloopkai-chs/moran.moe.dict.yaml{.bak,}
-# mv ../zrloopkai-chs/moran.computer.dict.yaml{.bak,}
-# mv ../zrloopkai-chs/moran.hanyu.dict.yaml{.bak,}
-# mv ../zrloopkai-chs/moran.words.dict.yaml{.bak,}
-mv ../zrloopkai-chs/moran_fixed.dict.yaml{.bak,}
-mv ../zrloopkai-chs/moran_fixed_simp.dict.yaml{.bak,}
-# mv ../zrloopkai-chs/zrlf.dict.yaml{.bak,}
-cd ..
-
 # 整理文件結構
 rm -rf ./zrloopkai-cht/tools
 rm -rf ./zrloopkai-cht/make_simp_dist.sh
-mkdir -p ./zrloopkai-cht/snow-dicts/
-mkdir -p ./zrloopkai-chs/snow-dicts/
 # cp -a ./zrloopkai-cht/moran_fixed.dict.yaml ./schema/zrloopkai_fixed.dict.yaml
 # cp -a ./zrloopkai-cht/moran_fixed_simp.dict.yaml ./schema/zrloopkai_fixed_simp.dict.yaml
 cp -a ./schema/default.custom.zrloopkai.yaml ./zrloopkai-cht/default.custom.yaml
@@ -192,37 +45,14 @@ cp -a ./schema/default.custom.zrloopkai.yaml ./zrloopkai-chs/default.custom.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\n//g" ./schema/moran_fixed_simp.dict.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\t.*\n//g" ./schema/moran_fixed_simp.dict.yaml
 
-cd ./tools-additional
-# 生成繁體霧凇
-python3 gen_dict_with_shape.py -p zrloopkai -x zrmdb -t -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../zrloopkai-cht/snow-dicts/zrloopkai_zrmdb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x zrmdb -t -o ../zrloopkai-cht/snow-dicts/flypy_zrmdb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x zrmdb -t -o ../zrloopkai-cht/snow-dicts/flypy_zrmdb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x zrmdb -t -o ../zrloopkai-cht/snow-dicts/flypy_zrmdb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x zrmdb -t -o ../zrloopkai-cht/snow-dicts/flypy_zrmdb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x zrmdb -t -o ../zrloopkai-cht/snow-dicts/flypy_zrmdb_others.dict.yaml
-python3 gen_dict_with_shape.py -p zrloopkai -x zrmdb -t -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../zrloopkai-cht/snow-dicts/zrloopkai_zrmdb_tencent.dict.yaml
-# 生成簡體霧凇
-python3 gen_dict_with_shape.py -p zrloopkai -x zrmdb -s -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../zrloopkai-chs/snow-dicts/zrloopkai_zrmdb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x zrmdb -o ../zrloopkai-chs/snow-dicts/flypy_zrmdb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x zrmdb -o ../zrloopkai-chs/snow-dicts/flypy_zrmdb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x zrmdb -o ../zrloopkai-chs/snow-dicts/flypy_zrmdb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x zrmdb -o ../zrloopkai-chs/snow-dicts/flypy_zrmdb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x zrmdb -o ../zrloopkai-chs/snow-dicts/flypy_zrmdb_others.dict.yaml
-python3 gen_dict_with_shape.py -p zrloopkai -x zrmdb -s -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../zrloopkai-chs/snow-dicts/zrloopkai_zrmdb_tencent.dict.yaml
-cd ..
-
 # 生成ocz
 cp ./rime-radical-pinyin/radical.schema.yaml ./zrloopkai-chs
 cp ./rime-radical-pinyin/radical.schema.yaml ./zrloopkai-cht
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./zrloopkai-cht
-sed '/\.\.\./q' ./zrloopkai-cht/radical_flypy.dict.yaml > ./zrloopkai-cht/radical_flypy.dict.yaml.bak
-python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o temp.txt -c ./zrloopkai-cht/moran.chars.dict.yaml
-echo "" >> ./zrloopkai-cht/radical_flypy.dict.yaml.bak
-cat temp.txt >> ./zrloopkai-cht/radical_flypy.dict.yaml.bak
-mv ./zrloopkai-cht/radical_flypy.dict.yaml{.bak,}
+python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o ./zrloopkai-cht/temp.txt -c ./zrloopkai-cht/moran.chars.dict.yaml
+python3 ./tools-additional/assemble_dict.py -o ./zrloopkai-cht/radical_flypy.dict.yaml --head ./zrloopkai-cht/radical_flypy.dict.yaml "..." --text "" --file ./zrloopkai-cht/temp.txt
 cp ./zrloopkai-cht/radical_flypy.dict.yaml ./zrloopkai-chs
 
-rm -f temp.txt
 rm -f ./zrloopkai-cht/temp.txt
 rm -f ./zrloopkai-chs/temp.txt
 
@@ -238,7 +68,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/zrloopkai_zrmdb_tencent      #
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml zrloopkai.schema.yaml
@@ -295,7 +124,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/zrloopkai_zrmdb_tencent      #
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml zrloopkai.schema.yaml
@@ -5,177 +5,30 @@ set -x
 
 # BUILD_TYPE="$1"
 
-rm -rf zrloopmoqi-chs
-rm -rf zrloopmoqi-cht
+# 複製 rime-moran 並生成詞庫（見 tools-additional/schemes.py）；build.py 為每個方案各自生成詞庫，再以 --no-dicts 執行
+if [ "$1" != "--no-dicts" ]; then
+    cd ./tools-additional
+    python3 make_dicts.py zrloopmoqi
+    cd ..
+fi
 
 # 生成繁體
-cp -a ./rime-moran-cht/. ./zrloopmoqi-cht
-
-rm -rf ./zrloopmoqi-cht/.git
-rm -rf ./zrloopmoqi-cht/.gitignore
-rm -rf ./zrloopmoqi-cht/README.md
-rm -rf ./zrloopmoqi-cht/README-en.md
-rm -rf ./zrloopmoqi-cht/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./zrloopmoqi-cht/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./zrloopmoqi-cht/moran.yaml
 # mv ./zrloopmoqi-cht/punctuation.yaml ./schema
 cp ./rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt ./zrloopmoqi-cht/opencc/moran_chaifen.txt
 sed -i -E 's/^(\S+)\t(\S+)\t(.+)$/\1\t〔\3\2〕/' ./zrloopmoqi-cht/opencc/moran_chaifen.txt
-cp ./rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt ./tools-additional/moqidb.txt # && sed -i '0,/\.\.\./d' ./tools-additional/moqidb.txt
-perl -CSAD -i -pe 's/(.*\t[a-z]{2})\t.*/$1/' ./tools-additional/moqidb.txt
 
 # 生成簡體
-cp -a ./rime-moran-chs/. ./zrloopmoqi-chs
-
-rm -rf ./zrloopmoqi-chs/.git
-rm -rf ./zrloopmoqi-chs/.gitignore
-rm -rf ./zrloopmoqi-chs/README.md
-rm -rf ./zrloopmoqi-chs/README-en.md
-rm -rf ./zrloopmoqi-chs/.github/
 perl -CSAD -i -pe 's/(^.*ZRM-SPECIFIC)/# $1/' ./zrloopmoqi-chs/moran.yaml
 perl -0777 -i -pe 's/(  user_sentence_top:)\n(    __append:)\n(      __patch:)/$1\n# $2\n# $3/' ./zrloopmoqi-chs/moran.yaml
 # mv ./zrloopmoqi-chs/punctuation.yaml ./schema
 cp ./rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt ./zrloopmoqi-chs/opencc/moran_chaifen.txt
 sed -i -E 's/^(\S+)\t(\S+)\t(.+)$/\1\t〔\3\2〕/' ./zrloopmoqi-chs/opencc/moran_chaifen.txt
-cp ./rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt ./tools-additional/moqidb.txt # && sed -i '0,/\.\.\./d' ./tools-additional/moqidb.txt
-perl -CSAD -i -pe 's/(.*\t[a-z]{2})\t.*/$1/' ./tools-additional/moqidb.txt
-
-# 轉換詞庫
-cd ./tools-additional
-# 轉換繁体詞庫
-echo 轉換繁体詞庫...
-sed '/\.\.\./q' ../zrloopmoqi-cht/moran.chars.dict.yaml > ../zrloopmoqi-cht/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p zrloopmoqi -x moqidb -i ../data/zdicdbtonesorted.yaml -o ../zrloopmoqi-cht/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../zrloopmoqi-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../zrloopmoqi-cht/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../zrloopmoqi-cht/temp.txt
-echo "" >> ../zrloopmoqi-cht/moran.chars.dict.yaml.bak
-cat ../zrloopmoqi-cht/temp.txt >> ../zrloopmoqi-cht/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../zrloopmoqi-cht/moran.base.dict.yaml > ../zrloopmoqi-cht/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../zrloopmoqi-cht/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../zrloopmoqi-cht/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p zrloopmoqi -x moqidb -t -i ../zrloopmoqi-cht/snow_pinyin.base.dict.yaml -o ../zrloopmoqi-cht/temp.txt
-# echo "" >> ../zrloopmoqi-cht/moran.base.dict.yaml.bak
-cat ../zrloopmoqi-cht/temp.txt >> ../zrloopmoqi-cht/moran.base.dict.yaml.bak
-rm ../zrloopmoqi-cht/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopmoqi-cht/moran.tencent.dict.yaml > ../../zrloopmoqi-cht/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopmoqi-cht/moran.moe.dict.yaml > ../../zrloopmoqi-cht/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopmoqi-cht/moran.computer.dict.yaml > ../../zrloopmoqi-cht/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopmoqi-cht/moran.hanyu.dict.yaml > ../../zrloopmoqi-cht/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopmoqi-cht/moran.words.dict.yaml > ../../zrloopmoqi-cht/moran.words.dict.yaml.bak
-# python3 convert_sp.py -i ../zrloopmoqi-cht/zrlf.dict.yaml -o ../zrloopmoqi-cht/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../zrloopmoqi-cht/moran_fixed.dict.yaml > ../zrloopmoqi-cht/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/zrloopmoqi.simpchars.txt ../zrloopmoqi-cht/zrloopmoqi.simpchars.txt && opencc -i ../zrloopmoqi-cht/zrloopmoqi.simpchars.txt -o ../zrloopmoqi-cht/temp.txt -c s2t
-echo "" >> ../zrloopmoqi-cht/moran_fixed.dict.yaml.bak
-cat ../zrloopmoqi-cht/temp.txt >> ../zrloopmoqi-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/zrloop.simpwords.txt -o ../zrloopmoqi-cht/temp.txt -c s2t
-echo "" >> ../zrloopmoqi-cht/moran_fixed.dict.yaml.bak && cat ../zrloopmoqi-cht/temp.txt >> ../zrloopmoqi-cht/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../zrloopmoqi-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../zrloopmoqi-cht/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../zrloopmoqi-cht/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../zrloopmoqi-cht/moran_fixed.dict.yaml >> ../zrloopmoqi-cht/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../zrloopmoqi-cht/temp.txt -c s2t
-echo "" >> ../zrloopmoqi-cht/moran_fixed.dict.yaml.bak && cat ../zrloopmoqi-cht/temp.txt >> ../zrloopmoqi-cht/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../zrloopmoqi-cht/moran_fixed.dict.yaml.bak
-rm ../zrloopmoqi-cht/zrloopmoqi.simpchars.txt
-
-sed '/#----------词库----------#/q' ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml > ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/zrloopmoqi.simpchars.txt ../zrloopmoqi-cht/zrloopmoqi.simpchars.txt && cp ../zrloopmoqi-cht/zrloopmoqi.simpchars.txt ../zrloopmoqi-cht/temp.txt
-echo "" >> ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml.bak
-cat ../zrloopmoqi-cht/temp.txt >> ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/zrloop.simpwords.txt ../zrloopmoqi-cht/temp.txt
-echo "" >> ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml.bak && cat ../zrloopmoqi-cht/temp.txt >> ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml >> ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../zrloopmoqi-cht/temp.txt
-echo "" >> ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml.bak && cat ../zrloopmoqi-cht/temp.txt >> ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml.bak
-rm ../zrloopmoqi-cht/zrloopmoqi.simpchars.txt
-
-mv ../zrloopmoqi-cht/moran.chars.dict.yaml{.bak,}
-mv ../zrloopmoqi-cht/moran.base.dict.yaml{.bak,}
-# mv ../zrloopmoqi-cht/moran.tencent.dict.yaml{.bak,}
-# mv ../zrloopmoqi-cht/moran.moe.dict.yaml{.bak,}
-# mv ../zrloopmoqi-cht/moran.computer.dict.yaml{.bak,}
-# mv ../zrloopmoqi-cht/moran.hanyu.dict.yaml{.bak,}
-# mv ../zrloopmoqi-cht/moran.words.dict.yaml{.bak,}
-mv ../zrloopmoqi-cht/moran_fixed.dict.yaml{.bak,}
-mv ../zrloopmoqi-cht/moran_fixed_simp.dict.yaml{.bak,}
-# mv ../zrloopmoqi-cht/zrlf.dict.yaml{.bak,}
-
-# 轉換简体詞庫
-echo 轉換简体詞庫...
-sed '/\.\.\./q' ../zrloopmoqi-chs/moran.chars.dict.yaml > ../zrloopmoqi-chs/moran.chars.dict.yaml.bak
-python3 gen_dict_with_shape.py -p zrloopmoqi -x moqidb -i ../data/zdicdbtonesorted.yaml -o ../zrloopmoqi-chs/temp.txt
-perl -CSAD -i -pe "s/(.*);;/\1/g" ../zrloopmoqi-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t.*;[a-z]{0,1}\n//g" ../zrloopmoqi-chs/temp.txt
-# perl -CSAD -i -pe "s/.*\t[a-z]{2};;.*\n//g" ../zrloopmoqi-chs/temp.txt
-echo "" >> ../zrloopmoqi-chs/moran.chars.dict.yaml.bak
-cat ../zrloopmoqi-chs/temp.txt >> ../zrloopmoqi-chs/moran.chars.dict.yaml.bak
-
-sed '/\.\.\./q' ../zrloopmoqi-chs/moran.base.dict.yaml > ../zrloopmoqi-chs/moran.base.dict.yaml.bak
-cp ../rime-snow-pinyin/snow_pinyin.base.dict.yaml ../zrloopmoqi-chs/snow_pinyin.base.dict.yaml
-sed -i '0,/\.\.\./d' ../zrloopmoqi-chs/snow_pinyin.base.dict.yaml
-python3 gen_dict_with_shape.py -p zrloopmoqi -x moqidb -s -i ../zrloopmoqi-chs/snow_pinyin.base.dict.yaml -o ../zrloopmoqi-chs/temp.txt
-# echo "" >> ../zrloopmoqi-chs/moran.base.dict.yaml.bak
-cat ../zrloopmoqi-chs/temp.txt >> ../zrloopmoqi-chs/moran.base.dict.yaml.bak
-rm ../zrloopmoqi-chs/snow_pinyin.base.dict.yaml
-
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopmoqi-chs/moran.tencent.dict.yaml > ../../zrloopmoqi-chs/moran.tencent.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopmoqi-chs/moran.moe.dict.yaml > ../../zrloopmoqi-chs/moran.moe.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopmoqi-chs/moran.computer.dict.yaml > ../../zrloopmoqi-chs/moran.computer.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopmoqi-chs/moran.hanyu.dict.yaml > ../../zrloopmoqi-chs/moran.hanyu.dict.yaml.bak
-# python3 schemagen.py convert-sp --to=flypy --rime-dict=../../zrloopmoqi-chs/moran.words.dict.yaml > ../../zrloopmoqi-chs/moran.words.dict.yaml.bak
-# python3 convert_sp.py -i ../zrloopmoqi-chs/zrlf.dict.yaml -o ../zrloopmoqi-chs/zrlf.dict.yaml.bak
-
-sed '/#----------詞庫----------#/q' ../zrloopmoqi-chs/moran_fixed.dict.yaml > ../zrloopmoqi-chs/moran_fixed.dict.yaml.bak
-cp ../data/assess.tiger-code.com/zrloopmoqi.simpchars.txt ../zrloopmoqi-chs/zrloopmoqi.simpchars.txt && opencc -i ../zrloopmoqi-chs/zrloopmoqi.simpchars.txt -o ../zrloopmoqi-chs/temp.txt -c s2t
-echo "" >> ../zrloopmoqi-chs/moran_fixed.dict.yaml.bak
-cat ../zrloopmoqi-chs/temp.txt >> ../zrloopmoqi-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/zrloop.simpwords.txt -o ../zrloopmoqi-chs/temp.txt -c s2t
-echo "" >> ../zrloopmoqi-chs/moran_fixed.dict.yaml.bak && cat ../zrloopmoqi-chs/temp.txt >> ../zrloopmoqi-chs/moran_fixed.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../zrloopmoqi-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../zrloopmoqi-chs/moran_fixed.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../zrloopmoqi-chs/moran_fixed.dict.yaml
-sed '0,/#----------詞庫----------#/d' ../zrloopmoqi-chs/moran_fixed.dict.yaml >> ../zrloopmoqi-chs/moran_fixed.dict.yaml.bak
-opencc -i ../data/assess.tiger-code.com/common.simp.words.txt -o ../zrloopmoqi-chs/temp.txt -c s2t
-echo "" >> ../zrloopmoqi-chs/moran_fixed.dict.yaml.bak && cat ../zrloopmoqi-chs/temp.txt >> ../zrloopmoqi-chs/moran_fixed.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../zrloopmoqi-chs/moran_fixed.dict.yaml.bak
-rm ../zrloopmoqi-chs/zrloopmoqi.simpchars.txt
-
-sed '/#----------词库----------#/q' ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml > ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/zrloopmoqi.simpchars.txt ../zrloopmoqi-chs/zrloopmoqi.simpchars.txt && cp ../zrloopmoqi-chs/zrloopmoqi.simpchars.txt ../zrloopmoqi-chs/temp.txt
-echo "" >> ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml.bak
-cat ../zrloopmoqi-chs/temp.txt >> ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/zrloop.simpwords.txt ../zrloopmoqi-chs/temp.txt
-echo "" >> ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml.bak && cat ../zrloopmoqi-chs/temp.txt >> ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml.bak
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{1}\t[A-Za-z]+.*\n//g" ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{3}\t[A-Za-z]{4}+\n//g" ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml
-perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}\x{3007}\x{3400}-\x{4dbf}\x{20000}-\x{2a6df}\x{2a700}-\x{2b73f}\x{2b740}-\x{2b81f}\x{2b820}-\x{2ceaf}\x{2ceb0}-\x{2ebe0}\x{30000}-\x{3134a}\x{31350}-\x{323af}\x{2ebf0}-\x{2ee5f}]{2}\t[A-Za-z]{3,4}+\n//g" ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml
-sed '0,/#----------词库----------#/d' ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml >> ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml.bak
-cp ../data/assess.tiger-code.com/common.simp.words.txt ../zrloopmoqi-chs/temp.txt
-echo "" >> ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml.bak && cat ../zrloopmoqi-chs/temp.txt >> ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml.bak && perl -i -ne 'print if !$seen{$_}++' ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml.bak
-rm ../zrloopmoqi-chs/zrloopmoqi.simpchars.txt
-
-mv ../zrloopmoqi-chs/moran.chars.dict.yaml{.bak,}
-mv ../zrloopmoqi-chs/moran.base.dict.yaml{.bak,}
-# mv ../zrloopmoqi-chs/moran.tencent.dict.yaml{.bak,}
-# mv ../zrloopmoqi-chs/moran.moe.dict.yaml{.bak,}
-# mv ../zrloopmoqi-chs/moran.computer.dict.yaml{.bak,}
-# mv ../zrloopmoqi-chs/moran.hanyu.dict.yaml{.bak,}
-# mv ../zrloopmoqi-chs/moran.words.dict.yaml{.bak,}
-mv ../zrloopmoqi-chs/moran_fixed.dict.yaml{.bak,}
-mv ../zrloopmoqi-chs/moran_fixed_simp.dict.yaml{.bak,}
-# mv ../zrloopmoqi-chs/zrlf.dict.yaml{.bak,}
-cd ..
 
 # 整理文件結構
 rm -rf ./zrloopmoqi-cht/tools
 rm -rf ./zrloopmoqi-cht/make_simp_dist.sh
-mkdir -p ./zrloopmoqi-cht/snow-dicts/
-mkdir -p ./zrloopmoqi-chs/snow-dicts/
 # cp -a ./zrloopmoqi-cht/moran_fixed.dict.yaml ./schema/zrloopmoqi_fixed.dict.yaml
 # cp -a ./zrloopmoqi-cht/moran_fixed_simp.dict.yaml ./schema/zrloopmoqi_fixed_simp.dict.yaml
 cp -a ./schema/default.custom.zrloopmoqi.yaml ./zrloopmoqi-cht/default.custom.yaml
@@ -196,37 +49,14 @@ cp -a ./schema/default.custom.zrloopmoqi.yaml ./zrloopmoqi-chs/default.custom.ya
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\n//g" ./schema/moran_fixed_simp.dict.yaml
 # perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fa5}A-Za-z0-9\x{3007}\x{ff0c}-\x{ffee}]{1,100}\t[A-Za-z0-9]{5,100}\t.*\n//g" ./schema/moran_fixed_simp.dict.yaml
 
-cd ./tools-additional
-# 生成繁體霧凇
-python3 gen_dict_with_shape.py -p zrloopmoqi -x moqidb -t -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../zrloopmoqi-cht/snow-dicts/zrloopmoqi_moqidb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x moqidb -t -o ../zrloopmoqi-cht/snow-dicts/flypy_moqidb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x moqidb -t -o ../zrloopmoqi-cht/snow-dicts/flypy_moqidb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x moqidb -t -o ../zrloopmoqi-cht/snow-dicts/flypy_moqidb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x moqidb -t -o ../zrloopmoqi-cht/snow-dicts/flypy_moqidb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x moqidb -t -o ../zrloopmoqi-cht/snow-dicts/flypy_moqidb_others.dict.yaml
-python3 gen_dict_with_shape.py -p zrloopmoqi -x moqidb -t -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../zrloopmoqi-cht/snow-dicts/zrloopmoqi_moqidb_tencent.dict.yaml
-# 生成簡體霧凇
-python3 gen_dict_with_shape.py -p zrloopmoqi -x moqidb -s -i ../rime-snow-pinyin/snow_pinyin.ext.dict.yaml -o ../zrloopmoqi-chs/snow-dicts/zrloopmoqi_moqidb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/8105.dict.yaml    -x moqidb -o ../zrloopmoqi-chs/snow-dicts/flypy_moqidb_8105.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/41448.dict.yaml   -x moqidb -o ../zrloopmoqi-chs/snow-dicts/flypy_moqidb_41448.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/base.dict.yaml    -x moqidb -o ../zrloopmoqi-chs/snow-dicts/flypy_moqidb_base.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/ext.dict.yaml     -x moqidb -o ../zrloopmoqi-chs/snow-dicts/flypy_moqidb_ext.dict.yaml
-# python3 gen_dict_with_shape.py -i ../rime-snow/cn_dicts/others.dict.yaml  -x moqidb -o ../zrloopmoqi-chs/snow-dicts/flypy_moqidb_others.dict.yaml
-python3 gen_dict_with_shape.py -p zrloopmoqi -x moqidb -s -i ../rime-snow-pinyin/snow_pinyin.tencent.dict.yaml -o ../zrloopmoqi-chs/snow-dicts/zrloopmoqi_moqidb_tencent.dict.yaml
-cd ..
-
 # 生成ocz
 cp ./rime-radical-pinyin/radical.schema.yaml ./zrloopmoqi-chs
 cp ./rime-radical-pinyin/radical.schema.yaml ./zrloopmoqi-cht
 cp ./rime-radical-pinyin/radical_flypy.dict.yaml ./zrloopmoqi-cht
-sed '/\.\.\./q' ./zrloopmoqi-cht/radical_flypy.dict.yaml > ./zrloopmoqi-cht/radical_flypy.dict.yaml.bak
-python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o temp.txt -c ./zrloopmoqi-cht/moran.chars.dict.yaml
-echo "" >> ./zrloopmoqi-cht/radical_flypy.dict.yaml.bak
-cat temp.txt >> ./zrloopmoqi-cht/radical_flypy.dict.yaml.bak
-mv ./zrloopmoqi-cht/radical_flypy.dict.yaml{.bak,}
+python3 ./tools-additional/prepare_chaizi.py -i ./chaizi-re/radical.yaml -o ./zrloopmoqi-cht/temp.txt -c ./zrloopmoqi-cht/moran.chars.dict.yaml
+python3 ./tools-additional/assemble_dict.py -o ./zrloopmoqi-cht/radical_flypy.dict.yaml --head ./zrloopmoqi-cht/radical_flypy.dict.yaml "..." --text "" --file ./zrloopmoqi-cht/temp.txt
 cp ./zrloopmoqi-cht/radical_flypy.dict.yaml ./zrloopmoqi-chs
 
-rm -f temp.txt
 rm -f ./zrloopmoqi-cht/temp.txt
 rm -f ./zrloopmoqi-chs/temp.txt
 
@@ -242,7 +72,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/zrloopmoqi_moqidb_tencent
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml zrloopmoqi.schema.yaml
@@ -299,7 +128,6 @@ sed -i "s/\(  - moran\.words  \)/  - snow-dicts\/zrloopmoqi_moqidb_tencent
 sed -i "s/\(  - moran\.tencent\)/# \1/g" ./moran.extended.dict.yaml
 sed -i "s/\(  - moran\.moe\)/# \1/g" ./moran.extended.dict.yaml
 
-
 rm moran.extended.dict.yaml.bak
 
 cp moran.schema.yaml zrloopmoqi.schema.yaml
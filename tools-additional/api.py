@@ -0,0 +1,36 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+The converters of this directory as functions on rows, for build drivers
+that chain stages in one process instead of through files.
+
+Every function takes iterables of rows (lists or tuples of str, as
+rime_dict.reader gives them) and returns rows again, so the output of one
+stage can be fed straight into the next:
+
+    import api
+
+    api.set_opencc_cache()
+    rows = api.iter_rows("../rime-ice/cn_dicts/8105.dict.yaml")
+    rows = api.convert_dict(rows, pinyin="zrlong", shape="zrmdb", variant="s")
+    api.write_rows("../molong-chs/temp.txt", rows)
+
+The command line tools are thin wrappers around the same functions.
+"""
+
+from convert_sp import convert_shuangpin
+from dazhu import build_dazhu
+from gen_dict_with_shape import convert_dict, set_opencc_cache
+from prepare_chaizi import build_chaizi
+from rime_dict import iter_rows, read_rows, write_rows
+
+__all__ = [
+    "build_chaizi",
+    "build_dazhu",
+    "convert_dict",
+    "convert_shuangpin",
+    "iter_rows",
+    "read_rows",
+    "set_opencc_cache",
+    "write_rows",
+]
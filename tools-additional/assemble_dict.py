@@ -0,0 +1,176 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Build a dict file from a chain of stages, written once.
+
+The make scripts put a dict together by writing the header to a .bak,
+then for every part writing temp.txt, fixing it up with perl -i or sed -i
+and appending it with cat >>, before moving the .bak into place. Here the
+parts are read in order, filtered as they stream past and written to a
+temp file next to the output, which is renamed over it at the end:
+
+    python3 assemble_dict.py -o ../X-cht/moran.chars.dict.yaml \
+        --head ../X-cht/moran.chars.dict.yaml "..." --text "" \
+        --run "python3 gen_dict_with_shape.py -p X -x zrmdb -m -i ../data/zdicdbtonesorted.yaml -o -" \
+        --sub "(.*);;" "\1"
+
+Sources, in the order given:
+    --head FILE MARKER   lines of FILE up to the first one with MARKER in it, as sed '/MARKER/q'
+    --body FILE MARKER   lines of FILE after that one, as sed '0,/MARKER/d'
+    --file FILE          all of FILE, as cat
+    --text TEXT          TEXT and a newline, as echo
+    --run COMMAND        what a bash command writes to stdout, through a pipe
+
+--sub and --filter apply to the source before them, --dedupe to the
+whole output. Any source may read the output file itself, it is only
+replaced once everything has been read. A file given to --head and
+--body is mapped and scanned for all of its markers once, and a part
+that is neither filtered nor deduped is copied in one piece.
+"""
+
+import argparse
+import io
+import re
+import subprocess
+import sys
+from collections import namedtuple
+from itertools import chain
+
+import dedupe
+import filter_dict
+import rime_dict
+
+TEXT_OPTIONS = dict(encoding="UTF-8", errors="surrogateescape", newline="\n")
+
+Source = namedtuple("Source", "kind args filters")
+
+
+def text_lines(text):
+    yield text + "\n"
+
+
+def run_lines(command):
+    # pipefail, so a failing producer in front of a filter still fails the stage
+    proc = subprocess.Popen(["bash", "-o", "pipefail", "-c", command], stdout=subprocess.PIPE)
+    try:
+        yield from io.TextIOWrapper(proc.stdout, **TEXT_OPTIONS)
+    except BaseException:
+        proc.kill()
+        raise
+    finally:
+        proc.stdout.close()
+        code = proc.wait()
+    if code:
+        raise subprocess.CalledProcessError(code, command)
+
+
+# "lines" is any iterable of lines, for callers that build a dict in-process
+SOURCES = {"text": text_lines, "run": run_lines, "lines": iter}
+# Sources cut out of a file mapped with rime_dict.DictFile
+DICT_PARTS = {"head": rime_dict.DictFile.head, "body": rime_dict.DictFile.body, "file": rime_dict.DictFile.text}
+
+
+class DictFiles:
+    r"""The files the head, body and file sources read, each mapped and scanned once for all its markers."""
+
+    def __init__(self, sources):
+        self.markers = {}
+        for source in sources:
+            if source.kind in DICT_PARTS:
+                self.markers.setdefault(source.args[0], []).extend(source.args[1:])
+        self.files = {}
+
+    def get(self, path):
+        # Mapped when it is first read, so a source may read what an earlier assemble() wrote
+        if path not in self.files:
+            self.files[path] = rime_dict.DictFile(path, self.markers[path], errors=TEXT_OPTIONS["errors"])
+        return self.files[path]
+
+    def close(self):
+        for dict_file in self.files.values():
+            dict_file.close()
+
+
+def sub_lines(lines, pattern, repl):
+    # Line by line with the newline, like perl -pe "s/PATTERN/REPL/g"
+    pattern = re.compile(pattern)
+    return (pattern.sub(repl, line) for line in lines)
+
+
+def source_lines(source, dict_files, by_line=True):
+    if source.kind in DICT_PARTS:
+        text = DICT_PARTS[source.kind](dict_files.get(source.args[0]), *source.args[1:])
+        # A part nothing looks into is written in one piece
+        lines = rime_dict.text_lines(text) if by_line or source.filters else [text]
+    else:
+        lines = SOURCES[source.kind](*source.args)
+    for kind, args in source.filters:
+        if kind == "sub":
+            lines = sub_lines(lines, *args)
+        else:
+            lines = filter_dict.filter_lines(lines, args)
+    return lines
+
+
+def assemble(output, sources, dedupe_memory=None):
+    r"""Write the lines of all sources to output in one go; dedupe_memory=None keeps repeats."""
+    dict_files = DictFiles(sources)
+    try:
+        lines = chain.from_iterable(source_lines(source, dict_files, dedupe_memory is not None) for source in sources)
+        if dedupe_memory is not None:
+            lines = dedupe.iter_unique(lines, max_items=dedupe.max_entries(dedupe_memory))
+        with rime_dict.atomic_write(output, **TEXT_OPTIONS) as f_out:
+            f_out.writelines(lines)
+    finally:
+        dict_files.close()
+
+
+class StageAction(argparse.Action):
+    r"""Collects the sources in the order they are given, with their filters."""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        if namespace.stages is None:
+            namespace.stages = []
+        if self.dest in SOURCES or self.dest in DICT_PARTS:
+            namespace.stages.append(Source(self.dest, values if isinstance(values, list) else [values], []))
+        elif not namespace.stages:
+            parser.error(f"{option_string} has to follow a source")
+        else:
+            namespace.stages[-1].filters.append((self.dest, values))
+
+
+def get_cli_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output_file", "-o", type=str, required=True, help="Output file")
+    parser.set_defaults(stages=None)
+    parser.add_argument("--head", nargs=2, action=StageAction, metavar=("FILE", "MARKER"))
+    parser.add_argument("--body", nargs=2, action=StageAction, metavar=("FILE", "MARKER"))
+    parser.add_argument("--file", action=StageAction, metavar="FILE")
+    parser.add_argument("--text", action=StageAction, metavar="TEXT")
+    parser.add_argument("--run", action=StageAction, metavar="COMMAND")
+    parser.add_argument("--sub", nargs=2, action=StageAction, metavar=("PATTERN", "REPL"),
+                        help="Replace every match of a Python regex in each line of the source before")
+    parser.add_argument("--filter", nargs="+", action=StageAction, metavar="RULE", choices=filter_dict.RULES,
+                        help="Drop the lines of the source before that match any of these filter_dict.py rules")
+    parser.add_argument("--dedupe", action="store_true", help="Drop repeated lines of the output, as dedupe.py")
+    parser.add_argument("--dedupe-memory", type=dedupe.memory_budget, default=dedupe.DEFAULT_MEMORY,
+                        help="Memory budget in MB for --dedupe before it spills to temp files")
+    args = parser.parse_args()
+    if not args.stages:
+        parser.error("nothing to write, give at least one source")
+    return args
+
+
+def main():
+    args = get_cli_args()
+    try:
+        assemble(args.output_file, args.stages, args.dedupe_memory if args.dedupe else None)
+    except subprocess.CalledProcessError as e:
+        sys.exit(f"{args.output_file}: {e}")
+    dropped = ", ".join(f"{name} {n}" for name, n in filter_dict.stats.items() if name != "kept")
+    if dropped:
+        print(f"{args.output_file}: dropped {dropped}")
+
+
+if __name__ == "__main__":
+    main()
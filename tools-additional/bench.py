@@ -0,0 +1,268 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Micro-benchmarks for the dictionary tools.
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import os
+import re
+import time
+import tracemalloc
+from collections import defaultdict
+
+import dict_array
+import gen_dict_with_shape
+import rime_dict
+import schemes
+import shape_db
+
+
+def load_syllables(input_file):
+    syllables = []
+    with open(input_file, encoding='UTF-8') as f:
+        for line in f:
+            columns = line.rstrip("\n").split("\t")
+            if len(columns) < 2 or not columns[1] or columns[1][0].isnumeric():
+                continue
+            syllables.extend(columns[1].split())
+    return syllables
+
+
+def convertible(convert, syllables):
+    ok = []
+    for syllable in syllables:
+        try:
+            convert(syllable)
+        except (IndexError, KeyError):
+            continue
+        ok.append(syllable)
+    return ok
+
+
+def throughput(fn, syllables, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for syllable in syllables:
+            fn(syllable)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(syllables) / best
+
+
+def bench_codec(args):
+    syllables = load_syllables(args.input_file)
+    toneless = [re.sub("[0-9]", "", syllable) for syllable in syllables]
+    print(f"{len(syllables)} syllables from {args.input_file}")
+    print(f"{'codec':<20}{'convert/s':>14}{'table/s':>14}{'speedup':>10}")
+    for name, (convert, _, _) in gen_dict_with_shape.PINYIN_CODECS.items():
+        sample = convertible(convert, toneless if name in ["flypy", "zrm"] else syllables)
+        before = throughput(convert, sample, args.repeat)
+        after = throughput(gen_dict_with_shape.get_codec(name).__getitem__, sample, args.repeat)
+        print(f"{name:<20}{before:>14,.0f}{after:>14,.0f}{after / before:>9.1f}x")
+
+
+def traced(fn, *args):
+    # The memory still held by the result of fn and the most fn held at once, as seen by tracemalloc
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn(*args)
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, (size - before, peak - before)
+
+
+def legacy_shape_dict(path, multishape):
+    # The structure get_shape_dict used to build: one list per character
+    shape_dict = defaultdict(list)
+    keypairs_seen = set()
+    with open(path, newline="", encoding='UTF-8') as f:
+        for row in csv.reader(f, delimiter="\t", quotechar="`"):
+            if len(row) >= 2:
+                key, value = row[0], row[1]
+                if not multishape:
+                    if key not in shape_dict:
+                        shape_dict[key].append(value)
+                else:
+                    keypair = key + value
+                    if keypair not in keypairs_seen:
+                        shape_dict[key].append(value)
+                        keypairs_seen.add(keypair)
+    return shape_dict, keypairs_seen
+
+
+def read_rows(path, compact):
+    with open(path, newline="", encoding='UTF-8') as f:
+        rows = csv.reader(f, delimiter="\t", quotechar="`")
+        return list(map(gen_dict_with_shape.compact_row, rows)) if compact else list(rows)
+
+
+def rewrite_rows(rows, shape_dict, args, compact):
+    pinyin_fn = gen_dict_with_shape.get_pinyin_fn(args.pinyin)
+    with contextlib.redirect_stdout(io.StringIO()):  # rows that fail to convert are printed
+        out_rows = gen_dict_with_shape.remove_dupe(gen_dict_with_shape.iter_rewrite(
+            rows, False, False, ";", pinyin_fn, shape_dict, args.multishape))
+    return out_rows if compact else [list(row) for row in out_rows]
+
+
+def bench_memory(args):
+    shape_file = f"{args.shape}.txt"
+    print(f"{'structure':<36}{'held':>11}{'compact':>11}{'saved':>7}{'peak':>11}{'compact':>11}{'saved':>7}")
+
+    def report(name, legacy, compact):
+        columns = "".join(f"{old / 2**20:>9.2f}MB{new / 2**20:>9.2f}MB{1 - new / old:>7.0%}"
+                          for old, new in zip(legacy, compact))
+        print(f"{name:<36}{columns}")
+
+    _, legacy = traced(legacy_shape_dict, shape_file, args.multishape)
+    shape_dict, compact = traced(shape_db.load_shape_dict, shape_file, args.multishape, False)
+    report(f"shapes {shape_file}", legacy, compact)
+    # As the builds load it once the .shapecache is there
+    if shape_db.read_cache(shape_file, args.multishape) is None:
+        shape_db.write_cache(shape_file, *shape_db.parse_shape_db(shape_file))
+    _, compact = traced(shape_db.read_cache, shape_file, args.multishape)
+    report(f"shapes {shape_file}.shapecache", legacy, compact)
+
+    input_files = args.input_file + [os.path.join("..", schemes.BASE_DICTS[base]) for base in args.base]
+    for input_file in input_files:
+        name = input_file.rsplit('/', 1)[-1]
+        rows, legacy = traced(read_rows, input_file, False)
+        del rows
+        rows, compact = traced(read_rows, input_file, True)
+        report(f"rows {name}", legacy, compact)
+
+        out_rows, legacy = traced(rewrite_rows, rows, shape_dict, args, False)
+        del out_rows
+        _, compact = traced(rewrite_rows, rows, shape_dict, args, True)
+        report(f"rewritten rows {name}", legacy, compact)
+        del rows
+
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_tsv(args):
+    path = args.input_file
+
+    def csv_read():
+        with open(path, newline="", encoding='UTF-8') as f:
+            for _ in csv.reader(f, delimiter="\t", quotechar="`"):
+                pass
+
+    def rime_read():
+        for _ in rime_dict.iter_rows(path):
+            pass
+
+    def rime_read_text():
+        with rime_dict.open_dict(path) as f:
+            for _ in rime_dict.reader(f):
+                pass
+
+    rows = rime_dict.read_rows(path)
+
+    def csv_write():
+        with open(args.output_file, "w", newline="", encoding='UTF-8') as f:
+            csv.writer(f, delimiter="\t", quotechar="`", lineterminator="\n").writerows(rows)
+
+    def rime_write():
+        rime_dict.write_rows(args.output_file, rows)
+
+    print(f"{len(rows)} rows from {path}")
+    print(f"{'':<24}{'rows/s':>14}{'speedup':>10}")
+    for name, baseline, fns in [("read", csv_read, [("rime_dict.iter_rows", rime_read),
+                                                              ("rime_dict.reader", rime_read_text)]),
+                                ("write", csv_write, [("rime_dict.writer", rime_write)])]:
+        before = best_of(baseline, args.repeat)
+        print(f"{'csv ' + name:<24}{len(rows) / before:>14,.0f}")
+        for label, fn in fns:
+            after = best_of(fn, args.repeat)
+            print(f"{label:<24}{len(rows) / after:>14,.0f}{before / after:>9.1f}x")
+
+
+def bench_numpy(args):
+    if dict_array.np is None:
+        raise SystemExit("the numpy benchmark needs NumPy installed")
+    rows = rime_dict.read_rows(args.input_file)
+    schemes = [scheme.split(":") for scheme in args.schemes]
+    with contextlib.redirect_stdout(io.StringIO()):  # rows that fail to convert are printed
+        start = time.perf_counter()
+        encoded = dict_array.encode(gen_dict_with_shape.iter_prepared(rows, False, False))
+        encode_time = time.perf_counter() - start
+    print(f"{len(rows)} rows from {args.input_file}, encoded in {encode_time:.2f}s")
+    print(f"{'scheme':<28}{'rows s':>10}{'numpy s':>10}{'speedup':>10}")
+    for pinyin, shape in schemes:
+        pinyin_fn = gen_dict_with_shape.get_pinyin_fn(pinyin)
+        shape_dict = gen_dict_with_shape.get_shape_dict(shape, False)
+
+        def rows_path():
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in gen_dict_with_shape.iter_rewrite(rows, False, False, ";", pinyin_fn, shape_dict, False):
+                    pass
+
+        def numpy_path():
+            for _ in encoded.convert(pinyin_fn, shape_dict, ";"):
+                pass
+
+        before = best_of(rows_path, args.repeat)
+        after = best_of(numpy_path, args.repeat)
+        print(f"{pinyin + ':' + shape:<28}{before:>10.2f}{after:>10.2f}{before / after:>9.1f}x")
+
+
+def get_cli_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest="bench", required=True)
+    codec = subparsers.add_parser("codec", help="Per-syllable throughput of the pinyin codecs")
+    codec.add_argument("--input_file", "-i", type=str,
+                       default="../data/zdicdbtonesorted.yaml",
+                       help="Dictionary to take syllables from")
+    codec.add_argument("--repeat", "-r", type=int, default=5, help="Best of N runs")
+    codec.set_defaults(func=bench_codec)
+    memory = subparsers.add_parser("memory", help="Memory held by the shape db and row structures, and their peak")
+    memory.add_argument("--input_file", "-i", type=str, nargs="+",
+                        default=["../data/zdicdbtonesorted.yaml"],
+                        help="Dictionaries to load and rewrite")
+    memory.add_argument("--base", nargs="+", choices=list(schemes.BASE_DICTS), default=[],
+                        help="Load and rewrite the base dicts of these as well, the largest the schemes read")
+    memory.add_argument("--pinyin", "-p", type=str, default="zrlong", help="Pinyin scheme")
+    memory.add_argument("--shape", "-x", type=str, default="zrmdb", help="shape schema")
+    memory.add_argument("--multishape", "-m", action="store_true", help="Keep every shape of a character")
+    memory.set_defaults(func=bench_memory)
+    tsv = subparsers.add_parser("tsv", help="Rows per second of rime_dict against the csv module")
+    tsv.add_argument("--input_file", "-i", type=str,
+                     default="../data/zdicdbtonesorted.yaml",
+                     help="Dictionary to read")
+    tsv.add_argument("--output_file", "-o", type=str, default=os.devnull,
+                     help="Where the write benchmark writes to")
+    tsv.add_argument("--repeat", "-r", type=int, default=5, help="Best of N runs")
+    tsv.set_defaults(func=bench_tsv)
+    numpy = subparsers.add_parser("numpy", help="Row by row conversion against the encoded dictionary, per scheme")
+    numpy.add_argument("--input_file", "-i", type=str,
+                       default="../data/zdicdbtonesorted.yaml",
+                       help="Dictionary to encode once and convert")
+    numpy.add_argument("--repeat", "-r", type=int, default=3, help="Best of N runs")
+    numpy.add_argument("schemes", nargs="*", metavar="PINYIN:SHAPE",
+                       default=["zrlong:zrmdb_zrlong", "zrloopkai:moqidb", "xhloopkai:zrmdb", "flypy:flypydb"],
+                       help="Schemes to convert to")
+    numpy.set_defaults(func=bench_numpy)
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    args = get_cli_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
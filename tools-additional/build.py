@@ -0,0 +1,374 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Build every scheme in parallel; the build half of generate.sh.
+
+    python3 tools-additional/build.py [--jobs N] [TARGET ...]
+
+Every step of the build is a node: a shell command with the files and
+directories it reads and writes, given relative to the repository root.
+The nodes are listed in the order generate.sh ran them, and that order
+is where the dependencies come from: a node waits for every earlier node
+that writes something it reads or writes, and for every earlier node
+that reads something it writes. Everything else runs side by side on up
+to --jobs workers, so the tree comes out as if the steps had run one
+after another.
+
+TARGETs are node names or patterns (make_xhup*, dazhu_*); they are built
+with whatever they depend on. Every line a node prints is prefixed with
+its name, as generate.sh did with sed 's/^/make_xxx: /'. When a node
+fails, the nodes depending on it are skipped and the others carry on.
+
+With --incremental a node is skipped when its command, the Python tools
+it runs with the modules of this directory they import, and the contents
+of its inputs are the same as on a run that is in
+the cache (see build_cache.py); its outputs are put back from there, so
+after a change to one source only the nodes reading it are run again.
+Programs outside this repository (opencc, perl) are not part of the key.
+What a node writes inside its inputs besides its outputs, as make all
+does in rime-moran, is found by looking at them before and after it ran;
+from then on it is left out of the key and cached with the outputs.
+The .shapecache files and the OpenCC cache the tools write next to
+themselves are not outputs: a .shapecache is checked against its db
+whenever it is read, and the OpenCC cache only holds conversions by the
+text converted.
+"""
+
+import argparse
+import ast
+import fnmatch
+import hashlib
+import os
+import platform
+import re
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import build_cache
+import schemes
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSESS = "data/assess.tiger-code.com"
+CHARDICTS = f"{ASSESS}/chardicts"
+SIMP_WORDS = f"{ASSESS}/common.simp.words.txt"
+ZDIC = "data/zdicdbtonesorted.yaml"
+CHAIZI = "chaizi-re"
+MOQI_CHAIFEN = "rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt"
+DEFAULT_CACHE_DIR = os.path.join(ROOT, ".build-cache")
+
+# What each make_*.sh reads besides its scheme, rime-radical-pinyin and its default.custom. The scheme
+# comes from its make_dicts node, which copies rime-moran and builds its dicts from what schemes.py
+# lists, after the shape node writing its shape db; make_*.sh --no-dicts only does the rest.
+SCHEME_SOURCES = {
+    "molong": [CHAIZI],
+    "molongkai": [CHAIZI],
+    "molongmoqi": [CHAIZI, MOQI_CHAIFEN],
+    "morankai": [CHAIZI],
+    "xhloopfly": [CHAIZI],
+    "xhloopkai": [CHAIZI],
+    "xhloopmoqi": [CHAIZI, MOQI_CHAIFEN],
+    "xhupkai": [],
+    "xhupmoqi": [MOQI_CHAIFEN],
+    "xhupzrmfast": [],
+    "zrloopkai": [CHAIZI],
+    "zrloopmoqi": [CHAIZI, MOQI_CHAIFEN],
+}
+# (source, target): the chardict of source, with its second code letter upper-cased,
+# is appended to the chars dict of target
+CHARDICT_MERGES = [
+    ("xhloopkai", "xhupkai"), ("xhupkai", "xhloopkai"),
+    ("xhloopmoqi", "xhupmoqi"), ("xhupmoqi", "xhloopmoqi"),
+    ("morankai", "zrloopkai"), ("zrloopkai", "morankai"),
+]
+DAZHU_SCHEMES = ["xhloopkai", "molongkai"]
+
+
+class Node:
+    r"""One step of the build: a bash script run in cwd (relative to the root).
+
+    tools are the scripts of tools-additional it runs, by file name.
+    """
+
+    def __init__(self, name, command, inputs=(), outputs=(), cwd=".", tools=()):
+        self.name = name
+        self.command = command
+        self.inputs = [os.path.normpath(path) for path in inputs]
+        self.outputs = [os.path.normpath(path) for path in outputs]
+        self.cwd = cwd
+        self.tools = list(tools)
+
+
+def script_tools(script):
+    r"""The tools a shell script runs, from its lines that are not comments."""
+    with open(os.path.join(ROOT, script), encoding="UTF-8") as f:
+        text = "".join(line for line in f if not line.lstrip().startswith("#"))
+    return sorted(set(re.findall(r"tools-additional/(\w+\.py)", text)))
+
+
+def chars_dict(scheme, variant):
+    return f"{scheme}-{variant}/moran.chars.dict.yaml"
+
+
+def chardict(scheme):
+    return f"{CHARDICTS}/{scheme}.chars.dict.txt"
+
+
+def shape_db_node(shape):
+    r"""The node writing tools-additional/SHAPE.txt from its source, for every scheme using it."""
+    source, _ = schemes.SHAPE_DBS[shape]
+    return Node(f"shape_{shape}", f"python3 make_dicts.py --shape-db {shape}",
+                inputs=[source], outputs=[f"tools-additional/{shape}.txt"], cwd="tools-additional",
+                tools=["make_dicts.py"])
+
+
+def make_dicts_node(name):
+    r"""The node copying rime-moran into a scheme and building its dicts."""
+    inputs = ["rime-moran-cht", "rime-moran-chs", *schemes.inputs(name),
+              f"tools-additional/{schemes.SCHEMES[name].shape}.txt"]
+    # Two workers, one for each variant; the other schemes build side by side
+    return Node(f"make_dicts_{name}", f"python3 make_dicts.py --jobs 2 {name}", inputs=inputs,
+                outputs=[f"{name}-{variant}" for variant in schemes.VARIANTS], cwd="tools-additional",
+                tools=["make_dicts.py"])
+
+
+def make_nodes():
+    r"""The build as generate.sh ran it, in the same order."""
+    nodes = [
+        Node("make_simpdict", "bash make_simpdict.sh",
+             inputs=["make_simpdict.sh", f"{ASSESS}/common.simp2.words.txt", f"{ASSESS}/common.simp3.words.txt",
+                     f"{ASSESS}/common.simp4.words.txt", f"{ASSESS}/common.simpothers.words.txt"],
+             outputs=[SIMP_WORDS]),
+        Node("rime_moran", "\n".join([
+            "rm -rf rime-moran-cht rime-moran-chs",
+            "cd ./rime-moran/",
+            "make all",
+            "make dist",
+            "mv dist/ ../rime-moran-cht/",
+            "make dist",
+            "./make_simp_dist.sh",
+            "mv dist/ ../rime-moran-chs/",
+        ]), inputs=["rime-moran"], outputs=["rime-moran-cht", "rime-moran-chs"]),
+    ]
+    shapes = dict.fromkeys(schemes.SCHEMES[scheme].shape for scheme in SCHEME_SOURCES)
+    nodes += [shape_db_node(shape) for shape in shapes if schemes.SHAPE_DBS[shape]]
+    nodes += [make_dicts_node(scheme) for scheme in SCHEME_SOURCES]
+    for scheme, sources in SCHEME_SOURCES.items():
+        script = f"make_{scheme}.sh"
+        nodes.append(Node(f"make_{scheme}", f"bash {script} --no-dicts",
+                          inputs=[script, f"{scheme}-cht", f"{scheme}-chs", "rime-radical-pinyin",
+                                  f"schema/default.custom.{scheme}.yaml", *sources],
+                          outputs=[f"{scheme}-cht", f"{scheme}-chs"], tools=script_tools(script)))
+    for scheme in SCHEME_SOURCES:
+        # The cht chars dict without its header, for the assessment site and the merges below
+        nodes.append(Node(f"chardict_{scheme}",
+                          f"python3 assemble_dict.py -o ../{chardict(scheme)} --body ../{chars_dict(scheme, 'cht')} ...",
+                          inputs=[chars_dict(scheme, "cht")], outputs=[chardict(scheme)], cwd="tools-additional",
+                          tools=["assemble_dict.py"]))
+    for source, target in CHARDICT_MERGES:
+        nodes.append(Node(f"merge_{source}_{target}", "\n".join([
+            f"sed -i -E 's/([^\\t]*\\t)(.)(.)/\\1\\2\\u\\3/' ./{chardict(source)}",
+            f"cat ./{chardict(source)} >> ./{chars_dict(target, 'cht')}",
+            f"cat ./{chardict(source)} >> ./{chars_dict(target, 'chs')}",
+        ]), inputs=[chardict(source), chars_dict(target, "cht"), chars_dict(target, "chs")],
+            outputs=[chardict(source), chars_dict(target, "cht"), chars_dict(target, "chs")]))
+    for scheme in DAZHU_SCHEMES:
+        output = f"dazhu-{scheme}-chs.txt"
+        nodes.append(Node(f"dazhu_{scheme}", f"python3 dazhu.py --folder '{scheme}-chs' -f --output '{output}'",
+                          inputs=[f"{scheme}-chs", "tools-additional/stroke.dict.yaml", "rime-moran/opencc"],
+                          outputs=[f"tools-additional/{output}"], cwd="tools-additional", tools=["dazhu.py"]))
+    # -x emptydb writes the readings of every word to pinyinwithtone_combined.txt as well
+    nodes.append(Node("pinyinwithtone",
+                      f"python3 gen_dict_with_shape.py -p tonenum2tonesymbol -x emptydb -i ../{ZDIC} -o ./pinyinwithtone.txt",
+                      inputs=[ZDIC, "tools-additional/emptydb.txt"],
+                      outputs=["tools-additional/pinyinwithtone.txt", "tools-additional/pinyinwithtone_combined.txt"],
+                      cwd="tools-additional", tools=["gen_dict_with_shape.py"]))
+    return nodes
+
+
+def overlaps(a, b):
+    # The same path, or one is inside the other
+    return a == b or a.startswith(b + "/") or b.startswith(a + "/")
+
+
+def touches(paths, others):
+    return any(overlaps(a, b) for a in paths for b in others)
+
+
+def dependencies(nodes):
+    r"""Map every node name to the names of the earlier nodes it has to wait for."""
+    deps = {}
+    for i, node in enumerate(nodes):
+        deps[node.name] = {earlier.name for earlier in nodes[:i]
+                           if touches(node.inputs + node.outputs, earlier.outputs)
+                           or touches(node.outputs, earlier.inputs)}
+    return deps
+
+
+def select(nodes, deps, targets):
+    # The targets and everything they depend on, still in build order
+    names = [node.name for node in nodes]
+    wanted = set()
+    for target in targets:
+        matches = fnmatch.filter(names, target)
+        if not matches:
+            raise SystemExit(f"build: no node matches {target}")
+        wanted.update(matches)
+    todo = list(wanted)
+    while todo:
+        for name in deps[todo.pop()] - wanted:
+            wanted.add(name)
+            todo.append(name)
+    return [node for node in nodes if node.name in wanted]
+
+
+class Log:
+    r"""Writes whole lines from all nodes to stdout, each prefixed with its node's name."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.out = sys.stdout.buffer
+
+    def write(self, name, line):
+        if isinstance(line, str):
+            line = line.encode("UTF-8")
+        if not line.endswith(b"\n"):
+            line += b"\n"
+        with self.lock:
+            self.out.write(name.encode("UTF-8") + b": " + line)
+            self.out.flush()
+
+
+def imported_tools(tools):
+    r"""The tools and the modules of tools-additional they import, however deep, by file name."""
+    found = set()
+    todo = list(tools)
+    while todo:
+        name = todo.pop()
+        if name in found:
+            continue
+        found.add(name)
+        with open(os.path.join(ROOT, "tools-additional", name), "rb") as f:
+            tree = ast.parse(f.read(), name)
+        # Imports inside functions as well, such as the optional ones
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                modules = [node.module]
+            else:
+                continue
+            for module in modules:
+                path = f"{module.partition('.')[0]}.py"
+                if os.path.isfile(os.path.join(ROOT, "tools-additional", path)):
+                    todo.append(path)
+    return sorted(found)
+
+
+def tool_version(tools):
+    # The Python tools a node runs; build.py itself only matters through the commands
+    h = hashlib.sha256(platform.python_version().encode())
+    for name in imported_tools(tools):
+        with open(os.path.join(ROOT, "tools-additional", name), "rb") as f:
+            h.update(name.encode() + b"\0" + f.read())
+    return h.hexdigest()
+
+
+def run_node(node, log, cache=None, version=None):
+    r"""Run a node, or restore it from the cache; return (exit code, seconds, whether it was cached)."""
+    started = time.perf_counter()
+    if cache is not None:
+        # Whatever it wrote inside its inputs last time is not what it is keyed on, but put back with its outputs
+        written = cache.written(node.name)
+        before = cache.trees(node.inputs)
+        key = cache.key(node.command, node.cwd, node.inputs, version, written, before)
+        restored = cache.restore(key, node.outputs + written)
+        if restored is not None:
+            log.write(node.name, f"unchanged, restored {' '.join(restored)}" if restored else "unchanged")
+            return 0, time.perf_counter() - started, True
+    # Unbuffered, so the lines of python steps show up as they are printed
+    env = dict(os.environ, PYTHONUNBUFFERED="1")
+    with subprocess.Popen(["bash", "-e", "-x", "-c", node.command], cwd=os.path.join(ROOT, node.cwd), env=env,
+                          stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as proc:
+        for line in proc.stdout:
+            log.write(node.name, line)
+    if cache is not None and proc.returncode == 0:
+        written = cache.changed(before, cache.trees(node.inputs), node.outputs)
+        cache.set_written(node.name, written)
+        cache.store(cache.key(node.command, node.cwd, node.inputs, version, written, before), node.outputs + written)
+    return proc.returncode, time.perf_counter() - started, False
+
+
+def build(nodes, deps, jobs, log, cache=None):
+    r"""Run the nodes; return the names of those that failed, were skipped and came from the cache."""
+    versions = {node.name: tool_version(node.tools) for node in nodes} if cache is not None else {}
+    waiting = {node.name: node for node in nodes}
+    running = {}
+    failed, skipped, cached = [], [], []
+    with ThreadPoolExecutor(jobs) as pool:
+        while waiting or running:
+            for name, node in list(waiting.items()):
+                blocked = deps[name] & (set(failed) | set(skipped))
+                if blocked:
+                    del waiting[name]
+                    skipped.append(name)
+                    log.write("build", f"skipping {name}, {', '.join(sorted(blocked))} did not build")
+                elif not deps[name] & (waiting.keys() | set(running.values())):
+                    del waiting[name]
+                    running[pool.submit(run_node, node, log, cache, versions.get(name))] = name
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                code, seconds, from_cache = future.result()
+                if code:
+                    failed.append(name)
+                elif from_cache:
+                    cached.append(name)
+                status = f"failed with exit {code}" if code else "from the cache" if from_cache else "done"
+                log.write("build", f"{name} {status} in {seconds:.1f}s")
+    return failed, skipped, cached
+
+
+def get_cli_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="*", help="Nodes to build, with what they depend on (default: all)")
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="Number of nodes run at the same time (0 = all cores)")
+    parser.add_argument("--list", "-l", action="store_true", help="Print the nodes and what they wait for, and exit")
+    parser.add_argument("--incremental", "-i", action="store_true",
+                        help="Skip nodes whose inputs did not change, restoring their outputs from the cache")
+    parser.add_argument("--cache-dir", type=str, default=DEFAULT_CACHE_DIR,
+                        help="Artifact cache of --incremental (default: .build-cache in the repository)")
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    args = get_cli_args()
+    nodes = make_nodes()
+    deps = dependencies(nodes)
+    if args.targets:
+        nodes = select(nodes, deps, args.targets)
+    if args.list:
+        for node in nodes:
+            print(f"{node.name}: {' '.join(name for name in deps if name in deps[node.name])}")
+        return
+    log = Log()
+    cache = build_cache.BuildCache(args.cache_dir, ROOT) if args.incremental else None
+    started = time.perf_counter()
+    try:
+        failed, skipped, cached = build(nodes, deps, args.jobs or os.cpu_count(), log, cache)
+    finally:
+        if cache is not None:
+            cache.save()
+    log.write("build", f"{len(nodes) - len(failed) - len(skipped)} of {len(nodes)} nodes built "
+                       f"({len(cached)} from the cache) in {time.perf_counter() - started:.1f}s")
+    if failed:
+        sys.exit(f"build: failed: {' '.join(failed)}" + (f"; skipped: {' '.join(skipped)}" if skipped else ""))
+
+
+if __name__ == "__main__":
+    main()
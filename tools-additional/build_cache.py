@@ -0,0 +1,222 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Content-addressed artifact cache for build.py --incremental.
+
+A step is keyed by the hash of its command, the version of the tools and
+the contents of everything it reads. After a step has run, the files it
+wrote are stored under that key; when the key comes up again the step is
+skipped and its outputs are put back from the cache, unless they are
+already as the step left them.
+
+    cache = build_cache.BuildCache(".build-cache", root)
+    key = cache.key(node.command, node.cwd, node.inputs, version)
+    if cache.restore(key, node.outputs) is None:
+        ...  # run the step
+        cache.store(key, node.outputs)
+    cache.save()
+
+File contents are stored once, by hash, under objects/; manifests/ maps
+every key to the trees of the outputs. Hashes of files are remembered by
+size and mtime in state.json, so unchanged inputs are not read again.
+
+A step may write inside what it reads besides its outputs, as make all
+does in rime-moran. changed() compares the trees of its inputs from before
+and after it ran to find those paths; set_written() keeps them under
+written/ by step name, and they are then left out of its key and stored
+with its outputs, so the step is not keyed on what it writes itself.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import threading
+
+HASH_BLOCK = 1 << 20
+
+
+def _replace_atomically(target, write):
+    tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write(tmp)
+    except BaseException:
+        if os.path.lexists(tmp):
+            os.unlink(tmp)
+        raise
+    os.replace(tmp, target)
+
+
+def _inside(path, other):
+    return path == other or path.startswith(other + "/")
+
+
+def _remove(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.unlink(path)
+
+
+class BuildCache:
+    def __init__(self, directory, root):
+        self.directory = directory
+        self.root = root
+        self.objects = os.path.join(directory, "objects")
+        self.manifests = os.path.join(directory, "manifests")
+        os.makedirs(self.objects, exist_ok=True)
+        self.written_dir = os.path.join(directory, "written")
+        os.makedirs(self.manifests, exist_ok=True)
+        os.makedirs(self.written_dir, exist_ok=True)
+        self._state_file = os.path.join(directory, "state.json")
+        try:
+            with open(self._state_file, encoding='UTF-8') as f:
+                self._hashes = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self._hashes = {}
+        self._lock = threading.Lock()
+
+    def save(self):
+        with self._lock:
+            state = json.dumps(self._hashes, ensure_ascii=False, separators=(",", ":"))
+
+        def write(tmp):
+            with open(tmp, "w", encoding='UTF-8') as f:
+                f.write(state)
+        _replace_atomically(self._state_file, write)
+
+    def _file_hash(self, relpath, st):
+        # Hashes are reused for as long as the size and mtime of the file stay the same
+        known = self._hashes.get(relpath)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+            return known[2]
+        h = hashlib.sha256()
+        with open(os.path.join(self.root, relpath), "rb") as f:
+            while block := f.read(HASH_BLOCK):
+                h.update(block)
+        digest = h.hexdigest()
+        with self._lock:
+            self._hashes[relpath] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def tree(self, path):
+        r"""Map path and everything under it to ["d"], ["l", target] or ["f", hash, executable]."""
+        entries = {}
+        full = os.path.join(self.root, path)
+        if not os.path.lexists(full):
+            return entries
+        todo = [path]
+        while todo:
+            relpath = todo.pop()
+            full = os.path.join(self.root, relpath)
+            st = os.lstat(full)
+            if stat.S_ISLNK(st.st_mode):
+                entries[relpath] = ["l", os.readlink(full)]
+            elif stat.S_ISDIR(st.st_mode):
+                entries[relpath] = ["d"]
+                todo.extend(os.path.join(relpath, name) for name in os.listdir(full))
+            else:
+                entries[relpath] = ["f", self._file_hash(relpath, st), bool(st.st_mode & stat.S_IXUSR)]
+        return entries
+
+    def trees(self, paths):
+        return {path: self.tree(path) for path in paths}
+
+    def key(self, command, cwd, inputs, version, exclude=(), trees=None):
+        r"""Hash a step; exclude are paths under its inputs left out, trees those of inputs if already walked."""
+        if trees is None:
+            trees = self.trees(inputs)
+        h = hashlib.sha256()
+        h.update(json.dumps([command, cwd, version], ensure_ascii=False).encode("UTF-8"))
+        for path in inputs:
+            tree = sorted((relpath, entry) for relpath, entry in trees[path].items()
+                          if not any(_inside(relpath, other) for other in exclude))
+            h.update(json.dumps([path, tree], ensure_ascii=False).encode("UTF-8"))
+        return h.hexdigest()
+
+    @staticmethod
+    def changed(before, after, outputs):
+        r"""The topmost paths that differ between two trees() of the inputs of a step, outside its outputs."""
+        changed = set()
+        for path in before:
+            old, new = before[path], after.get(path, {})
+            changed.update(relpath for relpath in old.keys() | new.keys() if old.get(relpath) != new.get(relpath))
+        changed = [relpath for relpath in changed if not any(_inside(relpath, output) for output in outputs)]
+        return sorted(relpath for relpath in changed
+                      if not any(_inside(relpath, other) and relpath != other for other in changed))
+
+    def _written_file(self, name):
+        return os.path.join(self.written_dir, hashlib.sha256(name.encode("UTF-8")).hexdigest())
+
+    def written(self, name):
+        r"""The paths the step called name wrote inside its inputs when it last ran."""
+        try:
+            with open(self._written_file(name), encoding='UTF-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return []
+
+    def set_written(self, name, paths):
+        def write(tmp):
+            with open(tmp, "w", encoding='UTF-8') as f:
+                json.dump(paths, f, ensure_ascii=False)
+        _replace_atomically(self._written_file(name), write)
+
+    def _object(self, digest):
+        return os.path.join(self.objects, digest[:2], digest[2:])
+
+    def store(self, key, outputs):
+        trees = {path: self.tree(path) for path in outputs}
+        for tree in trees.values():
+            for relpath, entry in tree.items():
+                if entry[0] == "f" and not os.path.exists(self._object(entry[1])):
+                    os.makedirs(os.path.dirname(self._object(entry[1])), exist_ok=True)
+                    _replace_atomically(self._object(entry[1]),
+                                        lambda tmp: shutil.copyfile(os.path.join(self.root, relpath), tmp))
+
+        def write(tmp):
+            with open(tmp, "w", encoding='UTF-8') as f:
+                json.dump(trees, f, ensure_ascii=False)
+        _replace_atomically(os.path.join(self.manifests, key), write)
+
+    def _put_back(self, current, tree):
+        # Only what differs is touched; children sort after their directory, so go deepest first
+        for relpath in sorted(current, reverse=True):
+            if current[relpath] != tree.get(relpath):
+                _remove(os.path.join(self.root, relpath))
+        for relpath, entry in sorted(tree.items()):
+            if current.get(relpath) == entry:
+                continue
+            full = os.path.join(self.root, relpath)
+            if entry[0] == "d":
+                os.makedirs(full, exist_ok=True)
+            elif entry[0] == "l":
+                os.symlink(entry[1], full)
+            else:
+                os.makedirs(os.path.dirname(full) or ".", exist_ok=True)
+                shutil.copyfile(self._object(entry[1]), full)
+                if entry[2]:
+                    os.chmod(full, os.stat(full).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+                with self._lock:
+                    st = os.stat(full)
+                    self._hashes[relpath] = [st.st_size, st.st_mtime_ns, entry[1]]
+
+    def restore(self, key, outputs):
+        r"""Put back the outputs stored under key; None when there are none, else the paths put back."""
+        try:
+            with open(os.path.join(self.manifests, key), encoding='UTF-8') as f:
+                trees = json.load(f)
+        except FileNotFoundError:
+            return None
+        if sorted(trees) != sorted(outputs) or not all(
+                os.path.exists(self._object(entry[1]))
+                for tree in trees.values() for entry in tree.values() if entry[0] == "f"):
+            return None
+        restored = []
+        for path in outputs:
+            current = self.tree(path)
+            if current != trees[path]:
+                self._put_back(current, trees[path])
+                restored.append(path)
+        return restored
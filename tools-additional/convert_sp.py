@@ -2,51 +2,47 @@
 # -*- coding: utf-8 -*-
 r"""
 Convert quanpin dictionary files to pinyin+shape for Rime input method.
+
+    python3 convert_sp.py -i zrlf.dict.yaml -o zrlf.dict.yaml
+    python3 convert_sp.py --batch "../*-ch?" --dicts zrlf --jobs 4
+
+Batch mode converts any number of files in one process, on forked
+workers, each written atomically, and prints the rows and throughput of
+every file. It only takes the dicts named by --dicts, zrlf unless given:
+the conversion rewrites whole codes, which only the zrlf dicts are made of.
+A file that fails is left as it was and reported once the others are done.
 """
 
-import csv
 import re
 import argparse
+import glob
+import multiprocessing
 import os
+import time
+
+import rime_dict
+
+# Ziranma finals -> flypy finals, by the key they are typed with
+ZRM2FLY_YUNMU = {
+    "a": "a", "e": "e", "o": "o", "i": "i", "u": "u", "b": "z", "c": "n", "d": "l", "f": "f", "g": "g",
+    "h": "h", "j": "j", "k": "c", "l": "d", "m": "m", "n": "b", "p": "y", "q": "q", "r": "r", "s": "s",
+    "t": "t", "v": "v", "w": "x", "x": "p", "y": "k", "z": "w",
+}
+# Codes converted so far; a dict has far fewer distinct codes than rows
+_zrm2fly_codes = {}
+
 
 def zrm2fly(shuangpin):
-    yunmu_dict = {
-        "a": "a",
-        "e": "e",
-        "o": "o",
-        "i": "i",
-        "u": "u",
-        "b": "z",
-        "c": "n",
-        "d": "l",
-        "f": "f",
-        "g": "g",
-        "h": "h",
-        "j": "j",
-        "k": "c",
-        "l": "d",
-        "m": "m",
-        "n": "b",
-        "o": "o",
-        "p": "y",
-        "q": "q",
-        "r": "r",
-        "s": "s",
-        "t": "t",
-        "v": "v",
-        "w": "x",
-        "x": "p",
-        "y": "k",
-        "z": "w",
-    }
-    newcode = []
-    for i, code in enumerate(shuangpin):
-        if i%2 == 1 and shuangpin[i-1] not in "aoe":
-            # print(shuangpin)
-            newcode.append(yunmu_dict[code])
-        else:
-            newcode.append(code)
-    return "".join(newcode)
+    newcode = _zrm2fly_codes.get(shuangpin)
+    if newcode is None:
+        newcode = []
+        for i, code in enumerate(shuangpin):
+            if i%2 == 1 and shuangpin[i-1] not in "aoe":
+                newcode.append(ZRM2FLY_YUNMU[code])
+            else:
+                newcode.append(code)
+        newcode = _zrm2fly_codes[shuangpin] = "".join(newcode)
+    return newcode
 
 
 def rewrite_row(row, input_sp, output_sp):
@@ -61,6 +57,95 @@ def rewrite_row(row, input_sp, output_sp):
     return row
 
 
+def convert_shuangpin(rows, input_sp="zrm", output_sp="flypy"):
+    r"""Rewrite the codes of rows from one shuangpin scheme to another, lazily."""
+    return (rewrite_row(row, input_sp, output_sp) for row in rows)
+
+
+def convert_file(input_file, output_file, input_sp="zrm", output_sp="flypy"):
+    r"""Convert one dict file, written atomically, so output_file may be input_file; returns the rows written."""
+    rows = 0
+
+    def counted(out_rows):
+        nonlocal rows
+        for row in out_rows:
+            rows += 1
+            yield row
+
+    rime_dict.write_rows(output_file, counted(convert_shuangpin(rime_dict.iter_rows(input_file), input_sp, output_sp)))
+    return rows
+
+
+def dict_name(path):
+    name = os.path.basename(path)
+    return name[:-len(".dict.yaml")] if name.endswith(".dict.yaml") else name
+
+
+def batch_files(patterns, dicts=None):
+    r"""The files matching the globs in patterns, the *.dict.yaml files of the directories among them, named in dicts if given."""
+    paths = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)):
+            if os.path.isdir(path):
+                paths.extend(sorted(glob.glob(os.path.join(glob.escape(path), "*.dict.yaml"))))
+            else:
+                paths.append(path)
+    return [path for path in dict.fromkeys(paths) if dicts is None or dict_name(path) in dicts]
+
+
+def _convert_job(job):
+    start = time.perf_counter()
+    try:
+        rows = convert_file(*job)
+    except Exception as e:  # reported with the file, the other jobs go on
+        return job[1], 0, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+    return job[1], rows, time.perf_counter() - start, None
+
+
+def convert_files(jobs_list, jobs=1):
+    r"""Run (input_file, output_file, input_sp, output_sp) jobs on forked workers.
+
+    Yields (output_file, rows, seconds, error) in order; error is None, or
+    why the job failed, in which case its output was not written.
+    """
+    if jobs == 1 or len(jobs_list) < 2 or "fork" not in multiprocessing.get_all_start_methods():
+        yield from map(_convert_job, jobs_list)
+        return
+    with multiprocessing.get_context("fork").Pool(min(jobs, len(jobs_list))) as pool:
+        yield from pool.imap(_convert_job, jobs_list)
+
+
+def rate(rows, seconds):
+    return f"{rows} rows in {seconds:.2f}s ({rows / seconds if seconds else 0:,.0f} rows/s)"
+
+
+def run_batch(args):
+    files = batch_files(args.batch, args.dicts)
+    missing = sorted(set(args.dicts or ()) - set(map(dict_name, files)))
+    if missing:
+        raise SystemExit(f"convert_sp: no {', '.join(missing)} dict in {' '.join(args.batch)}")
+    outputs = files
+    if args.output_dir and files:
+        # Laid out as the inputs are below the directory they have in common
+        top = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in files])
+        outputs = [os.path.join(args.output_dir, os.path.relpath(os.path.abspath(path), top)) for path in files]
+        for directory in dict.fromkeys(map(os.path.dirname, outputs)):
+            os.makedirs(directory, exist_ok=True)
+    jobs_list = [(path, output_file, args.input_sp, args.output_sp) for path, output_file in zip(files, outputs)]
+    start = time.perf_counter()
+    total = 0
+    failed = []
+    for output_file, rows, seconds, error in convert_files(jobs_list, args.jobs or os.cpu_count()):
+        if error is not None:
+            failed.append(f"{output_file}: {error}")
+            continue
+        total += rows
+        print(f"{output_file}: {rate(rows, seconds)}", flush=True)
+    print(f"{len(jobs_list) - len(failed)} files: {rate(total, time.perf_counter() - start)}")
+    if failed:
+        raise SystemExit("convert_sp: not converted, left as they were:\n" + "\n".join(failed))
+
+
 def get_cli_args():
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--input_file", "-i", type=str,
@@ -76,27 +161,35 @@ def get_cli_args():
                         help="Output Shuangpin scheme")
     parser.add_argument("--delimiter", "-d", type=str, default=";",
                         help="Delimiter to seperate pinyin and shape")
+    parser.add_argument("--batch", nargs="+", metavar="PATH",
+                        help="Batch mode: convert the *.dict.yaml files of these directories and the files "
+                             "matching these globs, in place or into --output_dir, instead of -i/-o")
+    parser.add_argument("--dicts", nargs="+", metavar="NAME", default=["zrlf"],
+                        help="In batch mode, the dicts to convert (default: zrlf)")
+    parser.add_argument("--output_dir", type=str, default="",
+                        help="In batch mode, write the outputs here, laid out as the inputs are")
+    parser.add_argument("--jobs", "-j", type=int, default=0,
+                        help="In batch mode, number of worker processes (0 = all cores)")
     args = parser.parse_args()
     return args
 
 
 def main():
     args = get_cli_args()
+    if args.batch:
+        run_batch(args)
+        return
     input_sp = args.input_sp
     output_sp = args.output_sp
     delim = args.delimiter
-    with open(os.path.realpath(args.input_file), newline="", encoding='UTF-8') as f:
-        rows = list(csv.reader(f, delimiter="\t", quotechar="`"))
-    out_rows = [rewrite_row(row, input_sp, output_sp) for row in rows]
+    rows = rime_dict.read_rows(os.path.realpath(args.input_file))
+    out_rows = list(convert_shuangpin(rows, input_sp, output_sp))
 
     output_file = os.path.realpath(args.output_file)
     if output_file == "":
         _, input_postfix = args.input_file.split(".", maxsplit=1)
         output_file = f"{args.input_sp}_{args.output_sp}.{input_postfix}"
-    with open(output_file, "w", newline="", encoding='UTF-8') as f:
-        my_tsv = csv.writer(f, delimiter="\t",
-                            quotechar="`", lineterminator="\n")
-        my_tsv.writerows(out_rows)
+    rime_dict.write_rows(output_file, out_rows)
 
 
 if __name__ == "__main__":
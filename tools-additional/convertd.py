@@ -0,0 +1,195 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Warm worker for the conversion tools, reachable over a Unix socket.
+
+    python3 convertd.py serve [--socket PATH] [--jobs N] &
+    python3 convertd.py run gen_dict_with_shape.py -p zrlong -x zrmdb -i in.yaml -o out.txt
+    python3 convertd.py stop
+
+The server imports the tools once, builds the OpenCC converters and the
+codec tables and loads every shape db next to it before it takes jobs.
+Each job runs in a process forked from the server, so jobs run side by
+side, start warm and leave nothing behind for the next one. A job runs
+in the client's working directory and writes to the client's own stdout
+and stderr, which are passed over the socket, so its output lands where
+it would have without the server.
+
+`run` runs the tool itself when no server is listening, so scripts can
+use it either way. Every job's latency is logged by the server and
+printed to the client's stderr.
+"""
+
+import argparse
+import glob
+import importlib
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import time
+import traceback
+
+# The client side only needs these names; the tools are imported by the server
+TOOLS = {
+    "gen_dict_with_shape.py": "gen_dict_with_shape",
+    "convert_sp.py": "convert_sp",
+}
+DEFAULT_SOCKET = os.environ.get("CONVERTD_SOCKET") or os.path.join(
+    tempfile.gettempdir(), f"convertd-{os.getuid()}.sock")
+MAX_MESSAGE = 1 << 20
+
+
+def warm_up(directory):
+    import gen_dict_with_shape
+    import shape_db
+    for name in TOOLS.values():
+        importlib.import_module(name)
+    for name in gen_dict_with_shape.PINYIN_CODECS:
+        gen_dict_with_shape.get_codec(name)
+    for converter in [gen_dict_with_shape.opencc_t2s, gen_dict_with_shape.opencc_s2t]:
+        converter.converter
+    # Forked jobs find these in shape_db's table of loaded dbs
+    for path in sorted(glob.glob(os.path.join(directory, "*db*.txt"))):
+        for multishape in [False, True]:
+            shape_db.load_shape_dict(path, multishape)
+
+
+def read_message(sock, data=b""):
+    while not data.endswith(b"\n"):
+        chunk = sock.recv(MAX_MESSAGE)
+        if not chunk:
+            return None
+        data += chunk
+    return json.loads(data)
+
+
+def run_job(request, fds):
+    # Runs in the forked process; the client's stdout and stderr become ours
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(fds[0], 1)
+    os.dup2(fds[1], 2)
+    try:
+        os.chdir(request["cwd"])
+        sys.argv = [request["tool"], *request["argv"]]
+        importlib.import_module(TOOLS[request["tool"]]).main()
+        code = 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return code
+
+
+class JobHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data, fds, _, _ = socket.recv_fds(self.request, MAX_MESSAGE, 2)
+        request = read_message(self.request, data)
+        if request is None:
+            return
+        if request.get("stop"):
+            os.kill(os.getppid(), signal.SIGTERM)
+            return
+        started = time.perf_counter()
+        code = run_job(request, fds)
+        seconds = time.perf_counter() - started
+        self.request.sendall(json.dumps({"exit": code, "seconds": seconds}).encode() + b"\n")
+        print(f"{request['tool']} {' '.join(request['argv'])}: exit {code} in {seconds:.2f}s",
+              file=self.server.log, flush=True)
+
+
+class JobServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    pass
+
+
+def serve(args):
+    warm_up(os.path.dirname(os.path.abspath(__file__)))
+    if os.path.exists(args.socket):
+        os.unlink(args.socket)  # left behind by a server that was killed
+    # The jobs take over fd 2, the log keeps the server's own
+    log = os.fdopen(os.dup(2), "w")
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    with JobServer(args.socket, JobHandler) as server:
+        server.max_children = args.jobs or os.cpu_count()
+        server.log = log
+        print(f"convertd: serving on {args.socket}", file=log, flush=True)
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(args.socket)
+
+
+def connect(path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def run(args):
+    tool = os.path.basename(args.tool)
+    sock = connect(args.socket) if tool in TOOLS else None
+    if sock is None:
+        # No server (or not one of its tools), run it the usual way
+        os.execv(sys.executable, [sys.executable, args.tool, *args.argv])
+    started = time.perf_counter()
+    request = {"tool": tool, "argv": args.argv, "cwd": os.getcwd()}
+    with sock:
+        socket.send_fds(sock, [json.dumps(request).encode() + b"\n"], [1, 2])
+        reply = read_message(sock)
+    if reply is None:
+        sys.exit(f"convertd: the server dropped {tool}")
+    print(f"convertd: {tool} ran in {reply['seconds']:.2f}s, "
+          f"{time.perf_counter() - started:.2f}s with the round trip", file=sys.stderr)
+    sys.exit(reply["exit"])
+
+
+def stop(args):
+    sock = connect(args.socket)
+    if sock is None:
+        sys.exit(f"convertd: nothing listening on {args.socket}")
+    with sock:
+        socket.send_fds(sock, [json.dumps({"stop": True}).encode() + b"\n"], [])
+
+
+def get_cli_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", type=str, default=DEFAULT_SOCKET,
+                        help="Unix socket of the server (default: $CONVERTD_SOCKET or one in the temp dir)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve_parser = subparsers.add_parser("serve", help="Warm up and take jobs until stopped")
+    serve_parser.add_argument("--jobs", "-j", type=int, default=0,
+                              help="Number of jobs run at the same time (0 = all cores)")
+    serve_parser.set_defaults(func=serve)
+    run_parser = subparsers.add_parser("run", help="Run a tool on the server, or here when there is none")
+    run_parser.add_argument("tool", help=f"Tool script; {', '.join(sorted(TOOLS))} run on the server")
+    run_parser.add_argument("argv", nargs=argparse.REMAINDER, help="Arguments for the tool")
+    run_parser.set_defaults(func=run)
+    stop_parser = subparsers.add_parser("stop", help="Stop the server")
+    stop_parser.set_defaults(func=stop)
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    args = get_cli_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
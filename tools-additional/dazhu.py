@@ -5,8 +5,17 @@ import os
 from collections import defaultdict
 import re
 
+import rime_dict
+
+WORD = re.compile(r'\w+')
+LETTERS = re.compile(r'[a-z]+')
+FIXED_CODE = re.compile(r'[a-z;]+')
+CHAR_CODE = re.compile(r'[a-zA-Z]+;[a-zA-Z]+')
+CODE_PAIR = re.compile(r'[a-z]{2};[a-z]{2}')
+
 
 class FakeOpenCC:
+    @staticmethod
     def convert(text):
         return text
 
@@ -59,10 +68,13 @@ class Table:
         else:
             return self.get_long_code(word[0])[0] + self.get_long_code(word[1])[0] + self.get_long_code(word[2])[0] + self.get_long_code(word[-1])[0]
 
-    def print_c2w(self, file):
+    def rows(self):
         for code, pairs in self.c2w.items():
-            words = [pair[0] for pair in pairs]
-            print(code + '\t' + '\t'.join(words), file=file)
+            yield [code] + [pair[0] for pair in pairs]
+
+    def print_c2w(self, file):
+        for row in self.rows():
+            print('\t'.join(row), file=file)
 
     def print_w2c(self, file):
         for word, codes in self.w2c.items():
@@ -79,119 +91,125 @@ def make_opencc(config):
     os.chdir(cwd)
     return cc
 
-table = Table()
+def add_coded_words(table, rows):
+    # base and extended dicts: the pinyin halves of "xx;yy" pairs make the code
+    for row in rows:
+        if len(row) < 2 or not CODE_PAIR.search(row[1]): continue
+        word = row[0]
+        codes = row[1]
+
+        pairs = codes.split()
+        parts_before_semicolon = [pair.split(';')[0] for pair in pairs]
+
+        code = ''.join(parts_before_semicolon)
+        table.add(word, code)
+
+
+def add_prefixed(table, rows, prefix):
+    # liangfen, stroke and radical tables: the code letters behind a prefix
+    for row in rows:
+        code = len(row) >= 2 and WORD.fullmatch(row[0]) and LETTERS.match(row[1])
+        if not code: continue
+        table.add(row[0], prefix + code.group())
 
-def main(args):
-    cc = make_opencc(args.opencc)
-    folder = args.folder
-    extended = args.extended
-    output = args.output
-    fulllist = args.fulllist
-    global table
+
+def build_dazhu(chars, fixed=None, base=None, liangfen=None, stroke=None, radical=None, extended=None, cc=None):
+    r"""Build the 大竹 code table from the rows of the scheme's dicts.
+
+    chars are the rows of moran.chars.dict.yaml; the others are the rows of
+    moran_fixed_simp, moran.base, zrlf, stroke, radical_flypy and the
+    extended dicts, each left out (None) for the short table. cc converts
+    the fixed table's words (default: unchanged). Returns the Table, whose
+    rows() are (code, word, word, ...).
+    """
+    cc = cc or FakeOpenCC()
+    table = Table()
 
     # fixed table
-    if fulllist:
+    if fixed is not None:
         print("Generating fixed table")
-        with open('../' + folder + '/moran_fixed_simp.dict.yaml', 'r') as f:
-            deferred = []
-            for l in f:
-                matches = re.findall(r'^([^\t]+)\t([a-z;]+)\t?([a-z]+)?', l)
-                if matches:
-                    word, code, stem = matches[0]
-                    if stem:
-                        # stem should be added at the end of the list of codes of this char
-                        deferred.append((word, stem))
-                else:
-                    matches = re.findall(r'^\w+$', l)
-                    if not matches: continue
-                    word = matches[0]
-                    code = None
-                word = cc.convert(word)
-                table.add(word, code)
-            for (word, stem) in deferred:
-                table.add(word, stem)
+        deferred = []
+        for row in fixed:
+            if len(row) >= 2 and row[0] and FIXED_CODE.fullmatch(row[1]):
+                word, code = row[0], row[1]
+                if len(row) > 2 and LETTERS.fullmatch(row[2]):
+                    # stem should be added at the end of the list of codes of this char
+                    deferred.append((word, row[2]))
+            elif len(row) == 1 and WORD.fullmatch(row[0]):
+                word = row[0]
+                code = None
+            else:
+                continue
+            word = cc.convert(word)
+            table.add(word, code)
+        for (word, stem) in deferred:
+            table.add(word, stem)
 
     # chars
     print("Generating character table")
-    with open('../' + folder + '/moran.chars.dict.yaml', 'r') as f:
-        for l in f:
-            matches = re.findall(r'(\w+)\t([a-zA-Z]+;[a-zA-Z]+)\t(\d+)', l)
-            if not matches: continue
-            char, code, w = matches[0]
-            w = int(w)
-            table.add(char, ''.join(code.split(';')) + '/', w)
+    for row in chars:
+        if not (len(row) >= 3 and WORD.fullmatch(row[0]) and CHAR_CODE.fullmatch(row[1])
+                and row[2].isdecimal()):
+            continue
+        char, code, w = row[:3]
+        w = int(w)
+        table.add(char, ''.join(code.split(';')) + '/', w)
 
     # base
-    if fulllist:
+    if base is not None:
         print("Generating base table")
-        with open('../' + folder + '/moran.base.dict.yaml', 'r') as f:
-            for l in f:
-                matches = re.findall(r'[a-z]{2};[a-z]{2}', l)
-                if not matches: continue
-                parts = l.split('\t')
-                word = parts[0]
-                codes = parts[1]
-
-                pairs = codes.split()
-                parts_before_semicolon = [pair.split(';')[0] for pair in pairs]
-
-                code = ''.join(parts_before_semicolon)
-                table.add(word, code)
+        add_coded_words(table, base)
 
     # liangfen
-    if fulllist:
+    if liangfen is not None:
         print("Generating liangfen table")
-        with open('../' + folder + '/zrlf.dict.yaml', 'r') as f:
-            for l in f:
-                matches = re.findall(r'(\w+)\t([a-z]+)', l)
-                if not matches: continue
-                char, code = matches[0]
-                table.add(char, 'olf' + code)
+        add_prefixed(table, liangfen, 'olf')
 
     # stroke
-    if fulllist:
+    if stroke is not None:
         print("Generating stroke table")
-        with open('stroke.dict.yaml') as f:
-            for l in f:
-                matches = re.findall(r'(\w+)\t([a-z]+)', l)
-                if not matches: continue
-                char, code = matches[0]
-                table.add(char, 'obh' + code)
+        add_prefixed(table, stroke, 'obh')
 
     # 拆分表
-    if fulllist:
+    if radical is not None:
         print("Generating radical table")
-        with open('../' + folder + '/radical_flypy.dict.yaml', 'r') as f:
-            for l in f:
-                matches = re.findall(r'(\w+)\t([a-z]+)', l)
-                if not matches: continue
-                char, code = matches[0]
-                table.add(char, 'ocz' + code)
+        add_prefixed(table, radical, 'ocz')
 
     # 补充表
-    if fulllist:
+    if extended is not None:
         print("Generating extended table")
-        directory = '../' + folder + '/' + extended + '/'
-        for filename in os.listdir(directory):
-            if "tencent" in filename:
-                continue
-            filepath = os.path.join(directory, filename)
-            with open(filepath, 'r') as f:
-                for l in f:
-                    matches = re.findall(r'[a-z]{2};[a-z]{2}', l)
-                    if not matches: continue
-                    parts = l.split('\t')
-                    word = parts[0]
-                    codes = parts[1]
+        add_coded_words(table, extended)
 
-                    pairs = codes.split()
-                    parts_before_semicolon = [pair.split(';')[0] for pair in pairs]
+    return table
 
-                    code = ''.join(parts_before_semicolon)
-                    table.add(word, code)
 
+def read_dict(path):
+    return rime_dict.iter_rows(path, comments=False, header=False)
 
-    with open(output, 'w') as f:
+
+def read_extended(directory):
+    for filename in os.listdir(directory):
+        if "tencent" in filename:
+            continue
+        yield from read_dict(os.path.join(directory, filename))
+
+
+def main(args):
+    cc = make_opencc(args.opencc)
+    folder = '../' + args.folder + '/'
+    if args.fulllist:
+        table = build_dazhu(read_dict(folder + 'moran.chars.dict.yaml'),
+                            fixed=read_dict(folder + 'moran_fixed_simp.dict.yaml'),
+                            base=read_dict(folder + 'moran.base.dict.yaml'),
+                            liangfen=read_dict(folder + 'zrlf.dict.yaml'),
+                            stroke=read_dict('stroke.dict.yaml'),
+                            radical=read_dict(folder + 'radical_flypy.dict.yaml'),
+                            extended=read_extended(folder + args.extended + '/'),
+                            cc=cc)
+    else:
+        table = build_dazhu(read_dict(folder + 'moran.chars.dict.yaml'), cc=cc)
+
+    with open(args.output, 'w') as f:
         table.print_c2w(f)
         # table.print_w2c(f)
 
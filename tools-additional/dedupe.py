@@ -0,0 +1,168 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+First-occurrence dedupe and sort with a memory budget.
+
+Up to the budget, keys are kept in a set as usual. Past it, the rest of
+the input is deduped out of core: (key, position, item) entries are
+sorted in runs that are spilled to temp files, the runs are k-way merged
+(MERGE_WIDTH at a time, so the open temp files stay few) so the first
+position of every key wins, and the survivors are sorted back into input
+order the same way.
+
+As a command it replaces perl -i -ne 'print if !$seen{$_}++' FILE:
+
+    python3 dedupe.py [--memory MB] FILE...
+"""
+
+import argparse
+import heapq
+import pickle
+import tempfile
+from collections import Counter
+from itertools import chain, islice
+
+import rime_dict
+
+DEFAULT_MEMORY = 512  # MB
+ENTRY_BYTES = 256  # rough cost of one held entry: key, item and the set or list slot
+PICKLE_BATCH = 256  # per run, the merge holds one batch of every run
+MERGE_WIDTH = 64  # runs merged at once, each an open temp file
+
+# Counters of the out-of-core path, for the tools to report
+stats = Counter()
+_MISSING = object()
+
+
+def max_entries(memory):
+    return max(1, memory * 2**20 // ENTRY_BYTES)
+
+
+def memory_budget(value):
+    # argparse type of the --memory options; below 1 MB every few rows would make a run of their own
+    memory = int(value)
+    if memory < 1:
+        raise argparse.ArgumentTypeError(f"{value} MB is too small, give at least 1")
+    return memory
+
+
+def _spill(entries, tmpdir):
+    f = tempfile.TemporaryFile(dir=tmpdir, buffering=1 << 16)
+    entries = iter(entries)
+    while batch := list(islice(entries, PICKLE_BATCH)):
+        pickle.dump(batch, f, pickle.HIGHEST_PROTOCOL)
+    f.seek(0)
+    return f
+
+
+def _load(f):
+    with f:
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                return
+            yield from batch
+
+
+def _merge(runs, key, tmpdir):
+    # Into one new run; the runs merged are closed as they run out
+    return _spill(heapq.merge(*map(_load, runs), key=key), tmpdir)
+
+
+def external_sort(items, key=None, max_items=None, tmpdir=None):
+    r"""Iterate over items in sorted order, holding at most max_items of them at a time.
+
+    Every MERGE_WIDTH runs of a level are merged into one run of the next
+    as they are written, so only a few of them are ever open at once.
+    """
+    max_items = max_items or max_entries(DEFAULT_MEMORY)
+    items = iter(items)
+    chunk = sorted(islice(items, max_items), key=key)
+    if len(chunk) < max_items:
+        return iter(chunk)
+    levels = []
+    while chunk:
+        stats["runs"] += 1
+        stats["spilled"] += len(chunk)
+        run = _spill(chunk, tmpdir)
+        chunk = None
+        for runs in levels:
+            runs.append(run)
+            if len(runs) < MERGE_WIDTH:
+                break
+            run = _merge(runs, key, tmpdir)
+            runs.clear()
+        else:
+            levels.append([run])
+        chunk = sorted(islice(items, max_items), key=key)
+    # The higher a level, the earlier its runs, so equal keys stay in input order
+    runs = [run for level in reversed(levels) for run in level]
+    while len(runs) > MERGE_WIDTH:
+        runs = [_merge(runs[i:i + MERGE_WIDTH], key, tmpdir) for i in range(0, len(runs), MERGE_WIDTH)]
+    return heapq.merge(*map(_load, runs), key=key)
+
+
+def iter_unique(items, key=None, max_items=None, tmpdir=None):
+    r"""Yield the first item of every key, in input order.
+
+    key defaults to the item itself and has to be hashable and sortable.
+    Once more than max_items distinct keys have been seen, the rest of the
+    input goes through external_sort instead of the set.
+    """
+    max_items = max_items or max_entries(DEFAULT_MEMORY)
+    seen = set()
+    items = iter(items)
+    for item in items:
+        k = item if key is None else key(item)
+        if k not in seen:
+            seen.add(k)
+            yield item
+            if len(seen) >= max_items:
+                break
+    else:
+        return
+
+    # Keys that were already written sort first (position -1) and are not written again
+    written = sorted(seen)
+    seen = None
+    entries = chain(((k, -1, None) for k in written),
+                    ((item if key is None else key(item), position, item) for position, item in enumerate(items)))
+    entries = external_sort(entries, max_items=max_items, tmpdir=tmpdir)
+    written = None
+
+    def first_positions():
+        last = _MISSING
+        for k, position, item in entries:
+            if last is _MISSING or k != last:
+                last = k
+                if position >= 0:
+                    yield position, item
+
+    for _, item in external_sort(first_positions(), max_items=max_items, tmpdir=tmpdir):
+        yield item
+
+
+def dedupe_lines(path, memory=DEFAULT_MEMORY):
+    # Byte lines like perl's $_, so the file is kept exactly as it was apart from the repeats
+    with open(path, "rb") as f_in, rime_dict.atomic_write(path, "wb") as f_out:
+        f_out.writelines(iter_unique(f_in, max_items=max_entries(memory)))
+
+
+def get_cli_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="+", help="Files to dedupe in place, line by line")
+    parser.add_argument("--memory", "-m", type=memory_budget, default=DEFAULT_MEMORY,
+                        help="Memory budget in MB before spilling to temp files")
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    args = get_cli_args()
+    for path in args.files:
+        dedupe_lines(path, args.memory)
+
+
+if __name__ == "__main__":
+    main()
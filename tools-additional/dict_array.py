@@ -0,0 +1,130 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Integer-encoded dictionary for gen_dict_with_shape --numpy.
+
+Syllables, characters and the trailing columns (weights) come from small
+closed vocabularies, so a dictionary is held as NumPy arrays of their IDs:
+one reading ID, a (syllable, char) pair, per character, an offsets array
+marking where every entry starts and one ID for its remaining columns.
+
+Converting to a scheme is then one gather per column over the readings,
+syllable -> pinyin code and char -> shape. The token of every reading is
+formatted once, and the strings of a row are only joined when it is
+written. The same encoded dictionary can be converted to any number of
+schemes without parsing the input again.
+
+    encoded = dict_array.encode(gen_dict_with_shape.iter_prepared(rows, False, False))
+    for row in encoded.convert(pinyin_fn, shape_dict, ";"):
+        ...
+
+NumPy is optional. Without it `np` is None and the tools stay on their
+row by row path.
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BLOCK_SIZE = 1 << 16  # entries joined into strings at a time
+
+
+class Vocabulary:
+    r"""Items <-> consecutive integer IDs, in the order they were first seen."""
+
+    __slots__ = ("ids", "items")
+
+    def __init__(self):
+        self.ids = {}
+        self.items = []
+
+    def id(self, item):
+        i = self.ids.get(item)
+        if i is None:
+            i = self.ids[item] = len(self.items)
+            self.items.append(item)
+        return i
+
+    def __len__(self):
+        return len(self.items)
+
+
+class EncodedDict:
+    r"""A dictionary as ID arrays; see the module docstring.
+
+    Every character of an entry is a reading ID, one per distinct
+    (syllable, char) pair, and the readings point into the syllable and
+    char vocabularies. Rows that are written as they are (comments,
+    ['三觭龍', '1'], words whose length does not match the pinyin) keep
+    their place as an entry with extra ID -1 and are stored in passthrough
+    by entry number.
+    """
+
+    def __init__(self):
+        self.syllables = Vocabulary()
+        self.chars = Vocabulary()
+        self.readings = Vocabulary()
+        self.extras = Vocabulary()
+        self.passthrough = {}
+        self.reading_syllables = self.reading_chars = None
+        self.reading_ids = self.offsets = self.extra_ids = None
+
+    def __len__(self):
+        return len(self.extra_ids)
+
+    def convert(self, pinyin_fn, shape_dict, delim):
+        r"""Yield the rows of one scheme, the ones rewrite_row gives without --multishape."""
+        codes = Vocabulary()
+        code_table = np.array([codes.id(pinyin_fn(syllable)) for syllable in self.syllables.items], dtype=np.int32)
+        shapes = Vocabulary()
+        shape_table = np.array([shapes.id(shape_dict.get(char, delim)[0]) for char in self.chars.items], dtype=np.int32)
+        # One gather per column, then the "code;shape" token of every reading is formatted once
+        reading_codes = code_table[self.reading_syllables].tolist()
+        reading_shapes = shape_table[self.reading_chars].tolist()
+        tokens = np.array([f"{codes.items[code]}{delim}{shapes.items[shape]}"
+                           for code, shape in zip(reading_codes, reading_shapes)], dtype=object)
+        chars = np.array(self.chars.items, dtype=object)[self.reading_chars]
+        extras = self.extras.items
+        # Strings are looked up a block of entries at a time, not for the whole dictionary at once
+        for first in range(0, len(self), BLOCK_SIZE):
+            offsets = self.offsets[first:first + BLOCK_SIZE + 1]
+            reading_ids = self.reading_ids[offsets[0]:offsets[-1]]
+            offsets = (offsets - offsets[0]).tolist()
+            block_tokens = tokens[reading_ids].tolist()
+            block_chars = chars[reading_ids].tolist()
+            for i, extra_id in enumerate(self.extra_ids[first:first + BLOCK_SIZE].tolist()):
+                if extra_id < 0:
+                    yield self.passthrough[first + i]
+                else:
+                    start, stop = offsets[i], offsets[i + 1]
+                    yield ("".join(block_chars[start:stop]), " ".join(block_tokens[start:stop]), *extras[extra_id])
+
+
+def encode(prepared):
+    r"""Encode the (row, (word, pinyin_list)) pairs of gen_dict_with_shape.iter_prepared.
+
+    A word of None is a row to write as it is, given in place of the pinyin list.
+    """
+    encoded = EncodedDict()
+    reading_id, extra_id = encoded.readings.id, encoded.extras.id
+    reading_ids = array("i")
+    offsets = array("q", [0])
+    extra_ids = array("i")
+    for row, (word, pinyin_list) in prepared:
+        if word is None:
+            encoded.passthrough[len(extra_ids)] = pinyin_list
+            extra_ids.append(-1)
+        else:
+            reading_ids.extend(map(reading_id, zip(pinyin_list, word)))
+            extra_ids.append(extra_id(tuple(row[2:])))
+        offsets.append(len(reading_ids))
+    readings = encoded.readings.items
+    encoded.reading_syllables = np.array([encoded.syllables.id(syllable) for syllable, _ in readings], dtype=np.int32)
+    encoded.reading_chars = np.array([encoded.chars.id(char) for _, char in readings], dtype=np.int32)
+    encoded.reading_ids = np.array(reading_ids, dtype=np.int32)
+    encoded.offsets = np.array(offsets, dtype=np.int64)
+    encoded.extra_ids = np.array(extra_ids, dtype=np.int32)
+    return encoded
@@ -0,0 +1,131 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Drop the lines of a dict that match any of a set of rules, in one pass.
+
+Every rule is a word length in CJK characters and a code shape, the
+filters the make scripts ran as one perl -CSAD -i -pe pass each:
+
+    perl -CSAD -i -pe "s/^[\x{4e00}-\x{9fff}...]{2}\t[A-Za-z]{3,4}+\n//g" FILE
+
+is the rule word-2-short-code here. Rules are tried in the order given,
+so each dropped line is counted for the first rule it matches, as it was
+for the first perl pass that removed it:
+
+    python3 filter_dict.py -r char -r word-3-full-code -r word-2-short-code FILE...
+
+A line only matches when all of its word is CJK, which is looked up in a
+table by code point rather than through a regex of ranges. As with perl,
+a last line without a newline is never dropped.
+"""
+
+import argparse
+from collections import Counter, namedtuple
+
+import rime_dict
+
+# The ranges of the perl character class, both ends included
+CJK_RANGES = [
+    (0x4e00, 0x9fff), (0x3007, 0x3007), (0x3400, 0x4dbf), (0x20000, 0x2a6df), (0x2a700, 0x2b73f),
+    (0x2b740, 0x2b81f), (0x2b820, 0x2ceaf), (0x2ceb0, 0x2ebe0), (0x30000, 0x3134a), (0x31350, 0x323af),
+    (0x2ebf0, 0x2ee5f),
+]
+# Code point -> 1 for CJK, 0 for anything else below the last range; used with str.translate,
+# which leaves the code points past the end of the table as they are
+CJK_TABLE = bytearray(max(end for _, end in CJK_RANGES) + 1)
+for _start, _end in CJK_RANGES:
+    CJK_TABLE[_start:_end + 1] = b"\1" * (_end + 1 - _start)
+
+# chars: word length; letters: code length; exact: the code is only those letters,
+# otherwise it starts with at least letters[0] of them and anything may follow
+Rule = namedtuple("Rule", "chars letters exact")
+RULES = {
+    "char": Rule((1, 1), (1, None), False),  # {1}\t[A-Za-z]+.*\n
+    "char-4-code": Rule((1, 1), (4, None), False),  # {1}\t[A-Za-z]{4}.*\n
+    "word-2-short-code": Rule((2, 2), (3, 4), True),  # {2}\t[A-Za-z]{3,4}+\n
+    "word-3-full-code": Rule((3, 3), (4, 4), True),  # {3}\t[A-Za-z]{4}+\n
+    "words": Rule((2, 100), (1, None), False),  # {2,100}\t[A-Za-z]+.*\n
+}
+
+stats = Counter()
+
+
+def is_cjk(word):
+    return not word.translate(CJK_TABLE).strip("\1")
+
+
+def is_letters(code):
+    return code.isascii() and code.isalpha()
+
+
+def code_matches(rule, code):
+    least, most = rule.letters
+    if rule.exact:
+        return least <= len(code) <= most and is_letters(code)
+    return len(code) >= least and is_letters(code[:least])
+
+
+def compile_rules(names):
+    r"""Return a function giving the name of the first rule a line matches, or None."""
+    # The rules that apply to each word length, in the order given
+    by_length = {}
+    for name in names:
+        rule = RULES[name]
+        for length in range(rule.chars[0], rule.chars[1] + 1):
+            by_length.setdefault(length, []).append((name, rule))
+
+    def first_match(line):
+        if line[-1:] != "\n":
+            return None
+        tab = line.find("\t")
+        rules = by_length.get(tab)
+        # The word is checked once, the rules then only look at the code
+        if rules is None or not is_cjk(line[:tab]):
+            return None
+        code = line[tab + 1:-1]
+        for name, rule in rules:
+            if code_matches(rule, code):
+                return name
+        return None
+    return first_match
+
+
+def filter_lines(lines, names):
+    first_match = compile_rules(names)
+    for line in lines:
+        name = first_match(line)
+        if name is None:
+            stats["kept"] += 1
+            yield line
+        else:
+            stats[name] += 1
+
+
+def filter_file(path, names):
+    # Only "\n" ends a line, as for perl; bytes that are not UTF-8 are written back as they were
+    options = dict(encoding="UTF-8", errors="surrogateescape", newline="\n")
+    with open(path, **options) as f_in, rime_dict.atomic_write(path, **options) as f_out:
+        f_out.writelines(filter_lines(f_in, names))
+
+
+def get_cli_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     epilog="rules: " + ", ".join(RULES))
+    parser.add_argument("files", nargs="+", help="Files to filter in place")
+    parser.add_argument("--rule", "-r", action="append", required=True, choices=RULES,
+                        help="Drop the lines matching this rule; may be given more than once")
+    args = parser.parse_args()
+    return args
+
+
+def main():
+    args = get_cli_args()
+    for path in args.files:
+        stats.clear()
+        filter_file(path, args.rule)
+        hits = ", ".join(f"{name} {stats[name]}" for name in args.rule)
+        print(f"{path}: dropped {hits}; kept {stats['kept']} lines")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,1330 +4,1413 @@ r"""
 Convert quanpin dictionary files to pinyin+shape for Rime input method.
 """
 
-import csv
 import re
 import argparse
-import opencc
+import heapq
+import math
 import os
-from collections import defaultdict
-from itertools import product
+import sys
+import multiprocessing
+from collections import Counter
+from itertools import islice, product
+
+import dedupe
+import dict_array
+import rime_dict
+from opencc_cache import DEFAULT_CACHE_FILE, CachedConverter, DiskCache
+from shape_db import load_shape_dict
+
+opencc_t2s = CachedConverter('t2s.json')
+opencc_s2t = CachedConverter('s2t.json')
+
+
+TONESYMBOL_SHENGMU = {"zh": "zh", "ch": "ch", "sh": "sh"}
+TONESYMBOL_YUNMU = {
+    "a5": "a",
+    "a1": "ā",
+    "a2": "á",
+    "a3": "ǎ",
+    "a4": "à",
+    "ai5": "ai",
+    "ai1": "āi",
+    "ai2": "ái",
+    "ai3": "ǎi",
+    "ai4": "ài",
+    "an5": "an",
+    "an1": "ān",
+    "an2": "án",
+    "an3": "ǎn",
+    "an4": "àn",
+    "ang5": "ang",
+    "ang1": "āng",
+    "ang2": "áng",
+    "ang3": "ǎng",
+    "ang4": "àng",
+    "ao5": "ao",
+    "ao1": "āo",
+    "ao2": "áo",
+    "ao3": "ǎo",
+    "ao4": "ào",
+    "e5": "e",
+    "e1": "ē",
+    "e2": "é",
+    "e3": "ě",
+    "e4": "è",
+    "ei5": "ei",
+    "ei1": "ēi",
+    "ei2": "éi",
+    "ei3": "ěi",
+    "ei4": "èi",
+    "en5": "en",
+    "en1": "ēn",
+    "en2": "én",
+    "en3": "ěn",
+    "en4": "èn",
+    "eng5": "eng",
+    "eng1": "ēng",
+    "eng2": "éng",
+    "eng3": "ěng",
+    "eng4": "èng",
+    "er5": "er",
+    "er1": "ēr",
+    "er2": "ér",
+    "er3": "ěr",
+    "er4": "èr",
+    "i5": "i",
+    "i1": "ī",
+    "i2": "í",
+    "i3": "ǐ",
+    "i4": "ì",
+    "ia5": "ia",
+    "ia1": "iā",
+    "ia2": "iá",
+    "ia3": "iǎ",
+    "ia4": "ià",
+    "ian5": "ian",
+    "ian1": "iān",
+    "ian2": "ián",
+    "ian3": "iǎn",
+    "ian4": "iàn",
+    "iang5": "iang",
+    "iang1": "iāng",
+    "iang2": "iáng",
+    "iang3": "iǎng",
+    "iang4": "iàng",
+    "iao5": "iao",
+    "iao1": "iāo",
+    "iao2": "iáo",
+    "iao3": "iǎo",
+    "iao4": "iào",
+    "ie5": "ie",
+    "ie1": "iē",
+    "ie2": "ié",
+    "ie3": "iě",
+    "ie4": "iè",
+    "in5": "in",
+    "in1": "īn",
+    "in2": "ín",
+    "in3": "ǐn",
+    "in4": "ìn",
+    "ing5": "ing",
+    "ing1": "īng",
+    "ing2": "íng",
+    "ing3": "ǐng",
+    "ing4": "ìng",
+    "iong5": "iong",
+    "iong1": "iōng",
+    "iong2": "ióng",
+    "iong3": "iǒng",
+    "iong4": "iòng",
+    "iu5": "iu",
+    "iu1": "iū",
+    "iu2": "iú",
+    "iu3": "iǔ",
+    "iu4": "iù",
+    "o5": "o",
+    "o1": "ō",
+    "o2": "ó",
+    "o3": "ǒ",
+    "o4": "ò",
+    "ong5": "ong",
+    "ong1": "ōng",
+    "ong2": "óng",
+    "ong3": "ǒng",
+    "ong4": "òng",
+    "ou5": "ou",
+    "ou1": "ōu",
+    "ou2": "óu",
+    "ou3": "ǒu",
+    "ou4": "òu",
+    "u5": "u",
+    "u1": "ū",
+    "u2": "ú",
+    "u3": "ǔ",
+    "u4": "ù",
+    "ua5": "ua",
+    "ua1": "uā",
+    "ua2": "uá",
+    "ua3": "uǎ",
+    "ua4": "uà",
+    "uai5": "uai",
+    "uai1": "uāi",
+    "uai2": "uái",
+    "uai3": "uǎi",
+    "uai4": "uài",
+    "uan5": "uan",
+    "uan1": "uān",
+    "uan2": "uán",
+    "uan3": "uǎn",
+    "uan4": "uàn",
+    "uang5": "uang",
+    "uang1": "uāng",
+    "uang2": "uáng",
+    "uang3": "uǎng",
+    "uang4": "uàng",
+    "ue5": "ue",
+    "ue1": "uē",
+    "ue2": "ué",
+    "ue3": "uě",
+    "ue4": "uè",
+    "ui5": "ui",
+    "ui1": "uī",
+    "ui2": "uí",
+    "ui3": "uǐ",
+    "ui4": "uì",
+    "un5": "un",
+    "un1": "ūn",
+    "un2": "ún",
+    "un3": "ǔn",
+    "un4": "ùn",
+    "uo5": "uo",
+    "uo1": "uō",
+    "uo2": "uó",
+    "uo3": "uǒ",
+    "uo4": "uò",
+    "v5": "ü",
+    "v1": "ǖ",
+    "v2": "ǘ",
+    "v3": "ǚ",
+    "v4": "ǜ",
+    "ve5": "üe",
+    "ve1": "üē",
+    "ve2": "üé",
+    "ve3": "üě",
+    "ve4": "üè",
+}
+TONESYMBOL_ZERO = {
+    "a5": "a",
+    "a1": "ā",
+    "a2": "á",
+    "a3": "ǎ",
+    "a4": "à",
+    "ai5": "ai",
+    "ai1": "āi",
+    "ai2": "ái",
+    "ai3": "ǎi",
+    "ai4": "ài",
+    "an5": "an",
+    "an1": "ān",
+    "an2": "án",
+    "an3": "ǎn",
+    "an4": "àn",
+    "ang5": "ang",
+    "ang1": "āng",
+    "ang2": "áng",
+    "ang3": "ǎng",
+    "ang4": "àng",
+    "ao5": "ao",
+    "ao1": "āo",
+    "ao2": "áo",
+    "ao3": "ǎo",
+    "ao4": "ào",
+    "e5": "e",
+    "e1": "ē",
+    "e2": "é",
+    "e3": "ě",
+    "e4": "è",
+    "ei5": "ei",
+    "ei1": "ēi",
+    "ei2": "éi",
+    "ei3": "ěi",
+    "ei4": "èi",
+    "en5": "en",
+    "en1": "ēn",
+    "en2": "én",
+    "en3": "ěn",
+    "en4": "èn",
+    "eng5": "eng",
+    "eng1": "ēng",
+    "eng2": "éng",
+    "eng3": "ěng",
+    "eng4": "èng",
+    "er5": "er",
+    "er1": "ēr",
+    "er2": "ér",
+    "er3": "ěr",
+    "er4": "èr",
+    "o5": "o",
+    "o1": "ō",
+    "o2": "ó",
+    "o3": "ǒ",
+    "o4": "ò",
+    "ou5": "ou",
+    "ou1": "ōu",
+    "ou2": "óu",
+    "ou3": "ǒu",
+    "ou4": "òu",
+    "ju5": "ju",
+    "ju1": "jū",
+    "ju2": "jú",
+    "ju3": "jǔ",
+    "ju4": "jù",
+    "qu5": "qu",
+    "qu1": "qū",
+    "qu2": "qú",
+    "qu3": "qǔ",
+    "qu4": "qù",
+    "xu5": "xu",
+    "xu1": "xū",
+    "xu2": "xú",
+    "xu3": "xǔ",
+    "xu4": "xù",
+    "yu5": "yu",
+    "yu1": "yū",
+    "yu2": "yú",
+    "yu3": "yǔ",
+    "yu4": "yù",
+}
 
-opencc_t2s = opencc.OpenCC('t2s.json')
-opencc_s2t = opencc.OpenCC('s2t.json')
 
 def tonenum2tonesymbol(pinyin: str):
-    shengmu_dict = {"zh": "zh", "ch": "ch", "sh": "sh"}
-    yunmu_dict = {
-        "a5": "a",
-        "a1": "ā",
-        "a2": "á",
-        "a3": "ǎ",
-        "a4": "à",
-        "ai5": "ai",
-        "ai1": "āi",
-        "ai2": "ái",
-        "ai3": "ǎi",
-        "ai4": "ài",
-        "an5": "an",
-        "an1": "ān",
-        "an2": "án",
-        "an3": "ǎn",
-        "an4": "àn",
-        "ang5": "ang",
-        "ang1": "āng",
-        "ang2": "áng",
-        "ang3": "ǎng",
-        "ang4": "àng",
-        "ao5": "ao",
-        "ao1": "āo",
-        "ao2": "áo",
-        "ao3": "ǎo",
-        "ao4": "ào",
-        "e5": "e",
-        "e1": "ē",
-        "e2": "é",
-        "e3": "ě",
-        "e4": "è",
-        "ei5": "ei",
-        "ei1": "ēi",
-        "ei2": "éi",
-        "ei3": "ěi",
-        "ei4": "èi",
-        "en5": "en",
-        "en1": "ēn",
-        "en2": "én",
-        "en3": "ěn",
-        "en4": "èn",
-        "eng5": "eng",
-        "eng1": "ēng",
-        "eng2": "éng",
-        "eng3": "ěng",
-        "eng4": "èng",
-        "er5": "er",
-        "er1": "ēr",
-        "er2": "ér",
-        "er3": "ěr",
-        "er4": "èr",
-        "i5": "i",
-        "i1": "ī",
-        "i2": "í",
-        "i3": "ǐ",
-        "i4": "ì",
-        "ia5": "ia",
-        "ia1": "iā",
-        "ia2": "iá",
-        "ia3": "iǎ",
-        "ia4": "ià",
-        "ian5": "ian",
-        "ian1": "iān",
-        "ian2": "ián",
-        "ian3": "iǎn",
-        "ian4": "iàn",
-        "iang5": "iang",
-        "iang1": "iāng",
-        "iang2": "iáng",
-        "iang3": "iǎng",
-        "iang4": "iàng",
-        "iao5": "iao",
-        "iao1": "iāo",
-        "iao2": "iáo",
-        "iao3": "iǎo",
-        "iao4": "iào",
-        "ie5": "ie",
-        "ie1": "iē",
-        "ie2": "ié",
-        "ie3": "iě",
-        "ie4": "iè",
-        "in5": "in",
-        "in1": "īn",
-        "in2": "ín",
-        "in3": "ǐn",
-        "in4": "ìn",
-        "ing5": "ing",
-        "ing1": "īng",
-        "ing2": "íng",
-        "ing3": "ǐng",
-        "ing4": "ìng",
-        "iong5": "iong",
-        "iong1": "iōng",
-        "iong2": "ióng",
-        "iong3": "iǒng",
-        "iong4": "iòng",
-        "iu5": "iu",
-        "iu1": "iū",
-        "iu2": "iú",
-        "iu3": "iǔ",
-        "iu4": "iù",
-        "o5": "o",
-        "o1": "ō",
-        "o2": "ó",
-        "o3": "ǒ",
-        "o4": "ò",
-        "ong5": "ong",
-        "ong1": "ōng",
-        "ong2": "óng",
-        "ong3": "ǒng",
-        "ong4": "òng",
-        "ou5": "ou",
-        "ou1": "ōu",
-        "ou2": "óu",
-        "ou3": "ǒu",
-        "ou4": "òu",
-        "u5": "u",
-        "u1": "ū",
-        "u2": "ú",
-        "u3": "ǔ",
-        "u4": "ù",
-        "ua5": "ua",
-        "ua1": "uā",
-        "ua2": "uá",
-        "ua3": "uǎ",
-        "ua4": "uà",
-        "uai5": "uai",
-        "uai1": "uāi",
-        "uai2": "uái",
-        "uai3": "uǎi",
-        "uai4": "uài",
-        "uan5": "uan",
-        "uan1": "uān",
-        "uan2": "uán",
-        "uan3": "uǎn",
-        "uan4": "uàn",
-        "uang5": "uang",
-        "uang1": "uāng",
-        "uang2": "uáng",
-        "uang3": "uǎng",
-        "uang4": "uàng",
-        "ue5": "ue",
-        "ue1": "uē",
-        "ue2": "ué",
-        "ue3": "uě",
-        "ue4": "uè",
-        "ui5": "ui",
-        "ui1": "uī",
-        "ui2": "uí",
-        "ui3": "uǐ",
-        "ui4": "uì",
-        "un5": "un",
-        "un1": "ūn",
-        "un2": "ún",
-        "un3": "ǔn",
-        "un4": "ùn",
-        "uo5": "uo",
-        "uo1": "uō",
-        "uo2": "uó",
-        "uo3": "uǒ",
-        "uo4": "uò",
-        "v5": "ü",
-        "v1": "ǖ",
-        "v2": "ǘ",
-        "v3": "ǚ",
-        "v4": "ǜ",
-        "ve5": "üe",
-        "ve1": "üē",
-        "ve2": "üé",
-        "ve3": "üě",
-        "ve4": "üè",
-    }
-    zero = {
-        "a5": "a",
-        "a1": "ā",
-        "a2": "á",
-        "a3": "ǎ",
-        "a4": "à",
-        "ai5": "ai",
-        "ai1": "āi",
-        "ai2": "ái",
-        "ai3": "ǎi",
-        "ai4": "ài",
-        "an5": "an",
-        "an1": "ān",
-        "an2": "án",
-        "an3": "ǎn",
-        "an4": "àn",
-        "ang5": "ang",
-        "ang1": "āng",
-        "ang2": "áng",
-        "ang3": "ǎng",
-        "ang4": "àng",
-        "ao5": "ao",
-        "ao1": "āo",
-        "ao2": "áo",
-        "ao3": "ǎo",
-        "ao4": "ào",
-        "e5": "e",
-        "e1": "ē",
-        "e2": "é",
-        "e3": "ě",
-        "e4": "è",
-        "ei5": "ei",
-        "ei1": "ēi",
-        "ei2": "éi",
-        "ei3": "ěi",
-        "ei4": "èi",
-        "en5": "en",
-        "en1": "ēn",
-        "en2": "én",
-        "en3": "ěn",
-        "en4": "èn",
-        "eng5": "eng",
-        "eng1": "ēng",
-        "eng2": "éng",
-        "eng3": "ěng",
-        "eng4": "èng",
-        "er5": "er",
-        "er1": "ēr",
-        "er2": "ér",
-        "er3": "ěr",
-        "er4": "èr",
-        "o5": "o",
-        "o1": "ō",
-        "o2": "ó",
-        "o3": "ǒ",
-        "o4": "ò",
-        "ou5": "ou",
-        "ou1": "ōu",
-        "ou2": "óu",
-        "ou3": "ǒu",
-        "ou4": "òu",
-        "ju5": "ju",
-        "ju1": "jū",
-        "ju2": "jú",
-        "ju3": "jǔ",
-        "ju4": "jù",
-        "qu5": "qu",
-        "qu1": "qū",
-        "qu2": "qú",
-        "qu3": "qǔ",
-        "qu4": "qù",
-        "xu5": "xu",
-        "xu1": "xū",
-        "xu2": "xú",
-        "xu3": "xǔ",
-        "xu4": "xù",
-        "yu5": "yu",
-        "yu1": "yū",
-        "yu2": "yú",
-        "yu3": "yǔ",
-        "yu4": "yù",
-    }
-    if pinyin in zero:
-        return zero[pinyin]
+    if pinyin in TONESYMBOL_ZERO:
+        return TONESYMBOL_ZERO[pinyin]
     if pinyin[1] == "h" and len(pinyin) > 2:
         shengmu, yunmu = pinyin[:2], pinyin[2:]
-        shengmu = shengmu_dict[shengmu]
+        shengmu = TONESYMBOL_SHENGMU[shengmu]
     else:
         shengmu, yunmu = pinyin[:1], pinyin[1:]
-    return shengmu + yunmu_dict.get(yunmu, yunmu)
+    return shengmu + TONESYMBOL_YUNMU.get(yunmu, yunmu)
+
+
+ZRLOOP_SHENGMU = {"zh": "v", "ch": "i", "sh": "u"}
+ZRLOOP_YUNMU = {
+    "a5": "a",
+    "a1": "a",
+    "a2": "s",
+    "a3": "d",
+    "a4": "l",
+    "ai5": "l",
+    "ai1": "l",
+    "ai2": "a",
+    "ai3": "s",
+    "ai4": "k",
+    "an5": "j",
+    "an1": "j",
+    "an2": "k",
+    "an3": "l",
+    "an4": "h",
+    "ang5": "h",
+    "ang1": "h",
+    "ang2": "j",
+    "ang3": "k",
+    "ang4": "g",
+    "ao5": "k",
+    "ao1": "k",
+    "ao2": "l",
+    "ao3": "a",
+    "ao4": "j",
+    "e5": "e",
+    "e1": "e",
+    "e2": "r",
+    "e3": "t",
+    "e4": "w",
+    "ei5": "z",
+    "ei1": "z",
+    "ei2": "x",
+    "ei3": "c",
+    "ei4": "m",
+    "en5": "f",
+    "en1": "f",
+    "en2": "g",
+    "en3": "h",
+    "en4": "d",
+    "eng5": "g",
+    "eng1": "g",
+    "eng2": "h",
+    "eng3": "j",
+    "eng4": "f",
+    "er5": "r",
+    "er1": "r",
+    "er2": "t",
+    "er3": "y",
+    "er4": "e",
+    "i5": "i",
+    "i1": "i",
+    "i2": "o",
+    "i3": "p",
+    "i4": "u",
+    "ia5": "w",
+    "ia1": "w",
+    "ia2": "e",
+    "ia3": "r",
+    "ia4": "q",
+    "ian5": "m",
+    "ian1": "m",
+    "ian2": "z",
+    "ian3": "x",
+    "ian4": "n",
+    "iang5": "d",
+    "iang1": "d",
+    "iang2": "f",
+    "iang3": "g",
+    "iang4": "s",
+    "iao5": "c",
+    "iao1": "c",
+    "iao2": "v",
+    "iao3": "b",
+    "iao4": "x",
+    "ie5": "x",
+    "ie1": "x",
+    "ie2": "c",
+    "ie3": "v",
+    "ie4": "z",
+    "in5": "n",
+    "in1": "n",
+    "in2": "m",
+    "in3": "z",
+    "in4": "b",
+    "ing5": "y",
+    "ing1": "y",
+    "ing2": "u",
+    "ing3": "i",
+    "ing4": "t",
+    "iong5": "s",
+    "iong1": "s",
+    "iong2": "d",
+    "iong3": "f",
+    "iong4": "a",
+    "iu5": "q",
+    "iu1": "q",
+    "iu2": "w",
+    "iu3": "e",
+    "iu4": "p",
+    "o5": "o",
+    "o1": "o",
+    "o2": "p",
+    "o3": "q",
+    "o4": "i",
+    "ong5": "s",
+    "ong1": "s",
+    "ong2": "d",
+    "ong3": "f",
+    "ong4": "a",
+    "ou5": "b",
+    "ou1": "b",
+    "ou2": "n",
+    "ou3": "m",
+    "ou4": "v",
+    "u5": "u",
+    "u1": "u",
+    "u2": "i",
+    "u3": "o",
+    "u4": "y",
+    "ua5": "w",
+    "ua1": "w",
+    "ua2": "e",
+    "ua3": "r",
+    "ua4": "q",
+    "uai5": "y",
+    "uai1": "y",
+    "uai2": "u",
+    "uai3": "i",
+    "uai4": "t",
+    "uan5": "r",
+    "uan1": "r",
+    "uan2": "t",
+    "uan3": "y",
+    "uan4": "e",
+    "uang5": "d",
+    "uang1": "d",
+    "uang2": "f",
+    "uang3": "g",
+    "uang4": "s",
+    "ue5": "t",
+    "ue1": "t",
+    "ue2": "y",
+    "ue3": "u",
+    "ue4": "r",
+    "ui5": "v",
+    "ui1": "v",
+    "ui2": "b",
+    "ui3": "n",
+    "ui4": "c",
+    "un5": "p",
+    "un1": "p",
+    "un2": "q",
+    "un3": "w",
+    "un4": "o",
+    "uo5": "o",
+    "uo1": "o",
+    "uo2": "p",
+    "uo3": "q",
+    "uo4": "i",
+    "v5": "v",
+    "v1": "v",
+    "v2": "b",
+    "v3": "n",
+    "v4": "c",
+    "ve5": "t",
+    "ve1": "t",
+    "ve2": "y",
+    "ve3": "u",
+    "ve4": "r",
+}
+ZRLOOP_ZERO = {
+    "a5": "aa",
+    "a1": "aa",
+    "a2": "as",
+    "a3": "ad",
+    "a4": "al",
+    "ai5": "ai",
+    "ai1": "ai",
+    "ai2": "ao",
+    "ai3": "ap",
+    "ai4": "au",
+    "an5": "an",
+    "an1": "an",
+    "an2": "am",
+    "an3": "az",
+    "an4": "ab",
+    "ang5": "ah",
+    "ang1": "ah",
+    "ang2": "aj",
+    "ang3": "ak",
+    "ang4": "ag",
+    "ao5": "ao",
+    "ao1": "ao",
+    "ao2": "ap",
+    "ao3": "aq",
+    "ao4": "ai",
+    "e5": "ee",
+    "e1": "ee",
+    "e2": "er",
+    "e3": "et",
+    "e4": "ew",
+    "ei5": "ei",
+    "ei1": "ei",
+    "ei2": "eo",
+    "ei3": "ep",
+    "ei4": "eu",
+    "en5": "en",
+    "en1": "en",
+    "en2": "em",
+    "en3": "ez",
+    "en4": "eb",
+    "eng5": "eg",
+    "eng1": "eg",
+    "eng2": "eh",
+    "eng3": "ej",
+    "eng4": "ef",
+    "er5": "er",
+    "er1": "er",
+    "er2": "et",
+    "er3": "ey",
+    "er4": "ee",
+    "o5": "oo",
+    "o1": "oo",
+    "o2": "op",
+    "o3": "oq",
+    "o4": "oi",
+    "ou5": "ou",
+    "ou1": "ou",
+    "ou2": "oi",
+    "ou3": "oo",
+    "ou4": "oy",
+    "ju5": "jv",
+    "ju1": "jv",
+    "ju2": "jb",
+    "ju3": "jn",
+    "ju4": "jc",
+    "qu5": "qv",
+    "qu1": "qv",
+    "qu2": "qb",
+    "qu3": "qn",
+    "qu4": "qc",
+    "xu5": "xv",
+    "xu1": "xv",
+    "xu2": "xb",
+    "xu3": "xn",
+    "xu4": "xc",
+    "yu5": "yv",
+    "yu1": "yv",
+    "yu2": "yb",
+    "yu3": "yn",
+    "yu4": "yc",
+}
 
 
 def snow2zrloopkai(pinyin: str):
-    shengmu_dict = {"zh": "v", "ch": "i", "sh": "u"}
-    yunmu_dict = {
-        "a5": "a",
-        "a1": "a",
-        "a2": "s",
-        "a3": "d",
-        "a4": "l",
-        "ai5": "l",
-        "ai1": "l",
-        "ai2": "a",
-        "ai3": "s",
-        "ai4": "k",
-        "an5": "j",
-        "an1": "j",
-        "an2": "k",
-        "an3": "l",
-        "an4": "h",
-        "ang5": "h",
-        "ang1": "h",
-        "ang2": "j",
-        "ang3": "k",
-        "ang4": "g",
-        "ao5": "k",
-        "ao1": "k",
-        "ao2": "l",
-        "ao3": "a",
-        "ao4": "j",
-        "e5": "e",
-        "e1": "e",
-        "e2": "r",
-        "e3": "t",
-        "e4": "w",
-        "ei5": "z",
-        "ei1": "z",
-        "ei2": "x",
-        "ei3": "c",
-        "ei4": "m",
-        "en5": "f",
-        "en1": "f",
-        "en2": "g",
-        "en3": "h",
-        "en4": "d",
-        "eng5": "g",
-        "eng1": "g",
-        "eng2": "h",
-        "eng3": "j",
-        "eng4": "f",
-        "er5": "r",
-        "er1": "r",
-        "er2": "t",
-        "er3": "y",
-        "er4": "e",
-        "i5": "i",
-        "i1": "i",
-        "i2": "o",
-        "i3": "p",
-        "i4": "u",
-        "ia5": "w",
-        "ia1": "w",
-        "ia2": "e",
-        "ia3": "r",
-        "ia4": "q",
-        "ian5": "m",
-        "ian1": "m",
-        "ian2": "z",
-        "ian3": "x",
-        "ian4": "n",
-        "iang5": "d",
-        "iang1": "d",
-        "iang2": "f",
-        "iang3": "g",
-        "iang4": "s",
-        "iao5": "c",
-        "iao1": "c",
-        "iao2": "v",
-        "iao3": "b",
-        "iao4": "x",
-        "ie5": "x",
-        "ie1": "x",
-        "ie2": "c",
-        "ie3": "v",
-        "ie4": "z",
-        "in5": "n",
-        "in1": "n",
-        "in2": "m",
-        "in3": "z",
-        "in4": "b",
-        "ing5": "y",
-        "ing1": "y",
-        "ing2": "u",
-        "ing3": "i",
-        "ing4": "t",
-        "iong5": "s",
-        "iong1": "s",
-        "iong2": "d",
-        "iong3": "f",
-        "iong4": "a",
-        "iu5": "q",
-        "iu1": "q",
-        "iu2": "w",
-        "iu3": "e",
-        "iu4": "p",
-        "o5": "o",
-        "o1": "o",
-        "o2": "p",
-        "o3": "q",
-        "o4": "i",
-        "ong5": "s",
-        "ong1": "s",
-        "ong2": "d",
-        "ong3": "f",
-        "ong4": "a",
-        "ou5": "b",
-        "ou1": "b",
-        "ou2": "n",
-        "ou3": "m",
-        "ou4": "v",
-        "u5": "u",
-        "u1": "u",
-        "u2": "i",
-        "u3": "o",
-        "u4": "y",
-        "ua5": "w",
-        "ua1": "w",
-        "ua2": "e",
-        "ua3": "r",
-        "ua4": "q",
-        "uai5": "y",
-        "uai1": "y",
-        "uai2": "u",
-        "uai3": "i",
-        "uai4": "t",
-        "uan5": "r",
-        "uan1": "r",
-        "uan2": "t",
-        "uan3": "y",
-        "uan4": "e",
-        "uang5": "d",
-        "uang1": "d",
-        "uang2": "f",
-        "uang3": "g",
-        "uang4": "s",
-        "ue5": "t",
-        "ue1": "t",
-        "ue2": "y",
-        "ue3": "u",
-        "ue4": "r",
-        "ui5": "v",
-        "ui1": "v",
-        "ui2": "b",
-        "ui3": "n",
-        "ui4": "c",
-        "un5": "p",
-        "un1": "p",
-        "un2": "q",
-        "un3": "w",
-        "un4": "o",
-        "uo5": "o",
-        "uo1": "o",
-        "uo2": "p",
-        "uo3": "q",
-        "uo4": "i",
-        "v5": "v",
-        "v1": "v",
-        "v2": "b",
-        "v3": "n",
-        "v4": "c",
-        "ve5": "t",
-        "ve1": "t",
-        "ve2": "y",
-        "ve3": "u",
-        "ve4": "r",
-    }
-    zero = {
-        "a5": "aa",
-        "a1": "aa",
-        "a2": "as",
-        "a3": "ad",
-        "a4": "al",
-        "ai5": "ai",
-        "ai1": "ai",
-        "ai2": "ao",
-        "ai3": "ap",
-        "ai4": "au",
-        "an5": "an",
-        "an1": "an",
-        "an2": "am",
-        "an3": "az",
-        "an4": "ab",
-        "ang5": "ah",
-        "ang1": "ah",
-        "ang2": "aj",
-        "ang3": "ak",
-        "ang4": "ag",
-        "ao5": "ao",
-        "ao1": "ao",
-        "ao2": "ap",
-        "ao3": "aq",
-        "ao4": "ai",
-        "e5": "ee",
-        "e1": "ee",
-        "e2": "er",
-        "e3": "et",
-        "e4": "ew",
-        "ei5": "ei",
-        "ei1": "ei",
-        "ei2": "eo",
-        "ei3": "ep",
-        "ei4": "eu",
-        "en5": "en",
-        "en1": "en",
-        "en2": "em",
-        "en3": "ez",
-        "en4": "eb",
-        "eng5": "eg",
-        "eng1": "eg",
-        "eng2": "eh",
-        "eng3": "ej",
-        "eng4": "ef",
-        "er5": "er",
-        "er1": "er",
-        "er2": "et",
-        "er3": "ey",
-        "er4": "ee",
-        "o5": "oo",
-        "o1": "oo",
-        "o2": "op",
-        "o3": "oq",
-        "o4": "oi",
-        "ou5": "ou",
-        "ou1": "ou",
-        "ou2": "oi",
-        "ou3": "oo",
-        "ou4": "oy",
-        "ju5": "jv",
-        "ju1": "jv",
-        "ju2": "jb",
-        "ju3": "jn",
-        "ju4": "jc",
-        "qu5": "qv",
-        "qu1": "qv",
-        "qu2": "qb",
-        "qu3": "qn",
-        "qu4": "qc",
-        "xu5": "xv",
-        "xu1": "xv",
-        "xu2": "xb",
-        "xu3": "xn",
-        "xu4": "xc",
-        "yu5": "yv",
-        "yu1": "yv",
-        "yu2": "yb",
-        "yu3": "yn",
-        "yu4": "yc",
-    }
-    if pinyin in zero:
-        return zero[pinyin]
+    if pinyin in ZRLOOP_ZERO:
+        return ZRLOOP_ZERO[pinyin]
     if pinyin[1] == "h" and len(pinyin) > 2:
         shengmu, yunmu = pinyin[:2], pinyin[2:]
-        shengmu = shengmu_dict[shengmu]
+        shengmu = ZRLOOP_SHENGMU[shengmu]
     else:
         shengmu, yunmu = pinyin[:1], pinyin[1:]
-    return shengmu + yunmu_dict.get(yunmu, yunmu)
+    return shengmu + ZRLOOP_YUNMU.get(yunmu, yunmu)
+
+
+XHLOOP_SHENGMU = {"zh": "v", "ch": "i", "sh": "u"}
+XHLOOP_YUNMU = {
+    "a5": "a",
+    "a1": "a",
+    "a2": "s",
+    "a3": "d",
+    "a4": "l",
+    "ai5": "d",
+    "ai1": "d",
+    "ai2": "f",
+    "ai3": "g",
+    "ai4": "s",
+    "an5": "j",
+    "an1": "j",
+    "an2": "k",
+    "an3": "l",
+    "an4": "h",
+    "ang5": "h",
+    "ang1": "h",
+    "ang2": "j",
+    "ang3": "k",
+    "ang4": "g",
+    "ao5": "c",
+    "ao1": "c",
+    "ao2": "v",
+    "ao3": "b",
+    "ao4": "x",
+    "e5": "e",
+    "e1": "e",
+    "e2": "r",
+    "e3": "t",
+    "e4": "w",
+    "ei5": "w",
+    "ei1": "w",
+    "ei2": "e",
+    "ei3": "r",
+    "ei4": "q",
+    "en5": "f",
+    "en1": "f",
+    "en2": "g",
+    "en3": "h",
+    "en4": "d",
+    "eng5": "g",
+    "eng1": "g",
+    "eng2": "h",
+    "eng3": "j",
+    "eng4": "f",
+    "er5": "r",
+    "er1": "r",
+    "er2": "t",
+    "er3": "y",
+    "er4": "e",
+    "i5": "i",
+    "i1": "i",
+    "i2": "o",
+    "i3": "p",
+    "i4": "u",
+    "ia5": "x",
+    "ia1": "x",
+    "ia2": "c",
+    "ia3": "v",
+    "ia4": "z",
+    "ian5": "m",
+    "ian1": "m",
+    "ian2": "z",
+    "ian3": "x",
+    "ian4": "n",
+    "iang5": "l",
+    "iang1": "l",
+    "iang2": "a",
+    "iang3": "s",
+    "iang4": "k",
+    "iao5": "n",
+    "iao1": "n",
+    "iao2": "m",
+    "iao3": "z",
+    "iao4": "b",
+    "ie5": "p",
+    "ie1": "p",
+    "ie2": "q",
+    "ie3": "w",
+    "ie4": "o",
+    "in5": "b",
+    "in1": "b",
+    "in2": "n",
+    "in3": "m",
+    "in4": "v",
+    "ing5": "k",
+    "ing1": "k",
+    "ing2": "l",
+    "ing3": "a",
+    "ing4": "j",
+    "iong5": "s",
+    "iong1": "s",
+    "iong2": "d",
+    "iong3": "f",
+    "iong4": "a",
+    "iu5": "q",
+    "iu1": "q",
+    "iu2": "w",
+    "iu3": "e",
+    "iu4": "p",
+    "o5": "o",
+    "o1": "o",
+    "o2": "p",
+    "o3": "q",
+    "o4": "i",
+    "ong5": "s",
+    "ong1": "s",
+    "ong2": "d",
+    "ong3": "f",
+    "ong4": "a",
+    "ou5": "z",
+    "ou1": "z",
+    "ou2": "x",
+    "ou3": "c",
+    "ou4": "m",
+    "u5": "u",
+    "u1": "u",
+    "u2": "i",
+    "u3": "o",
+    "u4": "y",
+    "ua5": "x",
+    "ua1": "x",
+    "ua2": "c",
+    "ua3": "v",
+    "ua4": "z",
+    "uai5": "k",
+    "uai1": "k",
+    "uai2": "l",
+    "uai3": "a",
+    "uai4": "j",
+    "uan5": "r",
+    "uan1": "r",
+    "uan2": "t",
+    "uan3": "y",
+    "uan4": "e",
+    "uang5": "l",
+    "uang1": "l",
+    "uang2": "a",
+    "uang3": "s",
+    "uang4": "k",
+    "ue5": "t",
+    "ue1": "t",
+    "ue2": "y",
+    "ue3": "u",
+    "ue4": "r",
+    "ui5": "v",
+    "ui1": "v",
+    "ui2": "b",
+    "ui3": "n",
+    "ui4": "c",
+    "un5": "y",
+    "un1": "y",
+    "un2": "u",
+    "un3": "i",
+    "un4": "t",
+    "uo5": "o",
+    "uo1": "o",
+    "uo2": "p",
+    "uo3": "q",
+    "uo4": "i",
+    "v5": "v",
+    "v1": "v",
+    "v2": "b",
+    "v3": "n",
+    "v4": "c",
+    "ve5": "t",
+    "ve1": "t",
+    "ve2": "y",
+    "ve3": "u",
+    "ve4": "r",
+}
+XHLOOP_ZERO = {
+    "a5": "aa",
+    "a1": "aa",
+    "a2": "as",
+    "a3": "ad",
+    "a4": "al",
+    "ai5": "ai",
+    "ai1": "ai",
+    "ai2": "ao",
+    "ai3": "ap",
+    "ai4": "au",
+    "an5": "an",
+    "an1": "an",
+    "an2": "am",
+    "an3": "az",
+    "an4": "ab",
+    "ang5": "ah",
+    "ang1": "ah",
+    "ang2": "aj",
+    "ang3": "ak",
+    "ang4": "ag",
+    "ao5": "ao",
+    "ao1": "ao",
+    "ao2": "ap",
+    "ao3": "aq",
+    "ao4": "ai",
+    "e5": "ee",
+    "e1": "ee",
+    "e2": "er",
+    "e3": "et",
+    "e4": "ew",
+    "ei5": "ei",
+    "ei1": "ei",
+    "ei2": "eo",
+    "ei3": "ep",
+    "ei4": "eu",
+    "en5": "en",
+    "en1": "en",
+    "en2": "em",
+    "en3": "ez",
+    "en4": "eb",
+    "eng5": "eg",
+    "eng1": "eg",
+    "eng2": "eh",
+    "eng3": "ej",
+    "eng4": "ef",
+    "er5": "er",
+    "er1": "er",
+    "er2": "et",
+    "er3": "ey",
+    "er4": "ee",
+    "o5": "oo",
+    "o1": "oo",
+    "o2": "op",
+    "o3": "oq",
+    "o4": "oi",
+    "ou5": "ou",
+    "ou1": "ou",
+    "ou2": "oi",
+    "ou3": "oo",
+    "ou4": "oy",
+    "ju5": "jv",
+    "ju1": "jv",
+    "ju2": "jb",
+    "ju3": "jn",
+    "ju4": "jc",
+    "qu5": "qv",
+    "qu1": "qv",
+    "qu2": "qb",
+    "qu3": "qn",
+    "qu4": "qc",
+    "xu5": "xv",
+    "xu1": "xv",
+    "xu2": "xb",
+    "xu3": "xn",
+    "xu4": "xc",
+    "yu5": "yv",
+    "yu1": "yv",
+    "yu2": "yb",
+    "yu3": "yn",
+    "yu4": "yc",
+}
 
 
 def snow2xhloopkai(pinyin: str):
-    shengmu_dict = {"zh": "v", "ch": "i", "sh": "u"}
-    yunmu_dict = {
-        "a5": "a",
-        "a1": "a",
-        "a2": "s",
-        "a3": "d",
-        "a4": "l",
-        "ai5": "d",
-        "ai1": "d",
-        "ai2": "f",
-        "ai3": "g",
-        "ai4": "s",
-        "an5": "j",
-        "an1": "j",
-        "an2": "k",
-        "an3": "l",
-        "an4": "h",
-        "ang5": "h",
-        "ang1": "h",
-        "ang2": "j",
-        "ang3": "k",
-        "ang4": "g",
-        "ao5": "c",
-        "ao1": "c",
-        "ao2": "v",
-        "ao3": "b",
-        "ao4": "x",
-        "e5": "e",
-        "e1": "e",
-        "e2": "r",
-        "e3": "t",
-        "e4": "w",
-        "ei5": "w",
-        "ei1": "w",
-        "ei2": "e",
-        "ei3": "r",
-        "ei4": "q",
-        "en5": "f",
-        "en1": "f",
-        "en2": "g",
-        "en3": "h",
-        "en4": "d",
-        "eng5": "g",
-        "eng1": "g",
-        "eng2": "h",
-        "eng3": "j",
-        "eng4": "f",
-        "er5": "r",
-        "er1": "r",
-        "er2": "t",
-        "er3": "y",
-        "er4": "e",
-        "i5": "i",
-        "i1": "i",
-        "i2": "o",
-        "i3": "p",
-        "i4": "u",
-        "ia5": "x",
-        "ia1": "x",
-        "ia2": "c",
-        "ia3": "v",
-        "ia4": "z",
-        "ian5": "m",
-        "ian1": "m",
-        "ian2": "z",
-        "ian3": "x",
-        "ian4": "n",
-        "iang5": "l",
-        "iang1": "l",
-        "iang2": "a",
-        "iang3": "s",
-        "iang4": "k",
-        "iao5": "n",
-        "iao1": "n",
-        "iao2": "m",
-        "iao3": "z",
-        "iao4": "b",
-        "ie5": "p",
-        "ie1": "p",
-        "ie2": "q",
-        "ie3": "w",
-        "ie4": "o",
-        "in5": "b",
-        "in1": "b",
-        "in2": "n",
-        "in3": "m",
-        "in4": "v",
-        "ing5": "k",
-        "ing1": "k",
-        "ing2": "l",
-        "ing3": "a",
-        "ing4": "j",
-        "iong5": "s",
-        "iong1": "s",
-        "iong2": "d",
-        "iong3": "f",
-        "iong4": "a",
-        "iu5": "q",
-        "iu1": "q",
-        "iu2": "w",
-        "iu3": "e",
-        "iu4": "p",
-        "o5": "o",
-        "o1": "o",
-        "o2": "p",
-        "o3": "q",
-        "o4": "i",
-        "ong5": "s",
-        "ong1": "s",
-        "ong2": "d",
-        "ong3": "f",
-        "ong4": "a",
-        "ou5": "z",
-        "ou1": "z",
-        "ou2": "x",
-        "ou3": "c",
-        "ou4": "m",
-        "u5": "u",
-        "u1": "u",
-        "u2": "i",
-        "u3": "o",
-        "u4": "y",
-        "ua5": "x",
-        "ua1": "x",
-        "ua2": "c",
-        "ua3": "v",
-        "ua4": "z",
-        "uai5": "k",
-        "uai1": "k",
-        "uai2": "l",
-        "uai3": "a",
-        "uai4": "j",
-        "uan5": "r",
-        "uan1": "r",
-        "uan2": "t",
-        "uan3": "y",
-        "uan4": "e",
-        "uang5": "l",
-        "uang1": "l",
-        "uang2": "a",
-        "uang3": "s",
-        "uang4": "k",
-        "ue5": "t",
-        "ue1": "t",
-        "ue2": "y",
-        "ue3": "u",
-        "ue4": "r",
-        "ui5": "v",
-        "ui1": "v",
-        "ui2": "b",
-        "ui3": "n",
-        "ui4": "c",
-        "un5": "y",
-        "un1": "y",
-        "un2": "u",
-        "un3": "i",
-        "un4": "t",
-        "uo5": "o",
-        "uo1": "o",
-        "uo2": "p",
-        "uo3": "q",
-        "uo4": "i",
-        "v5": "v",
-        "v1": "v",
-        "v2": "b",
-        "v3": "n",
-        "v4": "c",
-        "ve5": "t",
-        "ve1": "t",
-        "ve2": "y",
-        "ve3": "u",
-        "ve4": "r",
-    }
-    zero = {
-        "a5": "aa",
-        "a1": "aa",
-        "a2": "as",
-        "a3": "ad",
-        "a4": "al",
-        "ai5": "ai",
-        "ai1": "ai",
-        "ai2": "ao",
-        "ai3": "ap",
-        "ai4": "au",
-        "an5": "an",
-        "an1": "an",
-        "an2": "am",
-        "an3": "az",
-        "an4": "ab",
-        "ang5": "ah",
-        "ang1": "ah",
-        "ang2": "aj",
-        "ang3": "ak",
-        "ang4": "ag",
-        "ao5": "ao",
-        "ao1": "ao",
-        "ao2": "ap",
-        "ao3": "aq",
-        "ao4": "ai",
-        "e5": "ee",
-        "e1": "ee",
-        "e2": "er",
-        "e3": "et",
-        "e4": "ew",
-        "ei5": "ei",
-        "ei1": "ei",
-        "ei2": "eo",
-        "ei3": "ep",
-        "ei4": "eu",
-        "en5": "en",
-        "en1": "en",
-        "en2": "em",
-        "en3": "ez",
-        "en4": "eb",
-        "eng5": "eg",
-        "eng1": "eg",
-        "eng2": "eh",
-        "eng3": "ej",
-        "eng4": "ef",
-        "er5": "er",
-        "er1": "er",
-        "er2": "et",
-        "er3": "ey",
-        "er4": "ee",
-        "o5": "oo",
-        "o1": "oo",
-        "o2": "op",
-        "o3": "oq",
-        "o4": "oi",
-        "ou5": "ou",
-        "ou1": "ou",
-        "ou2": "oi",
-        "ou3": "oo",
-        "ou4": "oy",
-        "ju5": "jv",
-        "ju1": "jv",
-        "ju2": "jb",
-        "ju3": "jn",
-        "ju4": "jc",
-        "qu5": "qv",
-        "qu1": "qv",
-        "qu2": "qb",
-        "qu3": "qn",
-        "qu4": "qc",
-        "xu5": "xv",
-        "xu1": "xv",
-        "xu2": "xb",
-        "xu3": "xn",
-        "xu4": "xc",
-        "yu5": "yv",
-        "yu1": "yv",
-        "yu2": "yb",
-        "yu3": "yn",
-        "yu4": "yc",
-    }
-    if pinyin in zero:
-        return zero[pinyin]
+    if pinyin in XHLOOP_ZERO:
+        return XHLOOP_ZERO[pinyin]
     if pinyin[1] == "h" and len(pinyin) > 2:
         shengmu, yunmu = pinyin[:2], pinyin[2:]
-        shengmu = shengmu_dict[shengmu]
+        shengmu = XHLOOP_SHENGMU[shengmu]
     else:
         shengmu, yunmu = pinyin[:1], pinyin[1:]
-    return shengmu + yunmu_dict.get(yunmu, yunmu)
+    return shengmu + XHLOOP_YUNMU.get(yunmu, yunmu)
+
+
+ZRLONG_SHENGMU = {"zh": "v", "ch": "i", "sh": "u"}
+ZRLONG_YUNMU = {
+    "a5": "l",
+    "a1": "l",
+    "a2": "u",
+    "a3": "m",
+    "a4": "i",
+    "ai5": "b",
+    "ai1": "b",
+    "ai2": "d",
+    "ai3": "u",
+    "ai4": "o",
+    "an5": "n",
+    "an1": "n",
+    "an2": "k",
+    "an3": "o",
+    "an4": "j",
+    "ang5": "u",
+    "ang1": "u",
+    "ang2": "w",
+    "ang3": "p",
+    "ang4": "d",
+    "ao5": "q",
+    "ao1": "q",
+    "ao2": "i",
+    "ao3": "x",
+    "ao4": "v",
+    "e5": "r",
+    "e1": "r",
+    "e2": "e",
+    "e3": "l",
+    "e4": "i",
+    "ei5": "i",
+    "ei1": "i",
+    "ei2": "r",
+    "ei3": "j",
+    "ei4": "f",
+    "en5": "e",
+    "en1": "e",
+    "en2": "s",
+    "en3": "o",
+    "en4": "o",
+    "eng5": "c",
+    "eng1": "c",
+    "eng2": "f",
+    "eng3": "y",
+    "eng4": "f",
+    "er5": "q",
+    "er1": "q",
+    "er2": "k",
+    "er3": "u",
+    "er4": "h",
+    "i5": "j",
+    "i1": "j",
+    "i2": "b",
+    "i3": "g",
+    "i4": "t",
+    "ia5": "d",
+    "ia1": "d",
+    "ia2": "c",
+    "ia3": "n",
+    "ia4": "x",
+    "ian5": "r",
+    "ian1": "r",
+    "ian2": "v",
+    "ian3": "p",
+    "ian4": "a",
+    "iang5": "y",
+    "iang1": "y",
+    "iang2": "i",
+    "iang3": "u",
+    "iang4": "e",
+    "iao5": "m",
+    "iao1": "m",
+    "iao2": "u",
+    "iao3": "l",
+    "iao4": "l",
+    "ie5": "k",
+    "ie1": "k",
+    "ie2": "s",
+    "ie3": "c",
+    "ie4": "q",
+    "in5": "h",
+    "in1": "h",
+    "in2": "c",
+    "in3": "x",
+    "in4": "v",
+    "ing5": "e",
+    "ing1": "e",
+    "ing2": "n",
+    "ing3": "w",
+    "ing4": "w",
+    "iong5": "p",
+    "iong1": "p",
+    "iong2": "k",
+    "iong3": "e",
+    "iong4": "h",
+    "iu5": "z",
+    "iu1": "z",
+    "iu2": "m",
+    "iu3": "z",
+    "iu4": "o",
+    "o5": "p",
+    "o1": "p",
+    "o2": "e",
+    "o3": "i",
+    "o4": "g",
+    "ong5": "k",
+    "ong1": "k",
+    "ong2": "j",
+    "ong3": "n",
+    "ong4": "y",
+    "ou5": "x",
+    "ou1": "x",
+    "ou2": "a",
+    "ou3": "z",
+    "ou4": "r",
+    "u5": "a",
+    "u1": "a",
+    "u2": "l",
+    "u3": "m",
+    "u4": "h",
+    "ua5": "s",
+    "ua1": "s",
+    "ua2": "t",
+    "ua3": "g",
+    "ua4": "g",
+    "uai5": "g",
+    "uai1": "g",
+    "uai2": "s",
+    "uai3": "p",
+    "uai4": "f",
+    "uan5": "d",
+    "uan1": "d",
+    "uan2": "o",
+    "uan3": "s",
+    "uan4": "c",
+    "uang5": "w",
+    "uang1": "w",
+    "uang2": "b",
+    "uang3": "u",
+    "uang4": "e",
+    "ue5": "u",
+    "ue1": "u",
+    "ue2": "i",
+    "ue3": "o",
+    "ue4": "d",
+    "ui5": "t",
+    "ui1": "t",
+    "ui2": "w",
+    "ui3": "v",
+    "ui4": "f",
+    "un5": "g",
+    "un1": "g",
+    "un2": "f",
+    "un3": "o",
+    "un4": "r",
+    "uo5": "s",
+    "uo1": "s",
+    "uo2": "l",
+    "uo3": "l",
+    "uo4": "p",
+    "v5": "h",
+    "v1": "h",
+    "v2": "m",
+    "v3": "s",
+    "v4": "f",
+    "ve5": "u",
+    "ve1": "u",
+    "ve2": "i",
+    "ve3": "o",
+    "ve4": "d",
+}
+ZRLONG_ZERO = {
+    "a5": "al",
+    "a1": "al",
+    "a2": "au",
+    "a3": "am",
+    "a4": "ai",
+    "ai5": "ab",
+    "ai1": "ab",
+    "ai2": "ad",
+    "ai3": "au",
+    "ai4": "ao",
+    "an5": "an",
+    "an1": "an",
+    "an2": "ak",
+    "an3": "ao",
+    "an4": "aj",
+    "ang5": "au",
+    "ang1": "au",
+    "ang2": "aw",
+    "ang3": "ap",
+    "ang4": "ad",
+    "ao5": "aq",
+    "ao1": "aq",
+    "ao2": "ai",
+    "ao3": "ax",
+    "ao4": "av",
+    "e5": "er",
+    "e1": "er",
+    "e2": "ee",
+    "e3": "el",
+    "e4": "ei",
+    "ei5": "ei",
+    "ei1": "ei",
+    "ei2": "er",
+    "ei3": "ej",
+    "ei4": "ef",
+    "en5": "ee",
+    "en1": "ee",
+    "en2": "es",
+    "en3": "eo",
+    "en4": "eo",
+    "eng5": "ec",
+    "eng1": "ec",
+    "eng2": "ef",
+    "eng3": "ey",
+    "eng4": "ef",
+    "er5": "eq",
+    "er1": "eq",
+    "er2": "ek",
+    "er3": "eu",
+    "er4": "eh",
+    "o5": "op",
+    "o1": "op",
+    "o2": "oe",
+    "o3": "oi",
+    "o4": "og",
+    "ou5": "ox",
+    "ou1": "ox",
+    "ou2": "oa",
+    "ou3": "oz",
+    "ou4": "or",
+    "ju5": "jh",
+    "ju1": "jh",
+    "ju2": "jm",
+    "ju3": "js",
+    "ju4": "jf",
+    "qu5": "qh",
+    "qu1": "qh",
+    "qu2": "qm",
+    "qu3": "qs",
+    "qu4": "qf",
+    "xu5": "xh",
+    "xu1": "xh",
+    "xu2": "xm",
+    "xu3": "xs",
+    "xu4": "xf",
+    "yu5": "yh",
+    "yu1": "yh",
+    "yu2": "ym",
+    "yu3": "ys",
+    "yu4": "yf",
+}
 
 
 def snow2zrlong(pinyin: str):
-    shengmu_dict = {"zh": "v", "ch": "i", "sh": "u"}
-    yunmu_dict = {
-        "a5": "l",
-        "a1": "l",
-        "a2": "u",
-        "a3": "m",
-        "a4": "i",
-        "ai5": "b",
-        "ai1": "b",
-        "ai2": "d",
-        "ai3": "u",
-        "ai4": "o",
-        "an5": "n",
-        "an1": "n",
-        "an2": "k",
-        "an3": "o",
-        "an4": "j",
-        "ang5": "u",
-        "ang1": "u",
-        "ang2": "w",
-        "ang3": "p",
-        "ang4": "d",
-        "ao5": "q",
-        "ao1": "q",
-        "ao2": "i",
-        "ao3": "x",
-        "ao4": "v",
-        "e5": "r",
-        "e1": "r",
-        "e2": "e",
-        "e3": "l",
-        "e4": "i",
-        "ei5": "i",
-        "ei1": "i",
-        "ei2": "r",
-        "ei3": "j",
-        "ei4": "f",
-        "en5": "e",
-        "en1": "e",
-        "en2": "s",
-        "en3": "o",
-        "en4": "o",
-        "eng5": "c",
-        "eng1": "c",
-        "eng2": "f",
-        "eng3": "y",
-        "eng4": "f",
-        "er5": "q",
-        "er1": "q",
-        "er2": "k",
-        "er3": "u",
-        "er4": "h",
-        "i5": "j",
-        "i1": "j",
-        "i2": "b",
-        "i3": "g",
-        "i4": "t",
-        "ia5": "d",
-        "ia1": "d",
-        "ia2": "c",
-        "ia3": "n",
-        "ia4": "x",
-        "ian5": "r",
-        "ian1": "r",
-        "ian2": "v",
-        "ian3": "p",
-        "ian4": "a",
-        "iang5": "y",
-        "iang1": "y",
-        "iang2": "i",
-        "iang3": "u",
-        "iang4": "e",
-        "iao5": "m",
-        "iao1": "m",
-        "iao2": "u",
-        "iao3": "l",
-        "iao4": "l",
-        "ie5": "k",
-        "ie1": "k",
-        "ie2": "s",
-        "ie3": "c",
-        "ie4": "q",
-        "in5": "h",
-        "in1": "h",
-        "in2": "c",
-        "in3": "x",
-        "in4": "v",
-        "ing5": "e",
-        "ing1": "e",
-        "ing2": "n",
-        "ing3": "w",
-        "ing4": "w",
-        "iong5": "p",
-        "iong1": "p",
-        "iong2": "k",
-        "iong3": "e",
-        "iong4": "h",
-        "iu5": "z",
-        "iu1": "z",
-        "iu2": "m",
-        "iu3": "z",
-        "iu4": "o",
-        "o5": "p",
-        "o1": "p",
-        "o2": "e",
-        "o3": "i",
-        "o4": "g",
-        "ong5": "k",
-        "ong1": "k",
-        "ong2": "j",
-        "ong3": "n",
-        "ong4": "y",
-        "ou5": "x",
-        "ou1": "x",
-        "ou2": "a",
-        "ou3": "z",
-        "ou4": "r",
-        "u5": "a",
-        "u1": "a",
-        "u2": "l",
-        "u3": "m",
-        "u4": "h",
-        "ua5": "s",
-        "ua1": "s",
-        "ua2": "t",
-        "ua3": "g",
-        "ua4": "g",
-        "uai5": "g",
-        "uai1": "g",
-        "uai2": "s",
-        "uai3": "p",
-        "uai4": "f",
-        "uan5": "d",
-        "uan1": "d",
-        "uan2": "o",
-        "uan3": "s",
-        "uan4": "c",
-        "uang5": "w",
-        "uang1": "w",
-        "uang2": "b",
-        "uang3": "u",
-        "uang4": "e",
-        "ue5": "u",
-        "ue1": "u",
-        "ue2": "i",
-        "ue3": "o",
-        "ue4": "d",
-        "ui5": "t",
-        "ui1": "t",
-        "ui2": "w",
-        "ui3": "v",
-        "ui4": "f",
-        "un5": "g",
-        "un1": "g",
-        "un2": "f",
-        "un3": "o",
-        "un4": "r",
-        "uo5": "s",
-        "uo1": "s",
-        "uo2": "l",
-        "uo3": "l",
-        "uo4": "p",
-        "v5": "h",
-        "v1": "h",
-        "v2": "m",
-        "v3": "s",
-        "v4": "f",
-        "ve5": "u",
-        "ve1": "u",
-        "ve2": "i",
-        "ve3": "o",
-        "ve4": "d",
-    }
-    zero = {
-        "a5": "al",
-        "a1": "al",
-        "a2": "au",
-        "a3": "am",
-        "a4": "ai",
-        "ai5": "ab",
-        "ai1": "ab",
-        "ai2": "ad",
-        "ai3": "au",
-        "ai4": "ao",
-        "an5": "an",
-        "an1": "an",
-        "an2": "ak",
-        "an3": "ao",
-        "an4": "aj",
-        "ang5": "au",
-        "ang1": "au",
-        "ang2": "aw",
-        "ang3": "ap",
-        "ang4": "ad",
-        "ao5": "aq",
-        "ao1": "aq",
-        "ao2": "ai",
-        "ao3": "ax",
-        "ao4": "av",
-        "e5": "er",
-        "e1": "er",
-        "e2": "ee",
-        "e3": "el",
-        "e4": "ei",
-        "ei5": "ei",
-        "ei1": "ei",
-        "ei2": "er",
-        "ei3": "ej",
-        "ei4": "ef",
-        "en5": "ee",
-        "en1": "ee",
-        "en2": "es",
-        "en3": "eo",
-        "en4": "eo",
-        "eng5": "ec",
-        "eng1": "ec",
-        "eng2": "ef",
-        "eng3": "ey",
-        "eng4": "ef",
-        "er5": "eq",
-        "er1": "eq",
-        "er2": "ek",
-        "er3": "eu",
-        "er4": "eh",
-        "o5": "op",
-        "o1": "op",
-        "o2": "oe",
-        "o3": "oi",
-        "o4": "og",
-        "ou5": "ox",
-        "ou1": "ox",
-        "ou2": "oa",
-        "ou3": "oz",
-        "ou4": "or",
-        "ju5": "jh",
-        "ju1": "jh",
-        "ju2": "jm",
-        "ju3": "js",
-        "ju4": "jf",
-        "qu5": "qh",
-        "qu1": "qh",
-        "qu2": "qm",
-        "qu3": "qs",
-        "qu4": "qf",
-        "xu5": "xh",
-        "xu1": "xh",
-        "xu2": "xm",
-        "xu3": "xs",
-        "xu4": "xf",
-        "yu5": "yh",
-        "yu1": "yh",
-        "yu2": "ym",
-        "yu3": "ys",
-        "yu4": "yf",
-    }
-    if pinyin in zero:
-        return zero[pinyin]
+    if pinyin in ZRLONG_ZERO:
+        return ZRLONG_ZERO[pinyin]
     if pinyin[1] == "h" and len(pinyin) > 2:
         shengmu, yunmu = pinyin[:2], pinyin[2:]
-        shengmu = shengmu_dict[shengmu]
+        shengmu = ZRLONG_SHENGMU[shengmu]
     else:
         shengmu, yunmu = pinyin[:1], pinyin[1:]
-    return shengmu + yunmu_dict.get(yunmu, yunmu)
+    return shengmu + ZRLONG_YUNMU.get(yunmu, yunmu)
+
+
+FLYPY_SHENGMU = {"zh": "v", "ch": "i", "sh": "u"}
+FLYPY_YUNMU = {
+    "ou": "z",
+    "iao": "n",
+    "uang": "l",
+    "iang": "l",
+    "en": "f",
+    "eng": "g",
+    "ang": "h",
+    "an": "j",
+    "ao": "c",
+    "ai": "d",
+    "ian": "m",
+    "in": "b",
+    "uo": "o",
+    "un": "y",
+    "iu": "q",
+    "uan": "r",
+    "van": "r",
+    "iong": "s",
+    "ong": "s",
+    "ue": "t",
+    "ve": "t",
+    "ui": "v",
+    "ua": "x",
+    "ia": "x",
+    "ie": "p",
+    "uai": "k",
+    "ing": "k",
+    "ei": "w",
+}
+FLYPY_ZERO = {
+    "a": "aa",
+    "an": "an",
+    "ai": "ai",
+    "ang": "ah",
+    "ao": "ao",
+    "o": "oo",
+    "ou": "ou",
+    "e": "ee",
+    "ei": "ei",
+    "n": "en",
+    "en": "en",
+    "eng": "eg",
+    "er": "er",
+    "ju": "ju",
+    "qu": "qu",
+    "xu": "xu",
+    "yu": "yu",
+}
 
 
 def lunapy2flypy(pinyin: str):
     r""" 全拼拼音转为小鹤双拼码, 如果转自然码等请自行替换双拼映射
     adapted from: https://github.com/boomker/rime-flypy-xhfast/blob/15664c597644bd41410ec4595cece88a6452a1bf/scripts/flypy_dict_generator_new.py
     """
-    shengmu_dict = {"zh": "v", "ch": "i", "sh": "u"}
-    yunmu_dict = {
-        "ou": "z",
-        "iao": "n",
-        "uang": "l",
-        "iang": "l",
-        "en": "f",
-        "eng": "g",
-        "ang": "h",
-        "an": "j",
-        "ao": "c",
-        "ai": "d",
-        "ian": "m",
-        "in": "b",
-        "uo": "o",
-        "un": "y",
-        "iu": "q",
-        "uan": "r",
-        "van": "r",
-        "iong": "s",
-        "ong": "s",
-        "ue": "t",
-        "ve": "t",
-        "ui": "v",
-        "ua": "x",
-        "ia": "x",
-        "ie": "p",
-        "uai": "k",
-        "ing": "k",
-        "ei": "w",
-    }
-    zero = {
-        "a": "aa",
-        "an": "an",
-        "ai": "ai",
-        "ang": "ah",
-        "ao": "ao",
-        "o": "oo",
-        "ou": "ou",
-        "e": "ee",
-        "ei": "ei",
-        "n": "en",
-        "en": "en",
-        "eng": "eg",
-        "er": "er",
-        "ju": "ju",
-        "qu": "qu",
-        "xu": "xu",
-        "yu": "yu",
-    }
-    if pinyin in zero:
-        return zero[pinyin]
+    if pinyin in FLYPY_ZERO:
+        return FLYPY_ZERO[pinyin]
     if pinyin[1] == "h" and len(pinyin) > 2:
         shengmu, yunmu = pinyin[:2], pinyin[2:]
-        shengmu = shengmu_dict[shengmu]
+        shengmu = FLYPY_SHENGMU[shengmu]
     else:
         shengmu, yunmu = pinyin[:1], pinyin[1:]
-    return shengmu + yunmu_dict.get(yunmu, yunmu)
+    return shengmu + FLYPY_YUNMU.get(yunmu, yunmu)
+
+
+ZRM_SHENGMU = {"zh": "v", "ch": "i", "sh": "u"}
+ZRM_YUNMU = {
+    "ou": "b",
+    "iao": "c",
+    "uang": "d",
+    "iang": "d",
+    "en": "f",
+    "eng": "g",
+    "ang": "h",
+    "an": "j",
+    "ao": "k",
+    "ai": "l",
+    "ian": "m",
+    "in": "n",
+    "uo": "o",
+    "un": "p",
+    "iu": "q",
+    "uan": "r",
+    "van": "r",
+    "iong": "s",
+    "ong": "s",
+    "ue": "t",
+    "ve": "t",
+    "ui": "v",
+    "ua": "w",
+    "ia": "w",
+    "ie": "x",
+    "uai": "y",
+    "ing": "y",
+    "ei": "z",
+}
+ZRM_ZERO = {
+    "a": "aa",
+    "an": "an",
+    "ai": "ai",
+    "ang": "ah",
+    "ao": "ao",
+    "o": "oo",
+    "ou": "ou",
+    "e": "ee",
+    "ei": "ei",
+    "n": "en",
+    "en": "en",
+    "eng": "eg",
+    "er": "er",
+    "ju": "ju",
+    "qu": "qu",
+    "xu": "xu",
+    "yu": "yu",
+}
 
 
 def lunapy2zrm(pinyin: str):
     r""" 全拼拼音转为自然双拼码
     adapted from: https://github.com/boomker/rime-flypy-xhfast/blob/15664c597644bd41410ec4595cece88a6452a1bf/scripts/flypy_dict_generator_new.py
     """
-    shengmu_dict = {"zh": "v", "ch": "i", "sh": "u"}
-    yunmu_dict = {
-        "ou": "b",
-        "iao": "c",
-        "uang": "d",
-        "iang": "d",
-        "en": "f",
-        "eng": "g",
-        "ang": "h",
-        "an": "j",
-        "ao": "k",
-        "ai": "l",
-        "ian": "m",
-        "in": "n",
-        "uo": "o",
-        "un": "p",
-        "iu": "q",
-        "uan": "r",
-        "van": "r",
-        "iong": "s",
-        "ong": "s",
-        "ue": "t",
-        "ve": "t",
-        "ui": "v",
-        "ua": "w",
-        "ia": "w",
-        "ie": "x",
-        "uai": "y",
-        "ing": "y",
-        "ei": "z",
-    }
-    zero = {
-        "a": "aa",
-        "an": "an",
-        "ai": "ai",
-        "ang": "ah",
-        "ao": "ao",
-        "o": "oo",
-        "ou": "ou",
-        "e": "ee",
-        "ei": "ei",
-        "n": "en",
-        "en": "en",
-        "eng": "eg",
-        "er": "er",
-        "ju": "ju",
-        "qu": "qu",
-        "xu": "xu",
-        "yu": "yu",
-    }
-    if pinyin in zero:
-        return zero[pinyin]
+    if pinyin in ZRM_ZERO:
+        return ZRM_ZERO[pinyin]
     if pinyin[1] == "h" and len(pinyin) > 2:
         shengmu, yunmu = pinyin[:2], pinyin[2:]
-        shengmu = shengmu_dict[shengmu]
+        shengmu = ZRM_SHENGMU[shengmu]
     else:
         shengmu, yunmu = pinyin[:1], pinyin[1:]
-    return shengmu + yunmu_dict.get(yunmu, yunmu)
+    return shengmu + ZRM_YUNMU.get(yunmu, yunmu)
+
+INITIALS = ["b", "p", "m", "f", "d", "t", "n", "l", "g", "k", "h", "j", "q", "x",
+            "zh", "ch", "sh", "r", "z", "c", "s", "y", "w"]
+SIMPLE_FINALS = ["a", "o", "e", "i", "u", "v"]
+
+# codec name -> (converter, yunmu table, zero-initial table)
+PINYIN_CODECS = {
+    "tonenum2tonesymbol": (tonenum2tonesymbol, TONESYMBOL_YUNMU, TONESYMBOL_ZERO),
+    "zrloopkai": (snow2zrloopkai, ZRLOOP_YUNMU, ZRLOOP_ZERO),
+    "xhloopkai": (snow2xhloopkai, XHLOOP_YUNMU, XHLOOP_ZERO),
+    "zrlong": (snow2zrlong, ZRLONG_YUNMU, ZRLONG_ZERO),
+    "flypy": (lunapy2flypy, FLYPY_YUNMU, FLYPY_ZERO),
+    "zrm": (lunapy2zrm, ZRM_YUNMU, ZRM_ZERO),
+}
+
+# schema name passed with -p -> codec name
+PINYIN_SCHEMAS = {
+    "flypy": "flypy", "xhupmoqi": "flypy", "xhupkai": "flypy", "xhupzrmfast": "flypy",
+    "zrm": "zrm", "morankai": "zrm",
+    "zrlong": "zrlong", "molongkai": "zrlong", "molongmoqi": "zrlong",
+    "xhloopkai": "xhloopkai", "xhloopmoqi": "xhloopkai", "xhloopfly": "xhloopkai", "xhloopzzd": "xhloopkai",
+    "zrloopkai": "zrloopkai", "zrloopmoqi": "zrloopkai",
+    "tonenum2tonesymbol": "tonenum2tonesymbol",
+}
+
+_codec_tables = {}
+
+
+class SyllableTable(dict):
+    """Syllable -> code table of one codec.
+
+    Every initial x final (with tones) is converted once up front; syllables
+    outside the table are converted on first use and remembered.
+    """
+
+    def __init__(self, convert, yunmu_dict, zero):
+        super().__init__()
+        self.convert = convert
+        for syllable in zero:
+            self[syllable] = convert(syllable)
+        for shengmu in INITIALS:
+            for yunmu in list(yunmu_dict) + SIMPLE_FINALS:
+                syllable = shengmu + yunmu
+                self[syllable] = convert(syllable)
+
+    def __missing__(self, syllable):
+        code = self[syllable] = self.convert(syllable)
+        return code
+
+
+def get_codec(name: str):
+    table = _codec_tables.get(name)
+    if table is None:
+        table = _codec_tables[name] = SyllableTable(*PINYIN_CODECS[name])
+    return table
+
+
+def do_nothing(pinyin: str):
+    return pinyin
+
 
 def get_pinyin_fn(schema: str):
     schema = schema.lower()
     if schema in ["quanpin", "static"]:
-        def do_nothing(pinyin: str):
-            return pinyin
         return do_nothing
-    if schema in ["flypy", "xhupmoqi", "xhupkai", "xhupzrmfast"]:
-        return lunapy2flypy
-    if schema in ["zrm", "morankai"]:
-        return lunapy2zrm
-    if schema in ["zrlong", "molongkai", "molongmoqi"]:
-        return snow2zrlong
-    if schema in ["xhloopkai", "xhloopmoqi", "xhloopfly", "xhloopzzd"]:
-        return snow2xhloopkai
-    if schema in ["zrloopkai", "zrloopmoqi"]:
-        return snow2zrloopkai
-    if schema in ["tonenum2tonesymbol"]:
-        return tonenum2tonesymbol
-
-def get_shape_dict(schema: str, multishape: bool):
-    if multishape:
-        # Create a defaultdict with list as the default factory
-        shape_dict = defaultdict(list)
-        keypairs_seen = set()  # Set to keep track of keys seen so far
-        rows = []
-        with open(f"{schema}.txt", newline="", encoding='UTF-8') as f:
-            rows = csv.reader(f, delimiter="\t", quotechar="`")
-            for row in rows:
-                if len(row) >= 2:
-                    key, value = row[0], row[1]
-                    keypair = key+value
-                    if keypair not in keypairs_seen:
-                        shape_dict[key].append(value) # Add values to the dictionary
-                        keypairs_seen.add(keypair)  # Add the keypair to the set
-    else:
-        shape_dict = defaultdict(list)
-        keys_seen = set()  # Set to keep track of keys seen so far
-        rows = []
-        with open(f"{schema}.txt", newline="", encoding='UTF-8') as f:
-            rows = csv.reader(f, delimiter="\t", quotechar="`")
-            for row in rows:
-                if len(row) >= 2:
-                    key, value = row[0], row[1]
-                    # Only add the key-value pair if the key hasn't been seen before
-                    if key not in keys_seen:
-                        shape_dict[key].append(value) # Add values to the dictionary
-                        keys_seen.add(key)  # Add the key to the set
-    return shape_dict
-
-
-def rewrite_row(row, traditional, simplified, delim, pinyin_fn, shape_dict, multishape):
-    new_rows = []
+    if schema in PINYIN_SCHEMAS:
+        return get_codec(PINYIN_SCHEMAS[schema]).__getitem__
+
+
+def get_shape_dict(schema: str, multishape: bool, use_cache=True):
+    return load_shape_dict(f"{schema}.txt", multishape, use_cache)
+
+
+PUNCTUATION = re.compile("[-;·，。；：“”‘’《》（）！？、…—–]")
+
+
+def get_converter(traditional, simplified):
+    if traditional and not simplified:
+        return opencc_s2t
+    if simplified and not traditional:
+        return opencc_t2s
+    return None
+
+
+def prefetch_conversions(rows, traditional, simplified):
+    # Convert the words of a whole chunk in one batch before rewrite_row asks for them one by one
+    converter = get_converter(traditional, simplified)
+    if converter is None:
+        return
+    converter.prefetch([PUNCTUATION.sub("", row[0]) for row in rows
+                        if len(row) >= 2 and row[0][:1] != "#" and not row[1][:1].isnumeric()])
+
+
+# Counters for the multishape expansion, summed over workers as well
+variant_stats = Counter()
+
+
+def iter_ranked_indices(lengths):
+    # Best-first walk over index tuples: a smaller sum of per-character shape
+    # positions means the combination uses the more common shapes
+    start = (0,) * len(lengths)
+    heap = [(0, start)]
+    seen = {start}
+    while heap:
+        rank, indices = heapq.heappop(heap)
+        yield indices
+        for i, length in enumerate(lengths):
+            if indices[i] + 1 < length:
+                nxt = indices[:i] + (indices[i] + 1,) + indices[i + 1:]
+                if nxt not in seen:
+                    seen.add(nxt)
+                    heapq.heappush(heap, (rank + 1, nxt))
+
+
+def iter_shape_combinations(shape_lists, max_variants):
+    lengths = [len(shapes) for shapes in shape_lists]
+    total = math.prod(lengths)
+    if not max_variants or total <= max_variants:
+        return product(*shape_lists)
+    variant_stats["pruned_words"] += 1
+    variant_stats["pruned_variants"] += total - max_variants
+    # Keep the best ranked combinations but emit them in the usual product order
+    kept = sorted(islice(iter_ranked_indices(lengths), max_variants))
+    return ([shape_lists[i][j] for i, j in enumerate(indices)] for indices in kept)
+
+
+def compact_row(row):
+    # Rows are held as tuples; the weight columns repeat a lot, so they are interned
+    return (*row[:2], *map(sys.intern, row[2:]))
+
+
+def prepare_row(row, traditional, simplified):
+    r"""Split a row into the word to write and its pinyin list.
+
+    Rows that are written as they are come back as (None, row_to_write).
+    """
     if len(row) < 2 or row[0][0] == "#":
-        new_rows.append(row)
-        return new_rows
+        return None, row
     if len(row) > 1 and row[1][0].isnumeric():  # ['三觭龍', '1']
-        new_rows.append(row)
-        return new_rows
+        return None, row
     # row == ['三觭龍', 'san ji long'] or ['三觭龍', 'san ji long', '1']
     zh_chars = row[0]
     # eg. '安娜·卡列尼娜' -> '安娜卡列尼娜'
-    zh_chars = re.sub("[-;·，。；：“”‘’《》（）！？、…—–]", "", zh_chars)
-    if traditional and not simplified:
-        zh_chars = opencc_s2t.convert(zh_chars)
-    if simplified and not traditional:
-        zh_chars = opencc_t2s.convert(zh_chars)  # '三觭龍' -> '三觭龙'
+    zh_chars = PUNCTUATION.sub("", zh_chars)
+    converter = get_converter(traditional, simplified)
+    if converter is not None:
+        zh_chars = converter.convert(zh_chars)  # '三觭龍' -> '三觭龙'
     pinyin_list = row[1].split()  # ['san', 'ji', 'long']
     if len(zh_chars) != len(pinyin_list):  # failure case
-        print(row)
-        row[0] = "#" + row[0]
-        new_rows.append(row)
-        return new_rows
+        print(list(row))  # as a list, however the row is held
+        return None, ("#" + row[0], *row[1:])
     new_zh_chars = []
     for i, char in enumerate(zh_chars):
         if char == "干" and "qian" in pinyin_list[i]:
             new_zh_chars.append("乾")
         else:
             new_zh_chars.append(char)
-    new_zh_chars = "".join(new_zh_chars)
+    return "".join(new_zh_chars), pinyin_list
+
+
+def rewrite_row(row, traditional, simplified, delim, pinyin_fn, shape_dict, multishape, max_variants=0):
+    new_rows = []
+    new_zh_chars, pinyin_list = prepare_row(row, traditional, simplified)
+    if new_zh_chars is None:
+        new_rows.append(pinyin_list)  # the row to write as it is
+        return new_rows
     code_list = []
     if multishape:
-        new_pinyin_list = []
-        new_shape_list = []
-        results = []
-        for pinyin in pinyin_list:
-            new_pinyin_list.append(pinyin_fn(pinyin))
-        for hanzi in new_zh_chars:
-            new_shape_list.append(shape_dict.get(hanzi, delim))
-
-        cartesian_product = product(*new_shape_list)
-        combinations = [list(item) for item in cartesian_product]
-        # Create the final list by combining elements from new_pinyin_list with each combination
-        results = [['{};{}'.format(new_pinyin_list[i], comb[i]) for i in range(len(new_pinyin_list))] for comb in combinations]
-        for result in results:
-            # Create a new row list for each iteration
-            new_row = row.copy()
-            new_row[0] = new_zh_chars
-            new_row[1] = " ".join(result)
-            new_rows.append(new_row)
+        new_pinyin_list = [pinyin_fn(pinyin) for pinyin in pinyin_list]
+        new_shape_list = [shape_dict.get(hanzi, delim) for hanzi in new_zh_chars]
+        codes_seen = set()
+        # Combinations are produced lazily and deduped as they stream out
+        for comb in iter_shape_combinations(new_shape_list, max_variants):
+            code = " ".join(['{};{}'.format(pinyin, shape) for pinyin, shape in zip(new_pinyin_list, comb)])
+            if code in codes_seen:
+                continue
+            codes_seen.add(code)
+            # One new row for each combination, sharing the remaining columns
+            new_rows.append((new_zh_chars, code, *row[2:]))
     else:
         for (pinyin, hanzi) in zip(pinyin_list, new_zh_chars):
             new_code = pinyin_fn(pinyin) + delim + shape_dict.get(hanzi, delim)[0]
             code_list.append(new_code)
 
-        new_row = row.copy()
-        new_row[0] = new_zh_chars
-        new_row[1] = " ".join(code_list)
-        new_rows.append(new_row)
-        # new_pinyin_list = []
-        # new_shape_list = []
-        # for pinyin in pinyin_list:
-            # new_pinyin_list.append(pinyin_fn(pinyin))
-        # for hanzi in new_zh_chars:
-            # new_shape_list.append([shape_dict.get(hanzi, delim)[0]])
-        # # Generate all combinations of elements in shape_dict using itertools.product
-        # combinations = product(*new_shape_list)
-        # # Create the final list by combining elements from new_pinyin_list with each combination
-        # results = [['{};{}'.format(new_pinyin_list[i], comb[i]) for i in range(len(new_pinyin_list))] for comb in combinations]
-        # for result in results:
-            # row[0] = new_zh_chars
-            # row[1] = " ".join(result)
-            # new_rows.append(row)
+        new_rows.append((new_zh_chars, " ".join(code_list), *row[2:]))
     return new_rows
 
 
@@ -1335,8 +1418,8 @@ def get_cli_args():
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--input_file", "-i", type=str,
                         default="luna_pinyin.dict.yaml",
-                        help="Input file")
-    parser.add_argument("--output_file", "-o", type=str, default="output.txt", help="Output file")
+                        help="Input file, - for stdin")
+    parser.add_argument("--output_file", "-o", type=str, default="output.txt", help="Output file, - for stdout")
     parser.add_argument("--pinyin", "-p", type=str, help="Pinyin scheme")
     parser.add_argument("--shape", "-x", type=str, help="shape schema")
     parser.add_argument("--delimiter", "-d", type=str, default=";",
@@ -1344,78 +1427,334 @@ def get_cli_args():
     parser.add_argument('--traditional', "-t", action='store_true', help='Generate traditional characters')
     parser.add_argument('--simplified', "-s", action='store_true', help='Generate simplified characters')
     parser.add_argument('--multishape', "-m", action='store_true', help='Generate multiple shape codes for a single character')
+    parser.add_argument('--max-variants', type=int, default=0,
+                        help='With --multishape, keep at most this many shape combinations per word (0 = all)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Read, convert, dedupe and write row by row instead of loading the whole input')
+    parser.add_argument('--jobs', "-j", type=int, default=1,
+                        help='Number of worker processes for the conversion (0 = all cores)')
+    parser.add_argument('--opencc-cache', type=str, default=DEFAULT_CACHE_FILE,
+                        help='On-disk cache of OpenCC conversions shared between runs')
+    parser.add_argument('--no-opencc-cache', action='store_true', help='Do not use the on-disk OpenCC cache')
+    parser.add_argument('--no-shape-cache', action='store_true',
+                        help='Parse the shape db text instead of its compiled .shapecache')
+    parser.add_argument('--dedupe-memory', type=dedupe.memory_budget, default=dedupe.DEFAULT_MEMORY,
+                        help='Memory budget in MB for removing duplicate rows before it spills to temp files')
+    parser.add_argument('--numpy', action='store_true',
+                        help='Encode the input as NumPy ID arrays and convert it with array gathers '
+                             '(needs NumPy, not with --multishape or --stream)')
+    parser.add_argument('--target', action='append', default=[], metavar='PINYIN:SHAPE:VARIANT:OUTPUT',
+                        help='Fan-out mode: read the input once and convert it for every target; '
+                             'VARIANT is t, s or - (may be repeated, replaces -p/-x/-t/-s/-o)')
+    parser.add_argument('--targets-file', type=str,
+                        help='File with one "PINYIN SHAPE VARIANT OUTPUT" target per line for fan-out mode')
     args = parser.parse_args()
+    if args.targets_file:
+        with open(args.targets_file, encoding='UTF-8') as f:
+            args.target += [":".join(line.strip().split(maxsplit=3)) for line in f
+                            if line.strip() and not line.lstrip().startswith("#")]
+    try:
+        args.target = [Target(spec) for spec in args.target]
+    except ValueError as e:
+        parser.error(str(e))
+    if args.target and args.jobs != 1:
+        parser.error("--target runs in a single process, drop --jobs")
+    if args.numpy:
+        if dict_array.np is None:
+            parser.error("--numpy needs NumPy installed")
+        if args.multishape or args.stream:
+            parser.error("--numpy converts the whole input with one shape per character, "
+                         "drop --multishape and --stream")
+        if args.jobs != 1:
+            parser.error("--numpy runs in a single process, drop --jobs")
+    if args.stream and args.output_file != "-" and dict_path(args.input_file) == dict_path(args.output_file):
+        parser.error("--stream cannot write to its own input file")
+    if args.output_file == "-" and ToneCombiner.wanted(args.pinyin, args.shape):
+        parser.error("the _combined.txt output is named after the output file, drop -o -")
     return args
 
 
-def remove_dupe(input_lists):
-    seen = set()
-    output_lists = []
-    for sublist in input_lists:
-        sublist_tuple = tuple(sublist[0:2])
-        if sublist_tuple not in seen:
-            output_lists.append(sublist)
-            seen.add(sublist_tuple)
-    return output_lists
+def dict_path(path):
+    # "-" stays as it is, rime_dict.open_dict takes it for stdin or stdout
+    return path if path == "-" else os.path.realpath(path)
+
+
+CHUNK_SIZE = 2000
+_worker_args = None
+
+
+def iter_chunks(rows):
+    rows = iter(rows)
+    return iter(lambda: list(islice(rows, CHUNK_SIZE)), [])
+
+
+def iter_rewrite(rows, traditional, simplified, delim, pinyin_fn, shape_dict, multishape, max_variants=0):
+    for chunk in iter_chunks(rows):
+        prefetch_conversions(chunk, traditional, simplified)
+        for row in chunk:
+            yield from rewrite_row(row, traditional, simplified, delim, pinyin_fn, shape_dict, multishape, max_variants)
+
+
+def iter_prepared(rows, traditional, simplified):
+    for chunk in iter_chunks(rows):
+        prefetch_conversions(chunk, traditional, simplified)
+        for row in chunk:
+            yield row, prepare_row(row, traditional, simplified)
+
+
+def _init_worker(*args):
+    global _worker_args
+    _worker_args = args
+
+
+def _rewrite_chunk(chunk):
+    traditional, simplified = _worker_args[:2]
+    converter = get_converter(traditional, simplified)
+    converter_stats = Counter(converter.stats) if converter is not None else Counter()
+    variant_stats.clear()
+    prefetch_conversions(chunk, traditional, simplified)
+    out_rows = []
+    for row in chunk:
+        out_rows.extend(rewrite_row(row, *_worker_args))
+    if converter is not None:
+        converter_stats = converter.stats - converter_stats
+    return out_rows, converter_stats, variant_stats
+
+
+def iter_rewrite_parallel(rows, jobs, traditional, simplified, delim, pinyin_fn, shape_dict, multishape, max_variants=0):
+    # Workers are forked after the shape dict and codec tables are built, so they share
+    # them copy-on-write. Chunks are converted a window at a time and yielded in input
+    # order, which keeps the first-occurrence dedupe identical to a single-process run.
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+    converter = get_converter(traditional, simplified)
+    initargs = (traditional, simplified, delim, pinyin_fn, shape_dict, multishape, max_variants)
+    with context.Pool(jobs, initializer=_init_worker, initargs=initargs) as pool:
+        chunks = iter_chunks(rows)
+        while True:
+            window = list(islice(chunks, jobs * 4))
+            if not window:
+                break
+            for out_rows, converter_stats, chunk_variant_stats in pool.map(_rewrite_chunk, window):
+                if converter is not None:
+                    converter.stats.update(converter_stats)
+                variant_stats.update(chunk_variant_stats)
+                yield from out_rows
+
+
+def dupe_key(sublist):
+    # For two-column tuple rows the key is the row itself
+    return tuple(sublist[0:2])
+
+
+def iter_remove_dupe(input_lists, max_items=None):
+    # Only the (word, code) keys are kept; past max_items of them dedupe spills to disk
+    return dedupe.iter_unique(input_lists, key=dupe_key, max_items=max_items)
+
+
+def remove_dupe(input_lists, max_items=None):
+    return list(iter_remove_dupe(input_lists, max_items))
+
+
+# (traditional, simplified) -> variant; neither or both keep the characters as they are
+VARIANTS = {(True, False): "t", (False, True): "s"}
+
+
+def set_opencc_cache(path=DEFAULT_CACHE_FILE):
+    r"""Share OpenCC conversions with other runs through the on-disk cache at path (None: memory only)."""
+    disk_cache = DiskCache(path) if path else None
+    opencc_t2s.disk_cache = disk_cache
+    opencc_s2t.disk_cache = disk_cache
+
+
+def convert_dict(rows, pinyin, shape, variant=None, delimiter=";", multishape=False, max_variants=0,
+                 jobs=1, numpy=False, dedupe_memory=dedupe.DEFAULT_MEMORY, use_shape_cache=True):
+    r"""Convert quanpin rows to pinyin+shape rows, with repeated (word, code) pairs removed.
+
+    rows is any iterable of rows, lists or tuples of str as rime_dict.reader
+    gives them; pinyin and shape are the -p and -x names of the command line
+    and variant is "t" (traditional), "s" (simplified) or None. The result
+    is an iterator that converts as it goes, except that numpy=True encodes
+    the whole input before returning.
+    """
+    pinyin_fn = get_pinyin_fn(pinyin)
+    if pinyin_fn is None:
+        raise ValueError(f"unknown pinyin scheme {pinyin!r}")
+    shape_dict = get_shape_dict(shape, multishape, use_shape_cache)
+    traditional, simplified = variant == "t", variant == "s"
+    if numpy:
+        encoded = dict_array.encode(iter_prepared(rows, traditional, simplified))
+        out_rows = encoded.convert(pinyin_fn, shape_dict, delimiter)
+    elif jobs > 1:
+        out_rows = iter_rewrite_parallel(rows, jobs, traditional, simplified, delimiter, pinyin_fn, shape_dict, multishape, max_variants)
+    else:
+        out_rows = iter_rewrite(rows, traditional, simplified, delimiter, pinyin_fn, shape_dict, multishape, max_variants)
+    return iter_remove_dupe(out_rows, dedupe.max_entries(dedupe_memory))
+
+
+class Target:
+    r"""One output of fan-out mode, parsed from PINYIN:SHAPE:VARIANT:OUTPUT."""
+
+    def __init__(self, spec):
+        fields = spec.split(":", 3)
+        if len(fields) != 4 or fields[2] not in ["t", "s", "-"]:
+            raise ValueError(f"bad target {spec!r}, expected PINYIN:SHAPE:t|s|-:OUTPUT")
+        pinyin = fields[0].lower()
+        if pinyin not in PINYIN_SCHEMAS and pinyin not in ["quanpin", "static"]:
+            raise ValueError(f"bad target {spec!r}, unknown pinyin scheme {fields[0]!r}")
+        self.pinyin, self.shape, variant, output_file = fields
+        self.traditional = variant == "t"
+        self.simplified = variant == "s"
+        self.output_file = os.path.realpath(output_file)
+
+
+def fan_out(rows, targets, delim, multishape, max_variants, dedupe_memory=dedupe.DEFAULT_MEMORY, use_shape_cache=True):
+    # The input is read and split into rows once and held; every target is then
+    # converted from them in turn, deduped within dedupe_memory, into its own file.
+    if len(targets) > 1:
+        rows = list(map(compact_row, rows))
+    for target in targets:
+        out_rows = convert_dict(rows, target.pinyin, target.shape, VARIANTS.get((target.traditional, target.simplified)),
+                                delim, multishape, max_variants, dedupe_memory=dedupe_memory,
+                                use_shape_cache=use_shape_cache)
+        write_target(target, out_rows)
+
+
+def write_target(target, out_rows):
+    combiner = ToneCombiner(target.output_file) if ToneCombiner.wanted(target.pinyin, target.shape) else None
+    if combiner is not None:
+        out_rows = combiner.tap(out_rows)
+    with rime_dict.atomic_write(target.output_file) as f:
+        rime_dict.writer(f).writerows(out_rows)
+    if combiner is not None:
+        combiner.write()
+
+
+def fan_out_encoded(rows, targets, delim, dedupe_memory=dedupe.DEFAULT_MEMORY, use_shape_cache=True):
+    # Every variant (t, s, -) is encoded once and each of its targets is converted
+    # from the arrays, so comparing schemes costs no second parse
+    if len({(target.traditional, target.simplified) for target in targets}) > 1:
+        rows = list(map(compact_row, rows))
+    encoded = {}
+    shape_dicts = {}
+    for target in targets:
+        variant = (target.traditional, target.simplified)
+        if variant not in encoded:
+            encoded[variant] = dict_array.encode(iter_prepared(rows, *variant))
+        if target.shape not in shape_dicts:
+            shape_dicts[target.shape] = get_shape_dict(target.shape, False, use_shape_cache)
+        out_rows = encoded[variant].convert(get_pinyin_fn(target.pinyin), shape_dicts[target.shape], delim)
+        write_target(target, iter_remove_dupe(out_rows, dedupe.max_entries(dedupe_memory)))
+
+
+class ToneCombiner:
+    r"""Readings of every word, grouped for the tonenum2tonesymbol + emptydb `_combined.txt` output.
+
+    Rows are added as they are written, so the grouping needs neither the
+    converted file nor a second parse of it.
+    """
+
+    def __init__(self, output_file):
+        self.output_file = output_file[:output_file.rfind('.')]+"_combined.txt"
+        self.readings = {}
+
+    @staticmethod
+    def wanted(pinyin, shape):
+        return pinyin == "tonenum2tonesymbol" and shape == "emptydb"
+
+    def add(self, row):
+        if len(row) < 2:
+            return
+        # emptydb has no shapes, so every syllable ends in two delimiters
+        value = row[1].replace(';;', '')
+        if value != 'pp':
+            # Kept as the joined text, most words have a single reading
+            readings = self.readings.get(row[0])
+            self.readings[row[0]] = value if readings is None else readings + '〕〔' + value
+
+    def tap(self, rows):
+        for row in rows:
+            self.add(row)
+            yield row
+
+    def write(self):
+        with rime_dict.atomic_write(self.output_file) as file:
+            file.writelines(f"{key}\t〔{readings}〕\n" for key, readings in self.readings.items())
 
 
 def main():
     args = get_cli_args()
-    pinyin_fn = get_pinyin_fn(args.pinyin)
     multishape = args.multishape
-    shape_dict = get_shape_dict(args.shape, multishape)
+    max_variants = args.max_variants
     delim = args.delimiter
-    traditional = args.traditional
-    simplified = args.simplified
-    rows = []
-    with open(os.path.realpath(args.input_file), newline="", encoding='UTF-8') as f:
-        rows = list(csv.reader(f, delimiter="\t", quotechar="`"))
+    if not args.no_opencc_cache:
+        set_opencc_cache(args.opencc_cache)
 
-    out_rows = []
-    for row in rows:
-        new_rows = rewrite_row(row, traditional, simplified, delim, pinyin_fn, shape_dict, multishape)
-        for new_row in new_rows:
-            out_rows.append(new_row)
+    if args.target:
+        rows = rime_dict.iter_rows(dict_path(args.input_file))
+        if args.numpy:
+            fan_out_encoded(rows, args.target, delim, args.dedupe_memory, not args.no_shape_cache)
+        else:
+            fan_out(rows, args.target, delim, multishape, max_variants, args.dedupe_memory,
+                    not args.no_shape_cache)
+        for converter in [opencc_s2t, opencc_t2s]:
+            if converter.stats:
+                print(converter.summary())
+        return
 
-    out_rows = remove_dupe(out_rows)
-    output_file = os.path.realpath(args.output_file)
+    traditional = args.traditional
+    simplified = args.simplified
+    variant = VARIANTS.get((traditional, simplified))
+    options = dict(delimiter=delim, multishape=multishape, max_variants=max_variants, jobs=args.jobs or os.cpu_count(),
+                   numpy=args.numpy, dedupe_memory=args.dedupe_memory, use_shape_cache=not args.no_shape_cache)
+    output_file = args.output_file
     if output_file == "":
         _, input_postfix = args.input_file.split(".", maxsplit=1)
         output_file = f"{args.pinyin}_{args.shape}.{input_postfix}"
-    with open(output_file, "w", newline="", encoding='UTF-8') as f:
-        my_tsv = csv.writer(f, delimiter="\t", quotechar="`", lineterminator="\n")
-        my_tsv.writerows(out_rows)
-
-    if args.pinyin == "tonenum2tonesymbol" and args.shape == "emptydb":
-        # Read the input text file
-        input_file = output_file
-        output_file = input_file[:input_file.rfind('.')]+"_combined.txt"
-
-        # Dictionary to store values from column 1 as keys and corresponding values from column 2 as a list
-        data = {}
-
-        # Read input file and populate the dictionary
-        with open(input_file, 'r') as file:
-            for line in file:
-                # Split the line into columns based on tab separation
-                columns = line.strip().split('\t')
-                key = columns[0]
-                value = columns[1].replace(';;', '')
-
-                # Append the value to the list corresponding to the key
-                if value != 'pp':
-                    if key in data:
-                        data[key].append(value)
-                    else:
-                        data[key] = [value]
-
-        # Write to the output file
-        with open(output_file, 'w') as file:
-            for key, values in data.items():
-                # Join the values with commas
-                values_str = '〕〔'.join(values)
-                # Write key-value pairs separated by tab
-                file.write(f"{key}\t〔{values_str}〕\n")
+    output_file = dict_path(output_file)
+    if output_file == "-":
+        # The rows go to fd 1 on their own, everything printed goes to stderr so it cannot mix in
+        sys.stdout = sys.stderr
+    combiner = ToneCombiner(output_file) if ToneCombiner.wanted(args.pinyin, args.shape) else None
+
+    if args.stream:
+        with rime_dict.atomic_write(output_file) as f_out:
+            out_rows = convert_dict(rime_dict.iter_rows(dict_path(args.input_file)), args.pinyin, args.shape, variant,
+                                    **options)
+            if combiner is not None:
+                out_rows = combiner.tap(out_rows)
+            my_tsv = rime_dict.writer(f_out)
+            my_tsv.writerows(out_rows)
+    else:
+        if args.numpy:
+            # Encoded straight from the reader, the rows themselves are never held
+            rows = rime_dict.iter_rows(dict_path(args.input_file))
+        else:
+            rows = list(map(compact_row, rime_dict.iter_rows(dict_path(args.input_file))))
+        out_rows = convert_dict(rows, args.pinyin, args.shape, variant, **options)
+        # The input is fully read by now, so the output may be the input file itself
+        if combiner is not None:
+            out_rows = combiner.tap(out_rows)
+        with rime_dict.atomic_write(output_file) as f:
+            my_tsv = rime_dict.writer(f)
+            my_tsv.writerows(out_rows)
+
+    converter = get_converter(traditional, simplified)
+    if converter is not None:
+        print(converter.summary())
+    if variant_stats["pruned_words"]:
+        print(f"--max-variants {max_variants}: pruned {variant_stats['pruned_variants']} shape combinations "
+              f"from {variant_stats['pruned_words']} words")
+
+    if dedupe.stats["runs"]:
+        print(f"--dedupe-memory {args.dedupe_memory}: {dedupe.stats['spilled']} rows deduped on disk "
+              f"in {dedupe.stats['runs']} sorted runs")
+
+    if combiner is not None:
+        combiner.write()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,374 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Copy rime-moran into the schemes and build their dicts, any number of
+schemes in one process.
+
+    python3 make_dicts.py [--jobs N] [SCHEME ...]
+    python3 make_dicts.py --shape-db SHAPE
+
+What goes into every scheme is in schemes.py. The make_*.sh scripts did
+this one scheme at a time, so each of them read and parsed
+zdicdbtonesorted, the snow_pinyin and rime-ice dicts, the rime-moran
+dicts and the assessment data again. Here every one of them is read once:
+
+1. the shape dbs are written and rime-moran-cht/chs copied into the
+   schemes, as the scripts did;
+2. the moran dicts of the flypy schemes are converted with schemagen
+   convert-sp, all of them side by side on the workers, then the dicts
+   made from the scheme's own files (convert_sp.py) and the fixed dicts
+   are built, from rime-moran heads and bodies and assessment data read
+   and converted with OpenCC once for all schemes;
+3. every big source is parsed into rows once, converted for each scheme
+   and variant that uses it, and dropped before the next one is read.
+
+Steps 2 and 3 run on --jobs forked workers, which share what was read
+before them copy-on-write. Like the other tools, run it from
+tools-additional.
+"""
+
+import argparse
+import io
+import multiprocessing
+import os
+import re
+import shutil
+import subprocess
+import sys
+from collections import namedtuple
+from itertools import islice
+
+import assemble_dict
+import convert_sp
+import dedupe
+import gen_dict_with_shape
+import rime_dict
+import schemes
+from assemble_dict import TEXT_OPTIONS, Source
+
+ROOT = ".."
+DIST_JUNK = {".git", ".gitignore", "README.md", "README-en.md", ".github"}
+# gen_dict_with_shape.py variant of the cht and chs dicts converted from shared sources
+CONVERT_VARIANTS = {"cht": "t", "chs": "s"}
+# The last line of the header of the moran fixed dicts, and the line convert-fixed-sp output is cut at
+FIXED_DICTS = {
+    "moran_fixed": ("#----------詞庫----------#", r"# Some words for testing\.\.\."),
+    "moran_fixed_simp": ("#----------词库----------#", "# 化学元素"),
+}
+# The fixed words the simpchars and simpwords replace
+REPLACED_RULES = ["char", "word-3-full-code", "word-2-short-code"]
+SHAPE_REWRITES = {
+    "tabs": lambda line: line.replace(" ", "\t"),  # sed 's/ /\t/g'
+    "moqi": lambda line: re.sub(r"(.*\t[a-z]{2})\t.*", r"\1", line, count=1),  # perl -pe 's/(.*\t[a-z]{2})\t.*/$1/'
+}
+STATIC_CHARS = (r"python3 gen_dict_with_shape.py -p static -x {shape} -i {path} -o - "
+                r"| perl -CSAD -pe 's/(.*);;/\1/g' | sed '0,/\.\.\./d' "
+                r"| awk 'NF >= 2 && /^[^\s]+\t[a-z;]+/ && !seen[$1 FS $2]++ {{print $0}}'")
+
+# A dict put together by assemble_dict.assemble
+Step = namedtuple("Step", "output sources dedupe")
+# A dict converted from the rows of a shared source: the head lines, then the converted rows through filters
+Conversion = namedtuple("Conversion", "output head pinyin shape variant multishape filters")
+
+# What the forked workers work on, set before the pool is made
+_tasks = None
+_rows = None
+
+
+def root(path):
+    return os.path.join(ROOT, path)
+
+
+def scheme_dir(name, variant):
+    return root(f"{name}-{variant}")
+
+
+def dist_dir(variant):
+    return root(f"rime-moran-{variant}")
+
+
+class Shared:
+    r"""Lines of the files that more than one scheme reads, each read and converted to traditional once."""
+
+    def __init__(self, jobs=1):
+        self.jobs = jobs
+        self._files = {}
+        self._parts = {}
+
+    def _lines(self, path, part, *marker, s2t=False):
+        # Every file is mapped and scanned once, each part of it split into lines once
+        if path not in self._files:
+            self._files[path] = rime_dict.DictFile(path, errors=TEXT_OPTIONS["errors"])
+        key = (path, part, s2t) + marker
+        if key not in self._parts:
+            text = getattr(self._files[path], part)(*marker)
+            if s2t:
+                # As opencc -c s2t, in this process and on the workers
+                text = gen_dict_with_shape.opencc_s2t.convert_text(text, self.jobs)
+            self._parts[key] = list(rime_dict.text_lines(text))
+        return self._parts[key]
+
+    def file(self, path):
+        return self._lines(path, "text")
+
+    def head(self, path, marker):
+        # As sed '/MARKER/q'
+        return self._lines(path, "head", marker)
+
+    def body(self, path, marker, s2t=False):
+        # As sed '0,/MARKER/d'
+        return self._lines(path, "body", marker, s2t=s2t)
+
+    def assessment(self, path, s2t):
+        # The words of an assessment file, in traditional characters for moran_fixed
+        return self._lines(path, "text", s2t=s2t)
+
+    def parts(self):
+        # Every line list handed out, by (path, part, s2t, *marker), for watch.py to update in place
+        return dict(self._parts)
+
+    def close(self):
+        for dict_file in self._files.values():
+            dict_file.close()
+        self._files.clear()
+
+
+def in_memory(lines, filters=()):
+    # A source of lines read or made in this process
+    return Source("lines", [lines], list(filters))
+
+
+BLANK = Source("text", [""], [])
+
+
+def prepare_shape_db(shape):
+    r"""Write SHAPE.txt from its source as the make scripts did, unless it already is just that."""
+    spec = schemes.SHAPE_DBS[shape]
+    if spec is None:
+        return
+    source, rewrite = spec
+    with open(root(source), **TEXT_OPTIONS) as f:
+        text = "".join(map(SHAPE_REWRITES[rewrite], f))
+    target = f"{shape}.txt"
+    try:
+        with open(target, **TEXT_OPTIONS) as f:
+            if f.read() == text:
+                return
+    except FileNotFoundError:
+        pass
+    # A rename, so a tool reading the db never sees half of it
+    with rime_dict.atomic_write(target, **TEXT_OPTIONS) as f:
+        f.write(text)
+
+
+def copy_dist(name, variant):
+    r"""Make the scheme directory a fresh copy of rime-moran, without its repository files."""
+    dist = dist_dir(variant)
+    out = scheme_dir(name, variant)
+    if os.path.lexists(out):
+        shutil.rmtree(out)
+    shutil.copytree(dist, out, symlinks=True,
+                    ignore=lambda directory, names: DIST_JUNK.intersection(names) if directory == dist else ())
+    os.makedirs(os.path.join(out, schemes.SCHEMES[name].extra[0]), exist_ok=True)
+
+
+def schemagen(command, path):
+    return f"python3 {root(schemes.SCHEMAGEN)} {command} --to=flypy --rime-dict={path}"
+
+
+def row_lines(rows):
+    # The lines rime_dict.writer writes for rows, a batch at a time, for assemble_dict
+    buffer = io.StringIO()
+    writer = rime_dict.writer(buffer)
+    rows = iter(rows)
+    while batch := list(islice(rows, rime_dict.WRITE_BATCH)):
+        writer.writerows(batch)
+        yield from io.StringIO(buffer.getvalue(), newline="\n")
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def fixed_sources(name, entry, variant, dict_name, shared):
+    path = os.path.join(scheme_dir(name, variant), f"{dict_name}.dict.yaml")
+    dist_path = os.path.join(dist_dir(variant), f"{dict_name}.dict.yaml")
+    marker, end = FIXED_DICTS[dict_name]
+    s2t = dict_name == "moran_fixed"
+    common = root(schemes.COMMON_WORDS)
+    if entry.fixed == "zrlong":
+        zrlong = root(schemes.ZRLONG)
+        return [in_memory(shared.head(dist_path, "...")), BLANK, in_memory(shared.body(zrlong, "...", s2t))]
+    if entry.fixed == "common":
+        return [in_memory(shared.file(dist_path)), BLANK, in_memory(shared.assessment(common, True))]
+    sources = [in_memory(shared.head(dist_path, marker))]
+    if entry.fixed == "flypy":
+        command = f"{schemagen('convert-fixed-sp', path)} | sed '/{end}/,$d' | sed '0,/{marker}/d'"
+        sources += [BLANK, Source("run", [command], [("filter", ["words", "char-4-code"])])]
+    if entry.simpchars:
+        sources += [BLANK, in_memory(shared.assessment(root(schemes.simpchars_file(entry)), s2t))]
+    sources += [BLANK, in_memory(shared.assessment(root(schemes.simpwords_file(entry)), s2t)),
+                in_memory(shared.body(dist_path, marker), [("filter", REPLACED_RULES)]),
+                BLANK, in_memory(shared.assessment(common, s2t))]
+    return sources
+
+
+def fixed_steps(name, variant, shared):
+    entry = schemes.SCHEMES[name]
+    return [Step(os.path.join(scheme_dir(name, variant), f"{dict_name}.dict.yaml"),
+                 fixed_sources(name, entry, variant, dict_name, shared), entry.fixed != "zrlong")
+            for dict_name in FIXED_DICTS]
+
+
+def scheme_steps(name, variant, shared):
+    r"""The dicts of a scheme built from its own files and the small shared ones, in the order they are built."""
+    entry = schemes.SCHEMES[name]
+    out = scheme_dir(name, variant)
+    steps = []
+    if entry.chars == "flypy":
+        # Converted by convert_sp_dicts before these steps run
+        path = os.path.join(out, "moran.chars.dict.yaml")
+        steps.append(Step(path, [Source("file", [path], [("sub", [r"([a-z]{2});[a-z]{2}", r"\1"])])], False))
+        steps.append(Step(path, [Source("head", [path, "..."], []), BLANK,
+                                 Source("run", [STATIC_CHARS.format(shape=entry.shape, path=path)], [])], False))
+    if entry.zrlf:
+        path = os.path.join(out, "zrlf.dict.yaml")
+        rows = convert_sp.convert_shuangpin(rime_dict.iter_rows(path))
+        steps.append(Step(path, [in_memory(row_lines(rows))], False))
+    return steps + fixed_steps(name, variant, shared)
+
+
+def sp_dicts(name, variant):
+    r"""The moran dicts of a scheme that schemagen convert-sp rewrites to flypy codes in place."""
+    entry = schemes.SCHEMES[name]
+    dict_names = list(entry.sp_dicts)
+    if entry.chars == "flypy" and "chars" not in dict_names:
+        dict_names.insert(0, "chars")
+    return [os.path.join(scheme_dir(name, variant), f"moran.{dict_name}.dict.yaml") for dict_name in dict_names]
+
+
+def convert_sp_dict(path):
+    # schemagen reads path while it writes the temp file, which then replaces it
+    with rime_dict.atomic_write(path, "wb") as f:
+        subprocess.run(["python3", root(schemes.SCHEMAGEN), "convert-sp", "--to=flypy", f"--rime-dict={path}"],
+                       stdout=f, check=True)
+    return path
+
+
+def convert_sp_dicts(names, jobs):
+    r"""Run schemagen convert-sp on the sp dicts of every scheme and variant, on the worker pool."""
+    paths = [path for name in names for variant in schemes.VARIANTS for path in sp_dicts(name, variant)]
+    for path in run_all(convert_sp_dict, paths, jobs):
+        print(path, flush=True)
+
+
+def conversions(names, shared):
+    r"""Map every big shared source, as (path, marker), to the dicts converted from its rows."""
+    by_source = {}
+    for name in names:
+        entry = schemes.SCHEMES[name]
+        directory, source, extra_names = entry.extra
+        for variant in schemes.VARIANTS:
+            out = scheme_dir(name, variant)
+            dist = dist_dir(variant)
+            if entry.chars in ["zdic", "zdic-multishape"]:
+                head = shared.head(os.path.join(dist, "moran.chars.dict.yaml"), "...") + ["\n"]
+                by_source.setdefault((root(schemes.ZDIC), None), []).append(Conversion(
+                    os.path.join(out, "moran.chars.dict.yaml"), head, entry.pinyin, entry.shape, None,
+                    entry.chars == "zdic-multishape", [("sub", ["(.*);;", r"\1"])]))
+            if entry.base:
+                head = shared.head(os.path.join(dist, "moran.base.dict.yaml"), "...")
+                by_source.setdefault((root(schemes.BASE_DICTS[entry.base]), "..."), []).append(Conversion(
+                    os.path.join(out, "moran.base.dict.yaml"), head, entry.pinyin, entry.shape,
+                    CONVERT_VARIANTS[variant], False, []))
+            for extra in extra_names:
+                by_source.setdefault((root(source.format(extra)), None), []).append(Conversion(
+                    os.path.join(out, directory, f"{entry.pinyin}_{entry.shape}_{extra}.dict.yaml"), [],
+                    entry.pinyin, entry.shape, CONVERT_VARIANTS[variant], False, []))
+    return by_source
+
+
+def read_rows(path, marker=None):
+    r"""The rows of a dict as gen_dict_with_shape.py holds them; with marker, only those after the line with it."""
+    with rime_dict.DictFile(path, [marker] if marker else []) as dict_file:
+        return list(map(gen_dict_with_shape.compact_row, dict_file.rows(marker)))
+
+
+def build_steps(index):
+    for step in _tasks[index]:
+        assemble_dict.assemble(step.output, step.sources, dedupe.DEFAULT_MEMORY if step.dedupe else None)
+    return [step.output for step in _tasks[index]]
+
+
+def convert(conversion):
+    out_rows = gen_dict_with_shape.convert_dict(_rows, conversion.pinyin, conversion.shape, conversion.variant,
+                                                multishape=conversion.multishape)
+    assemble_dict.assemble(conversion.output, [in_memory(conversion.head),
+                                               in_memory(row_lines(out_rows), conversion.filters)])
+    return [conversion.output]
+
+
+def run_all(function, items, jobs):
+    # Results as they come, from workers forked off this process so they see what it has loaded
+    if jobs == 1 or len(items) < 2 or "fork" not in multiprocessing.get_all_start_methods():
+        yield from map(function, items)
+        return
+    with multiprocessing.get_context("fork").Pool(min(jobs, len(items))) as pool:
+        yield from pool.imap_unordered(function, items)
+
+
+def make_dicts(names, jobs):
+    global _tasks, _rows
+    for shape in dict.fromkeys(schemes.SCHEMES[name].shape for name in names):
+        prepare_shape_db(shape)
+    for name in names:
+        for variant in schemes.VARIANTS:
+            copy_dist(name, variant)
+
+    convert_sp_dicts(names, jobs)
+    shared = Shared(jobs)
+    _tasks = [scheme_steps(name, variant, shared) for name in names for variant in schemes.VARIANTS]
+    for outputs in run_all(build_steps, range(len(_tasks)), jobs):
+        print("\n".join(outputs), flush=True)
+    _tasks = None
+
+    for (path, marker), batch in conversions(names, shared).items():
+        _rows = read_rows(path, marker)
+        # Loaded and converted here once, rather than in every worker
+        for shape, multishape in dict.fromkeys((c.shape, c.multishape) for c in batch):
+            gen_dict_with_shape.get_shape_dict(shape, multishape)
+        for variant in dict.fromkeys(c.variant for c in batch):
+            gen_dict_with_shape.prefetch_conversions(_rows, variant == "t", variant == "s")
+        for outputs in run_all(convert, batch, jobs):
+            print("\n".join(outputs), flush=True)
+        _rows = None
+
+
+def get_cli_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     epilog="schemes: " + ", ".join(schemes.SCHEMES))
+    parser.add_argument("schemes", nargs="*", metavar="SCHEME", help="Schemes to build (default: all of them)")
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="Number of worker processes (0 = all cores)")
+    parser.add_argument("--shape-db", choices=[shape for shape, spec in schemes.SHAPE_DBS.items() if spec],
+                        help="Only write SHAPE.txt from its source, as the schemes using it would")
+    args = parser.parse_args()
+    unknown = [name for name in args.schemes if name not in schemes.SCHEMES]
+    if unknown:
+        parser.error(f"unknown scheme {', '.join(unknown)}")
+    if args.shape_db and args.schemes:
+        parser.error("--shape-db builds no scheme")
+    return args
+
+
+def main():
+    args = get_cli_args()
+    if args.shape_db:
+        prepare_shape_db(args.shape_db)
+        return
+    gen_dict_with_shape.set_opencc_cache()
+    try:
+        make_dicts(list(dict.fromkeys(args.schemes)) or list(schemes.SCHEMES), args.jobs or os.cpu_count())
+    except subprocess.CalledProcessError as e:
+        sys.exit(f"make_dicts: {e}")
+
+
+if __name__ == "__main__":
+    main()
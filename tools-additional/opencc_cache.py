@@ -0,0 +1,170 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Batched OpenCC conversion with an in-memory and an on-disk cache.
+
+Texts are looked up in memory first, then in a SQLite file keyed by
+(config, text) that is shared by every run and every scheme. Whatever is
+left is joined with a newline, converted in one call into the native
+library and split back.
+
+Whole texts, the contents of a file, go through convert_text: they are
+cut into chunks of lines that forked workers convert side by side, and
+the result is kept in memory and on disk under the SHA-256 of the text.
+OpenCC never matches across a line break, so this gives what converting
+the text in one piece gives.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import sqlite3
+from collections import Counter
+
+import opencc
+
+DEFAULT_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".opencc_cache.sqlite3")
+SEPARATOR = "\n"
+BATCH_SIZE = 1000
+TEXT_CHUNK_SIZE = 1 << 20  # characters, cut at the next line break
+
+_text_converter = None
+
+
+class DiskCache:
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+        self._pid = None
+
+    def connection(self):
+        # Connections must not cross a fork, so every process opens its own
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, timeout=60)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS conversion "
+                               "(config TEXT, text TEXT, result TEXT, PRIMARY KEY (config, text))")
+            self._pid = os.getpid()
+        return self._conn
+
+    def get_many(self, config, texts):
+        conn = self.connection()
+        found = {}
+        for i in range(0, len(texts), 500):
+            batch = texts[i:i + 500]
+            query = "SELECT text, result FROM conversion WHERE config = ? AND text IN ({})".format(
+                ",".join("?" * len(batch)))
+            found.update(conn.execute(query, [config] + batch))
+        return found
+
+    def put_many(self, config, pairs):
+        conn = self.connection()
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO conversion VALUES (?, ?, ?)",
+                             ((config, text, result) for text, result in pairs))
+
+
+class CachedConverter:
+    def __init__(self, config, disk_cache=None):
+        self.config = config
+        self.cache_key = f"{config}@{getattr(opencc, '__version__', '')}"
+        self.disk_cache = disk_cache
+        self.memory = {}
+        self.texts = {}
+        self.stats = Counter()
+        self._converter = None
+
+    @property
+    def converter(self):
+        # Built on first use so runs that never convert do not pay for loading the config
+        if self._converter is None:
+            self._converter = opencc.OpenCC(self.config)
+        return self._converter
+
+    def convert(self, text):
+        self.stats["lookups"] += 1
+        result = self.memory.get(text)
+        if result is None:
+            self.prefetch([text])
+            result = self.memory[text]
+        return result
+
+    def prefetch(self, texts):
+        missing = [text for text in dict.fromkeys(texts) if text not in self.memory]
+        if not missing:
+            return
+        if self.disk_cache is not None:
+            found = self.disk_cache.get_many(self.cache_key, missing)
+            self.stats["disk"] += len(found)
+            self.memory.update(found)
+            missing = [text for text in missing if text not in found]
+        converted = []
+        for i in range(0, len(missing), BATCH_SIZE):
+            converted.extend(self.convert_batch(missing[i:i + BATCH_SIZE]))
+        self.stats["converted"] += len(missing)
+        self.memory.update(converted)
+        if self.disk_cache is not None and converted:
+            self.disk_cache.put_many(self.cache_key, converted)
+
+    def convert_batch(self, texts):
+        batch = [text for text in texts if SEPARATOR not in text]
+        pairs = []
+        if batch:
+            results = self.converter.convert(SEPARATOR.join(batch)).split(SEPARATOR)
+            if len(results) == len(batch):
+                pairs.extend(zip(batch, results))
+            else:
+                pairs.extend((text, self.converter.convert(text)) for text in batch)
+        pairs.extend((text, self.converter.convert(text)) for text in texts if SEPARATOR in text)
+        return pairs
+
+    def convert_text(self, text, jobs=1):
+        r"""The text converted, as opencc -c CONFIG converts a file, with jobs workers."""
+        key = hashlib.sha256(text.encode("UTF-8", "surrogatepass")).hexdigest()
+        self.stats["texts"] += 1
+        result = self.texts.get(key)
+        if result is None and self.disk_cache is not None:
+            result = self.disk_cache.get_many(f"{self.cache_key}#sha256", [key]).get(key)
+        if result is None:
+            self.stats["texts_converted"] += 1
+            result = "".join(self._convert_chunks(text_chunks(text), jobs))
+            if self.disk_cache is not None:
+                self.disk_cache.put_many(f"{self.cache_key}#sha256", [(key, result)])
+        self.texts[key] = result
+        return result
+
+    def _convert_chunks(self, chunks, jobs):
+        global _text_converter
+        if jobs == 1 or len(chunks) < 2 or "fork" not in multiprocessing.get_all_start_methods():
+            return map(self.converter.convert, chunks)
+        # Loaded before the fork, so the workers share it
+        _text_converter = self.converter
+        try:
+            with multiprocessing.get_context("fork").Pool(min(jobs, len(chunks))) as pool:
+                return pool.map(_convert_chunk, chunks)
+        finally:
+            _text_converter = None
+
+    def summary(self):
+        lookups = self.stats["lookups"]
+        disk = self.stats["disk"]
+        converted = self.stats["converted"]
+        memory = max(lookups - disk - converted, 0)
+        rate = 100 * (lookups - converted) / lookups if lookups else 0
+        return (f"OpenCC {self.config}: {lookups} lookups, {memory} memory hits, "
+                f"{disk} disk hits, {converted} converted ({rate:.1f}% hit rate)")
+
+
+def text_chunks(text, size=TEXT_CHUNK_SIZE):
+    # Whole lines of about size characters each, the last one as it ends
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start + size) + 1 or len(text)
+        chunks.append(text[start:end])
+        start = end
+    return chunks
+
+
+def _convert_chunk(chunk):
+    return _text_converter.convert(chunk)
@@ -0,0 +1,56 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Convert a text file with OpenCC in this process, as the opencc command does.
+
+    python3 opencc_file.py -i ../data/assess.tiger-code.com/common.simp.words.txt -o common.words.txt -c s2t
+
+The file is cut into chunks of lines that are converted by --jobs forked
+workers and joined back in order. The result is kept in the OpenCC cache
+file under the SHA-256 of the input, so a file that was converted before,
+by any scheme, is not converted again.
+"""
+
+import argparse
+import os
+import sys
+
+import rime_dict
+from opencc_cache import DEFAULT_CACHE_FILE, CachedConverter, DiskCache
+
+
+def config_file(config):
+    # "s2t" as the opencc command takes it, "s2t.json" as the library does
+    return config if os.path.splitext(config)[1] else f"{config}.json"
+
+
+def read_text(path):
+    if path == "-":
+        return sys.stdin.buffer.read().decode("UTF-8")
+    with open(path, newline="", encoding="UTF-8") as f:
+        return f.read()
+
+
+def get_cli_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input_file", "-i", type=str, default="-", help="Input file (default: stdin)")
+    parser.add_argument("--output_file", "-o", type=str, default="-", help="Output file (default: stdout)")
+    parser.add_argument("--config", "-c", type=str, required=True, help="OpenCC config, such as s2t or t2s.json")
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="Number of worker processes (0 = all cores)")
+    parser.add_argument("--opencc-cache", type=str, default=DEFAULT_CACHE_FILE,
+                        help="SQLite file caching OpenCC conversions across runs")
+    parser.add_argument("--no-opencc-cache", action="store_true", help="Do not use the on-disk OpenCC cache")
+    return parser.parse_args()
+
+
+def main():
+    args = get_cli_args()
+    disk_cache = None if args.no_opencc_cache else DiskCache(args.opencc_cache)
+    converter = CachedConverter(config_file(args.config), disk_cache)
+    text = converter.convert_text(read_text(args.input_file), args.jobs or os.cpu_count())
+    with rime_dict.atomic_write(args.output_file) as f:
+        f.write(text)
+
+
+if __name__ == "__main__":
+    main()
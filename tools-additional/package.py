@@ -0,0 +1,269 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Pack every scheme into its release archive; the release half of generate.sh.
+
+    python3 tools-additional/package.py [--jobs N] [--format 7z|zip] [DIRECTORY ...]
+
+The release archives are .7z: 7z runs for every directory side by side,
+from a sorted file list and with timestamps left out. 7z compresses each
+archive as one solid LZMA stream, which is what keeps the downloads small.
+Each 7z runs on one thread, as --jobs of them run at once, which also
+keeps its output the same from one run to the next; an archive that comes
+out as the one already there is left as it is. Every archive is
+compressed on its own: the files the schemes share are compressed again
+in each of them, and the time saved is only that of running the 7z side
+by side.
+
+--format zip is not what is released. The 24 scheme directories share
+most of their files: lua/, opencc/, recipes/ and dicts such as
+moran_english are the same in every scheme and in both variants. In a zip
+every entry is compressed by itself, so every distinct content is deflated
+once, on --jobs threads, and the archives are put together from those
+compressed bytes side by side. That is quicker to pack but gives larger
+archives (xhupkai-chs: 7.99 MB against 5.97 MB for LZMA). An archive has
+its entries in path order, with one fixed timestamp and only the
+executable bit of the mode, so the same directory always packs into the
+same bytes; an archive that already holds exactly those bytes is left as
+it is.
+"""
+
+import argparse
+import filecmp
+import glob
+import hashlib
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import rime_dict
+import schemes
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 1980-01-01 00:00:00, the earliest time a zip entry can have
+DOS_TIME, DOS_DATE = 0, (0 << 9) | (1 << 5) | 1
+DEFLATED, STORED = 8, 0
+UNIX = 3
+ZIP_VERSION = 20
+UTF8_NAMES = 0x800
+ZIP_LIMIT = 0xFFFFFFFF  # past this a zip needs ZIP64, which no archive here comes near
+
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+END_RECORD = struct.Struct("<4s4H2LH")
+
+# A file to pack: its name in the archive, where it is and the digest of its contents
+Entry = namedtuple("Entry", "name path digest executable")
+# A distinct content, compressed once for every archive holding it
+Blob = namedtuple("Blob", "method crc size data")
+
+
+def scheme_dirs():
+    return [f"{name}-{variant}" for name in schemes.SCHEMES for variant in schemes.VARIANTS]
+
+
+def walk(directory):
+    r"""The directories and files under directory, as archive names below its own name, in path order."""
+    top = os.path.basename(os.path.normpath(directory))
+    found = [(top + "/", None)]
+    for parent, dirnames, filenames in os.walk(directory, followlinks=True):
+        prefix = os.path.relpath(parent, directory).replace(os.sep, "/")
+        prefix = top + "/" if prefix == "." else f"{top}/{prefix}/"
+        found.extend((prefix + name + "/", None) for name in dirnames)
+        found.extend((prefix + name, os.path.join(parent, name)) for name in filenames)
+    return sorted(found)
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def is_executable(path):
+    return bool(os.stat(path).st_mode & 0o100)
+
+
+def archive_path(directory, output_dir, extension):
+    return os.path.join(output_dir, os.path.basename(os.path.normpath(directory)) + extension)
+
+
+def compress(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    crc = zlib.crc32(data)
+    deflated = zlib.compress(data, 9, wbits=-15)
+    if len(deflated) < len(data):
+        return Blob(DEFLATED, crc, len(data), deflated)
+    return Blob(STORED, crc, len(data), data)
+
+
+def zip_bytes(entries, blobs):
+    r"""The zip archive of entries, put together from the compressed blobs, as one bytes object."""
+    parts = []
+    central = []
+    offset = 0
+    for entry in entries:
+        name = entry.name.encode("UTF-8")
+        flags = UTF8_NAMES if not entry.name.isascii() else 0
+        if entry.path is None:
+            blob = Blob(STORED, 0, 0, b"")
+            attributes = (0o40755 << 16) | 0x10  # a directory, for MS-DOS too
+        else:
+            blob = blobs[entry.digest]
+            attributes = (0o100755 if entry.executable else 0o100644) << 16
+        if blob.size > ZIP_LIMIT or len(blob.data) > ZIP_LIMIT or offset > ZIP_LIMIT:
+            raise ValueError(f"{entry.name}: too large for a zip without ZIP64")
+        header = LOCAL_HEADER.pack(b"PK\x03\x04", ZIP_VERSION, 0, flags, blob.method, DOS_TIME, DOS_DATE,
+                                   blob.crc, len(blob.data), blob.size, len(name), 0)
+        parts += [header, name, blob.data]
+        central += [CENTRAL_HEADER.pack(b"PK\x01\x02", ZIP_VERSION, UNIX, ZIP_VERSION, 0, flags, blob.method,
+                                        DOS_TIME, DOS_DATE, blob.crc, len(blob.data), blob.size, len(name),
+                                        0, 0, 0, 0, attributes, offset), name]
+        offset += len(header) + len(name) + len(blob.data)
+    central = b"".join(central)
+    if len(entries) > 0xFFFF or offset > ZIP_LIMIT:
+        raise ValueError("too many entries for a zip without ZIP64")
+    end = END_RECORD.pack(b"PK\x05\x06", 0, 0, len(entries), len(entries), len(central), offset, 0)
+    return b"".join(parts + [central, end])
+
+
+def same_contents(path, data):
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except FileNotFoundError:
+        return False
+
+
+def same_files(path, other):
+    try:
+        return filecmp.cmp(path, other, shallow=False)
+    except FileNotFoundError:
+        return False
+
+
+def write_zip(archive, entries, blobs):
+    r"""Write archive unless it already holds these bytes; returns the bytes written."""
+    data = zip_bytes(entries, blobs)
+    if same_contents(archive, data):
+        return 0
+    with rime_dict.atomic_write(archive, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def pack_zip(directories, output_dir, jobs):
+    started = time.perf_counter()
+    listing = {directory: walk(directory) for directory in directories}
+    paths = [path for found in listing.values() for _, path in found if path is not None]
+    with ThreadPoolExecutor(jobs) as pool:
+        # zlib and hashlib let go of the GIL on large buffers, so threads are enough
+        digests = dict(zip(paths, pool.map(file_digest, paths)))
+        first = {}
+        for path in paths:
+            first.setdefault(digests[path], path)
+        blobs = dict(zip(first, pool.map(compress, first.values())))
+        archives = {}
+        for directory, found in listing.items():
+            entries = [Entry(name, path, digests.get(path), path is not None and is_executable(path))
+                       for name, path in found]
+            archive = archive_path(directory, output_dir, ".zip")
+            archives[archive] = pool.submit(write_zip, archive, entries, blobs)
+        written = {archive: future.result() for archive, future in archives.items()}
+    for archive, size in written.items():
+        print(f"{archive}: {'written, ' + str(size) + ' bytes' if size else 'unchanged'}")
+    read = sum(blob.size for blob in blobs.values())
+    print(f"{len(written)} archives, {len(paths)} files, {len(blobs)} distinct contents ({read} bytes) compressed "
+          f"once, {sum(written.values())} bytes written in {time.perf_counter() - started:.1f}s")
+
+
+def write_7z(directory, archive):
+    r"""Pack directory into archive unless it already holds what 7z made; returns the bytes written."""
+    # From the parent of directory, so the entries start with its name as with 7z a X.7z X/
+    parent = os.path.dirname(os.path.normpath(os.path.abspath(directory)))
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(archive))) as tmp:
+        listfile = os.path.join(tmp, "files.txt")
+        entries = walk(directory)
+        # The files, and the directories with nothing under them: 7z adds everything below a directory
+        # it is given, and makes the other directories from the paths of their files
+        with open(listfile, "w", encoding="UTF-8") as f:
+            f.writelines(name.rstrip("/") + "\n" for i, (name, path) in enumerate(entries)
+                         if path is not None or not (i + 1 < len(entries) and entries[i + 1][0].startswith(name)))
+        # Into a new file, as 7z adds to an archive that is already there
+        packed = os.path.join(tmp, os.path.basename(archive))
+        # -mmt=1: the archives are packed side by side already, a multithreaded LZMA2 for each would
+        # oversubscribe the cores and the memory
+        subprocess.run(["7z", "a", "-bd", "-mmt=1", "-mtm=off", "-mtc=off", "-mta=off", "-scsUTF-8", packed,
+                        f"@{listfile}"], cwd=parent, check=True, stdout=subprocess.DEVNULL)
+        if same_files(archive, packed):
+            return 0
+        size = os.path.getsize(packed)
+        os.replace(packed, archive)
+    return size
+
+
+def pack_7z(directories, output_dir, jobs):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(jobs) as pool:
+        archives = {}
+        for directory in directories:
+            archive = archive_path(directory, output_dir, ".7z")
+            archives[archive] = pool.submit(write_7z, directory, archive)
+        written = {archive: future.result() for archive, future in archives.items()}
+    for archive, size in written.items():
+        print(f"{archive}: {'written, ' + str(size) + ' bytes' if size else 'unchanged'}")
+    print(f"{len(written)} archives, {sum(written.values())} bytes written "
+          f"in {time.perf_counter() - started:.1f}s")
+
+
+def remove_stale(directories, output_dir, extension):
+    r"""Remove the archives in output_dir that none of directories packs into, as generate.sh did with rm -f."""
+    packed = {os.path.abspath(archive_path(directory, output_dir, extension)) for directory in directories}
+    for archive in sorted(glob.glob(os.path.join(glob.escape(output_dir), "*" + extension))):
+        if os.path.abspath(archive) not in packed:
+            os.unlink(archive)
+            print(f"{archive}: removed")
+
+
+def get_cli_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("directories", nargs="*", metavar="DIRECTORY",
+                        help="Directories to pack (default: every scheme and variant of schemes.py, removing "
+                             "any other archive of the format in --output-dir)")
+    parser.add_argument("--output-dir", "-o", type=str, default=ROOT,
+                        help="Where the archives go (default: the repository root)")
+    parser.add_argument("--format", choices=["7z", "zip"], default="7z",
+                        help="Archive format (default: 7z, as released)")
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="Number of threads (0 = all cores)")
+    return parser.parse_args()
+
+
+def main():
+    args = get_cli_args()
+    directories = args.directories or [os.path.join(ROOT, name) for name in scheme_dirs()]
+    missing = [directory for directory in directories if not os.path.isdir(directory)]
+    if missing:
+        sys.exit(f"package: no directory {' '.join(missing)}")
+    pack = pack_7z if args.format == "7z" else pack_zip
+    try:
+        pack(directories, args.output_dir, args.jobs or os.cpu_count())
+    except subprocess.CalledProcessError as e:
+        sys.exit(f"package: {e}")
+    if not args.directories:
+        # What is left from schemes no longer released; the others are kept when they come out unchanged
+        remove_stale(directories, args.output_dir, "." + args.format)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,13 @@ Convert quanpin dictionary files
 You need to convert input file to UTF-8 before running
 """
 
-import csv
 import re
 import argparse
 import opencc
 
+import dedupe
+import rime_dict
+
 opencc_t2s = opencc.OpenCC('t2s.json')
 opencc_s2t = opencc.OpenCC('s2t.json')
 
@@ -37,14 +39,10 @@ def generate_chaizi(list1, list2):
     return list3
 
 def remove_dupe(input_lists):
-    seen = set()
-    output_lists = []
-    for sublist in input_lists:
-        sublist_tuple = tuple(sublist)
-        if sublist_tuple not in seen:
-            output_lists.append(sublist)
-            seen.add(sublist_tuple)
-    return output_lists
+    return list(dedupe.iter_unique(input_lists, key=tuple))
+
+SIMPLIB = ['./xhloopfly-cht/moran.chars.dict.yaml']
+
 
 def rewrite_row(rows, currentlib, simplib):
     replacement_dict = {
@@ -163,16 +161,15 @@ def get_cli_args():
     return args
 
 
-def main():
-    simplib = ['./xhloopfly-cht/moran.chars.dict.yaml']
-    args = get_cli_args()
-    currentlib = args.current_library
-    with open(args.input_file, newline="", encoding='UTF-8') as f:
-        rows = list(csv.reader(f, delimiter="\t", quotechar="`"))
-    with open(args.current_library, newline="", encoding='UTF-8') as f:
-        libs = list(csv.reader(f, delimiter="\t", quotechar="`"))
+def build_chaizi(rows, libs):
+    r"""Turn chaizi rows (char, components, ...) into (char, code) rows.
 
-    rows = rewrite_row(rows, currentlib, simplib)
+    libs are the rows of the current moran.chars library; every component
+    is coded by the first code of its most frequent reading there.
+    """
+    rows = [list(row) for row in rows]
+    libs = [list(lib) for lib in libs]
+    rows = rewrite_row(rows, None, SIMPLIB)
     rows = list(filter(None, rows)) # remove empty
     rows = remove_dupe(rows)
 
@@ -203,12 +200,17 @@ def main():
     out_rows = generate_chaizi(rows, libs)
     out_rows = remove_dupe(out_rows)
     # out_rows = libs
+    return out_rows
+
+
+def main():
+    args = get_cli_args()
+    rows = rime_dict.read_rows(args.input_file)
+    libs = rime_dict.read_rows(args.current_library)
+    out_rows = build_chaizi(rows, libs)
 
     output_file = args.output_file
-    with open(output_file, "w", newline="", encoding='UTF-8') as f:
-        my_tsv = csv.writer(f, delimiter="\t",
-                            quotechar="`", lineterminator="\n")
-        my_tsv.writerows(out_rows)
+    rime_dict.write_rows(output_file, out_rows)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,169 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Prune a generated Rime dictionary down to an entry or byte budget.
+
+Every entry is scored by how common its word is: single characters by
+CharFreq.txt, longer words by 词频.txt, each as a share of its own
+corpus, with the dict's weight column breaking ties. The lowest scoring
+entries are dropped until the budget is met. The header, comments and
+the order of the kept entries stay as they were.
+
+    python3 prune_dict.py -i ../xhupkai-chs/moran.chars.dict.yaml --max-entries 60000
+"""
+
+import argparse
+import os
+
+import rime_dict
+
+DEFAULT_WORD_FREQ = "../data/frequency/词频.txt"
+DEFAULT_CHAR_FREQ = "../data/frequency/CharFreq.txt"
+
+
+def load_word_freq(path):
+    # word \t count
+    freq = {}
+    with open(path, encoding='UTF-8') as f:
+        for line in f:
+            columns = line.rstrip("\n").split("\t")
+            if len(columns) >= 2 and columns[1].isdigit():
+                freq[columns[0]] = freq.get(columns[0], 0) + int(columns[1])
+    return freq
+
+
+def load_char_freq(path):
+    # serial \t char \t count \t ..., GB18030 with /* */ comment lines
+    freq = {}
+    with open(path, encoding='GB18030', errors='replace') as f:
+        for line in f:
+            columns = line.rstrip("\r\n").split("\t")
+            if len(columns) >= 3 and not line.startswith("/*") and columns[2].isdigit():
+                freq.setdefault(columns[1], int(columns[2]))
+    return freq
+
+
+def shares(freq):
+    total = sum(freq.values())
+    return {word: count / total for word, count in freq.items()} if total else {}
+
+
+def frequency_share(word, word_share, char_share):
+    share = char_share.get(word) if len(word) == 1 else None
+    return word_share.get(word, 0.0) if share is None else share
+
+
+def weight_of(row, weight_column):
+    try:
+        return float(row[weight_column]) if weight_column is not None and len(row) > weight_column else 0.0
+    except ValueError:
+        return 0.0
+
+
+def is_entry(row):
+    return bool(row) and bool(row[0]) and not rime_dict.is_comment(row)
+
+
+def row_bytes(row):
+    return len("\t".join(row).encode("UTF-8")) + 1
+
+
+def score_entries(rows, word_share, char_share, weight_column=None):
+    r"""Map the index of every entry to its (frequency, weight).
+
+    A word's corpus share is split over its entries (readings) in
+    proportion to their weights, or evenly when they have none.
+    """
+    weights = {i: weight_of(row, weight_column) for i, row in enumerate(rows) if is_entry(row)}
+    readings = {}
+    for i in weights:
+        readings.setdefault(rows[i][0], []).append(i)
+    scores = {}
+    for word, indices in readings.items():
+        share = frequency_share(word, word_share, char_share)
+        total = sum(weights[i] for i in indices)
+        for i in indices:
+            fraction = weights[i] / total if total > 0 else 1 / len(indices)
+            scores[i] = (share * fraction, weights[i])
+    return scores
+
+
+def select(rows, scores, max_entries=None, max_bytes=None):
+    r"""Return the indices of the entries to keep, best first.
+
+    max_bytes counts the entries only; whatever else the file holds has to
+    be taken off the budget by the caller.
+    """
+    # Ties keep the earlier entry
+    ranked = sorted(scores, key=lambda i: (*scores[i], -i), reverse=True)
+    if max_entries is not None:
+        ranked = ranked[:max_entries]
+    if max_bytes is not None:
+        used = 0
+        for n, i in enumerate(ranked):
+            used += row_bytes(rows[i])
+            if used > max_bytes:
+                ranked = ranked[:n]
+                break
+    return ranked
+
+
+def kept_share(scores, kept, column):
+    total = sum(score[column] for score in scores.values())
+    return sum(scores[i][column] for i in kept) / total if total else None
+
+
+def prune_file(input_file, output_file, word_share, char_share, max_entries=None, max_bytes=None):
+    with rime_dict.open_dict(input_file) as f:
+        header = rime_dict.read_header(f)
+        rows = list(rime_dict.reader(f))
+    if max_bytes is not None:
+        # The header and comments are always kept, so they come off the budget first
+        fixed = len(header.encode("UTF-8")) + sum(row_bytes(row) for row in rows if not is_entry(row))
+        max_bytes = max(max_bytes - fixed, 0)
+    columns = rime_dict.header_columns(header)
+    weight_column = columns.index("weight") if "weight" in columns else None
+    scores = score_entries(rows, word_share, char_share, weight_column)
+    kept = select(rows, scores, max_entries, max_bytes)
+    keep = set(kept)
+    out_rows = (row for i, row in enumerate(rows) if i in keep or not is_entry(row))
+
+    with rime_dict.atomic_write(output_file) as f:
+        f.write(header)
+        rime_dict.writer(f).writerows(out_rows)
+
+    report = [f"{input_file}: kept {len(kept)} of {len(scores)} entries, removed {len(scores) - len(kept)}"]
+    for column, name in enumerate(["corpus frequency", "weight"]):
+        share = kept_share(scores, kept, column)
+        if share is not None:
+            report.append(f"{share:.2%} of the {name}")
+    print(", ".join(report))
+
+
+def get_cli_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input_file", "-i", type=str, required=True, help="Input file")
+    parser.add_argument("--output_file", "-o", type=str, default="",
+                        help="Output file (default: prune the input file in place)")
+    parser.add_argument("--max-entries", type=int, help="Keep at most this many entries")
+    parser.add_argument("--max-bytes", type=int, help="Keep the whole file within this many bytes")
+    parser.add_argument("--word-freq", type=str, default=DEFAULT_WORD_FREQ,
+                        help="Word frequency list, word and count per line")
+    parser.add_argument("--char-freq", type=str, default=DEFAULT_CHAR_FREQ,
+                        help="Character frequency list in the CharFreq.txt format")
+    args = parser.parse_args()
+    if args.max_entries is None and args.max_bytes is None:
+        parser.error("give a budget with --max-entries and/or --max-bytes")
+    return args
+
+
+def main():
+    args = get_cli_args()
+    word_share = shares(load_word_freq(args.word_freq))
+    char_share = shares(load_char_freq(args.char_freq))
+    prune_file(os.path.realpath(args.input_file), os.path.realpath(args.output_file or args.input_file),
+               word_share, char_share, args.max_entries, args.max_bytes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Reader and writer for Rime tab-separated dictionaries.
+
+Rows are read and written the way csv does with delimiter="\t" and
+quotechar="`", which is what every tool here has always used, but plain
+text is split and joined directly, a block at a time. Once a block
+needs the csv rules (a backtick, a carriage return) the csv module takes
+over for the rest of the file. read_rows and iter_rows open the file
+themselves, as bytes, and decode each block in one go up to its last
+newline, which is what puts reading ahead of csv (bench.py tsv); reader
+takes a file opened as text by the caller and reads it as text.
+
+    for row in rime_dict.iter_rows(path):
+        ...
+    with rime_dict.open_dict(path) as f:
+        header = rime_dict.read_header(f)
+        for row in rime_dict.reader(f):
+            ...
+    with rime_dict.atomic_write(path) as f:
+        rime_dict.writer(f).writerows(rows)
+
+DictFile splits a dict at its header and at marker lines such as
+"#----------詞庫----------#", as sed '/MARKER/q' and sed '0,/MARKER/d'
+did, from one scan of an mmap of the file:
+
+    with rime_dict.DictFile(path, ["...", "#----------詞庫----------#"]) as dict_file:
+        header = dict_file.head("...")
+        rows = dict_file.rows("#----------詞庫----------#")
+
+atomic_write writes to a temp file that only replaces the output once it
+is complete, so a build that stops halfway never leaves half a dict.
+
+Fields always come back as str. Rows of bytes fields would save the
+decode, but every tool here looks the fields up in str-keyed tables or
+hands them to OpenCC, so each field would be decoded on its own later,
+which costs more than decoding the block at once.
+"""
+
+import contextlib
+import csv
+import io
+import mmap
+import os
+import re
+import sys
+import tempfile
+from itertools import chain, filterfalse, islice, repeat
+
+BUFFER_SIZE = 1 << 18
+# Small enough for the lines of a block and their rows to stay in the CPU cache
+READ_BLOCK = 1 << 15
+WRITE_BATCH = 4096
+CSV_OPTIONS = dict(delimiter="\t", quotechar="`")
+
+
+def open_dict(path, mode="r", buffering=BUFFER_SIZE):
+    options = {} if "b" in mode else dict(newline="", encoding='UTF-8')
+    if path == "-":
+        # stdin or stdout, so the tools can be chained through pipes; left open on close
+        fd = sys.__stdout__.fileno() if "w" in mode or "a" in mode else sys.__stdin__.fileno()
+        return open(fd, mode, buffering=buffering, closefd=False, **options)
+    return open(path, mode, buffering=buffering, **options)
+
+
+def is_comment(row):
+    return bool(row) and row[0][:1] == "#"
+
+
+def _read_past_header(readline):
+    # Consumes the YAML header, a line of text from readline at a time, and returns the text
+    # read before and after it that still has to be parsed: leading comments and the first line of the body
+    head = []
+    in_header = False
+    while True:
+        line = readline()
+        if not line:
+            return "".join(head)
+        stripped = line.rstrip("\r\n")
+        if in_header:
+            if stripped == "...":
+                return "".join(head)
+        elif stripped == "---":
+            in_header = True
+        else:
+            head.append(line)
+            if stripped and stripped[0] != "#":
+                return "".join(head)
+
+
+def read_header(f):
+    r"""Return the leading comments and YAML header of an open dict file as text.
+
+    f is left on the first line after "..."; a file without a header comes
+    back as "" with nothing consumed.
+    """
+    start = f.tell()
+    head = []
+    in_header = False
+    while True:
+        line = f.readline()
+        if not line:
+            break
+        head.append(line)
+        stripped = line.rstrip("\r\n")
+        if in_header:
+            if stripped == "...":
+                return "".join(head)
+        elif stripped == "---":
+            in_header = True
+        elif stripped and stripped[0] != "#":
+            break
+    f.seek(start)
+    return ""
+
+
+def header_columns(header):
+    r"""The column names a header declares, or Rime's default text, code, weight, stem."""
+    lines = header.splitlines()
+    for i, line in enumerate(lines):
+        if line.rstrip() == "columns:":
+            columns = []
+            for item in lines[i + 1:]:
+                item = item.strip()
+                if not item.startswith("- "):
+                    break
+                columns.append(item[2:].strip())
+            return columns
+    return ["text", "code", "weight", "stem"]
+
+
+def _iter_blocks(f, text, block_size):
+    # Yields the rows a block of lines at a time, so the per-row loop stays in C
+    while True:
+        data = f.read(block_size)
+        block = text + data if text else data
+        if not block:
+            return
+        if "`" in block or "\r" in block:
+            # These need the csv rules; quoted fields may run over several lines,
+            # so csv reads the rest of the file from the end of this line on
+            block += f.readline()
+            yield csv.reader(chain(io.StringIO(block, newline=""), f), **CSV_OPTIONS)
+            return
+        if not data and block[-1] != "\n":  # last line without a newline
+            block += "\n"
+        cut = block.rfind("\n") + 1
+        text = block[cut:]
+        if not cut:
+            continue
+        lines = block[:cut - 1].split("\n")
+        if "" in lines:  # blank lines are empty rows, as with csv
+            yield [line.split("\t") if line else [] for line in lines]
+        else:
+            yield map(str.split, lines, repeat("\t"))
+
+
+def _csv_rows(text, raw):
+    # The rows of text and of the rest of raw by the csv rules, raw decoded as it is read
+    rest = io.TextIOWrapper(raw, encoding="UTF-8", newline="")
+    try:
+        yield from csv.reader(chain(io.StringIO(text, newline=""), rest), **CSV_OPTIONS)
+    finally:
+        rest.detach()
+
+
+def _iter_byte_blocks(raw, data, block_size):
+    # As _iter_blocks, reading a binary file; a block is decoded up to its last
+    # newline, so a character is never cut in two
+    rest = data
+    while True:
+        data = raw.read(block_size)
+        block = rest + data if rest else data
+        if not block:
+            return
+        if b"`" in block or b"\r" in block:
+            block += raw.readline()
+            yield _csv_rows(str(block, "UTF-8"), raw)
+            return
+        rest = b""
+        if data:
+            cut = block.rfind(b"\n") + 1
+            if not cut:
+                rest = block
+                continue
+            rest = block[cut:]
+            block = block[:cut]
+        text = str(block, "UTF-8")
+        lines = text.split("\n")
+        if not lines[-1]:
+            lines.pop()
+        if "\n\n" in text or text[0] == "\n":  # blank lines are empty rows, as with csv
+            yield [line.split("\t") if line else [] for line in lines]
+        else:
+            yield map(str.split, lines, repeat("\t"))
+
+
+def reader(f, comments=True, header=True, block_size=READ_BLOCK):
+    r"""Iterate over the rows of an open dict file as lists of str.
+
+    Blank lines are empty lists, as with csv.reader. comments=False drops
+    "#" lines; header=False drops the YAML header ("---" up to "...") that
+    may follow the leading comments.
+    """
+    head = "" if header else _read_past_header(f.readline)
+    rows = chain.from_iterable(_iter_blocks(f, head, block_size))
+    return rows if comments else filterfalse(is_comment, rows)
+
+
+def _readline(f):
+    # A line of a buffered binary file, as readline on the text file ends it: at \n, \r\n or a lone \r
+    line = b""
+    while data := f.peek(1):
+        ends = [end for end in (data.find(b"\n"), data.find(b"\r")) if end != -1]
+        if not ends:
+            line += f.read(len(data))
+            continue
+        line += f.read(min(ends) + 1)
+        if line[-1:] == b"\r" and f.peek(1)[:1] == b"\n":
+            line += f.read(1)
+        break
+    return str(line, "UTF-8")
+
+
+def _file_blocks(path, header, block_size=READ_BLOCK):
+    # The blocks of rows of a dict file opened here as bytes; the file stays open until the last one
+    with open_dict(path, "rb") as f:
+        head = "" if header else _read_past_header(lambda: _readline(f))
+        yield from _iter_byte_blocks(f, head.encode("UTF-8"), block_size)
+
+
+def read_rows(path, comments=True, header=True):
+    return list(iter_rows(path, comments, header))
+
+
+def iter_rows(path, comments=True, header=True):
+    # Like read_rows, one row at a time; chained from the blocks, so no generator runs for every row
+    rows = chain.from_iterable(_file_blocks(path, header))
+    return rows if comments else filterfalse(is_comment, rows)
+
+
+class writer:
+    r"""Drop-in for csv.writer(f, delimiter="\t", quotechar="`", lineterminator="\n").
+
+    Rows are joined a batch at a time; a batch with anything that needs
+    quoting, empty rows or fields that are not str is written by csv instead.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self._csv = csv.writer(f, lineterminator="\n", **CSV_OPTIONS)
+
+    def writerow(self, row):
+        try:
+            line = "\t".join(row)
+        except TypeError:
+            line = ""
+        if (not line or "`" in line or "\r" in line or "\n" in line
+                or line.count("\t") != len(row) - 1):
+            self._csv.writerow(row)
+        else:
+            self.f.write(line + "\n")
+
+    def writerows(self, rows):
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, WRITE_BATCH))
+            if not batch:
+                return
+            try:
+                text = "\n".join(map("\t".join, batch))
+            except TypeError:  # numbers and such, let csv turn them into text
+                text = None
+            if (text is None or "`" in text or "\r" in text or text.count("\n") != len(batch) - 1
+                    or text.count("\t") != sum(map(len, batch)) - len(batch)
+                    or "\n\n" in text or text[:1] == "\n" or text[-1:] == "\n" or not text):
+                self._csv.writerows(batch)
+            else:
+                self.f.write(text + "\n")
+
+
+def write_rows(path, rows):
+    with atomic_write(path) as f:
+        writer(f).writerows(rows)
+
+
+def _file_mode(path):
+    # The mode of the file replaced, or what a new file would get
+    try:
+        return os.stat(path).st_mode
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode="w", buffering=BUFFER_SIZE, **options):
+    r"""Open a temp file next to path to write path with, as open_dict does.
+
+    The temp file is renamed over path when the block ends, with the mode
+    of the file it replaces, and removed if the block raises, leaving path
+    as it was. options (newline, encoding, errors) go to open; "-" is
+    stdout, written as it goes.
+    """
+    if path == "-":
+        with open_dict(path, mode, buffering) as f:
+            yield f
+        return
+    if "b" not in mode:
+        options = {"newline": "", "encoding": "UTF-8", **options}
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    try:
+        with open(fd, mode, buffering=buffering, **options) as f:
+            yield f
+        os.chmod(tmp, _file_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.lexists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+class DictFile:
+    r"""A dict file mapped into memory, to be cut at its header or marker lines.
+
+    head(marker) is the text up to and with the first line that has marker
+    in it, or all of it without one, as sed '/MARKER/q'; body(marker) is
+    the text after that line, or nothing, as sed '0,/MARKER/d'. The
+    markers given are all looked for in one scan over the map, stopping
+    once every one is found; any other marker is scanned for when first
+    asked. Text is decoded with errors, "surrogateescape" keeps bytes that
+    are not UTF-8 as they are.
+    """
+
+    def __init__(self, path, markers=("...",), errors="strict"):
+        self.path = path
+        self.errors = errors
+        with open(path, "rb") as f:
+            try:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                self._data = b""
+        # marker -> offset just past its line, or None when it is not in the file
+        self._ends = {}
+        self.find(*markers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def find(self, *markers):
+        todo = {marker: marker.encode("UTF-8") for marker in markers if marker not in self._ends}
+        if not todo:
+            return
+        if not all(todo.values()) or any(b"\n" in encoded for encoded in todo.values()):
+            raise ValueError("a marker has to be text on one line")
+        data = self._data
+        pattern = re.compile(b"|".join(map(re.escape, todo.values())))
+        for match in pattern.finditer(data):
+            # A marker whose first place overlaps a match is on the same line, so every
+            # line with a match is checked for all of the markers still wanted
+            start = data.rfind(b"\n", 0, match.start()) + 1
+            end = data.find(b"\n", match.end()) + 1 or len(data)
+            line = data[start:end]
+            for marker, encoded in list(todo.items()):
+                if encoded in line:
+                    self._ends[marker] = end
+                    del todo[marker]
+            if not todo:
+                return
+        self._ends.update(dict.fromkeys(todo))
+
+    def _end(self, marker):
+        self.find(marker)
+        return self._ends[marker]
+
+    def _text(self, start, end):
+        return str(self._data[start:end], "UTF-8", self.errors)
+
+    def head(self, marker="..."):
+        end = self._end(marker)
+        return self._text(0, len(self._data) if end is None else end)
+
+    def body(self, marker="..."):
+        end = self._end(marker)
+        return "" if end is None else self._text(end, len(self._data))
+
+    def text(self):
+        return self._text(0, len(self._data))
+
+    def byte_lines(self, marker=None):
+        r"""The lines after marker, or of the whole file, as bytes without their newlines, one for each row."""
+        start = 0 if marker is None else self._end(marker)
+        lines = [] if start is None else self._data[start:].split(b"\n")
+        if lines and lines[-1] == b"":
+            lines.pop()
+        return lines
+
+    def rows(self, marker=None, comments=True):
+        r"""The rows of the body after marker, or of the whole file, as reader() gives them."""
+        text = self.text() if marker is None else self.body(marker)
+        return reader(io.StringIO(text, newline=""), comments)
+
+
+def text_lines(text):
+    # Lines ended by "\n" only, as they are in the file
+    return io.StringIO(text, newline="\n")
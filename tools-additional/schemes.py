@@ -0,0 +1,120 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+The schemes of this repository and where their dicts come from, one
+entry each; make_dicts.py builds them and build.py reads its inputs here.
+
+Paths are relative to the repository root. Every scheme is a copy of
+rime-moran-cht and rime-moran-chs with these dicts rebuilt:
+
+    chars    "zdic": moran.chars from zdicdbtonesorted, one shape per
+             character; "zdic-multishape": every shape; "flypy": the moran
+             chars through schemagen convert-sp, reshaped with -p static;
+             None: left as rime-moran has it
+    base     "snow" or "ice": moran.base from the base dict of rime-snow-pinyin
+             or rime-ice; None: left as it is
+    fixed    moran_fixed and moran_fixed_simp: "simp" puts simpchars and
+             simpwords from the assessment data before the fixed words,
+             filtered of what they replace; "flypy" puts the moran fixed
+             words through schemagen convert-fixed-sp first instead of
+             simpchars; "zrlong" takes rime-zrlong; "common" only appends
+             the common words
+    zrlf     whether zrlf gets its codes from convert_sp.py
+    sp_dicts moran dicts taken through schemagen convert-sp as they are
+    extra    (directory, source, names): dicts converted from every
+             source.format(name) into directory/PINYIN_SHAPE_NAME.dict.yaml
+"""
+
+from collections import namedtuple
+
+ASSESS = "data/assess.tiger-code.com"
+ZDIC = "data/zdicdbtonesorted.yaml"
+COMMON_WORDS = f"{ASSESS}/common.simp.words.txt"
+SNOW_BASE = "rime-snow-pinyin/snow_pinyin.base.dict.yaml"
+ICE_BASE = "rime-ice/cn_dicts/base.dict.yaml"
+ZRLONG = "rime-zrlong/zrlong.dict.yaml"
+SCHEMAGEN = "rime-moran/tools/schemagen.py"
+SCHEMAGEN_DIR = "rime-moran/tools"
+VARIANTS = ["cht", "chs"]
+
+# Shape db -> (source, rewrite): tools-additional/SHAPE.txt is made from source, by
+# "tabs" (spaces to tabs) or "moqi" (the first shape of moqi_chaifen); None: checked in as it is
+SHAPE_DBS = {
+    "zrmdb": ("rime-moran/tools/data/zrmdb.txt", "tabs"),
+    "moqidb": ("rime-shuangpin-fuzhuma/opencc/moqi_chaifen.txt", "moqi"),
+    "zrmdb_zrlong": ("tools-additional/zrmdb_zrlong.txt", "tabs"),
+    "flypydb": None,
+    "zrmfastdb": None,
+}
+
+SNOW_DICTS = ("snow-dicts", "rime-snow-pinyin/snow_pinyin.{}.dict.yaml", ("ext", "tencent"))
+ICE_DICTS = ("ice-dicts", "rime-ice/cn_dicts/{}.dict.yaml", ("8105", "41448", "base", "ext", "others", "tencent"))
+ICE_DICTS_NO_BASE = ("ice-dicts", "rime-ice/cn_dicts/{}.dict.yaml", ("8105", "41448", "ext", "others", "tencent"))
+
+Scheme = namedtuple("Scheme", "pinyin shape chars base fixed simpchars simpwords zrlf sp_dicts extra")
+
+
+def scheme(pinyin, shape, chars=None, base=None, fixed="simp", simpchars=None, simpwords=None, zrlf=False,
+           sp_dicts=(), extra=SNOW_DICTS):
+    return Scheme(pinyin, shape, chars, base, fixed, simpchars, simpwords, zrlf, sp_dicts, extra)
+
+
+SCHEMES = {
+    "molong": scheme("zrlong", "zrmdb_zrlong", chars="zdic", base="snow", fixed="zrlong"),
+    "molongkai": scheme("molongkai", "zrmdb", chars="zdic-multishape", base="snow",
+                        simpchars="molongkai", simpwords="molong"),
+    "molongmoqi": scheme("molongmoqi", "moqidb", chars="zdic", base="snow",
+                         simpchars="molongmoqi", simpwords="molong"),
+    "morankai": scheme("morankai", "zrmdb", fixed="common", extra=ICE_DICTS),
+    "xhloopfly": scheme("xhloopfly", "flypydb", chars="zdic", base="snow",
+                        simpchars="xhloopfly", simpwords="xhloop", zrlf=True),
+    "xhloopkai": scheme("xhloopkai", "zrmdb", chars="zdic-multishape", base="snow",
+                        simpchars="xhloopkai", simpwords="xhloop", zrlf=True),
+    "xhloopmoqi": scheme("xhloopmoqi", "moqidb", chars="zdic", base="snow",
+                         simpchars="xhloopmoqi", simpwords="xhloop", zrlf=True),
+    "xhupkai": scheme("xhupkai", "zrmdb", fixed="flypy", simpwords="xhup", zrlf=True,
+                      sp_dicts=("chars", "base", "tencent", "moe", "computer", "words"), extra=ICE_DICTS),
+    "xhupmoqi": scheme("xhupmoqi", "moqidb", chars="flypy", base="ice",
+                       simpchars="xhupmoqi", simpwords="xhup", zrlf=True, extra=ICE_DICTS_NO_BASE),
+    "xhupzrmfast": scheme("xhupzrmfast", "zrmfastdb", chars="flypy", base="ice",
+                          simpchars="xhupzrmfast", simpwords="xhup", zrlf=True, extra=ICE_DICTS_NO_BASE),
+    "zrloopkai": scheme("zrloopkai", "zrmdb", chars="zdic-multishape", base="snow",
+                        simpchars="zrloopkai", simpwords="zrloop"),
+    "zrloopmoqi": scheme("zrloopmoqi", "moqidb", chars="zdic", base="snow",
+                         simpchars="zrloopmoqi", simpwords="zrloop"),
+}
+
+BASE_DICTS = {"snow": SNOW_BASE, "ice": ICE_BASE}
+
+
+def simpchars_file(entry):
+    return f"{ASSESS}/{entry.simpchars}.simpchars.txt"
+
+
+def simpwords_file(entry):
+    return f"{ASSESS}/{entry.simpwords}.simpwords.txt"
+
+
+def inputs(name):
+    r"""The paths the dicts of a scheme are built from, besides rime-moran-cht and rime-moran-chs."""
+    entry = SCHEMES[name]
+    paths = []
+    shape_db = SHAPE_DBS[entry.shape]
+    paths.append(shape_db[0] if shape_db else f"tools-additional/{entry.shape}.txt")
+    if entry.chars in ["zdic", "zdic-multishape"]:
+        paths.append(ZDIC)
+    if entry.base:
+        paths.append(BASE_DICTS[entry.base])
+    if entry.chars == "flypy" or entry.fixed == "flypy" or entry.sp_dicts:
+        paths.append(SCHEMAGEN_DIR)
+    if entry.fixed == "zrlong":
+        paths.append(ZRLONG)
+    if entry.simpchars:
+        paths.append(simpchars_file(entry))
+    if entry.simpwords:
+        paths.append(simpwords_file(entry))
+    if entry.fixed in ["simp", "flypy", "common"]:
+        paths.append(COMMON_WORDS)
+    directory, source, names = entry.extra
+    paths.extend(source.format(name) for name in names)
+    return list(dict.fromkeys(paths))
@@ -0,0 +1,201 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Shape databases (zrmdb.txt, moqidb.txt, ...) with a compiled cache.
+
+The first load parses the tab-separated db and writes `<db>.shapecache`
+next to it. Later loads mmap that file instead of parsing the text again,
+as long as the db's mtime and size still match the ones recorded in the
+cache header.
+
+Either way the shapes end up in a ShapeTable: one dict from character to
+row number, an offsets array and one tuple of interned shape strings,
+instead of a small list per character.
+
+Cache layout (little endian):
+    header   magic, version, source mtime_ns, source size,
+             single key count, single keys/values blob lengths,
+             multi key count, multi value count, multi keys/values blob lengths
+    single   keys blob, values blob ("\n"-joined UTF-8, one value per key)
+    multi    offsets (uint32, key count + 1), keys blob, values blob
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+import rime_dict
+
+MAGIC = b"MLSC"
+VERSION = 1
+HEADER = struct.Struct("<4sIqq3Q4Q")
+
+
+class ShapeTable:
+    r"""Character -> shapes, stored as offsets into one tuple of interned strings.
+
+    get() returns the shapes of a character as a tuple (first shape first),
+    or the default when the character is unknown.
+    """
+
+    __slots__ = ("index", "offsets", "shapes")
+
+    def __init__(self, keys, offsets, shapes):
+        self.index = {key: i for i, key in enumerate(keys)}
+        self.offsets = offsets
+        self.shapes = tuple(map(sys.intern, shapes))
+
+    @classmethod
+    def from_single(cls, keys, shapes):
+        return cls(keys, array("I", range(len(keys) + 1)), shapes)
+
+    def get(self, key, default=None):
+        i = self.index.get(key)
+        if i is None:
+            return default
+        return self.shapes[self.offsets[i]:self.offsets[i + 1]]
+
+    def __getitem__(self, key):
+        shapes = self.get(key)
+        if shapes is None:
+            raise KeyError(key)
+        return shapes
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index)
+
+
+def parse_shape_db(path):
+    r"""Parse a shape db into its (single, multi) mappings.
+
+    single keeps the first shape of every character, multi keeps every
+    distinct shape in file order.
+    """
+    single = {}
+    multi = {}
+    for row in rime_dict.iter_rows(path):
+        if len(row) >= 2:
+            key, value = row[0], row[1]
+            if key not in single:
+                single[key] = value
+                multi[key] = [value]
+            elif value not in multi[key]:
+                multi[key].append(value)
+    return single, multi
+
+
+def build_table(single, multi, multishape):
+    if not multishape:
+        return ShapeTable.from_single(single, single.values())
+    offsets = array("I", [0])
+    for values in multi.values():
+        offsets.append(offsets[-1] + len(values))
+    return ShapeTable(multi, offsets, [v for vs in multi.values() for v in vs])
+
+
+def cache_path(path):
+    return os.path.splitext(path)[0] + ".shapecache"
+
+
+def _blob(strings):
+    return "\n".join(strings).encode("UTF-8")
+
+
+def _split(data, count):
+    return data.decode("UTF-8").split("\n") if count else []
+
+
+def write_cache(path, single, multi):
+    strings = list(single) + list(single.values()) + list(multi) + [v for vs in multi.values() for v in vs]
+    if any("\n" in s for s in strings):
+        return  # not representable, stay on the text db
+    stat = os.stat(path)
+    single_keys, single_values = _blob(single), _blob(single.values())
+    multi_keys = _blob(multi)
+    multi_values = _blob(v for vs in multi.values() for v in vs)
+    offsets = array("I", [0])
+    for values in multi.values():
+        offsets.append(offsets[-1] + len(values))
+    header = HEADER.pack(MAGIC, VERSION, stat.st_mtime_ns, stat.st_size,
+                         len(single), len(single_keys), len(single_values),
+                         len(multi), offsets[-1], len(multi_keys), len(multi_values))
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    target = cache_path(path)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(single_keys)
+        f.write(single_values)
+        f.write(offsets.tobytes())
+        f.write(multi_keys)
+        f.write(multi_values)
+    os.replace(tmp, target)
+
+
+def read_cache(path, multishape):
+    try:
+        stat = os.stat(path)
+        f = open(cache_path(path), "rb")
+    except OSError:
+        return None
+    with f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return None
+        with mm:
+            if len(mm) < HEADER.size:
+                return None
+            (magic, version, mtime_ns, size,
+             n_single, single_keys_len, single_values_len,
+             n_multi, n_multi_values, multi_keys_len, multi_values_len) = HEADER.unpack_from(mm)
+            if (magic, version, mtime_ns, size) != (MAGIC, VERSION, stat.st_mtime_ns, stat.st_size):
+                return None
+            pos = HEADER.size
+            if not multishape:
+                keys = _split(mm[pos:pos + single_keys_len], n_single)
+                pos += single_keys_len
+                values = _split(mm[pos:pos + single_values_len], n_single)
+                return ShapeTable.from_single(keys, values)
+            pos += single_keys_len + single_values_len
+            offsets = array("I")
+            offsets.frombytes(mm[pos:pos + 4 * (n_multi + 1)])
+            if sys.byteorder == "big":
+                offsets.byteswap()
+            pos += 4 * (n_multi + 1)
+            keys = _split(mm[pos:pos + multi_keys_len], n_multi)
+            pos += multi_keys_len
+            values = _split(mm[pos:pos + multi_values_len], n_multi_values)
+            return ShapeTable(keys, offsets, values)
+
+
+# Tables already built in this process, for long-lived ones like convertd.py
+_loaded = {}
+
+
+def load_shape_dict(path, multishape, use_cache=True):
+    stat = os.stat(path)
+    key = (os.path.realpath(path), multishape, use_cache)
+    loaded = _loaded.get(key)
+    if loaded is not None and loaded[0] == (stat.st_mtime_ns, stat.st_size):
+        return loaded[1]
+    shape_dict = read_cache(path, multishape) if use_cache else None
+    if shape_dict is None:
+        single, multi = parse_shape_db(path)
+        if use_cache:
+            try:
+                write_cache(path, single, multi)
+            except OSError:
+                pass  # read-only checkout, just go without the cache
+        shape_dict = build_table(single, multi, multishape)
+    _loaded[key] = ((stat.st_mtime_ns, stat.st_size), shape_dict)
+    return shape_dict
@@ -0,0 +1,566 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+r"""
+Keep the dicts of make_dicts.py up to date while their sources are edited.
+
+    python3 watch.py [--extra] [--interval S] [SCHEME ...]
+
+Run it from tools-additional after a make_dicts.py build. It converts the
+sources once more in memory, checks that this gives the dicts on disk and
+keeps, for every converted dict (moran.chars and moran.base, and the snow
+and ice dicts with --extra), where the lines written for each source line
+are in the file, and for every source and variant, which source lines hold
+each character. Then it polls the files they are made from:
+
+- a shape db (moqidb.txt, zrmdb_zrlong.txt or the file it is made from):
+  the characters whose shapes changed lead to the source lines holding
+  them, which are converted again, and only their bytes in the dicts are
+  rewritten, in place when they keep their length;
+- a line of a source such as zdicdbtonesorted.yaml edited in place: that
+  line and the lines with the same word are converted again the same way;
+  lines added or removed make the whole source convert again;
+- an assessment file (simpchars, simpwords, common words) or zrlong:
+  only its changed lines go through OpenCC again, and the fixed dicts
+  reading it are put together again from memory.
+
+The chars of the flypy schemes and the fixed dicts of xhupkai are made by
+schemagen and are not watched; make_*.sh still has to run for those.
+"""
+
+import argparse
+import contextlib
+import difflib
+import io
+import os
+import sys
+import time
+from array import array
+from bisect import insort
+from heapq import merge
+from itertools import chain
+
+import assemble_dict
+import gen_dict_with_shape
+import make_dicts
+import rime_dict
+import schemes
+from assemble_dict import TEXT_OPTIONS
+
+# As TEXT_OPTIONS, for bytes
+ENCODING = dict(encoding=TEXT_OPTIONS["encoding"], errors=TEXT_OPTIONS["errors"])
+DEFAULT_INTERVAL = 0.2
+
+
+def stamp(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def quiet(function, *args):
+    # prepare_row prints the rows it cannot convert, which make_dicts.py has shown already
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args)
+
+
+def segment_offsets(start, segments):
+    offsets = array("Q", [start])
+    for segment in segments:
+        offsets.append(offsets[-1] + len(segment))
+    return offsets
+
+
+def shift(offsets, deltas):
+    r"""Move the offsets after each (row, delta) of deltas, sorted by row, by the sum of the deltas up to it."""
+    total = 0
+    ends = [row + 1 for row, _ in deltas[1:]] + [len(offsets)]
+    for (row, delta), end in zip(deltas, ends):
+        total += delta
+        if total:
+            offsets[row + 1:end] = array("Q", [offset + total for offset in offsets[row + 1:end]])
+
+
+class Converted:
+    r"""A dict converted from the rows of a source, with where the lines of every row are in it."""
+
+    def __init__(self, conversion, source):
+        self.conversion = conversion
+        self.source = source
+        self.traditional = conversion.variant == "t"
+        self.simplified = conversion.variant == "s"
+        self.pinyin_fn = gen_dict_with_shape.get_pinyin_fn(conversion.pinyin)
+        self.head = "".join(conversion.head).encode(**ENCODING)
+        # offsets[i] is where the lines of row i start, offsets[-1] where the last row's end
+        self.offsets = None
+        self.stamp = None
+
+    @property
+    def output(self):
+        return self.conversion.output
+
+    def shape_dict(self):
+        return gen_dict_with_shape.get_shape_dict(self.conversion.shape, self.conversion.multishape)
+
+    def segments(self, row_ids):
+        r"""The bytes written for each of row_ids, with the (word, code) pairs seen before among them dropped."""
+        rows = self.source.rows
+        args = (self.traditional, self.simplified, ";", self.pinyin_fn, self.shape_dict(), self.conversion.multishape)
+        seen = set()
+        buffer = io.StringIO()
+        writer = rime_dict.writer(buffer)
+        segments = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in row_ids:
+                out_rows = []
+                for row in gen_dict_with_shape.rewrite_row(rows[i], *args):
+                    key = gen_dict_with_shape.dupe_key(row)
+                    if key not in seen:
+                        seen.add(key)
+                        out_rows.append(row)
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(out_rows)
+                lines = make_dicts.in_memory(rime_dict.text_lines(buffer.getvalue()), self.conversion.filters)
+                segments.append("".join(assemble_dict.source_lines(lines, None)).encode(**ENCODING))
+        return segments
+
+    def load(self):
+        r"""Convert every row and check the dict on disk is just that, followed by anything; False if not."""
+        self.offsets = None
+        self.stamp = stamp(self.output)
+        segments = self.segments(range(len(self.source.rows)))
+        expected = b"".join([self.head] + segments)
+        try:
+            with open(self.output, "rb") as f:
+                data = f.read(len(expected))
+        except FileNotFoundError:
+            data = b""
+        if data != expected:
+            print(f"{self.output}: not what make_dicts.py writes from the sources now, not watched")
+            return False
+        self.offsets = segment_offsets(len(self.head), segments)
+        return True
+
+    def write_all(self):
+        r"""Convert every row and write them after the head, keeping what follows them in the file."""
+        if self.offsets is None:
+            return 0
+        segments = self.segments(range(len(self.source.rows)))
+        with open(self.output, "rb") as f:
+            f.seek(self.offsets[-1])
+            tail = f.read()
+        with rime_dict.atomic_write(self.output, "wb") as f:
+            f.writelines([self.head] + segments + [tail])
+        self.offsets = segment_offsets(len(self.head), segments)
+        self.stamp = stamp(self.output)
+        return len(segments)
+
+    def rewrite(self, row_ids):
+        r"""Convert the rows again and put the bytes of those that changed in the file; returns how many did."""
+        if self.offsets is None or not row_ids:
+            return 0
+        offsets = self.offsets
+        changed = []
+        with open(self.output, "r+b") as f:
+            fd = f.fileno()
+            for i, segment in zip(row_ids, self.segments(row_ids)):
+                if os.pread(fd, offsets[i + 1] - offsets[i], offsets[i]) != segment:
+                    changed.append((i, segment))
+            if all(len(segment) == offsets[i + 1] - offsets[i] for i, segment in changed):
+                for i, segment in changed:
+                    os.pwrite(fd, segment, offsets[i])
+                changed_size = False
+            else:
+                data = f.read()
+                changed_size = True
+        if changed_size:
+            pieces = []
+            position = 0
+            for i, segment in changed:
+                pieces += [data[position:offsets[i]], segment]
+                position = offsets[i + 1]
+            pieces.append(data[position:])
+            with rime_dict.atomic_write(self.output, "wb") as f:
+                f.writelines(pieces)
+            shift(offsets, [(i, len(segment) - (offsets[i + 1] - offsets[i])) for i, segment in changed])
+        self.stamp = stamp(self.output)
+        return len(changed)
+
+
+class SourceRows:
+    r"""The rows of a big source, the dicts converted from them, and per variant the rows with each character."""
+
+    def __init__(self, path, marker, batch):
+        self.path = path
+        self.marker = marker
+        self.outputs = [Converted(conversion, self) for conversion in batch]
+        self.rows = []
+        self.lines = []
+        self.index = {}
+
+    def read(self):
+        r"""Read the rows and index them; False if they are not one a line, so a line cannot be told by its row."""
+        with rime_dict.DictFile(self.path, [self.marker] if self.marker else []) as dict_file:
+            lines = dict_file.byte_lines(self.marker)
+        rows = make_dicts.read_rows(self.path, self.marker)
+        if len(rows) != len(lines):
+            print(f"{self.path}: has rows over more than one line, not watched")
+            return False
+        self.rows = rows
+        self.lines = lines
+        self.index = {}
+        for variant in dict.fromkeys(output.conversion.variant for output in self.outputs):
+            gen_dict_with_shape.prefetch_conversions(rows, variant == "t", variant == "s")
+            index = self.index[variant] = {}
+            for i, row in enumerate(rows):
+                word = self.word(row, variant)
+                for char in set(word or ""):
+                    index.setdefault(char, array("I")).append(i)
+        return True
+
+    def load(self):
+        if not self.read():
+            self.outputs = []
+            return
+        self.outputs = [output for output in self.outputs if output.load()]
+
+    @staticmethod
+    def word(row, variant):
+        return quiet(gen_dict_with_shape.prepare_row, row, variant == "t", variant == "s")[0]
+
+    def rows_with(self, variant, chars):
+        index = self.index[variant]
+        return list(dict.fromkeys(merge(*(index.get(char, ()) for char in chars))))
+
+    def rows_with_word(self, variant, word):
+        # Every row with word holds all of its characters, so the shortest list of them has them all
+        if not word:
+            return ()
+        index = self.index[variant]
+        return min((index.get(char, ()) for char in set(word)), key=len)
+
+    def shapes_changed(self, shape, multishape, chars):
+        results = []
+        for output in self.outputs:
+            if (output.conversion.shape, output.conversion.multishape) == (shape, multishape):
+                results.append((output, output.rewrite(self.rows_with(output.conversion.variant, chars))))
+        return results
+
+    def edited_rows(self, lines):
+        r"""The rows that are different in the new lines, by row number; None if lines were added or removed."""
+        old = self.lines
+        if len(lines) != len(old):
+            return None
+        start = 0
+        while start < len(old) and old[start] == lines[start]:
+            start += 1
+        end = len(old)
+        while end > start and old[end - 1] == lines[end - 1]:
+            end -= 1
+        edited = [i for i in range(start, end) if old[i] != lines[i]]
+        if not edited:
+            return {}
+        text = b"\n".join(lines[i] for i in edited).decode("UTF-8") + "\n"
+        rows = list(map(gen_dict_with_shape.compact_row, rime_dict.reader(io.StringIO(text, newline=""))))
+        if len(rows) != len(edited):
+            return None
+        return dict(zip(edited, rows))
+
+    def edited(self):
+        r"""Convert the rows of the lines edited since the last read again; all of them after any other change."""
+        with rime_dict.DictFile(self.path, [self.marker] if self.marker else []) as dict_file:
+            lines = dict_file.byte_lines(self.marker)
+        edited = self.edited_rows(lines)
+        words = {}
+        if edited is not None:
+            for variant in self.index:
+                words[variant] = [(self.word(self.rows[i], variant), self.word(row, variant))
+                                  for i, row in edited.items()]
+        if edited is None or any(None in pair for pairs in words.values() for pair in pairs):
+            # Lines that come and go, and comments, shift or take part in what is kept of repeats
+            if not self.read():
+                self.outputs = []
+                return []
+            return [(output, output.write_all()) for output in self.outputs]
+        affected = {}
+        for variant, pairs in words.items():
+            index = self.index[variant]
+            for i, (old_word, new_word) in zip(edited, pairs):
+                for char in set(old_word) - set(new_word):
+                    index[char].remove(i)
+                for char in set(new_word) - set(old_word):
+                    insort(index.setdefault(char, array("I")), i)
+            rows = set(edited)
+            for pair in pairs:
+                for word in pair:
+                    rows.update(self.rows_with_word(variant, word))
+            affected[variant] = sorted(rows)
+        for i, row in edited.items():
+            self.rows[i] = row
+            self.lines[i] = lines[i]
+        return [(output, output.rewrite(affected[output.conversion.variant])) for output in self.outputs]
+
+
+class Assembled:
+    r"""A fixed dict put together from lines held in memory."""
+
+    def __init__(self, step):
+        self.step = step
+        # The lines of every source after its filters, taken again only when the list it reads changes
+        self.parts = [None] * len(step.sources)
+        self.loaded = False
+        self.stamp = None
+
+    @property
+    def output(self):
+        return self.step.output
+
+    def reads(self, changed):
+        return any(source.kind == "lines" and id(source.args[0]) in changed for source in self.step.sources)
+
+    def data(self, changed=()):
+        for i, source in enumerate(self.step.sources):
+            if self.parts[i] is None or source.kind == "lines" and id(source.args[0]) in changed:
+                self.parts[i] = list(assemble_dict.source_lines(source, None))
+        lines = chain.from_iterable(self.parts)
+        if self.step.dedupe:
+            # As dedupe.iter_unique, without its spilling to disk as all of it is in memory anyway
+            lines = dict.fromkeys(lines)
+        return "".join(lines).encode(**ENCODING)
+
+    def load(self):
+        self.stamp = stamp(self.output)
+        try:
+            with open(self.output, "rb") as f:
+                same = f.read() == self.data()
+        except FileNotFoundError:
+            same = False
+        if not same:
+            print(f"{self.output}: not what make_dicts.py writes from the sources now, not watched")
+        self.loaded = same
+        return same
+
+    def rewrite(self, changed):
+        if not self.loaded:
+            return 0
+        data = self.data(changed)
+        with open(self.output, "rb") as f:
+            if f.read() == data:
+                return 0
+        with rime_dict.atomic_write(self.output, "wb") as f:
+            f.write(data)
+        self.stamp = stamp(self.output)
+        return 1
+
+
+class Watcher:
+    r"""Everything watched, and what to do when each file changes, in the order it is looked at."""
+
+    def __init__(self, names, jobs):
+        self.names = names
+        self.shared = make_dicts.Shared(jobs)
+        self.sources = []
+        self.fixed = []
+        self.shapes = {}
+        self.raw = {}
+        self.handlers = {}
+        self.stamps = {}
+
+    def watch(self, path, handler):
+        self.handlers.setdefault(path, []).append(handler)
+
+    def load(self, extra):
+        shared = self.shared
+        extras = set()
+        for name in self.names:
+            directory, source, extra_names = schemes.SCHEMES[name].extra
+            extras.update(make_dicts.root(source.format(extra_name)) for extra_name in extra_names)
+        for (path, marker), batch in make_dicts.conversions(self.names, shared).items():
+            if marker is None and path in extras and not extra:
+                continue
+            started = time.perf_counter()
+            source = SourceRows(path, marker, batch)
+            source.load()
+            print(f"{path}: {len(source.rows)} rows, {len(source.outputs)} dicts "
+                  f"in {time.perf_counter() - started:.1f}s", flush=True)
+            if source.outputs:
+                self.sources.append(source)
+        for name in self.names:
+            for variant in schemes.VARIANTS:
+                for step in make_dicts.fixed_steps(name, variant, shared):
+                    if any(source.kind == "run" for source in step.sources):
+                        print(f"{step.output}: made with schemagen, not watched")
+                        continue
+                    assembled = Assembled(step)
+                    if assembled.load():
+                        self.fixed.append(assembled)
+        # What the fixed dicts read, with the lines before OpenCC to tell what changed
+        used = {id(source.args[0]) for assembled in self.fixed for source in assembled.step.sources
+                if source.kind == "lines"}
+        parts = {key: lines for key, lines in shared.parts().items() if id(lines) in used}
+        for key, lines in parts.items():
+            self.raw[key] = self.read_part(key) if key[2] else list(lines)
+        shared.close()
+
+        for output in self.outputs():
+            self.watch(output.output, self.output_changed)
+        shapes = dict.fromkeys(output.conversion.shape for source in self.sources for output in source.outputs)
+        for shape in shapes:
+            spec = schemes.SHAPE_DBS[shape]
+            if spec is not None:
+                self.watch(make_dicts.root(spec[0]), lambda path, shape=shape: make_dicts.prepare_shape_db(shape))
+        for source in self.sources:
+            for output in source.outputs:
+                key = (output.conversion.shape, output.conversion.multishape)
+                self.shapes[key] = output.shape_dict()
+        for shape in shapes:
+            self.watch(f"{shape}.txt", lambda path, shape=shape: self.shape_changed(shape))
+        for source in self.sources:
+            self.watch(source.path, lambda path, source=source: self.source_changed(source))
+        for path in dict.fromkeys(key[0] for key in parts):
+            self.watch(path, self.part_changed)
+        for path in self.handlers:
+            self.stamps[path] = stamp(path)
+
+    def outputs(self):
+        return [output for source in self.sources for output in source.outputs] + self.fixed
+
+    @staticmethod
+    def read_part(key):
+        path, part, s2t, *marker = key
+        with rime_dict.DictFile(path, marker, errors=TEXT_OPTIONS["errors"]) as dict_file:
+            return list(rime_dict.text_lines(getattr(dict_file, part)(*marker)))
+
+    def output_changed(self, path):
+        # Written by something else, such as make_dicts.py: check it again before changing it
+        for output in self.outputs():
+            if output.output == path and stamp(path) != output.stamp:
+                if output.load():
+                    print(f"{path}: changed outside, still watched")
+
+    def shape_changed(self, shape):
+        for (name, multishape), old in list(self.shapes.items()):
+            if name != shape:
+                continue
+            new = gen_dict_with_shape.get_shape_dict(shape, multishape)
+            self.shapes[name, multishape] = new
+            chars = [char for char in dict.fromkeys([*old, *new]) if old.get(char) != new.get(char)]
+            print(f"{shape}.txt: {len(chars)} characters changed" + (" (multishape)" if multishape else ""))
+            if chars:
+                for source in self.sources:
+                    self.report(source.shapes_changed(shape, multishape, chars))
+
+    def part_changed(self, path):
+        print(f"{path}: changed")
+        changed = set()
+        for key, raw in list(self.raw.items()):
+            if key[0] != path:
+                continue
+            lines = self.shared.parts()[key]
+            new_raw = self.read_part(key)
+            if new_raw == raw:
+                continue
+            if not key[2]:
+                lines[:] = new_raw
+            else:
+                lines[:] = self.convert_changed(raw, new_raw, lines)
+            self.raw[key] = new_raw
+            changed.add(id(lines))
+        results = []
+        for assembled in self.fixed:
+            if assembled.reads(changed):
+                results.append((assembled, assembled.rewrite(changed)))
+        self.report(results)
+
+    def convert_changed(self, raw, new_raw, converted):
+        r"""The lines of new_raw through OpenCC s2t, converting only those that are not in raw."""
+        lines = []
+        matcher = difflib.SequenceMatcher(None, raw, new_raw, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                lines += converted[i1:i2]
+            else:
+                text = gen_dict_with_shape.opencc_s2t.convert_text("".join(new_raw[j1:j2]), self.shared.jobs)
+                lines += rime_dict.text_lines(text)
+        return lines
+
+    def source_changed(self, source):
+        print(f"{source.path}: changed")
+        self.report(source.edited())
+
+    @staticmethod
+    def report(results):
+        for output, count in results:
+            if isinstance(output, Converted):
+                print(f"  {output.output}: {count} rows rewritten")
+            else:
+                print(f"  {output.output}: {'rewritten' if count else 'unchanged'}")
+
+    def changed(self):
+        return [path for path in self.handlers if stamp(path) != self.stamps[path]]
+
+    def run(self, interval):
+        print(f"watching {len(self.handlers)} files, {len(self.outputs())} dicts", flush=True)
+        while True:
+            time.sleep(interval)
+            if not self.changed():
+                continue
+            # Until the editor is done writing
+            while True:
+                before = {path: stamp(path) for path in self.handlers}
+                time.sleep(interval)
+                if before == {path: stamp(path) for path in self.handlers}:
+                    break
+            started = time.perf_counter()
+            outputs = {output.output for output in self.outputs()}
+            handled = set()
+            for path, handlers in self.handlers.items():
+                current = stamp(path)
+                if current == self.stamps[path]:
+                    continue
+                handled.add(path)
+                # Before it is read, so an edit made while it is handled is seen next time
+                self.stamps[path] = current
+                for handler in handlers:
+                    try:
+                        handler(path)
+                    except Exception as e:
+                        print(f"{path}: {type(e).__name__}: {e}", file=sys.stderr)
+            # What was written here is known already, only later changes are news
+            for output in self.outputs():
+                if output.stamp is not None:
+                    self.stamps[output.output] = output.stamp
+            if handled - outputs:
+                print(f"done in {time.perf_counter() - started:.3f}s", flush=True)
+
+
+def get_cli_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     epilog="schemes: " + ", ".join(schemes.SCHEMES))
+    parser.add_argument("schemes", nargs="*", metavar="SCHEME", help="Schemes to watch (default: all of them)")
+    parser.add_argument("--extra", action="store_true", help="Watch the snow and ice dicts too, which are big")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                        help=f"Seconds between looks at the files (default: {DEFAULT_INTERVAL})")
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="Number of worker processes for OpenCC (0 = all cores)")
+    args = parser.parse_args()
+    unknown = [name for name in args.schemes if name not in schemes.SCHEMES]
+    if unknown:
+        parser.error(f"unknown scheme {', '.join(unknown)}")
+    return args
+
+
+def main():
+    args = get_cli_args()
+    gen_dict_with_shape.set_opencc_cache()
+    watcher = Watcher(list(dict.fromkeys(args.schemes)) or list(schemes.SCHEMES), args.jobs or os.cpu_count())
+    watcher.load(args.extra)
+    try:
+        watcher.run(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()